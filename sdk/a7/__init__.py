@@ -1,31 +1,129 @@
-"""A7 Python SDK - Synchronous client for Deutsche Börse A7 Analytics Platform."""
-
-from a7.client import A7Client
-from a7.errors import (
-    A7Error,
-    AuthenticationError,
-    ConnectionError,
-    ForbiddenError,
-    NotFoundError,
-    RateLimitError,
-    ServerError,
-    ValidationError,
-)
+"""A7 Python SDK - Synchronous and asyncio clients for Deutsche Börse A7 Analytics Platform."""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 try:
     from a7._version import __version__
 except ImportError:
     __version__ = "0.0.0+unknown"
 
+if TYPE_CHECKING:
+    from a7.auth import CredentialPool
+    from a7.batch import BatchResult
+    from a7.book import OrderBook
+    from a7.breaker import CircuitBreaker
+    from a7.cache import DiskCache, MemoryCache
+    from a7.client import A7Client, AsyncA7Client
+    from a7.columnar import MessageStore
+    from a7.crawler import CrawlCheckpoint, CrawlItem, EOBICrawler
+    from a7.errors import (
+        A7Error,
+        AuthenticationError,
+        CircuitOpenError,
+        ConnectionError,
+        DeadlineExceededError,
+        ForbiddenError,
+        NotFoundError,
+        RateLimitError,
+        ServerError,
+        ValidationError,
+    )
+    from a7.hedging import Hedger
+    from a7.instrumentation import Instrumentation
+    from a7.metrics import MetricsRegistry
+    from a7.ratelimit import FileBucket, RateLimiter
+    from a7.retry import RetryPolicy
+    from a7.scheduler import Scheduler, priority
+    from a7.sharding import ShardedFetcher
+    from a7.timeouts import Deadline, TimeoutProfile
+
+# Public names and the module defining them; imported on first access so that
+# 'import a7' stays cheap and httpx is only loaded once a client is needed
+_EXPORTS = {
+    "A7Client": "a7.client",
+    "A7Error": "a7.errors",
+    "AsyncA7Client": "a7.client",
+    "AuthenticationError": "a7.errors",
+    "BatchResult": "a7.batch",
+    "CircuitBreaker": "a7.breaker",
+    "CircuitOpenError": "a7.errors",
+    "ConnectionError": "a7.errors",
+    "CrawlCheckpoint": "a7.crawler",
+    "CrawlItem": "a7.crawler",
+    "CredentialPool": "a7.auth",
+    "Deadline": "a7.timeouts",
+    "DeadlineExceededError": "a7.errors",
+    "DiskCache": "a7.cache",
+    "EOBICrawler": "a7.crawler",
+    "FileBucket": "a7.ratelimit",
+    "ForbiddenError": "a7.errors",
+    "Hedger": "a7.hedging",
+    "Instrumentation": "a7.instrumentation",
+    "MemoryCache": "a7.cache",
+    "MessageStore": "a7.columnar",
+    "MetricsRegistry": "a7.metrics",
+    "NotFoundError": "a7.errors",
+    "OrderBook": "a7.book",
+    "RateLimitError": "a7.errors",
+    "RateLimiter": "a7.ratelimit",
+    "RetryPolicy": "a7.retry",
+    "Scheduler": "a7.scheduler",
+    "ServerError": "a7.errors",
+    "ShardedFetcher": "a7.sharding",
+    "TimeoutProfile": "a7.timeouts",
+    "ValidationError": "a7.errors",
+    "priority": "a7.scheduler",
+}
+
 __all__ = [
     "A7Client",
     "A7Error",
+    "AsyncA7Client",
     "AuthenticationError",
+    "BatchResult",
+    "CircuitBreaker",
+    "CircuitOpenError",
     "ConnectionError",
+    "CrawlCheckpoint",
+    "CrawlItem",
+    "CredentialPool",
+    "Deadline",
+    "DeadlineExceededError",
+    "DiskCache",
+    "EOBICrawler",
+    "FileBucket",
     "ForbiddenError",
+    "Hedger",
+    "Instrumentation",
+    "MemoryCache",
+    "MessageStore",
+    "MetricsRegistry",
     "NotFoundError",
+    "OrderBook",
     "RateLimitError",
+    "RateLimiter",
+    "RetryPolicy",
+    "Scheduler",
     "ServerError",
+    "ShardedFetcher",
+    "TimeoutProfile",
     "ValidationError",
     "__version__",
+    "priority",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names lazily on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'a7' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List public names, including those not imported yet."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,9 +1,22 @@
 """Authentication handling for A7 SDK."""
 
-from typing import Generator
+import math
+import threading
+import time
+from collections.abc import Collection, Generator, Iterable
+from typing import Any, Optional
 
 import httpx
 
+from a7.config import DEFAULT_CREDENTIAL_COOLDOWN
+from a7.retry import parse_retry_after
+from a7.transport import AnyTransport, TransportWrapper
+
+# Token selection strategies of a CredentialPool
+ROUND_ROBIN = "round_robin"
+LEAST_THROTTLED = "least_throttled"
+STRATEGIES = frozenset({ROUND_ROBIN, LEAST_THROTTLED})
+
 
 class BearerAuth(httpx.Auth):
     """Bearer token authentication for httpx."""
@@ -35,3 +48,229 @@ class BearerAuth(httpx.Auth):
         """
         request.headers["Authorization"] = self.token
         yield request
+
+
+class _Credential:
+    """Usage and cooldown state of one token of a CredentialPool."""
+
+    def __init__(self, token: str) -> None:
+        self.header = BearerAuth(token).token
+        self.requests = 0
+        self.throttled = 0
+        self.last_throttled = -math.inf
+        self.benched_until = 0.0
+
+
+class CredentialPool:
+    """
+    Several A7 API tokens used in turn to add up their accounts' rate limits.
+
+    Each request is sent with one token of the pool, picked round-robin or
+    least-recently-throttled. A token answered with ``429`` is benched until
+    its cooldown ends (the response's ``Retry-After``, or ``cooldown``
+    seconds), and the request is sent again at once with another token, so
+    a throttled account does not fail the request. Only when every token
+    is benched does the ``429`` reach the retry policy, which then backs
+    off as usual.
+
+    Requests, throttles and cooldowns are tracked per token; see
+    :meth:`stats`. Pass the pool as the client's ``token``; one pool can be
+    shared by several clients of the same process.
+
+    Example:
+        >>> pool = CredentialPool([token_a, token_b, token_c], strategy="least_throttled")
+        >>> client = A7Client(token=pool, rate_limit=RateLimiter(rate=3 * 20))
+        >>> pool.stats()[0]
+        {'requests': 412, 'throttled': 2, 'benched_for': 0.0}
+    """
+
+    def __init__(
+        self,
+        tokens: Iterable[str],
+        *,
+        strategy: str = ROUND_ROBIN,
+        cooldown: float = DEFAULT_CREDENTIAL_COOLDOWN,
+    ) -> None:
+        """
+        Initialize credential pool.
+
+        Args:
+            tokens: A7 API tokens (with or without 'Bearer ' prefix)
+            strategy: 'round_robin' (default) or 'least_throttled', which
+                      prefers the token whose last 429 is longest ago
+            cooldown: Seconds a throttled token is benched when the response
+                      has no Retry-After header (default: 60.0)
+
+        Raises:
+            ValueError: If no token is given or the strategy is unknown
+        """
+        self._credentials = [_Credential(token) for token in tokens]
+        if not self._credentials:
+            raise ValueError("CredentialPool needs at least one token")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {sorted(STRATEGIES)}, got {strategy!r}")
+        self.strategy = strategy
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._next = 0
+
+    def __len__(self) -> int:
+        """Number of tokens in the pool."""
+        return len(self._credentials)
+
+    def acquire(self) -> int:
+        """
+        Pick the token for a new request and count the request.
+
+        Returns:
+            Index of the token to use; if every token is benched, the one
+            back soonest
+        """
+        with self._lock:
+            index = self._pick(())
+            if index is None:
+                index = min(
+                    range(len(self._credentials)),
+                    key=lambda i: self._credentials[i].benched_until,
+                )
+            self._credentials[index].requests += 1
+            return index
+
+    def alternative(self, tried: Collection[int]) -> Optional[int]:
+        """
+        Pick another token for a throttled request and count the request.
+
+        Args:
+            tried: Tokens (by index) already tried for this request
+
+        Returns:
+            Index of the token to use, or None if every other token is benched
+        """
+        with self._lock:
+            index = self._pick(tried)
+            if index is not None:
+                self._credentials[index].requests += 1
+            return index
+
+    def _pick(self, exclude: Collection[int]) -> Optional[int]:
+        """Token to use among those not benched or excluded; call with the lock held."""
+        now = time.monotonic()
+        available = [
+            index
+            for index, credential in enumerate(self._credentials)
+            if credential.benched_until <= now and index not in exclude
+        ]
+        if not available:
+            return None
+        if self.strategy == LEAST_THROTTLED:
+            return min(
+                available,
+                key=lambda i: (
+                    self._credentials[i].last_throttled,
+                    self._credentials[i].requests,
+                ),
+            )
+        count = len(self._credentials)
+        index = min(available, key=lambda i: (i - self._next) % count)
+        self._next = (index + 1) % count
+        return index
+
+    def authorization(self, index: int) -> str:
+        """Get the Authorization header value of a token."""
+        return self._credentials[index].header
+
+    def bench(self, index: int, retry_after: Optional[float] = None) -> None:
+        """
+        Record a 429 for a token and bench it.
+
+        Args:
+            index: Token that was throttled
+            retry_after: Cooldown in seconds from the response (default: cooldown)
+        """
+        with self._lock:
+            credential = self._credentials[index]
+            now = time.monotonic()
+            credential.throttled += 1
+            credential.last_throttled = now
+            cooldown = retry_after if retry_after is not None else self.cooldown
+            credential.benched_until = max(credential.benched_until, now + cooldown)
+
+    def stats(self) -> list[dict[str, float]]:
+        """
+        Get per-token usage, in the order the tokens were given.
+
+        Returns:
+            One dict per token with 'requests' (requests sent), 'throttled'
+            (429 responses) and 'benched_for' (seconds of cooldown left)
+        """
+        with self._lock:
+            now = time.monotonic()
+            return [
+                {
+                    "requests": credential.requests,
+                    "throttled": credential.throttled,
+                    "benched_for": max(0.0, credential.benched_until - now),
+                }
+                for credential in self._credentials
+            ]
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle the tokens and settings only, e.g. for ShardedFetcher workers."""
+        return {
+            "headers": [credential.header for credential in self._credentials],
+            "strategy": self.strategy,
+            "cooldown": self.cooldown,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled pool with fresh usage state."""
+        self.__init__(state["headers"], strategy=state["strategy"], cooldown=state["cooldown"])
+
+
+class CredentialPoolTransport(TransportWrapper):
+    """Transport wrapper that authenticates each attempt with a token of a CredentialPool."""
+
+    def __init__(self, transport: AnyTransport, pool: CredentialPool) -> None:
+        """
+        Initialize credential-pool transport.
+
+        Args:
+            transport: Transport that actually sends the requests
+            pool: Tokens to authenticate with
+        """
+        super().__init__(transport)
+        self._pool = pool
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request, switching tokens while the current one is throttled."""
+        tried: set[int] = set()
+        index = self._pool.acquire()
+        while True:
+            request.headers["Authorization"] = self._pool.authorization(index)
+            response = self._send(request)
+            if response.status_code != 429:
+                return response
+            self._pool.bench(index, parse_retry_after(response))
+            tried.add(index)
+            next_index = self._pool.alternative(tried)
+            if next_index is None:
+                return response
+            response.close()
+            index = next_index
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request, switching tokens while the current one is throttled."""
+        tried: set[int] = set()
+        index = self._pool.acquire()
+        while True:
+            request.headers["Authorization"] = self._pool.authorization(index)
+            response = await self._asend(request)
+            if response.status_code != 429:
+                return response
+            self._pool.bench(index, parse_retry_after(response))
+            tried.add(index)
+            next_index = self._pool.alternative(tried)
+            if next_index is None:
+                return response
+            await response.aclose()
+            index = next_index
@@ -0,0 +1,287 @@
+"""Concurrent execution of many resource method calls."""
+
+import asyncio
+import collections
+import contextvars
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Union
+
+from a7.errors import DeadlineExceededError
+from a7.timeouts import Deadline, activated, earlier
+
+# A resource method, as 'resource.method' or a bound method, and its keyword arguments
+BatchCall = tuple[Union[str, Callable[..., Any]], Mapping[str, Any]]
+
+# Calls submitted ahead of the results consumed, per worker
+_WINDOW_PER_WORKER = 4
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of one call of a batch.
+
+    Attributes:
+        index: Position of the call in the batch
+        method: Resource method, e.g. 'eobi.get_securities'
+        kwargs: Keyword arguments the method was called with
+        value: Return value, or None if the call failed
+        error: Exception raised by the call, or None if it succeeded
+    """
+
+    index: int
+    method: str
+    kwargs: Mapping[str, Any] = field(repr=False)
+    value: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
+
+    def unwrap(self) -> Any:
+        """
+        Return the value, or raise the call's exception.
+
+        Raises:
+            Exception: The exception raised by the call
+        """
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def _method_name(method: Callable[..., Any]) -> str:
+    """'resource.method' name of a bound resource method, else its qualified name."""
+    module = type(getattr(method, "__self__", None)).__module__
+    name = getattr(method, "__name__", None)
+    if module.startswith("a7.resources.") and name is not None:
+        # Resource modules are named after the client attribute serving them
+        return f"{module.rpartition('.')[2]}.{name}"
+    return getattr(method, "__qualname__", repr(method))
+
+
+def _resolve(client: Any, method: Union[str, Callable[..., Any]]) -> tuple[str, Callable[..., Any]]:
+    """Look up a 'resource.method' name on a client, or name a bound method."""
+    if callable(method):
+        return _method_name(method), method
+    resource, _, name = method.partition(".")
+    target = getattr(client, resource, None) if resource and not resource.startswith("_") else None
+    function = getattr(target, name, None) if name and not name.startswith("_") else None
+    if target is None or not callable(function):
+        raise ValueError(f"Unknown resource method: {method!r}")
+    return method, function
+
+
+def _run(
+    index: int,
+    name: str,
+    function: Callable[..., Any],
+    kwargs: dict[str, Any],
+    deadline: Optional[Deadline],
+) -> BatchResult:
+    try:
+        with activated(deadline):
+            return BatchResult(index, name, kwargs, value=function(**kwargs))
+    except Exception as error:
+        return BatchResult(index, name, kwargs, error=error)
+
+
+async def _arun(
+    index: int,
+    name: str,
+    function: Callable[..., Any],
+    kwargs: dict[str, Any],
+    *,
+    semaphore: asyncio.Semaphore,
+    deadline: Optional[Deadline],
+) -> BatchResult:
+    async with semaphore:
+        try:
+            with activated(deadline):
+                return BatchResult(index, name, kwargs, value=await function(**kwargs))
+        except Exception as error:
+            return BatchResult(index, name, kwargs, error=error)
+
+
+def _check_concurrency(max_concurrency: int) -> None:
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+
+def run_batch(
+    client: Any,
+    calls: Iterable[BatchCall],
+    *,
+    max_concurrency: int,
+    ordered: bool,
+    deadline: Optional[Deadline] = None,
+) -> Iterator[BatchResult]:
+    """
+    Run calls on a thread pool and yield their results.
+
+    Calls are taken from ``calls`` lazily, at most a few per worker ahead of
+    the results consumed, so a long generator of calls never builds up in
+    memory. Stopping the iteration early cancels the calls not started yet.
+    Once the deadline passes, calls not started yet are not sent; each
+    fails with DeadlineExceededError in its result.
+    Each call runs in a copy of the caller's context, so a request priority
+    set around the batch applies to its calls. A call to an unknown
+    resource method fails on its own, like any other call.
+
+    Args:
+        client: A7Client whose resources the calls are looked up on
+        calls: (resource_method, kwargs) pairs
+        max_concurrency: Number of calls in flight at once
+        ordered: Yield results in call order; otherwise as they complete
+        deadline: Time budget for the batch (default: the active Deadline,
+                  if any); an earlier active Deadline stays in force
+
+    Returns:
+        Iterator of BatchResult, one per call
+
+    Raises:
+        ValueError: If max_concurrency is below 1
+    """
+    _check_concurrency(max_concurrency)
+    return _iter_batch(
+        client, calls, max_concurrency, ordered, earlier(deadline, Deadline.current())
+    )
+
+
+def _iter_batch(
+    client: Any,
+    calls: Iterable[BatchCall],
+    max_concurrency: int,
+    ordered: bool,
+    deadline: Optional[Deadline],
+) -> Iterator[BatchResult]:
+    window = max_concurrency * _WINDOW_PER_WORKER
+    pending = enumerate(calls)
+    queued: collections.deque[Future[BatchResult]] = collections.deque()
+    running: set[Future[BatchResult]] = set()
+    pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="a7-batch")
+
+    def submit() -> None:
+        for index, (method, kwargs) in pending:
+            name = str(method)
+            try:
+                name, function = _resolve(client, method)
+                if deadline is not None:
+                    deadline.check()
+            except (ValueError, DeadlineExceededError) as error:
+                future: Future[BatchResult] = Future()
+                future.set_result(BatchResult(index, name, dict(kwargs), error=error))
+            else:
+                context = contextvars.copy_context()
+                future = pool.submit(
+                    context.run, _run, index, name, function, dict(kwargs), deadline
+                )
+            if ordered:
+                queued.append(future)
+            else:
+                running.add(future)
+            if len(queued) + len(running) >= window:
+                return
+
+    try:
+        submit()
+        while queued or running:
+            if ordered:
+                yield queued.popleft().result()
+            else:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            submit()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def arun_batch(
+    client: Any,
+    calls: Iterable[BatchCall],
+    *,
+    max_concurrency: int,
+    ordered: bool,
+    deadline: Optional[Deadline] = None,
+) -> AsyncIterator[BatchResult]:
+    """
+    Run calls as asyncio tasks and yield their results.
+
+    The asyncio counterpart of :func:`run_batch`: at most ``max_concurrency``
+    calls await a response at once, and closing the iterator early cancels
+    the calls still pending.
+
+    Args:
+        client: AsyncA7Client whose resources the calls are looked up on
+        calls: (resource_method, kwargs) pairs
+        max_concurrency: Number of calls in flight at once
+        ordered: Yield results in call order; otherwise as they complete
+        deadline: Time budget for the batch (default: the active Deadline,
+                  if any); an earlier active Deadline stays in force
+
+    Returns:
+        Async iterator of BatchResult, one per call
+
+    Raises:
+        ValueError: If max_concurrency is below 1
+    """
+    _check_concurrency(max_concurrency)
+    return _aiter_batch(
+        client, calls, max_concurrency, ordered, earlier(deadline, Deadline.current())
+    )
+
+
+async def _aiter_batch(
+    client: Any,
+    calls: Iterable[BatchCall],
+    max_concurrency: int,
+    ordered: bool,
+    deadline: Optional[Deadline],
+) -> AsyncIterator[BatchResult]:
+    window = max_concurrency * _WINDOW_PER_WORKER
+    semaphore = asyncio.Semaphore(max_concurrency)
+    pending = enumerate(calls)
+    queued: collections.deque[asyncio.Future[BatchResult]] = collections.deque()
+    running: set[asyncio.Future[BatchResult]] = set()
+
+    def submit() -> None:
+        for index, (method, kwargs) in pending:
+            name = str(method)
+            try:
+                name, function = _resolve(client, method)
+                if deadline is not None:
+                    deadline.check()
+            except (ValueError, DeadlineExceededError) as error:
+                task = asyncio.get_running_loop().create_future()
+                task.set_result(BatchResult(index, name, dict(kwargs), error=error))
+            else:
+                task = asyncio.ensure_future(
+                    _arun(
+                        index, name, function, dict(kwargs), semaphore=semaphore, deadline=deadline
+                    )
+                )
+            if ordered:
+                queued.append(task)
+            else:
+                running.add(task)
+            if len(queued) + len(running) >= window:
+                return
+
+    try:
+        submit()
+        while queued or running:
+            if ordered:
+                yield await queued.popleft()
+            else:
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+            submit()
+    finally:
+        for task in (*queued, *running):
+            task.cancel()
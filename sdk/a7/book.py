@@ -0,0 +1,418 @@
+"""Local reconstruction of T7 order books from EOBI messages."""
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from itertools import zip_longest
+from typing import Any, Optional
+
+# EOBI template IDs that change the order book
+ORDER_ADD = 13100
+ORDER_MODIFY = 13101
+ORDER_DELETE = 13102
+ORDER_MASS_DELETE = 13103
+FULL_ORDER_EXECUTION = 13104
+PARTIAL_ORDER_EXECUTION = 13105
+ORDER_MODIFY_SAME_PRIORITY = 13106
+INSTRUMENT_SUMMARY = 13601
+SNAPSHOT_ORDER = 13602
+
+# EOBI Side values
+BUY = 1
+SELL = 2
+
+
+class _Side:
+    """
+    Price levels and resting orders of one side of a book.
+
+    Level prices are kept in ascending order in one int64 array with the
+    level quantities in a parallel array; each level holds its orders as
+    parallel arrays of time priorities (ascending) and display quantities.
+    """
+
+    __slots__ = ("levels", "prices", "quantities")
+
+    def __init__(self) -> None:
+        self.prices = array("q")
+        self.quantities = array("q")
+        self.levels: dict[int, tuple[array[int], array[int]]] = {}
+
+    def clear(self) -> None:
+        self.prices = array("q")
+        self.quantities = array("q")
+        self.levels.clear()
+
+    def add(self, price: int, priority: int, qty: int) -> None:
+        level = self.levels.get(price)
+        if level is None:
+            index = bisect_left(self.prices, price)
+            self.prices.insert(index, price)
+            self.quantities.insert(index, 0)
+            level = self.levels[price] = (array("q"), array("q"))
+        priorities, qtys = level
+        position = bisect_left(priorities, priority)
+        priorities.insert(position, priority)
+        qtys.insert(position, qty)
+        self.quantities[bisect_left(self.prices, price)] += qty
+
+    def qty(self, price: int, priority: int) -> Optional[int]:
+        """Display quantity of an order, or None if it is not in the book."""
+        level = self.levels.get(price)
+        if level is None:
+            return None
+        priorities, qtys = level
+        position = bisect_left(priorities, priority)
+        if position == len(priorities) or priorities[position] != priority:
+            return None
+        return qtys[position]
+
+    def update(self, price: int, priority: int, qty: int) -> bool:
+        """Set an order's display quantity, removing it at 0; False if it is not in the book."""
+        level = self.levels.get(price)
+        if level is None:
+            return False
+        priorities, qtys = level
+        position = bisect_left(priorities, priority)
+        if position == len(priorities) or priorities[position] != priority:
+            return False
+        index = bisect_left(self.prices, price)
+        self.quantities[index] += qty - qtys[position]
+        if qty > 0:
+            qtys[position] = qty
+            return True
+        del priorities[position]
+        del qtys[position]
+        if not priorities:
+            del self.levels[price]
+            del self.prices[index]
+            del self.quantities[index]
+        return True
+
+    def snapshot(
+        self, best_first: Iterable[int], levels: int, complete: bool
+    ) -> list[dict[str, Any]]:
+        result = []
+        for index in best_first:
+            if len(result) == levels:
+                break
+            price = self.prices[index]
+            priorities, qtys = self.levels[price]
+            level: dict[str, Any] = {
+                "Price": str(price),
+                "Quantity": str(self.quantities[index]),
+                "OrderCount": len(priorities),
+            }
+            if complete:
+                level["Orders"] = [
+                    {"TrdRegTSTimePriority": str(priority), "DisplayQty": qty}
+                    for priority, qty in zip(priorities, qtys)
+                ]
+            result.append(level)
+        return result
+
+
+class OrderBook:
+    """
+    T7 order book of one security, built locally from its EOBI messages.
+
+    Apply the messages of a security in sequence order, e.g. from
+    :meth:`EOBIResource.iter_messages`, starting at the beginning of the
+    trading day (or at a snapshot cycle); the book then holds every resting
+    order and can be read at any point without a round trip to
+    ``orderbook.get_t7``. Orders are identified by side, price and time
+    priority, as in EOBI, and stored in int64 arrays per price level, so a
+    deep book costs a few bytes per order instead of a dict each.
+
+    Handles order add (13100), modify (13101, 13106), delete (13102), mass
+    delete (13103), full and partial execution (13104, 13105) and snapshot
+    cycles (13601, 13602); other templates are ignored. Messages referring
+    to an order not in the book, e.g. when the stream starts mid-day, are
+    counted in ``unmatched`` and skipped.
+
+    Example:
+        >>> book = OrderBook(security_id=2504978)
+        >>> for message in client.eobi.iter_messages("XETR", 20230804, 52885, 2504978):
+        ...     book.apply(message)
+        >>> book.best_bid()
+        (2405000000, 1500000)
+    """
+
+    def __init__(self, security_id: Optional[int] = None) -> None:
+        """
+        Initialize an empty order book.
+
+        Args:
+            security_id: Only apply messages of this security (default: the
+                         security of the first message that names one)
+        """
+        self.security_id = security_id
+        self.transact_time: Optional[int] = None
+        self.messages = 0
+        self.unmatched = 0
+        self._sides = {BUY: _Side(), SELL: _Side()}
+
+    def clear(self) -> None:
+        """Remove all resting orders."""
+        for side in self._sides.values():
+            side.clear()
+
+    def _remove(self, side: int, price: Any, priority: Any) -> None:
+        if not self._sides[side].update(int(price), int(priority), 0):
+            self.unmatched += 1
+
+    def _accepts(self, security_id: Optional[int]) -> bool:
+        if self.security_id is None:
+            self.security_id = security_id
+        return security_id in (None, self.security_id)
+
+    def apply(self, message: dict[str, Any]) -> None:
+        """
+        Update the book with an EOBI message.
+
+        Args:
+            message: EOBI message as returned in detailed mode
+        """
+        if not self._accepts(message.get("SecurityID")):
+            return
+        template = message["MessageHeader"]["TemplateID"]
+        details = message.get("OrderDetails", message)
+        if template in (ORDER_ADD, SNAPSHOT_ORDER):
+            self._sides[details["Side"]].add(
+                int(details["Price"]),
+                int(details["TrdRegTSTimePriority"]),
+                int(details["DisplayQty"]),
+            )
+        elif template == ORDER_MODIFY:
+            self._remove(details["Side"], message["PrevPrice"], message["TrdRegTSPrevTimePriority"])
+            self._sides[details["Side"]].add(
+                int(details["Price"]),
+                int(details["TrdRegTSTimePriority"]),
+                int(details["DisplayQty"]),
+            )
+        elif template == ORDER_MODIFY_SAME_PRIORITY:
+            side = self._sides[details["Side"]]
+            if not side.update(
+                int(details["Price"]),
+                int(details["TrdRegTSTimePriority"]),
+                int(details["DisplayQty"]),
+            ):
+                self.unmatched += 1
+        elif template in (ORDER_DELETE, FULL_ORDER_EXECUTION):
+            self._remove(details["Side"], details["Price"], details["TrdRegTSTimePriority"])
+        elif template == PARTIAL_ORDER_EXECUTION:
+            side, price = self._sides[details["Side"]], int(details["Price"])
+            priority = int(details["TrdRegTSTimePriority"])
+            qty = side.qty(price, priority)
+            if qty is None:
+                self.unmatched += 1
+            else:
+                side.update(price, priority, max(qty - int(details["LastQty"]), 0))
+        elif template in (ORDER_MASS_DELETE, INSTRUMENT_SUMMARY):
+            self.clear()
+        else:
+            return
+        self.messages += 1
+        if "TransactTime" in message:
+            self.transact_time = int(message["TransactTime"])
+
+    def best_bid(self) -> Optional[tuple[int, int]]:
+        """Highest bid price and its quantity, or None if there are no bids."""
+        side = self._sides[BUY]
+        return (side.prices[-1], side.quantities[-1]) if side.prices else None
+
+    def best_ask(self) -> Optional[tuple[int, int]]:
+        """Lowest ask price and its quantity, or None if there are no asks."""
+        side = self._sides[SELL]
+        return (side.prices[0], side.quantities[0]) if side.prices else None
+
+    def snapshot(self, levels: int = 10, *, complete: bool = False) -> dict[str, Any]:
+        """
+        Get the current book in the format of ``orderbook.get_t7``.
+
+        Args:
+            levels: Price levels per side (default: 10)
+            complete: Include the orders of each level (default: aggregated levels only)
+
+        Returns:
+            Dict with 'SecurityId', 'Timestamp' (TransactTime of the last
+            message applied) and 'Buy'/'Sell' levels, best price first
+        """
+        bids, asks = self._sides[BUY], self._sides[SELL]
+        return {
+            "SecurityId": self.security_id,
+            "Timestamp": str(self.transact_time) if self.transact_time is not None else None,
+            "Buy": bids.snapshot(reversed(range(len(bids.prices))), levels, complete),
+            "Sell": asks.snapshot(range(len(asks.prices)), levels, complete),
+        }
+
+
+def replay(
+    messages: Iterable[dict[str, Any]],
+    *,
+    book: Optional[OrderBook] = None,
+    interval: Optional[int] = None,
+    at: Optional[Iterable[int]] = None,
+    levels: int = 10,
+    complete: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """
+    Build a book from EOBI messages and yield snapshots along the way.
+
+    A snapshot taken at time T is the book after every packet with a
+    TransactTime at or before T, as ``orderbook.get_t7`` returns it for
+    ``from_time=T``. Without ``interval`` or ``at``, a snapshot is taken
+    after every packet; with ``interval``, the book at the end of the
+    messages is yielded last. Times before the first packet are skipped.
+
+    Args:
+        messages: EOBI messages in sequence order, each with its packet's
+                  TransactTime, as :meth:`EOBIResource.iter_messages` yields them
+        book: Book to update (default: a new, empty one)
+        interval: Take a snapshot every this many nanoseconds after the
+                  first packet (optional)
+        at: Ascending times to take snapshots at, in nanoseconds (optional)
+        levels: Price levels per side (default: 10)
+        complete: Include the orders of each level (default: aggregated levels only)
+
+    Yields:
+        Snapshots in the format of :meth:`OrderBook.snapshot`
+
+    Raises:
+        ValueError: If both interval and at are given, or interval is below 1
+
+    Example:
+        >>> messages = client.eobi.iter_messages("XETR", 20230804, 52885, 2504978)
+        >>> for snapshot in replay(messages, interval=60 * 10**9):
+        ...     print(snapshot["Timestamp"], snapshot["Buy"][:1], snapshot["Sell"][:1])
+    """
+    if interval is not None and at is not None:
+        raise ValueError("Pass either interval or at, not both")
+    if interval is not None and interval < 1:
+        raise ValueError("interval must be at least 1")
+    book = book if book is not None else OrderBook()
+    times = iter(at) if at is not None else None
+    boundary = next(times, None) if times is not None else None
+    every_packet = interval is None and times is None
+
+    def advance(current: int) -> Optional[int]:
+        if interval is not None:
+            return current + interval
+        return next(times, None) if times is not None else None
+
+    for message in messages:
+        transact_time = int(message["TransactTime"])
+        if book.transact_time is None:
+            # Times before the first packet have no book yet
+            if interval is not None:
+                boundary = transact_time + interval
+            while boundary is not None and boundary < transact_time:
+                boundary = advance(boundary)
+        elif transact_time != book.transact_time:
+            if every_packet:
+                yield book.snapshot(levels, complete=complete)
+            while boundary is not None and boundary < transact_time:
+                yield book.snapshot(levels, complete=complete)
+                boundary = advance(boundary)
+        book.apply(message)
+
+    if book.transact_time is None:
+        return
+    if times is None:
+        yield book.snapshot(levels, complete=complete)
+        return
+    while boundary is not None:
+        yield book.snapshot(levels, complete=complete)
+        boundary = next(times, None)
+
+
+def compare_books(local: dict[str, Any], remote: dict[str, Any]) -> list[str]:
+    """
+    List the differences between two order books in the ``orderbook.get_t7`` format.
+
+    Compares the timestamp and, per side, the price, quantity and order
+    count of each level, and the orders of each level if both books have
+    them. Prices and quantities compare equal as strings or numbers.
+
+    Args:
+        local: Book built locally, e.g. by :meth:`OrderBook.snapshot`
+        remote: Book returned by ``orderbook.get_t7``
+
+    Returns:
+        One line per difference; empty if the books match
+    """
+    differences = []
+    if local.get("Timestamp") != remote.get("Timestamp"):
+        differences.append(f"Timestamp: {local.get('Timestamp')} != {remote.get('Timestamp')}")
+    for side in ("Buy", "Sell"):
+        pairs = zip_longest(local.get(side, []), remote.get(side, []))
+        for depth, (ours, theirs) in enumerate(pairs):
+            if ours is None or theirs is None:
+                differences.append(f"{side} level {depth}: {ours} != {theirs}")
+                continue
+            for key in ("Price", "Quantity", "OrderCount"):
+                if int(ours[key]) != int(theirs[key]):
+                    differences.append(f"{side} level {depth} {key}: {ours[key]} != {theirs[key]}")
+            if "Orders" in ours and "Orders" in theirs:
+                ours_orders = [
+                    (int(o["TrdRegTSTimePriority"]), int(o["DisplayQty"])) for o in ours["Orders"]
+                ]
+                theirs_orders = [
+                    (int(o["TrdRegTSTimePriority"]), int(o["DisplayQty"])) for o in theirs["Orders"]
+                ]
+                if ours_orders != theirs_orders:
+                    differences.append(f"{side} level {depth} Orders differ")
+    return differences
+
+
+def check_against_t7(
+    client: Any,
+    market_id: str,
+    date: int,
+    market_segment_id: int,
+    snapshot: dict[str, Any],
+    *,
+    security_id: Optional[int] = None,
+    levels: int = 10,
+) -> list[str]:
+    """
+    Compare a local snapshot with the book ``orderbook.get_t7`` returns for its time.
+
+    Args:
+        client: A7Client to fetch the reference book with
+        market_id: Market identifier (e.g., 'XEUR', 'XETR')
+        date: Trading day in YYYYMMDD format
+        market_segment_id: Market segment ID
+        snapshot: Snapshot from :meth:`OrderBook.snapshot`
+        security_id: Security to fetch (default: the snapshot's SecurityId)
+        levels: Price levels per side the snapshot was taken with (default: 10)
+
+    Returns:
+        One line per difference (see :func:`compare_books`); empty if the books match
+
+    Raises:
+        ValueError: If neither security_id nor the snapshot names a security
+
+    Example:
+        >>> for snapshot in replay(messages, interval=3600 * 10**9):
+        ...     assert not check_against_t7(client, "XETR", 20230804, 52885, snapshot)
+    """
+    if security_id is None:
+        security_id = snapshot.get("SecurityId")
+    if security_id is None:
+        raise ValueError("Snapshot has no SecurityId; pass security_id")
+    complete = any("Orders" in level for level in (*snapshot["Buy"], *snapshot["Sell"]))
+    remote = client.orderbook.get_t7(
+        market_id,
+        date,
+        market_segment_id,
+        security_id,
+        from_time=snapshot["Timestamp"],
+        limit=1,
+        levels=levels,
+        orderbook="complete" if complete else "aggregated",
+    )
+    if isinstance(remote, list):
+        # A single book may still come back wrapped in a list
+        remote = remote[0] if remote else {}
+    return compare_books(snapshot, remote)
@@ -0,0 +1,289 @@
+"""Circuit breaker per endpoint family."""
+
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from typing import Optional
+
+import httpx
+
+from a7.config import (
+    DEFAULT_BREAKER_FAILURE_THRESHOLD,
+    DEFAULT_BREAKER_HALF_OPEN_PROBES,
+    DEFAULT_BREAKER_RESET_TIMEOUT,
+)
+from a7.endpoints import endpoint_family
+from a7.errors import CircuitOpenError
+from a7.transport import AnyTransport, TransportWrapper
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Server errors that indicate a degraded backend (429 is pacing, not failure)
+FAILURE_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+
+class _Circuit:
+    """State of one endpoint family."""
+
+    def __init__(self, generation: int) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        # Changes with every state transition; outcomes of requests let
+        # through under an earlier generation are ignored
+        self.generation = generation
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker keyed by endpoint family (``/v1/eobi``, ``/v1/ob``, ...).
+
+    Each family starts closed. After ``failure_threshold`` consecutive
+    failures (server errors, transport errors and timeouts, and responses
+    slower than ``latency_threshold``) it opens: requests to that family
+    fail immediately with :class:`~a7.errors.CircuitOpenError` instead of
+    tying up workers, while other families are unaffected. After
+    ``reset_timeout`` seconds the circuit is half-open and lets up to
+    ``half_open_probes`` requests through; a successful probe closes it, a
+    failed one opens it again for another ``reset_timeout``. Outcomes of
+    requests let through before the circuit last changed state, e.g. late
+    failures while it is open, are ignored.
+
+    One breaker can be shared by several clients.
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60, latency_threshold=10)
+        >>> client = A7Client(token="...", circuit_breaker=breaker)
+        >>> breaker.state("/v1/simulation/auction")
+        'closed'
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_BREAKER_RESET_TIMEOUT,
+        *,
+        half_open_probes: int = DEFAULT_BREAKER_HALF_OPEN_PROBES,
+        latency_threshold: Optional[float] = None,
+        failure_statuses: Iterable[int] = FAILURE_STATUS_CODES,
+    ) -> None:
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit (default: 5)
+            reset_timeout: Seconds a circuit stays open before probing (default: 30.0)
+            half_open_probes: Requests let through while half-open (default: 1)
+            latency_threshold: Seconds after which a successful response still
+                               counts as a failure (default: no latency limit)
+            failure_statuses: Response statuses counted as failures
+                              (default: 500, 502, 503, 504)
+
+        Raises:
+            ValueError: If a threshold, timeout or probe count is not positive
+        """
+        if failure_threshold < 1 or half_open_probes < 1:
+            raise ValueError("failure_threshold and half_open_probes must be at least 1")
+        if reset_timeout <= 0 or (latency_threshold is not None and latency_threshold <= 0):
+            raise ValueError("reset_timeout and latency_threshold must be positive")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = float(reset_timeout)
+        self.half_open_probes = half_open_probes
+        self.latency_threshold = latency_threshold
+        self.failure_statuses = frozenset(failure_statuses)
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+        self._generations = itertools.count()
+
+    def _circuit(self, family: str) -> _Circuit:
+        circuit = self._circuits.get(family)
+        if circuit is None:
+            circuit = self._circuits[family] = _Circuit(next(self._generations))
+        return circuit
+
+    def _transition(self, circuit: _Circuit, state: str) -> None:
+        circuit.state = state
+        circuit.generation = next(self._generations)
+
+    def _refresh(self, circuit: _Circuit, now: float) -> None:
+        if circuit.state == OPEN and now - circuit.opened_at >= self.reset_timeout:
+            self._transition(circuit, HALF_OPEN)
+            circuit.probes = 0
+
+    def state(self, family: str) -> str:
+        """
+        Get the state of an endpoint family's circuit.
+
+        Args:
+            family: Endpoint family, e.g. '/v1/ob'
+
+        Returns:
+            'closed', 'open' or 'half_open'
+        """
+        with self._lock:
+            circuit = self._circuits.get(family)
+            if circuit is None:
+                return CLOSED
+            self._refresh(circuit, time.monotonic())
+            return circuit.state
+
+    def before_request(self, family: str) -> int:
+        """
+        Let a request through or fail it fast.
+
+        Args:
+            family: Endpoint family of the request
+
+        Returns:
+            Generation of the circuit the request was let through under, to
+            pass to :meth:`record` or :meth:`release`
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all
+                              probes already in flight
+        """
+        with self._lock:
+            circuit = self._circuit(family)
+            now = time.monotonic()
+            self._refresh(circuit, now)
+            if circuit.state == CLOSED:
+                return circuit.generation
+            if circuit.state == HALF_OPEN and circuit.probes < self.half_open_probes:
+                circuit.probes += 1
+                return circuit.generation
+            retry_after = max(0.0, circuit.opened_at + self.reset_timeout - now)
+        raise CircuitOpenError(family, retry_after)
+
+    def record(self, family: str, success: bool, generation: int) -> None:
+        """
+        Record the outcome of a request that was let through.
+
+        Args:
+            family: Endpoint family of the request
+            success: Whether the request succeeded in time
+            generation: Value :meth:`before_request` returned for the request;
+                        the outcome is ignored if the circuit changed state since
+        """
+        with self._lock:
+            circuit = self._circuits.get(family)
+            if circuit is None or circuit.generation != generation:
+                return
+            if success:
+                if circuit.state != CLOSED:
+                    logger.info("Circuit for %s closed", family)
+                    self._transition(circuit, CLOSED)
+                circuit.failures = 0
+                return
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                logger.warning(
+                    "Circuit for %s opened after %d consecutive failures",
+                    family,
+                    circuit.failures,
+                )
+                self._transition(circuit, OPEN)
+                circuit.opened_at = time.monotonic()
+
+    def release(self, family: str, generation: int) -> None:
+        """
+        Give back a half-open probe whose request ended without an outcome.
+
+        Args:
+            family: Endpoint family of the request, e.g. after it was cancelled
+            generation: Value :meth:`before_request` returned for the request
+        """
+        with self._lock:
+            circuit = self._circuits.get(family)
+            if (
+                circuit is not None
+                and circuit.generation == generation
+                and circuit.state == HALF_OPEN
+                and circuit.probes > 0
+            ):
+                circuit.probes -= 1
+
+    def is_failure(self, response: Optional[httpx.Response], elapsed: float) -> bool:
+        """
+        Check whether a request outcome counts as a failure.
+
+        Args:
+            response: Response, or None if the transport raised an error
+            elapsed: Seconds until the response (or error) arrived
+
+        Returns:
+            True for transport errors, failure statuses and slow responses
+        """
+        if response is None or response.status_code in self.failure_statuses:
+            return True
+        return self.latency_threshold is not None and elapsed > self.latency_threshold
+
+    def reset(self, family: Optional[str] = None) -> None:
+        """
+        Close circuits and forget their failures.
+
+        Args:
+            family: Endpoint family to reset (default: all)
+        """
+        with self._lock:
+            if family is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(family, None)
+
+
+class CircuitBreakerTransport(TransportWrapper):
+    """Transport wrapper that guards every request with a CircuitBreaker."""
+
+    def __init__(self, transport: AnyTransport, breaker: CircuitBreaker) -> None:
+        """
+        Initialize circuit-breaker transport.
+
+        Args:
+            transport: Transport that actually sends the requests
+            breaker: Shared circuit breaker
+        """
+        super().__init__(transport)
+        self._breaker = breaker
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request unless its family's circuit is open."""
+        family = endpoint_family(request.url.path)
+        generation = self._breaker.before_request(family)
+        start = time.monotonic()
+        try:
+            response = self._send(request)
+        except httpx.TransportError:
+            self._breaker.record(family, False, generation)
+            raise
+        except BaseException:
+            self._breaker.release(family, generation)
+            raise
+        elapsed = time.monotonic() - start
+        success = not self._breaker.is_failure(response, elapsed)
+        self._breaker.record(family, success, generation)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request unless its family's circuit is open."""
+        family = endpoint_family(request.url.path)
+        generation = self._breaker.before_request(family)
+        start = time.monotonic()
+        try:
+            response = await self._asend(request)
+        except httpx.TransportError:
+            self._breaker.record(family, False, generation)
+            raise
+        except BaseException:
+            self._breaker.release(family, generation)
+            raise
+        elapsed = time.monotonic() - start
+        success = not self._breaker.is_failure(response, elapsed)
+        self._breaker.record(family, success, generation)
+        return response
@@ -0,0 +1,490 @@
+"""Response caching for A7 requests."""
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+
+import httpx
+
+from a7.config import (
+    DEFAULT_DISCOVERY_CACHE_MAX_ENTRIES,
+    DEFAULT_DISCOVERY_CACHE_TTL,
+    DEFAULT_DISK_CACHE_MAX_SIZE,
+)
+from a7.endpoints import match_route
+from a7.transport import AnyTransport, TransportWrapper
+
+# Resource methods whose responses for a past trading day never change
+HISTORICAL_ROUTES = frozenset(
+    {
+        "eobi.get_market_segments",
+        "eobi.get_securities",
+        "eobi.get_transact_times",
+        "eobi.get_applseq_nums",
+        "eobi.get_msg_seq_nums",
+        "eobi.get_message",
+        "orderbook.get_t7",
+        "orderbook.get_cme",
+        "mdp.get_assets",
+        "mdp.get_securities",
+        "mdp.get_sending_times",
+        "mdp.get_message",
+        "rdi.get_market_segments",
+        "rdi.get_security_details",
+        "rdi.get_instrument_snapshot",
+    }
+)
+
+# Discovery listings that are re-requested constantly inside crawl loops
+DISCOVERY_ROUTES = frozenset(
+    {
+        "eobi.get_markets",
+        "eobi.get_dates",
+        "eobi.get_market_segments",
+        "eobi.get_securities",
+        "mdp.get_exchanges",
+        "mdp.get_dates",
+        "mdp.get_assets",
+        "mdp.get_securities",
+        "sd.get_exchanges",
+        "sd.get_dates",
+        "sd.get_assets",
+        "sd.get_securities",
+        "sd.get_all_security_details",
+        "sd.get_security_details",
+        "auction.get_exchanges",
+        "auction.get_dates",
+        "precalc.get_dates",
+    }
+)
+
+CACHE_STATUS_HEADER = "X-A7-Cache"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    content_type TEXT,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE TABLE IF NOT EXISTS stats (total INTEGER NOT NULL);
+INSERT INTO stats (total) SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM stats);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries
+BEGIN UPDATE stats SET total = total + NEW.size; END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries
+BEGIN UPDATE stats SET total = total - OLD.size; END;
+"""
+
+
+def _today() -> int:
+    """Get today's date (UTC) in YYYYMMDD format."""
+    return int(datetime.now(timezone.utc).strftime("%Y%m%d"))
+
+
+def cache_key(request: httpx.Request) -> str:
+    """
+    Build a cache key from the normalized request URL.
+
+    Query parameters are sorted so that the same call always maps to the same
+    key regardless of argument order.
+
+    Args:
+        request: Outgoing request
+
+    Returns:
+        Hex digest identifying the request
+    """
+    url = request.url
+    query = "&".join(f"{key}={value}" for key, value in sorted(url.params.multi_items()))
+    normalized = f"{request.method} {url.scheme}://{url.host}:{url.port}{url.path}?{query}"
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+class DiskCache:
+    """
+    Persistent, size-capped cache for immutable historical responses.
+
+    Responses are stored zlib-compressed in a SQLite database and evicted in
+    least-recently-used order once the cache grows beyond ``max_size`` bytes
+    (compressed). Only GET requests of the configured resource methods are
+    cached, and only when their ``date`` lies strictly in the past, so data
+    for the current trading day is always fetched fresh.
+
+    The database may be shared by several processes. Entries are keyed by URL
+    and query only, so do not share one cache between tokens with different
+    entitlements.
+
+    Example:
+        >>> client = A7Client(token="...", cache=DiskCache("~/.cache/a7"))
+    """
+
+    def __init__(
+        self,
+        path: "str | os.PathLike[str]",
+        max_size: int = DEFAULT_DISK_CACHE_MAX_SIZE,
+        routes: Iterable[str] = HISTORICAL_ROUTES,
+        compression_level: int = 6,
+    ) -> None:
+        """
+        Initialize disk cache.
+
+        Args:
+            path: Cache directory (created if missing)
+            max_size: Maximum total size of stored bodies in bytes (default: 1 GiB)
+            routes: Resource methods to cache, e.g. 'eobi.get_message'
+                    (default: HISTORICAL_ROUTES)
+            compression_level: zlib compression level 0-9 (default: 6)
+        """
+        self.directory = Path(path).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.routes = frozenset(routes)
+        self.compression_level = compression_level
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        # SQLite connections must not be shared with forked children
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(
+                self.directory / "responses.sqlite3",
+                check_same_thread=False,
+                isolation_level=None,
+                timeout=30.0,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def is_cacheable(self, request: httpx.Request) -> bool:
+        """
+        Check whether a request falls under the cache rules.
+
+        Args:
+            request: Outgoing request
+
+        Returns:
+            True for GETs of a cached resource method with a past ``date``;
+            False if the date is not a number
+        """
+        if request.method != "GET":
+            return False
+        match = match_route(request)
+        if match is None or match.route.name not in self.routes:
+            return False
+        date = match.params.get("date")
+        return date is not None and date.isdecimal() and int(date) < _today()
+
+    def get(self, request: httpx.Request) -> Optional[httpx.Response]:
+        """
+        Look up a cached response.
+
+        Args:
+            request: Outgoing request
+
+        Returns:
+            Reconstructed response, or None on a cache miss
+        """
+        key = cache_key(request)
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT status, content_type, body FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        status, content_type, body = row
+        headers = {CACHE_STATUS_HEADER: "HIT"}
+        if content_type:
+            headers["Content-Type"] = content_type
+        return httpx.Response(
+            status, headers=headers, content=zlib.decompress(body), request=request
+        )
+
+    def set(self, request: httpx.Request, response: httpx.Response) -> None:
+        """
+        Store a response whose body has already been read.
+
+        Args:
+            request: Request the response belongs to
+            response: Successful response
+        """
+        body = zlib.compress(response.content, self.compression_level)
+        if len(body) > self.max_size:
+            return
+        key = cache_key(request)
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                connection.execute(
+                    "INSERT INTO entries (key, status, content_type, body, size, accessed)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        response.status_code,
+                        response.headers.get("Content-Type"),
+                        body,
+                        len(body),
+                        time.time(),
+                    ),
+                )
+                self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Drop least recently used entries until the cache fits max_size."""
+        excess = connection.execute("SELECT total FROM stats").fetchone()[0] - self.max_size
+        if excess <= 0:
+            return
+        connection.execute(
+            "DELETE FROM entries WHERE key IN ("
+            " SELECT key FROM ("
+            "  SELECT key, size, SUM(size) OVER (ORDER BY accessed, key) AS running"
+            "  FROM entries"
+            " ) WHERE running - size < ?"
+            ")",
+            (excess,),
+        )
+
+    @property
+    def size(self) -> int:
+        """Total size of stored (compressed) bodies in bytes."""
+        with self._lock:
+            return self._connect().execute("SELECT total FROM stats").fetchone()[0]
+
+    def __len__(self) -> int:
+        """Number of cached responses."""
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._connect().execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+
+class _MemoryEntry(NamedTuple):
+    expires: float
+    route: str
+    params: dict[str, str]
+    status: int
+    content_type: Optional[str]
+    content: bytes
+
+
+class MemoryCache:
+    """
+    Per-client in-memory TTL/LRU cache for discovery listings.
+
+    Markets, dates, segments and securities are re-listed constantly inside
+    crawl loops; this cache answers repeats without a round trip. Entries
+    expire after ``ttl`` seconds and the least recently used entry is dropped
+    once ``max_entries`` is reached. Thread-safe.
+
+    Example:
+        >>> discovery = MemoryCache(ttl=600)
+        >>> client = A7Client(token="...", discovery_cache=discovery)
+        >>> client.eobi.get_dates("XEUR")  # network
+        >>> client.eobi.get_dates("XEUR")  # cached
+        >>> discovery.invalidate("eobi.get_dates", market_id="XEUR")
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_DISCOVERY_CACHE_TTL,
+        max_entries: int = DEFAULT_DISCOVERY_CACHE_MAX_ENTRIES,
+        routes: Iterable[str] = DISCOVERY_ROUTES,
+    ) -> None:
+        """
+        Initialize memory cache.
+
+        Args:
+            ttl: Seconds an entry stays valid (default: 300)
+            max_entries: Maximum number of cached responses (default: 1024)
+            routes: Resource methods to cache (default: DISCOVERY_ROUTES)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.routes = frozenset(routes)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _MemoryEntry] = OrderedDict()
+
+    def is_cacheable(self, request: httpx.Request) -> bool:
+        """
+        Check whether a request falls under the cache rules.
+
+        Args:
+            request: Outgoing request
+
+        Returns:
+            True for GETs of a cached resource method
+        """
+        if request.method != "GET":
+            return False
+        match = match_route(request)
+        return match is not None and match.route.name in self.routes
+
+    def get(self, request: httpx.Request) -> Optional[httpx.Response]:
+        """
+        Look up a cached response.
+
+        Args:
+            request: Outgoing request
+
+        Returns:
+            Reconstructed response, or None if missing or expired
+        """
+        key = cache_key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        headers = {CACHE_STATUS_HEADER: "HIT"}
+        if entry.content_type:
+            headers["Content-Type"] = entry.content_type
+        return httpx.Response(entry.status, headers=headers, content=entry.content, request=request)
+
+    def set(self, request: httpx.Request, response: httpx.Response) -> None:
+        """
+        Store a response whose body has already been read.
+
+        Args:
+            request: Request the response belongs to
+            response: Successful response
+        """
+        match = match_route(request)
+        if match is None:
+            return
+        entry = _MemoryEntry(
+            time.monotonic() + self.ttl,
+            match.route.name,
+            match.params,
+            response.status_code,
+            response.headers.get("Content-Type"),
+            response.content,
+        )
+        key = cache_key(request)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, route: Optional[str] = None, **params: object) -> int:
+        """
+        Drop cached entries.
+
+        Args:
+            route: Resource method to invalidate (e.g. 'eobi.get_dates'),
+                   or None for every method
+            **params: Only drop entries whose path parameters match,
+                      e.g. market_id='XEUR', date=20250101
+
+        Returns:
+            Number of entries removed
+
+        Example:
+            >>> discovery.invalidate()                            # everything
+            >>> discovery.invalidate("eobi.get_securities")       # one method
+            >>> discovery.invalidate(market_id="XEUR")            # one market
+        """
+        wanted = {name: str(value) for name, value in params.items()}
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if (route is None or entry.route == route)
+                and all(entry.params.get(name) == value for name, value in wanted.items())
+            ]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Number of cached responses (including not yet purged expired ones)."""
+        return len(self._entries)
+
+
+ResponseCache = Union[DiskCache, MemoryCache]
+
+
+class CacheTransport(TransportWrapper):
+    """Transport wrapper that serves cacheable requests from a response cache."""
+
+    def __init__(self, transport: AnyTransport, cache: ResponseCache) -> None:
+        """
+        Initialize caching transport.
+
+        Args:
+            transport: Transport that actually sends the requests
+            cache: DiskCache or MemoryCache
+        """
+        super().__init__(transport)
+        self._cache = cache
+        # Disk lookups and (de)compression must not block the event loop
+        self._offload = isinstance(cache, DiskCache)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Return a cached response or fetch and store it."""
+        if not self._cache.is_cacheable(request):
+            return self._send(request)
+        cached = self._cache.get(request)
+        if cached is not None:
+            return cached
+        response = self._send(request)
+        if response.status_code == 200:
+            response.read()
+            self._cache.set(request, response)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Return a cached response or fetch and store it."""
+        if not self._cache.is_cacheable(request):
+            return await self._asend(request)
+        if self._offload:
+            cached = await asyncio.to_thread(self._cache.get, request)
+        else:
+            cached = self._cache.get(request)
+        if cached is not None:
+            return cached
+        response = await self._asend(request)
+        if response.status_code == 200:
+            await response.aread()
+            if self._offload:
+                await asyncio.to_thread(self._cache.set, request, response)
+            else:
+                self._cache.set(request, response)
+        return response
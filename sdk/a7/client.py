@@ -1,31 +1,50 @@
 """Main A7 client class."""
 
+import importlib
 import os
-from typing import Any
+import urllib.request
+from abc import ABC
+from collections.abc import AsyncIterator, Iterable, Iterator
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, Union, overload
 from urllib.parse import urlparse
 
 import httpx
 
-from a7.auth import BearerAuth
-from a7.config import DEFAULT_BASE_URL, DEFAULT_TIMEOUT, USER_AGENT
-from a7.errors import (
-    AuthenticationError,
-    ForbiddenError,
-    NotFoundError,
-    RateLimitError,
-    ServerError,
-    ValidationError,
+from a7.auth import BearerAuth, CredentialPool, CredentialPoolTransport
+from a7.batch import BatchCall, BatchResult, arun_batch, run_batch
+from a7.breaker import CircuitBreaker, CircuitBreakerTransport
+from a7.cache import CacheTransport, DiskCache, MemoryCache
+from a7.coalesce import SingleFlightTransport
+from a7.config import (
+    DEFAULT_BASE_URL,
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_TIMEOUT,
+    USER_AGENT,
+    resolve_http2,
+    resolve_limits,
 )
-from a7.resources.algo import AlgoResource
-from a7.resources.auction import AuctionResource
-from a7.resources.dataset import DatasetResource
-from a7.resources.eobi import EOBIResource
-from a7.resources.insights import InsightsResource
-from a7.resources.mdp import MDPResource
-from a7.resources.orderbook import OrderBookResource
-from a7.resources.precalc import PrecalcResource
-from a7.resources.rdi import RDIResource
-from a7.resources.sd import SDResource
+from a7.decoders import JSONDecoder, get_decoder
+from a7.errors import error_from_response
+from a7.hedging import Hedger, HedgingTransport
+from a7.instrumentation import Instrumentation, InstrumentationTransport
+from a7.ratelimit import RateLimiter, RateLimitTransport
+from a7.retry import RetryPolicy, RetryTransport, parse_retry_after
+from a7.scheduler import Scheduler, SchedulerTransport
+from a7.timeouts import Deadline, TimeoutProfile, TimeoutTransport
+from a7.transport import AnyTransport
+
+if TYPE_CHECKING:
+    from a7.resources.algo import AlgoResource, AsyncAlgoResource
+    from a7.resources.auction import AsyncAuctionResource, AuctionResource
+    from a7.resources.dataset import AsyncDatasetResource, DatasetResource
+    from a7.resources.eobi import AsyncEOBIResource, EOBIResource
+    from a7.resources.insights import AsyncInsightsResource, InsightsResource
+    from a7.resources.mdp import AsyncMDPResource, MDPResource
+    from a7.resources.orderbook import AsyncOrderBookResource, OrderBookResource
+    from a7.resources.precalc import AsyncPrecalcResource, PrecalcResource
+    from a7.resources.rdi import AsyncRDIResource, RDIResource
+    from a7.resources.sd import AsyncSDResource, SDResource
 
 
 def _should_bypass_proxy(url: str) -> bool:
@@ -69,7 +88,186 @@ def _should_bypass_proxy(url: str) -> bool:
     return False
 
 
-class A7Client:
+def _proxy_url(url: str) -> Optional[str]:
+    """
+    Resolve the proxy to use for a URL from the environment.
+
+    Args:
+        url: The URL that will be requested
+
+    Returns:
+        Proxy URL, or None if requests should go direct
+    """
+    if _should_bypass_proxy(url):
+        return None
+
+    proxies = urllib.request.getproxies()
+    proxy = proxies.get(urlparse(url).scheme) or proxies.get("all")
+    if not proxy:
+        return None
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    return proxy
+
+
+@overload
+def _wrap_transport(
+    transport: httpx.BaseTransport,
+    *,
+    credentials: Optional[CredentialPool],
+    timeouts: Optional[TimeoutProfile],
+    retry: RetryPolicy,
+    rate_limit: Optional[RateLimiter],
+    circuit_breaker: Optional[CircuitBreaker],
+    scheduler: Optional[Scheduler],
+    hedging: Optional[Hedger],
+    cache: Optional[DiskCache],
+    discovery_cache: Optional[MemoryCache],
+    coalesce: bool,
+    instrumentation: Optional[Instrumentation],
+) -> httpx.BaseTransport: ...
+
+
+@overload
+def _wrap_transport(
+    transport: httpx.AsyncBaseTransport,
+    *,
+    credentials: Optional[CredentialPool],
+    timeouts: Optional[TimeoutProfile],
+    retry: RetryPolicy,
+    rate_limit: Optional[RateLimiter],
+    circuit_breaker: Optional[CircuitBreaker],
+    scheduler: Optional[Scheduler],
+    hedging: Optional[Hedger],
+    cache: Optional[DiskCache],
+    discovery_cache: Optional[MemoryCache],
+    coalesce: bool,
+    instrumentation: Optional[Instrumentation],
+) -> httpx.AsyncBaseTransport: ...
+
+
+def _wrap_transport(
+    transport: AnyTransport,
+    *,
+    credentials: Optional[CredentialPool],
+    timeouts: Optional[TimeoutProfile],
+    retry: RetryPolicy,
+    rate_limit: Optional[RateLimiter],
+    circuit_breaker: Optional[CircuitBreaker],
+    scheduler: Optional[Scheduler],
+    hedging: Optional[Hedger],
+    cache: Optional[DiskCache],
+    discovery_cache: Optional[MemoryCache],
+    coalesce: bool,
+    instrumentation: Optional[Instrumentation],
+) -> AnyTransport:
+    """
+    Stack the SDK's transport middleware around the HTTP transport.
+
+    Timeouts and the active deadline are applied innermost, right before each
+    attempt is sent. Every retry attempt passes through the circuit breaker
+    and the rate limiter, so retries are paced too and stop as soon as a
+    circuit opens; cache hits (memory first, then disk) are served before
+    either and cost nothing. The scheduler grants each attempt a slot before
+    it takes rate-limit tokens, so priorities decide the order; backoff
+    sleeps hold no slot. The credential pool sits just below the retry
+    policy, so a throttled token is swapped for another before the retry
+    policy sees the 429, and the resend is scheduled and paced like any
+    other attempt.
+    Hedging sits above retry, so a hedge retries on its own, and below the
+    caches and single-flight, so a hedge is never served from or coalesced
+    with the request it duplicates. Single-flight sits above the caches so
+    concurrent identical GETs share one pass through the whole stack;
+    instrumentation is outermost and sees every call, cache hits included.
+
+    Args:
+        transport: Innermost HTTP transport
+        credentials: Optional token pool authenticating each attempt
+        timeouts: Optional timeouts per resource method or endpoint family
+        retry: Retry policy
+        rate_limit: Optional shared rate limiter
+        circuit_breaker: Optional per-endpoint-family circuit breaker
+        scheduler: Optional priority scheduler limiting requests in flight
+        hedging: Optional hedging of slow idempotent requests
+        cache: Optional persistent response cache
+        discovery_cache: Optional in-memory cache for discovery listings
+        coalesce: Whether concurrent identical GETs share one request
+        instrumentation: Optional request hooks and metrics
+
+    Returns:
+        Outermost transport to hand to the httpx client
+    """
+    transport = TimeoutTransport(transport, timeouts)
+    if rate_limit is not None:
+        transport = RateLimitTransport(transport, rate_limit)
+    if circuit_breaker is not None:
+        transport = CircuitBreakerTransport(transport, circuit_breaker)
+    if scheduler is not None:
+        transport = SchedulerTransport(transport, scheduler)
+    if credentials is not None:
+        transport = CredentialPoolTransport(transport, credentials)
+    transport = RetryTransport(transport, retry)
+    if hedging is not None:
+        transport = HedgingTransport(transport, hedging)
+    if cache is not None:
+        transport = CacheTransport(transport, cache)
+    if discovery_cache is not None:
+        transport = CacheTransport(transport, discovery_cache)
+    if coalesce:
+        transport = SingleFlightTransport(transport)
+    if instrumentation is not None:
+        transport = InstrumentationTransport(transport, instrumentation)
+    return transport
+
+
+def _raise_for_error(response: httpx.Response) -> None:
+    """Response hook raising the matching :mod:`a7.errors` exception for 4xx/5xx responses."""
+    if response.is_error:
+        response.read()
+        raise error_from_response(response, parse_retry_after(response))
+
+
+async def _araise_for_error(response: httpx.Response) -> None:
+    """Async response hook raising the matching :mod:`a7.errors` exception."""
+    if response.is_error:
+        await response.aread()
+        raise error_from_response(response, parse_retry_after(response))
+
+
+_HTTPClient = TypeVar("_HTTPClient", httpx.Client, httpx.AsyncClient)
+
+
+class _BaseA7Client(ABC, Generic[_HTTPClient]):
+    """Behaviour shared by the synchronous and asynchronous clients."""
+
+    # Set by the subclass __init__
+    _client: _HTTPClient
+    _decode: JSONDecoder
+
+    def _handle_error(self, error: httpx.HTTPStatusError) -> None:
+        """
+        Handle HTTP errors and raise appropriate custom exceptions.
+
+        Args:
+            error: HTTP status error from httpx
+
+        Raises:
+            AuthenticationError: For 401 status
+            ForbiddenError: For 403 status
+            NotFoundError: For 404 status
+            ValidationError: For 400 status
+            RateLimitError: For 429 status
+            ServerError: For 5xx status
+        """
+        raise error_from_response(error.response) from error
+
+    def _resource(self, module: str, name: str) -> Any:
+        """Import and construct a resource; used by the lazily created resource attributes."""
+        resource = getattr(importlib.import_module(f"a7.resources.{module}"), name)
+        return resource(self._client, self._decode)
+
+
+class A7Client(_BaseA7Client[httpx.Client]):
     """
     Main client for A7 Analytics Platform API.
 
@@ -80,84 +278,250 @@ class A7Client:
 
     def __init__(
         self,
-        token: str,
+        token: Union[str, CredentialPool],
         base_url: str = DEFAULT_BASE_URL,
-        timeout: float = DEFAULT_TIMEOUT,
+        timeout: Union[float, httpx.Timeout] = DEFAULT_TIMEOUT,
         verify_ssl: bool = True,
+        *,
+        timeouts: Optional[TimeoutProfile] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limit: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        scheduler: Optional[Scheduler] = None,
+        hedging: Optional[Hedger] = None,
+        cache: Optional[DiskCache] = None,
+        discovery_cache: Optional[MemoryCache] = None,
+        coalesce: bool = False,
+        http2: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        json_decoder: Optional[JSONDecoder] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        transport: Optional[httpx.BaseTransport] = None,
     ) -> None:
         """
         Initialize A7 client.
 
         Args:
-            token: A7 API token (with or without 'Bearer ' prefix)
+            token: A7 API token (with or without 'Bearer ' prefix), or a
+                   CredentialPool spreading requests over several tokens
             base_url: Base URL for A7 API (default: production URL)
-            timeout: Request timeout in seconds (default: 30.0)
+            timeout: Request timeout in seconds, or an httpx.Timeout with separate
+                     connect/read/write/pool limits (default: 30.0)
             verify_ssl: Whether to verify SSL certificates (default: True)
                        Set to False for self-signed certificates in dev environments
+            timeouts: Timeouts per resource method, resource or endpoint family
+                      that override timeout, e.g. 2 s for rdi.get_markets and
+                      minutes for algo.run
+            retry: Retry policy for 429/5xx responses and connection errors
+                   (default: RetryPolicy(), pass RetryPolicy(max_attempts=1) to disable)
+            rate_limit: Client-side rate limiter shared by all resources; pass the
+                        same RateLimiter to several clients to share one budget
+            circuit_breaker: Fail fast with CircuitOpenError while an endpoint family
+                             (e.g. '/v1/ob') keeps failing or answering too slowly
+            scheduler: Limit requests in flight and serve waiting requests by
+                       priority class, set with a7.priority()
+            hedging: Send a duplicate of a GET that is slower than usual and use
+                     whichever response arrives first, within a traffic budget
+            cache: Opt-in persistent cache for historical (past-date) responses
+            discovery_cache: Opt-in in-memory TTL cache for markets/dates/segments/
+                             securities listings; call its invalidate() to refresh
+            coalesce: Let concurrent identical GET requests share a single in-flight
+                      request; every caller receives the same response (default: False)
+            http2: Negotiate HTTP/2 so concurrent requests share few TLS connections
+                   (default: A7_HTTP2 or False; needs pip install a7[http2])
+            max_connections: Connection pool size (default: A7_MAX_CONNECTIONS or 100)
+            max_keepalive_connections: Idle connections kept open
+                                       (default: A7_MAX_KEEPALIVE_CONNECTIONS or 20)
+            keepalive_expiry: Seconds before an idle connection is closed
+                              (default: A7_KEEPALIVE_EXPIRY or 5.0)
+            json_decoder: Callable decoding response bytes (default: orjson or msgspec
+                          if installed, else stdlib json; see a7.decoders.get_decoder)
+            instrumentation: Pre/post request hooks with endpoint, status, size and
+                             connect/wait/download/decode timings, plus an optional
+                             MetricsRegistry
+            transport: Innermost transport to use instead of an HTTP connection pool,
+                       e.g. a7.testing.ReplayTransport; proxy, http2 and pool
+                       options do not apply to it
         """
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
+        self._retry = retry if retry is not None else RetryPolicy()
+        self.cache = cache
+        self.discovery_cache = discovery_cache
+        self._decode = json_decoder if json_decoder is not None else get_decoder()
+        self.instrumentation = instrumentation
+        if instrumentation is not None:
+            self._decode = instrumentation.wrap_decoder(self._decode)
 
-        # Determine transport settings based on NO_PROXY environment variable
-        transport = None
-        if _should_bypass_proxy(base_url):
-            # Explicitly disable proxies for this URL by using custom transport
-            transport = httpx.HTTPTransport(verify=verify_ssl, proxy=None)
+        # Proxy comes from the environment unless NO_PROXY matches the base URL;
+        # pool limits and HTTP/2 apply to direct and proxied connections alike
+        if transport is None:
+            transport = httpx.HTTPTransport(
+                verify=verify_ssl,
+                proxy=_proxy_url(base_url),
+                http2=resolve_http2(http2),
+                limits=resolve_limits(max_connections, max_keepalive_connections, keepalive_expiry),
+            )
+        wrapped = _wrap_transport(
+            transport,
+            credentials=token if isinstance(token, CredentialPool) else None,
+            timeouts=timeouts,
+            retry=self._retry,
+            rate_limit=rate_limit,
+            circuit_breaker=circuit_breaker,
+            scheduler=scheduler,
+            hedging=hedging,
+            cache=cache,
+            discovery_cache=discovery_cache,
+            coalesce=coalesce,
+            instrumentation=instrumentation,
+        )
 
         # Initialize HTTP client with authentication
         self._client = httpx.Client(
-            auth=BearerAuth(token),
+            auth=None if isinstance(token, CredentialPool) else BearerAuth(token),
             base_url=self._base_url,
             timeout=timeout,
             headers={"User-Agent": USER_AGENT},
             verify=verify_ssl,
-            transport=transport,
+            transport=wrapped,
+            event_hooks={"response": [_raise_for_error]},
         )
 
-        # Initialize resource endpoints
-        self.rdi = RDIResource(self._client)
-        self.algo = AlgoResource(self._client)
-        self.eobi = EOBIResource(self._client)
-        self.mdp = MDPResource(self._client)
-        self.orderbook = OrderBookResource(self._client)
-        self.dataset = DatasetResource(self._client)
-        self.insights = InsightsResource(self._client)
-        self.precalc = PrecalcResource(self._client)
-        self.auction = AuctionResource(self._client)
-        self.sd = SDResource(self._client)
+    @cached_property
+    def rdi(self) -> "RDIResource":
+        """Reference Data Interface (RDI) v2 endpoints."""
+        return self._resource("rdi", "RDIResource")
 
-    def _handle_error(self, error: httpx.HTTPStatusError) -> None:
+    @cached_property
+    def algo(self) -> "AlgoResource":
+        """Algorithm execution and management endpoints."""
+        return self._resource("algo", "AlgoResource")
+
+    @cached_property
+    def eobi(self) -> "EOBIResource":
+        """Enhanced Order Book Interface (EOBI) endpoints."""
+        return self._resource("eobi", "EOBIResource")
+
+    @cached_property
+    def mdp(self) -> "MDPResource":
+        """Market Data Platform (MDP) endpoints for CME data."""
+        return self._resource("mdp", "MDPResource")
+
+    @cached_property
+    def orderbook(self) -> "OrderBookResource":
+        """Constructed T7 and CME order book endpoints."""
+        return self._resource("orderbook", "OrderBookResource")
+
+    @cached_property
+    def dataset(self) -> "DatasetResource":
+        """Customer dataset endpoints."""
+        return self._resource("dataset", "DatasetResource")
+
+    @cached_property
+    def insights(self) -> "InsightsResource":
+        """Market insights endpoints."""
+        return self._resource("insights", "InsightsResource")
+
+    @cached_property
+    def precalc(self) -> "PrecalcResource":
+        """Precalculation job endpoints."""
+        return self._resource("precalc", "PrecalcResource")
+
+    @cached_property
+    def auction(self) -> "AuctionResource":
+        """Xetra auction simulation endpoints."""
+        return self._resource("auction", "AuctionResource")
+
+    @cached_property
+    def sd(self) -> "SDResource":
+        """Security Details (SD) v2 endpoints for CME data."""
+        return self._resource("sd", "SDResource")
+
+    def map(
+        self,
+        calls: Iterable[BatchCall],
+        *,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = True,
+        deadline: Optional[Deadline] = None,
+    ) -> Iterator[BatchResult]:
         """
-        Handle HTTP errors and raise appropriate custom exceptions.
+        Run many resource method calls concurrently and iterate over the results.
+
+        Calls run on a thread pool of ``max_concurrency`` threads sharing this
+        client's connection pool, rate limiter and caches. A failing call does
+        not stop the batch: its exception is captured in its result. Like the
+        builtin ``map``, calls start once iteration begins and are consumed
+        from ``calls`` lazily.
 
         Args:
-            error: HTTP status error from httpx
+            calls: (resource_method, kwargs) pairs; resource_method is a name
+                   such as 'eobi.get_securities' or a bound method such as
+                   client.eobi.get_securities
+            max_concurrency: Calls in flight at once (default: 8); keep it at or
+                             below max_connections
+            ordered: Yield results in call order (default) or as they complete
+            deadline: Time budget for the whole batch; once spent, calls not
+                      started yet and requests of running calls fail with
+                      DeadlineExceededError (default: the active Deadline, if any)
+
+        Returns:
+            Iterator of BatchResult, one per call
 
         Raises:
-            AuthenticationError: For 401 status
-            ForbiddenError: For 403 status
-            NotFoundError: For 404 status
-            ValidationError: For 400 status
-            RateLimitError: For 429 status
-            ServerError: For 5xx status
+            ValueError: If max_concurrency is below 1; a call to an unknown
+                        resource method fails with ValueError in its result
+
+        Example:
+            >>> calls = [
+            ...     ("eobi.get_securities", {"market_id": "XEUR", "date": 20240102,
+            ...                              "market_segment_id": segment})
+            ...     for segment in client.eobi.get_market_segments("XEUR", 20240102)
+            ... ]
+            >>> for result in client.map(calls, ordered=False):
+            ...     if result.ok:
+            ...         print(result.kwargs["market_segment_id"], len(result.value))
+        """
+        return run_batch(
+            self, calls, max_concurrency=max_concurrency, ordered=ordered, deadline=deadline
+        )
+
+    def gather(
+        self,
+        calls: Iterable[BatchCall],
+        *,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        deadline: Optional[Deadline] = None,
+    ) -> list[BatchResult]:
         """
-        status_code = error.response.status_code
-        message = f"HTTP {status_code}: {error.response.text}"
-
-        if status_code == 401:
-            raise AuthenticationError(message)
-        elif status_code == 403:
-            raise ForbiddenError(message)
-        elif status_code == 404:
-            raise NotFoundError(message)
-        elif status_code == 400:
-            raise ValidationError(message)
-        elif status_code == 429:
-            raise RateLimitError(message)
-        elif 500 <= status_code < 600:
-            raise ServerError(message)
-        else:
-            raise ServerError(message) from error
+        Run many resource method calls concurrently and wait for all results.
+
+        Same as :meth:`map`, collected into a list in call order.
+
+        Args:
+            calls: (resource_method, kwargs) pairs
+            max_concurrency: Calls in flight at once (default: 8)
+            deadline: Time budget for the whole batch; calls not started before
+                      it passes fail with DeadlineExceededError
+
+        Returns:
+            BatchResult of every call, in call order
+
+        Raises:
+            ValueError: If max_concurrency is below 1; a call to an unknown
+                        resource method fails with ValueError in its result
+
+        Example:
+            >>> results = client.gather(
+            ...     (client.rdi.get_market_segments, {"market_id": m, "date": 20240102})
+            ...     for m in ["XEUR", "XETR"]
+            ... )
+            >>> segments = [result.unwrap() for result in results]
+        """
+        return list(self.map(calls, max_concurrency=max_concurrency, deadline=deadline))
 
     def __enter__(self) -> "A7Client":
         """Context manager entry."""
@@ -170,3 +534,262 @@ class A7Client:
     def close(self) -> None:
         """Close the HTTP client and release resources."""
         self._client.close()
+
+
+class AsyncA7Client(_BaseA7Client[httpx.AsyncClient]):
+    """
+    Asynchronous client for A7 Analytics Platform API.
+
+    Mirrors :class:`A7Client` on top of ``httpx.AsyncClient`` so that a single
+    event loop can keep many requests in flight. Every resource method is a
+    coroutine.
+
+    Example:
+        >>> async with AsyncA7Client(token="YOUR_A7_TOKEN") as client:
+        ...     markets = await client.rdi.get_markets()
+    """
+
+    def __init__(
+        self,
+        token: Union[str, CredentialPool],
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: Union[float, httpx.Timeout] = DEFAULT_TIMEOUT,
+        verify_ssl: bool = True,
+        *,
+        timeouts: Optional[TimeoutProfile] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limit: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        scheduler: Optional[Scheduler] = None,
+        hedging: Optional[Hedger] = None,
+        cache: Optional[DiskCache] = None,
+        discovery_cache: Optional[MemoryCache] = None,
+        coalesce: bool = False,
+        http2: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        json_decoder: Optional[JSONDecoder] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """
+        Initialize async A7 client.
+
+        Args:
+            token: A7 API token (with or without 'Bearer ' prefix), or a
+                   CredentialPool spreading requests over several tokens
+            base_url: Base URL for A7 API (default: production URL)
+            timeout: Request timeout in seconds, or an httpx.Timeout with separate
+                     connect/read/write/pool limits (default: 30.0)
+            verify_ssl: Whether to verify SSL certificates (default: True)
+                       Set to False for self-signed certificates in dev environments
+            timeouts: Timeouts per resource method, resource or endpoint family
+                      that override timeout, e.g. 2 s for rdi.get_markets and
+                      minutes for algo.run
+            retry: Retry policy for 429/5xx responses and connection errors
+                   (default: RetryPolicy(), pass RetryPolicy(max_attempts=1) to disable)
+            rate_limit: Client-side rate limiter shared by all resources; pass the
+                        same RateLimiter to several clients to share one budget
+            circuit_breaker: Fail fast with CircuitOpenError while an endpoint family
+                             (e.g. '/v1/ob') keeps failing or answering too slowly
+            scheduler: Limit requests in flight and serve waiting requests by
+                       priority class, set with a7.priority()
+            hedging: Send a duplicate of a GET that is slower than usual and use
+                     whichever response arrives first, within a traffic budget
+            cache: Opt-in persistent cache for historical (past-date) responses
+            discovery_cache: Opt-in in-memory TTL cache for markets/dates/segments/
+                             securities listings; call its invalidate() to refresh
+            coalesce: Let concurrent identical GET requests share a single in-flight
+                      request; every caller receives the same response (default: False)
+            http2: Negotiate HTTP/2 so concurrent requests share few TLS connections
+                   (default: A7_HTTP2 or False; needs pip install a7[http2])
+            max_connections: Connection pool size (default: A7_MAX_CONNECTIONS or 100)
+            max_keepalive_connections: Idle connections kept open
+                                       (default: A7_MAX_KEEPALIVE_CONNECTIONS or 20)
+            keepalive_expiry: Seconds before an idle connection is closed
+                              (default: A7_KEEPALIVE_EXPIRY or 5.0)
+            json_decoder: Callable decoding response bytes (default: orjson or msgspec
+                          if installed, else stdlib json; see a7.decoders.get_decoder)
+            instrumentation: Pre/post request hooks with endpoint, status, size and
+                             connect/wait/download/decode timings, plus an optional
+                             MetricsRegistry
+            transport: Innermost transport to use instead of an HTTP connection pool,
+                       e.g. a7.testing.ReplayTransport; proxy, http2 and pool
+                       options do not apply to it
+        """
+        self._base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self._retry = retry if retry is not None else RetryPolicy()
+        self.cache = cache
+        self.discovery_cache = discovery_cache
+        self._decode = json_decoder if json_decoder is not None else get_decoder()
+        self.instrumentation = instrumentation
+        if instrumentation is not None:
+            self._decode = instrumentation.wrap_decoder(self._decode)
+
+        # Proxy comes from the environment unless NO_PROXY matches the base URL;
+        # pool limits and HTTP/2 apply to direct and proxied connections alike
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                verify=verify_ssl,
+                proxy=_proxy_url(base_url),
+                http2=resolve_http2(http2),
+                limits=resolve_limits(max_connections, max_keepalive_connections, keepalive_expiry),
+            )
+        wrapped = _wrap_transport(
+            transport,
+            credentials=token if isinstance(token, CredentialPool) else None,
+            timeouts=timeouts,
+            retry=self._retry,
+            rate_limit=rate_limit,
+            circuit_breaker=circuit_breaker,
+            scheduler=scheduler,
+            hedging=hedging,
+            cache=cache,
+            discovery_cache=discovery_cache,
+            coalesce=coalesce,
+            instrumentation=instrumentation,
+        )
+
+        # Initialize HTTP client with authentication
+        self._client = httpx.AsyncClient(
+            auth=None if isinstance(token, CredentialPool) else BearerAuth(token),
+            base_url=self._base_url,
+            timeout=timeout,
+            headers={"User-Agent": USER_AGENT},
+            verify=verify_ssl,
+            transport=wrapped,
+            event_hooks={"response": [_araise_for_error]},
+        )
+
+    @cached_property
+    def rdi(self) -> "AsyncRDIResource":
+        """Reference Data Interface (RDI) v2 endpoints."""
+        return self._resource("rdi", "AsyncRDIResource")
+
+    @cached_property
+    def algo(self) -> "AsyncAlgoResource":
+        """Algorithm execution and management endpoints."""
+        return self._resource("algo", "AsyncAlgoResource")
+
+    @cached_property
+    def eobi(self) -> "AsyncEOBIResource":
+        """Enhanced Order Book Interface (EOBI) endpoints."""
+        return self._resource("eobi", "AsyncEOBIResource")
+
+    @cached_property
+    def mdp(self) -> "AsyncMDPResource":
+        """Market Data Platform (MDP) endpoints for CME data."""
+        return self._resource("mdp", "AsyncMDPResource")
+
+    @cached_property
+    def orderbook(self) -> "AsyncOrderBookResource":
+        """Constructed T7 and CME order book endpoints."""
+        return self._resource("orderbook", "AsyncOrderBookResource")
+
+    @cached_property
+    def dataset(self) -> "AsyncDatasetResource":
+        """Customer dataset endpoints."""
+        return self._resource("dataset", "AsyncDatasetResource")
+
+    @cached_property
+    def insights(self) -> "AsyncInsightsResource":
+        """Market insights endpoints."""
+        return self._resource("insights", "AsyncInsightsResource")
+
+    @cached_property
+    def precalc(self) -> "AsyncPrecalcResource":
+        """Precalculation job endpoints."""
+        return self._resource("precalc", "AsyncPrecalcResource")
+
+    @cached_property
+    def auction(self) -> "AsyncAuctionResource":
+        """Xetra auction simulation endpoints."""
+        return self._resource("auction", "AsyncAuctionResource")
+
+    @cached_property
+    def sd(self) -> "AsyncSDResource":
+        """Security Details (SD) v2 endpoints for CME data."""
+        return self._resource("sd", "AsyncSDResource")
+
+    def map(
+        self,
+        calls: Iterable[BatchCall],
+        *,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = True,
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Run many resource method calls concurrently and iterate over the results.
+
+        Calls run as tasks on the current event loop, at most
+        ``max_concurrency`` at once. A failing call does not stop the batch:
+        its exception is captured in its result.
+
+        Args:
+            calls: (resource_method, kwargs) pairs; resource_method is a name
+                   such as 'eobi.get_securities' or a bound method such as
+                   client.eobi.get_securities
+            max_concurrency: Calls in flight at once (default: 8)
+            ordered: Yield results in call order (default) or as they complete
+            deadline: Time budget for the whole batch; once spent, calls not
+                      started yet and requests of running calls fail with
+                      DeadlineExceededError (default: the active Deadline, if any)
+
+        Returns:
+            Async iterator of BatchResult, one per call
+
+        Raises:
+            ValueError: If max_concurrency is below 1; a call to an unknown
+                        resource method fails with ValueError in its result
+
+        Example:
+            >>> async for result in client.map(calls, ordered=False):
+            ...     if result.ok:
+            ...         print(result.method, result.value)
+        """
+        return arun_batch(
+            self, calls, max_concurrency=max_concurrency, ordered=ordered, deadline=deadline
+        )
+
+    async def gather(
+        self,
+        calls: Iterable[BatchCall],
+        *,
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        deadline: Optional[Deadline] = None,
+    ) -> list[BatchResult]:
+        """
+        Run many resource method calls concurrently and wait for all results.
+
+        Same as :meth:`map`, collected into a list in call order.
+
+        Args:
+            calls: (resource_method, kwargs) pairs
+            max_concurrency: Calls in flight at once (default: 8)
+            deadline: Time budget for the whole batch; calls not started before
+                      it passes fail with DeadlineExceededError
+
+        Returns:
+            BatchResult of every call, in call order
+
+        Raises:
+            ValueError: If max_concurrency is below 1; a call to an unknown
+                        resource method fails with ValueError in its result
+        """
+        results = self.map(calls, max_concurrency=max_concurrency, deadline=deadline)
+        return [result async for result in results]
+
+    async def __aenter__(self) -> "AsyncA7Client":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Async context manager exit."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and release resources."""
+        await self._client.aclose()
@@ -0,0 +1,130 @@
+"""Single-flight de-duplication of concurrent identical GET requests."""
+
+import asyncio
+import threading
+from typing import Optional
+
+import httpx
+
+from a7.cache import cache_key
+from a7.transport import TransportWrapper
+
+# Headers describing the wire encoding, which no longer applies to decoded content
+_ENCODING_HEADERS = ("Content-Encoding", "Content-Length", "Transfer-Encoding")
+
+
+def _share(response: httpx.Response, request: httpx.Request) -> httpx.Response:
+    """Build an independent copy of a fully read response for another caller."""
+    headers = httpx.Headers(response.headers)
+    for name in _ENCODING_HEADERS:
+        headers.pop(name, None)
+    return httpx.Response(
+        response.status_code,
+        headers=headers,
+        content=response.content,
+        request=request,
+        extensions={"http_version": response.extensions.get("http_version", b"HTTP/1.1")},
+    )
+
+
+class _Flight:
+    """One in-flight request and the callers waiting for it."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: Optional[httpx.Response] = None
+        self.error: Optional[BaseException] = None
+
+
+class _AsyncFlight:
+    """One in-flight async request and the tasks waiting for it."""
+
+    def __init__(self) -> None:
+        self.done = asyncio.Event()
+        self.response: Optional[httpx.Response] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlightTransport(TransportWrapper):
+    """
+    Transport wrapper that lets concurrent identical GETs share one request.
+
+    The first caller for a URL (the leader) sends the request and reads the
+    body; callers arriving while it is in flight wait and receive their own
+    copy of the same response, or the same exception. Requests are identical
+    when their normalized URL and query match (see :func:`a7.cache.cache_key`).
+    """
+
+    def __init__(self, transport: "httpx.BaseTransport | httpx.AsyncBaseTransport") -> None:
+        """
+        Initialize single-flight transport.
+
+        Args:
+            transport: Transport that actually sends the requests
+        """
+        super().__init__(transport)
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+        self._async_flights: dict[str, _AsyncFlight] = {}
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request, or wait for an identical one already in flight."""
+        if request.method != "GET":
+            return self._send(request)
+
+        key = cache_key(request)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            assert flight.response is not None
+            return _share(flight.response, request)
+
+        try:
+            response = self._send(request)
+            response.read()
+            flight.response = response
+            return response
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request, or await an identical one already in flight."""
+        if request.method != "GET":
+            return await self._asend(request)
+
+        key = cache_key(request)
+        flight = self._async_flights.get(key)
+        if flight is not None:
+            await flight.done.wait()
+            if isinstance(flight.error, asyncio.CancelledError):
+                # The leader was cancelled, not failed: fetch independently
+                return await self._asend(request)
+            if flight.error is not None:
+                raise flight.error
+            assert flight.response is not None
+            return _share(flight.response, request)
+
+        flight = self._async_flights[key] = _AsyncFlight()
+        try:
+            response = await self._asend(request)
+            await response.aread()
+            flight.response = response
+            return response
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            del self._async_flights[key]
+            flight.done.set()
@@ -0,0 +1,458 @@
+"""Columnar in-memory store for EOBI messages, one table per TemplateID."""
+
+import json
+import math
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    import os
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None  # type: ignore[assignment]
+
+# Marks a field a message does not have, in int64 columns (floats use NaN,
+# interned strings the code -1)
+MISSING = -(2**63)
+
+_MAGIC = b"A7COLS1\n"
+_TYPECODES = {"int": "q", "intstr": "q", "float": "d", "bool": "b", "enum": "i", "json": "i"}
+_MISSING = {
+    "int": MISSING,
+    "intstr": MISSING,
+    "float": math.nan,
+    "bool": -1,
+    "enum": -1,
+    "json": -1,
+}
+
+
+def _kind(value: Any) -> str:
+    """Column kind able to hold a value."""
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int" if -(2**63) < value < 2**63 else "json"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        # Nanosecond timestamps and IDs sent as strings are stored as int64
+        digits = value.isdigit() and value.isascii() and (value == "0" or value[0] != "0")
+        return "intstr" if digits and len(value) <= 19 and int(value) < 2**63 else "enum"
+    return "json"
+
+
+def _widen(kind: str, other: str) -> str:
+    """Kind able to hold the values of two kinds."""
+    if {kind, other} in ({"bool", "int"}, {"int", "intstr"}):
+        return "int"
+    if {kind, other} == {"int", "float"}:
+        return "float"
+    if {kind, other} == {"intstr", "enum"}:
+        return "enum"
+    return "json"
+
+
+def _flatten(message: dict[str, Any], prefix: str = "") -> Iterator[tuple[str, Any]]:
+    """Leaf fields of a message as ('Group.Field', value) pairs."""
+    for key, value in message.items():
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}", value
+
+
+class _Column:
+    """Values of one field: a typed array, plus the distinct strings for interned kinds."""
+
+    __slots__ = ("codes", "kind", "values", "vocabulary")
+
+    def __init__(self, kind: str, vocabulary: Optional[list[str]] = None) -> None:
+        self.kind = kind
+        self.values = array(_TYPECODES[kind])
+        self.vocabulary: list[str] = vocabulary if vocabulary is not None else []
+        self.codes = {text: code for code, text in enumerate(self.vocabulary)}
+
+    def append(self, value: Any) -> None:
+        if value is None:
+            self.values.append(_MISSING[self.kind])
+        elif self.kind in ("enum", "json"):
+            text = value if self.kind == "enum" else json.dumps(value)
+            code = self.codes.get(text)
+            if code is None:
+                code = self.codes[text] = len(self.vocabulary)
+                self.vocabulary.append(text)
+            self.values.append(code)
+        else:
+            self.values.append(int(value) if self.kind in ("int", "intstr") else value)
+
+    def get(self, row: int) -> Any:
+        """Python value of a row, or None if the message did not have the field."""
+        value = self.values[row]
+        if self.kind == "float":
+            return None if math.isnan(value) else value
+        if value == _MISSING[self.kind]:
+            return None
+        if self.kind == "enum":
+            return self.vocabulary[value]
+        if self.kind == "json":
+            return json.loads(self.vocabulary[value])
+        if self.kind == "intstr":
+            return str(value)
+        return bool(value) if self.kind == "bool" else value
+
+    def converted(self, kind: str) -> "_Column":
+        column = _Column(kind)
+        for row in range(len(self.values)):
+            column.append(self.get(row))
+        return column
+
+    def sliced(self, start: int, stop: int) -> "_Column":
+        column = _Column(self.kind, list(self.vocabulary))
+        column.values = self.values[start:stop]
+        return column
+
+
+class TemplateTable:
+    """
+    Messages of one TemplateID, one typed array per field.
+
+    Nested fields are named by their path, e.g. ``'OrderDetails.Price'``
+    or ``'MessageHeader.MsgSeqNum'``. Integers and strings of digits
+    (nanosecond timestamps) are stored as int64, prices and quantities
+    as the scaled int64 values EOBI sends them in, floats as float64, and
+    other strings (enumerations) as int32 codes into a table of distinct
+    values. A field holding both integers and strings of digits is stored
+    as int64 and read back as integers. Messages without a field hold :data:`MISSING` (NaN for floats,
+    code -1 for strings) in its column.
+    """
+
+    def __init__(self, template_id: int) -> None:
+        """
+        Initialize an empty table.
+
+        Args:
+            template_id: TemplateID of the messages
+        """
+        self.template_id = template_id
+        self._rows = 0
+        self._columns: dict[str, _Column] = {}
+
+    def __len__(self) -> int:
+        """Number of messages."""
+        return self._rows
+
+    @property
+    def columns(self) -> list[str]:
+        """Field names, in the order they were first seen."""
+        return list(self._columns)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays (excluding the interned strings)."""
+        return sum(c.values.itemsize * len(c.values) for c in self._columns.values())
+
+    def append(self, message: dict[str, Any]) -> None:
+        """
+        Add a message.
+
+        Args:
+            message: EOBI message as returned in detailed mode; fields set to
+                     None are treated as missing
+        """
+        seen = set()
+        for name, value in _flatten(message):
+            if value is None:
+                continue
+            column = self._columns.get(name)
+            kind = _kind(value)
+            if column is None:
+                column = self._columns[name] = _Column(kind)
+                for _ in range(self._rows):
+                    column.append(None)
+            elif kind != column.kind:
+                # A value the column cannot hold widens it, e.g. int64 to float64;
+                # one it can (an int in a float64 column) is appended as is
+                widened = _widen(column.kind, kind)
+                if widened != column.kind:
+                    column = self._columns[name] = column.converted(widened)
+            column.append(value)
+            seen.add(name)
+        for name, column in self._columns.items():
+            if name not in seen:
+                column.append(None)
+        self._rows += 1
+
+    def column(self, name: str) -> "array[Any]":
+        """
+        Get the raw array of a field.
+
+        Args:
+            name: Field path, e.g. 'OrderDetails.Price'
+
+        Returns:
+            The column's array; string fields hold codes into :meth:`categories`
+
+        Raises:
+            KeyError: If no message of the table has the field
+        """
+        return self._columns[name].values
+
+    def categories(self, name: str) -> list[str]:
+        """Distinct strings of a string field, indexed by the codes in its column."""
+        return self._columns[name].vocabulary
+
+    def to_numpy(self, name: str) -> Any:
+        """
+        Get a field as a NumPy array (a copy), e.g. for vectorized analytics.
+
+        Args:
+            name: Field path, e.g. 'OrderDetails.Price'
+
+        Returns:
+            numpy.ndarray of int64, float64, int8 or int32 codes
+
+        Raises:
+            ImportError: If NumPy is not installed
+            KeyError: If no message of the table has the field
+        """
+        if numpy is None:
+            raise ImportError("numpy is not installed: pip install a7[numpy]")
+        return numpy.array(self._columns[name].values)
+
+    def message(self, row: int) -> dict[str, Any]:
+        """
+        Rebuild a message as the nested dict it was appended as.
+
+        Args:
+            row: Position of the message in the table
+
+        Returns:
+            The message, without the fields it did not have
+        """
+        if not -self._rows <= row < self._rows:
+            raise IndexError("row out of range")
+        row %= self._rows
+        message: dict[str, Any] = {}
+        for name, column in self._columns.items():
+            value = column.get(row)
+            if value is None:
+                continue
+            *groups, field = name.split(".")
+            target = message
+            for group in groups:
+                target = target.setdefault(group, {})
+            target[field] = value
+        return message
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate over the rebuilt messages."""
+        return (self.message(row) for row in range(self._rows))
+
+    def slice(self, start: Optional[int] = None, stop: Optional[int] = None) -> "TemplateTable":
+        """
+        Get a copy of a range of rows.
+
+        Args:
+            start: First row (default: 0)
+            stop: Row after the last one (default: all rows)
+
+        Returns:
+            New table with the rows in the range
+        """
+        start, stop, _ = slice(start, stop).indices(self._rows)
+        table = TemplateTable(self.template_id)
+        table._rows = max(stop - start, 0)
+        table._columns = {n: c.sliced(start, stop) for n, c in self._columns.items()}
+        return table
+
+    def between(
+        self, from_time: Optional[int] = None, to_time: Optional[int] = None
+    ) -> "TemplateTable":
+        """
+        Get a copy of the rows with a TransactTime in a range.
+
+        Rows must have been appended in TransactTime order.
+
+        Args:
+            from_time: First TransactTime to include (default: from the start)
+            to_time: Last TransactTime to include (default: to the end)
+
+        Returns:
+            New table with the rows in the range
+        """
+        times = self._columns.get("TransactTime")
+        if times is None:
+            return self.slice(0, 0)
+        start = bisect_left(times.values, int(from_time)) if from_time is not None else 0
+        stop = bisect_right(times.values, int(to_time)) if to_time is not None else self._rows
+        return self.slice(start, stop)
+
+
+class MessageStore:
+    """
+    Columnar store of EOBI messages, with one table per TemplateID.
+
+    Messages arrive as nested dicts, which cost hundreds of bytes each in
+    memory; the store routes each message to the :class:`TemplateTable` of
+    its TemplateID, which keeps every field in a typed array instead, so a
+    day of messages takes a small fraction of the memory and each field can
+    be read as a whole for vectorized analytics (see
+    :meth:`TemplateTable.to_numpy`, which needs NumPy: ``pip install
+    a7[numpy]``). The store is saved to and loaded from a single binary file
+    without NumPy.
+
+    Example:
+        >>> store = MessageStore()
+        >>> store.extend(client.eobi.iter_messages("XETR", 20230804, 52885, 2504978))
+        >>> adds = store[13100]
+        >>> prices = adds.to_numpy("OrderDetails.Price")
+        >>> store.save("2504978.a7cols")
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._tables: dict[int, TemplateTable] = {}
+
+    def __len__(self) -> int:
+        """Number of messages in all tables."""
+        return sum(len(table) for table in self._tables.values())
+
+    def __getitem__(self, template_id: int) -> TemplateTable:
+        """
+        Get the table of a TemplateID.
+
+        Raises:
+            KeyError: If no message of the template was appended
+        """
+        return self._tables[template_id]
+
+    def __contains__(self, template_id: object) -> bool:
+        """Whether messages of a TemplateID were appended."""
+        return template_id in self._tables
+
+    @property
+    def templates(self) -> list[int]:
+        """TemplateIDs with at least one message, ascending."""
+        return sorted(self._tables)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays of all tables."""
+        return sum(table.nbytes for table in self._tables.values())
+
+    def append(self, message: dict[str, Any]) -> None:
+        """
+        Add a message to the table of its TemplateID.
+
+        Args:
+            message: EOBI message with a MessageHeader, as returned in detailed mode
+        """
+        template_id = message["MessageHeader"]["TemplateID"]
+        table = self._tables.get(template_id)
+        if table is None:
+            table = self._tables[template_id] = TemplateTable(template_id)
+        table.append(message)
+
+    def extend(self, messages: Iterable[dict[str, Any]]) -> None:
+        """
+        Add messages, e.g. straight from :meth:`EOBIResource.iter_messages`.
+
+        Args:
+            messages: EOBI messages
+        """
+        for message in messages:
+            self.append(message)
+
+    def between(
+        self, from_time: Optional[int] = None, to_time: Optional[int] = None
+    ) -> "MessageStore":
+        """
+        Get a copy of the messages with a TransactTime in a range.
+
+        Messages must have been appended in TransactTime order.
+
+        Args:
+            from_time: First TransactTime to include (default: from the start)
+            to_time: Last TransactTime to include (default: to the end)
+
+        Returns:
+            New store with the messages in the range
+        """
+        store = MessageStore()
+        for template_id, table in self._tables.items():
+            part = table.between(from_time, to_time)
+            if len(part):
+                store._tables[template_id] = part
+        return store
+
+    def save(self, path: "str | os.PathLike[str]") -> None:
+        """
+        Write the store to a file.
+
+        Args:
+            path: File to write
+        """
+        header: dict[str, Any] = {"byteorder": sys.byteorder, "tables": []}
+        blobs = []
+        for template_id, table in sorted(self._tables.items()):
+            columns = []
+            for name, column in table._columns.items():
+                blob = column.values.tobytes()
+                blobs.append(blob)
+                columns.append(
+                    {
+                        "name": name,
+                        "kind": column.kind,
+                        "size": len(blob),
+                        "vocabulary": column.vocabulary,
+                    }
+                )
+            header["tables"].append(
+                {"template_id": template_id, "rows": len(table), "columns": columns}
+            )
+        encoded = json.dumps(header).encode()
+        with Path(path).open("wb") as file:
+            file.write(_MAGIC + struct.pack("<Q", len(encoded)) + encoded)
+            for blob in blobs:
+                file.write(blob)
+
+    @classmethod
+    def load(cls, path: "str | os.PathLike[str]") -> "MessageStore":
+        """
+        Read a store written by :meth:`save`.
+
+        Args:
+            path: File to read
+
+        Returns:
+            The store
+
+        Raises:
+            ValueError: If the file is not a saved store
+        """
+        with Path(path).open("rb") as file:
+            if file.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{path} is not a saved MessageStore")
+            (length,) = struct.unpack("<Q", file.read(8))
+            header = json.loads(file.read(length))
+            swap = header["byteorder"] != sys.byteorder
+            store = cls()
+            for spec in header["tables"]:
+                table = TemplateTable(spec["template_id"])
+                table._rows = spec["rows"]
+                for entry in spec["columns"]:
+                    column = _Column(entry["kind"], entry["vocabulary"])
+                    column.values.frombytes(file.read(entry["size"]))
+                    if swap:
+                        column.values.byteswap()
+                    table._columns[entry["name"]] = column
+                store._tables[table.template_id] = table
+        return store
@@ -3,6 +3,11 @@
 Default values - users can override via A7Client constructor or environment variables.
 """
 
+import os
+from typing import Callable, Optional
+
+import httpx
+
 # Default API Base URL (production)
 # Note: Version paths (/v1/, /v2/, etc.) are included in resource endpoints
 DEFAULT_BASE_URL = "https://a7.deutsche-boerse.com/api/"
@@ -15,3 +20,131 @@ DEFAULT_VERIFY_SSL = True
 
 # User agent
 USER_AGENT = "a7-python-sdk/0.2.3"
+
+# Retry policy: total attempts per request, base backoff and cap (seconds)
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_MAX_BACKOFF = 30.0
+
+# Credential pool: seconds a throttled token is benched without a Retry-After header
+DEFAULT_CREDENTIAL_COOLDOWN = 60.0
+
+# Persistent response cache size cap in bytes (compressed)
+DEFAULT_DISK_CACHE_MAX_SIZE = 1024**3
+
+# In-memory discovery cache: entry lifetime (seconds) and capacity
+DEFAULT_DISCOVERY_CACHE_TTL = 300.0
+DEFAULT_DISCOVERY_CACHE_MAX_ENTRIES = 1024
+
+# Connection pool: total connections, idle keep-alive connections and idle expiry (seconds)
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+# Circuit breaker: consecutive failures that open a circuit, seconds before a
+# half-open probe, and probes let through while half-open
+DEFAULT_BREAKER_FAILURE_THRESHOLD = 5
+DEFAULT_BREAKER_RESET_TIMEOUT = 30.0
+DEFAULT_BREAKER_HALF_OPEN_PROBES = 1
+
+# Hedged requests: percentile of recent response times before a duplicate is sent,
+# extra requests as a fraction of all requests, response times kept per family, and
+# threads sending hedgeable requests of sync clients
+DEFAULT_HEDGE_PERCENTILE = 95.0
+DEFAULT_HEDGE_BUDGET = 0.05
+DEFAULT_HEDGE_MIN_SAMPLES = 20
+DEFAULT_HEDGE_WINDOW = 1000
+DEFAULT_HEDGE_THREADS = 256
+
+# Request scheduler: requests in flight at once, share of the slots per priority
+# class while several classes wait, and the class of untagged requests
+DEFAULT_SCHEDULER_CONCURRENCY = 16
+DEFAULT_PRIORITY_WEIGHTS = {"interactive": 16.0, "normal": 4.0, "bulk": 1.0}
+DEFAULT_PRIORITY = "normal"
+
+# EOBI message streaming: transact times per page and packets fetched ahead
+DEFAULT_EOBI_PAGE_SIZE = 1000
+DEFAULT_EOBI_READ_AHEAD = 8
+
+# EOBI hierarchy crawler: segments listed at once and securities whose
+# transact times are paged at once
+DEFAULT_CRAWL_SEGMENT_CONCURRENCY = 4
+DEFAULT_CRAWL_SECURITY_CONCURRENCY = 8
+
+# Batch execution (client.map / client.gather): calls in flight at once
+DEFAULT_BATCH_CONCURRENCY = 8
+
+# HTTP/2 multiplexing (requires the 'h2' package: pip install a7[http2])
+DEFAULT_HTTP2 = False
+
+# Environment variables overriding the connection defaults above
+ENV_MAX_CONNECTIONS = "A7_MAX_CONNECTIONS"
+ENV_MAX_KEEPALIVE_CONNECTIONS = "A7_MAX_KEEPALIVE_CONNECTIONS"
+ENV_KEEPALIVE_EXPIRY = "A7_KEEPALIVE_EXPIRY"
+ENV_HTTP2 = "A7_HTTP2"
+
+
+def _env_number(name: str, default: float, cast: Callable[[str], float]) -> float:
+    """Read a numeric setting from the environment, or return the default."""
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return cast(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got {raw!r}") from None
+
+
+def resolve_http2(http2: Optional[bool] = None) -> bool:
+    """
+    Resolve whether to enable HTTP/2.
+
+    Args:
+        http2: Explicit setting; None falls back to A7_HTTP2, then DEFAULT_HTTP2
+
+    Returns:
+        True if HTTP/2 should be negotiated
+    """
+    if http2 is not None:
+        return http2
+    raw = os.getenv(ENV_HTTP2, "").strip()
+    if not raw:
+        return DEFAULT_HTTP2
+    return raw.lower() in ("1", "true", "yes", "on")
+
+
+def resolve_limits(
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+) -> httpx.Limits:
+    """
+    Resolve connection pool limits.
+
+    Each argument left as None is read from its A7_* environment variable,
+    falling back to the DEFAULT_* constant.
+
+    Args:
+        max_connections: Maximum number of concurrent connections
+        max_keepalive_connections: Maximum number of idle connections kept open
+        keepalive_expiry: Seconds an idle connection is kept open
+
+    Returns:
+        Pool limits for the HTTP transport
+
+    Raises:
+        ValueError: If an environment variable is not a valid number
+    """
+    if max_connections is None:
+        max_connections = int(_env_number(ENV_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS, int))
+    if max_keepalive_connections is None:
+        max_keepalive_connections = int(
+            _env_number(ENV_MAX_KEEPALIVE_CONNECTIONS, DEFAULT_MAX_KEEPALIVE_CONNECTIONS, int)
+        )
+    if keepalive_expiry is None:
+        keepalive_expiry = _env_number(ENV_KEEPALIVE_EXPIRY, DEFAULT_KEEPALIVE_EXPIRY, float)
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
@@ -0,0 +1,419 @@
+"""Concurrent, resumable crawl of the EOBI market hierarchy."""
+
+import asyncio
+import contextvars
+import inspect
+import json
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional, Protocol, Union, runtime_checkable
+
+from a7.config import (
+    DEFAULT_CRAWL_SECURITY_CONCURRENCY,
+    DEFAULT_CRAWL_SEGMENT_CONCURRENCY,
+    DEFAULT_EOBI_PAGE_SIZE,
+)
+
+if TYPE_CHECKING:
+    import os
+
+
+@runtime_checkable
+class ItemQueue(Protocol):
+    """Anything crawl items can be put() on, such as queue.Queue or asyncio.Queue."""
+
+    def put(self, item: "CrawlItem") -> Any:
+        """Add an item; may return an awaitable (asyncio.Queue)."""
+        ...
+
+
+# Receives each CrawlItem: a callable (a coroutine function for arun) or a queue
+Consumer = Union[Callable[["CrawlItem"], Any], ItemQueue]
+
+
+@dataclass
+class CrawlItem:
+    """
+    One security found by a crawl, ready to be downloaded.
+
+    Attributes:
+        market_id: Market identifier, e.g. 'XEUR'
+        date: Trading day in YYYYMMDD format
+        market_segment_id: Market segment ID
+        security_id: Security ID
+        transact_times: Transaction times of the security (empty if the
+                        crawl was told not to list them)
+    """
+
+    market_id: str
+    date: int
+    market_segment_id: int
+    security_id: int
+    transact_times: list[str] = field(default_factory=list, repr=False)
+
+
+class CrawlCheckpoint:
+    """
+    Progress of a crawl, kept in a file so an interrupted crawl can resume.
+
+    The file is an append-only JSON-lines log of the securities the
+    consumer is done with and of the segments all of whose securities are,
+    so recording progress costs one short write per security. A line cut
+    short by a crash is ignored when the file is read back.
+
+    A security is done when a callable consumer returns, or, for a queue
+    consumer, when the code taking items off the queue calls
+    :meth:`mark_done` after processing one.
+
+    Example:
+        >>> checkpoint = CrawlCheckpoint("xeur-20240102.crawl")
+        >>> EOBICrawler(client, "XEUR", 20240102, checkpoint=checkpoint).run(download)
+    """
+
+    def __init__(self, path: "str | os.PathLike[str]") -> None:
+        """
+        Initialize checkpoint, reading the progress already in the file.
+
+        Args:
+            path: Checkpoint file (created on the first record)
+        """
+        self.path = Path(path).expanduser()
+        self.scope: Optional[tuple[str, int]] = None
+        self.segments: set[int] = set()
+        self.securities: set[tuple[int, int]] = set()
+        self._open: dict[int, set[int]] = {}
+        self._lock = threading.RLock()
+        if self.path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        with self.path.open(encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if "market_id" in record:
+                    self.scope = (record["market_id"], record["date"])
+                elif "security" in record:
+                    self.securities.add((record["segment"], record["security"]))
+                else:
+                    self.segments.add(record["segment"])
+
+    def _append(self, record: dict[str, Any]) -> None:
+        with self._lock, self.path.open("a", encoding="utf-8") as file:
+            file.write(json.dumps(record) + "\n")
+
+    def bind(self, market_id: str, date: int) -> None:
+        """
+        Tie the checkpoint to the market and date of a crawl.
+
+        Args:
+            market_id: Market of the crawl
+            date: Trading day of the crawl
+
+        Raises:
+            ValueError: If the checkpoint holds progress of another market or date
+        """
+        if self.scope is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._append({"market_id": market_id, "date": date})
+            self.scope = (market_id, date)
+        elif self.scope != (market_id, date):
+            raise ValueError(
+                f"Checkpoint {self.path} belongs to a crawl of {self.scope[0]} on {self.scope[1]}"
+            )
+
+    def has_segment(self, market_segment_id: int) -> bool:
+        """Whether the consumer is done with every security of a segment."""
+        return market_segment_id in self.segments
+
+    def has_security(self, market_segment_id: int, security_id: int) -> bool:
+        """Whether the consumer is done with a security."""
+        return (market_segment_id, security_id) in self.securities
+
+    def track_segment(self, market_segment_id: int, security_ids: Iterable[int]) -> None:
+        """
+        Note the securities of a segment still to be done.
+
+        The segment is marked once :meth:`mark_done` was called for each of
+        them, or right away if there are none.
+
+        Args:
+            market_segment_id: Market segment ID
+            security_ids: Securities of the segment the consumer is yet to be handed
+        """
+        with self._lock:
+            pending = set(security_ids)
+            if pending:
+                self._open[market_segment_id] = pending
+            else:
+                self.mark_segment(market_segment_id)
+
+    def mark_done(self, item: CrawlItem) -> None:
+        """
+        Record that the consumer is done with an item.
+
+        Called by the crawler when a callable consumer returns; call it
+        yourself after processing an item taken off a queue consumer, from
+        any thread.
+
+        Args:
+            item: Item handed to the consumer
+        """
+        segment = item.market_segment_id
+        with self._lock:
+            self.mark_security(segment, item.security_id)
+            pending = self._open.get(segment)
+            if pending is not None:
+                pending.discard(item.security_id)
+                if not pending:
+                    del self._open[segment]
+                    self.mark_segment(segment)
+
+    def mark_segment(self, market_segment_id: int) -> None:
+        """Record that the consumer is done with every security of a segment."""
+        with self._lock:
+            self.segments.add(market_segment_id)
+            self._append({"segment": market_segment_id})
+
+    def mark_security(self, market_segment_id: int, security_id: int) -> None:
+        """Record that the consumer is done with a security."""
+        with self._lock:
+            self.securities.add((market_segment_id, security_id))
+            self._append({"segment": market_segment_id, "security": security_id})
+
+
+class EOBICrawler:
+    """
+    Walk the EOBI hierarchy of a market and date concurrently.
+
+    Lists the market segments (or takes the given ones), the securities of
+    every segment and the transaction times of every security, with up to
+    ``segment_concurrency`` segments and ``security_concurrency`` securities
+    being listed at once. Each security is handed to the consumer as a
+    :class:`CrawlItem` as soon as its transaction times are known, so
+    downloading can start while the rest of the market is still being
+    discovered. With a :class:`CrawlCheckpoint`, a crawl that was
+    interrupted picks up where it stopped: segments and securities the
+    consumer is done with are skipped.
+
+    The consumer is called from the crawler's threads, possibly from several
+    at once; pass a bounded ``queue.Queue`` to let downloaders apply
+    back-pressure. A callable consumer is done with an item when it returns.
+    Items put on a queue only count as done once the downloader calls
+    ``checkpoint.mark_done(item)``, so an interrupted crawl hands over again
+    every item that was queued but not yet processed.
+
+    Example:
+        >>> work: queue.Queue[CrawlItem] = queue.Queue(maxsize=100)
+        >>> crawler = EOBICrawler(client, "XEUR", 20240102,
+        ...                       checkpoint=CrawlCheckpoint("xeur.crawl"))
+        >>> threading.Thread(target=crawler.run, args=(work,)).start()
+        >>> item = work.get()
+        >>> download(item)
+        >>> crawler.checkpoint.mark_done(item)
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        market_id: str,
+        date: int,
+        *,
+        market_segment_ids: Optional[Iterable[int]] = None,
+        segment_concurrency: int = DEFAULT_CRAWL_SEGMENT_CONCURRENCY,
+        security_concurrency: int = DEFAULT_CRAWL_SECURITY_CONCURRENCY,
+        transact_times: bool = True,
+        page_size: int = DEFAULT_EOBI_PAGE_SIZE,
+        checkpoint: Optional[CrawlCheckpoint] = None,
+    ) -> None:
+        """
+        Initialize crawler.
+
+        Args:
+            client: A7Client for :meth:`run`, AsyncA7Client for :meth:`arun`
+            market_id: Market identifier, e.g. 'XEUR'
+            date: Trading day in YYYYMMDD format
+            market_segment_ids: Segments to crawl (default: all segments of the market)
+            segment_concurrency: Segments whose securities are listed at once (default: 4)
+            security_concurrency: Securities whose transaction times are listed at once
+                                  (default: 8)
+            transact_times: List the transaction times of each security (default: True)
+            page_size: Transaction times per request (default: 1000)
+            checkpoint: Progress file to resume from and record to (optional)
+
+        Raises:
+            ValueError: If a concurrency is below 1
+        """
+        if segment_concurrency < 1 or security_concurrency < 1:
+            raise ValueError("segment_concurrency and security_concurrency must be at least 1")
+        self.client = client
+        self.market_id = market_id
+        self.date = date
+        self.market_segment_ids = (
+            list(market_segment_ids) if market_segment_ids is not None else None
+        )
+        self.segment_concurrency = segment_concurrency
+        self.security_concurrency = security_concurrency
+        self.transact_times = transact_times
+        self.page_size = page_size
+        self.checkpoint = checkpoint
+
+    def _pending(self, segments: list[int]) -> list[int]:
+        if self.checkpoint is None:
+            return segments
+        return [segment for segment in segments if not self.checkpoint.has_segment(segment)]
+
+    def _todo(self, segment: int, securities: list[int]) -> list[int]:
+        if self.checkpoint is None:
+            return securities
+        return [s for s in securities if not self.checkpoint.has_security(segment, s)]
+
+    def _item(self, segment: int, security: int, times: list[str]) -> CrawlItem:
+        return CrawlItem(self.market_id, self.date, segment, security, times)
+
+    def run(self, consumer: Consumer) -> int:
+        """
+        Crawl with thread pools, handing each security to the consumer.
+
+        Args:
+            consumer: Callable taking a CrawlItem, or a queue to put() it on
+
+        Returns:
+            Number of items handed to the consumer by this run
+
+        Raises:
+            ValueError: If the checkpoint belongs to another market or date
+            Exception: The first error of a listing request or the consumer;
+                       progress up to then is kept in the checkpoint
+        """
+        if self.checkpoint is not None:
+            self.checkpoint.bind(self.market_id, self.date)
+        eobi = self.client.eobi
+        queued = isinstance(consumer, ItemQueue)
+        deliver = consumer.put if isinstance(consumer, ItemQueue) else consumer
+        lock = threading.Lock()
+        security_futures: list[Future[None]] = []
+        emitted = 0
+
+        def crawl_security(segment: int, security: int) -> None:
+            nonlocal emitted
+            times: list[str] = []
+            if self.transact_times:
+                times = list(
+                    eobi.iter_transact_times(
+                        self.market_id, self.date, segment, security, page_size=self.page_size
+                    )
+                )
+            item = self._item(segment, security, times)
+            deliver(item)
+            with lock:
+                emitted += 1
+            if self.checkpoint is not None and not queued:
+                self.checkpoint.mark_done(item)
+
+        def crawl_segment(segment: int) -> None:
+            todo = self._todo(segment, eobi.get_securities(self.market_id, self.date, segment))
+            if self.checkpoint is not None:
+                self.checkpoint.track_segment(segment, todo)
+            with lock:
+                for security in todo:
+                    context = contextvars.copy_context()
+                    security_futures.append(
+                        security_pool.submit(context.run, crawl_security, segment, security)
+                    )
+
+        segments = self.market_segment_ids
+        if segments is None:
+            segments = eobi.get_market_segments(self.market_id, self.date)
+        segments = self._pending(segments)
+        segment_pool = ThreadPoolExecutor(self.segment_concurrency, thread_name_prefix="a7-crawl")
+        security_pool = ThreadPoolExecutor(self.security_concurrency, thread_name_prefix="a7-crawl")
+        try:
+            segment_futures = [
+                segment_pool.submit(contextvars.copy_context().run, crawl_segment, segment)
+                for segment in segments
+            ]
+            for future in segment_futures:
+                future.result()
+            for future in security_futures:
+                future.result()
+        finally:
+            segment_pool.shutdown(wait=True, cancel_futures=True)
+            security_pool.shutdown(wait=True, cancel_futures=True)
+        return emitted
+
+    async def arun(self, consumer: Consumer) -> int:
+        """
+        Crawl with asyncio tasks, handing each security to the consumer.
+
+        The asyncio counterpart of :meth:`run`; the client must be an
+        AsyncA7Client. The consumer may be a coroutine function or an
+        ``asyncio.Queue``.
+
+        Args:
+            consumer: Callable taking a CrawlItem, or a queue to put() it on
+
+        Returns:
+            Number of items handed to the consumer by this run
+
+        Raises:
+            ValueError: If the checkpoint belongs to another market or date
+            Exception: The first error of a listing request or the consumer;
+                       progress up to then is kept in the checkpoint
+        """
+        if self.checkpoint is not None:
+            self.checkpoint.bind(self.market_id, self.date)
+        eobi = self.client.eobi
+        queued = isinstance(consumer, ItemQueue)
+        deliver = consumer.put if isinstance(consumer, ItemQueue) else consumer
+        segment_slots = asyncio.Semaphore(self.segment_concurrency)
+        security_slots = asyncio.Semaphore(self.security_concurrency)
+        emitted = 0
+
+        async def crawl_security(segment: int, security: int) -> None:
+            nonlocal emitted
+            times: list[str] = []
+            async with security_slots:
+                if self.transact_times:
+                    times = [
+                        transact_time
+                        async for transact_time in eobi.iter_transact_times(
+                            self.market_id, self.date, segment, security, page_size=self.page_size
+                        )
+                    ]
+            item = self._item(segment, security, times)
+            delivered = deliver(item)
+            if inspect.isawaitable(delivered):
+                await delivered
+            emitted += 1
+            if self.checkpoint is not None and not queued:
+                self.checkpoint.mark_done(item)
+
+        async def crawl_segment(segment: int) -> None:
+            async with segment_slots:
+                securities = await eobi.get_securities(self.market_id, self.date, segment)
+            todo = self._todo(segment, securities)
+            if self.checkpoint is not None:
+                self.checkpoint.track_segment(segment, todo)
+            await _gather(*(crawl_security(segment, s) for s in todo))
+
+        segments = self.market_segment_ids
+        if segments is None:
+            segments = await eobi.get_market_segments(self.market_id, self.date)
+        await _gather(*(crawl_segment(segment) for segment in self._pending(segments)))
+        return emitted
+
+
+async def _gather(*coroutines: Any) -> None:
+    """Run coroutines as tasks; on the first error, cancel the rest and raise it."""
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,64 @@
+"""JSON decoders used to parse response bodies."""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None  # type: ignore[assignment]
+
+# A decoder turns a raw response body into Python objects
+JSONDecoder = Callable[[bytes], Any]
+
+
+def stdlib_decoder(content: bytes) -> Any:
+    """Decode JSON with the standard library ``json`` module."""
+    return json.loads(content)
+
+
+def get_decoder(name: Optional[str] = None) -> JSONDecoder:
+    """
+    Get a JSON decoder by name.
+
+    Without a name the fastest installed library is used: orjson, then
+    msgspec, then the standard library. Every decoder accepts the raw
+    response bytes, so no intermediate ``str`` is created, and returns the
+    same objects as ``json.loads`` for A7 payloads (orjson and msgspec only
+    handle integers up to 64 bits, which covers all A7 identifiers and
+    nanosecond timestamps).
+
+    Args:
+        name: 'orjson', 'msgspec' or 'json' (default: auto-detect)
+
+    Returns:
+        Callable decoding bytes to Python objects
+
+    Raises:
+        ValueError: Unknown decoder name
+        ImportError: Requested library is not installed
+
+    Example:
+        >>> decode = get_decoder()
+        >>> decode(b'{"MarketIDs": ["XEUR"]}')
+        {'MarketIDs': ['XEUR']}
+    """
+    if name is None:
+        name = "orjson" if orjson is not None else "msgspec" if msgspec is not None else "json"
+
+    if name == "json":
+        return stdlib_decoder
+    if name == "orjson":
+        if orjson is None:
+            raise ImportError("orjson is not installed: pip install orjson")
+        return orjson.loads
+    if name == "msgspec":
+        if msgspec is None:
+            raise ImportError("msgspec is not installed: pip install msgspec")
+        return msgspec.json.Decoder().decode
+    raise ValueError(f"Unknown JSON decoder {name!r}, expected 'orjson', 'msgspec' or 'json'")
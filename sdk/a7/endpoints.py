@@ -0,0 +1,297 @@
+"""Classification of A7 request paths into endpoint families and resource methods."""
+
+import functools
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+# Families whose name spans more than one path segment after the version
+_MULTI_SEGMENT_FAMILIES = {
+    ("simulation", "auction"),
+    ("insights", "por"),
+    ("insights", "latencies"),
+}
+
+
+def endpoint_family(path: str) -> str:
+    """
+    Get the endpoint family of a request path.
+
+    The family is the API version plus the service name, e.g.
+    ``/v1/eobi``, ``/v1/ob``, ``/v2/rdi`` or ``/v1/simulation/auction``.
+    Any base path in front of the version (such as ``/api``) is ignored.
+
+    Args:
+        path: URL path of the request
+
+    Returns:
+        Endpoint family, or the path itself if no version segment is found
+
+    Example:
+        >>> endpoint_family("/api/v1/eobi/XEUR/20200227")
+        '/v1/eobi'
+    """
+    segments = [segment for segment in path.split("/") if segment]
+    for index, segment in enumerate(segments):
+        if len(segment) > 1 and segment[0] == "v" and segment[1:].isdigit():
+            service = segments[index + 1 : index + 3]
+            if tuple(service) in _MULTI_SEGMENT_FAMILIES:
+                return "/" + "/".join([segment, *service])
+            return "/" + "/".join([segment, *service[:1]])
+    return path
+
+
+# Path parameters that are always numeric; used to tell apart routes of the same shape
+_INT_PARAMS = frozenset(
+    {
+        "date",
+        "market_segment_id",
+        "security_id",
+        "transact_time",
+        "applseq_num",
+        "msg_seq_num",
+        "sending_time",
+        "roll",
+    }
+)
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+_INT_VALUE = r"-?\d+"
+_ANY_VALUE = r"[^/]+"
+
+
+@dataclass(frozen=True)
+class Route:
+    """
+    A resource method and the URL template it requests.
+
+    Attributes:
+        name: Resource method, e.g. 'eobi.get_message'
+        method: HTTP method
+        template: Path template relative to the base URL, e.g. '/v1/eobi/{market_id}'
+        query: Query parameters that must be present (to tell apart routes with
+               identical paths, such as T7 and CME order books)
+    """
+
+    name: str
+    method: str
+    template: str
+    query: frozenset[str] = frozenset()
+
+    @property
+    def family(self) -> str:
+        """Endpoint family of this route, e.g. '/v1/eobi'."""
+        return endpoint_family(self.template)
+
+    @property
+    def pattern(self) -> "re.Pattern[str]":
+        """Compiled regular expression matching concrete paths of this route."""
+        return _compile(self.template)
+
+
+@dataclass(frozen=True)
+class RouteMatch:
+    """A request path resolved to its route and path parameters."""
+
+    route: Route
+    params: dict[str, str]
+
+
+@functools.cache
+def _compile(template: str) -> "re.Pattern[str]":
+    # split() yields literal text at even and placeholder names at odd positions
+    parts = _PLACEHOLDER.split(template)
+    regex = "".join(
+        re.escape(part)
+        if index % 2 == 0
+        else rf"(?P<{part}>{_INT_VALUE if part in _INT_PARAMS else _ANY_VALUE})"
+        for index, part in enumerate(parts)
+    )
+    return re.compile(regex + "$")
+
+
+ROUTES: tuple[Route, ...] = (
+    # RDI v2
+    Route("rdi.get_markets", "GET", "/v2/rdi/"),
+    Route("rdi.get_market_segments", "GET", "/v2/rdi/{market_id}/{date}/"),
+    Route(
+        "rdi.get_security_details",
+        "GET",
+        "/v2/rdi/{market_id}/{date}/{market_segment_id}/{security_id}",
+    ),
+    Route(
+        "rdi.get_instrument_snapshot",
+        "GET",
+        "/v2/rdi/{market_id}/{date}/{market_segment_id}/{security_id}/{msg_seq_num}",
+    ),
+    # SD v2
+    Route("sd.get_exchanges", "GET", "/v2/sd/"),
+    Route("sd.get_dates", "GET", "/v2/sd/{exchange}/"),
+    Route("sd.get_assets", "GET", "/v2/sd/{exchange}/{date}/"),
+    Route("sd.get_securities", "GET", "/v2/sd/{exchange}/{date}/{asset}/"),
+    Route("sd.get_all_security_details", "GET", "/v2/sd/{exchange}/{date}/{asset}"),
+    Route("sd.get_security_details", "GET", "/v2/sd/{exchange}/{date}/{asset}/{security_id}"),
+    # EOBI
+    Route("eobi.get_markets", "GET", "/v1/eobi"),
+    Route("eobi.get_dates", "GET", "/v1/eobi/{market_id}"),
+    Route("eobi.get_market_segments", "GET", "/v1/eobi/{market_id}/{date}"),
+    Route("eobi.get_securities", "GET", "/v1/eobi/{market_id}/{date}/{market_segment_id}"),
+    Route(
+        "eobi.get_transact_times",
+        "GET",
+        "/v1/eobi/{market_id}/{date}/{market_segment_id}/{security_id}",
+    ),
+    Route(
+        "eobi.get_applseq_nums",
+        "GET",
+        "/v1/eobi/{market_id}/{date}/{market_segment_id}/{security_id}/{transact_time}",
+    ),
+    Route(
+        "eobi.get_msg_seq_nums",
+        "GET",
+        "/v1/eobi/{market_id}/{date}/{market_segment_id}/{security_id}/{transact_time}"
+        "/{applseq_num}",
+    ),
+    Route(
+        "eobi.get_message",
+        "GET",
+        "/v1/eobi/{market_id}/{date}/{market_segment_id}/{security_id}/{transact_time}"
+        "/{applseq_num}/{msg_seq_num}",
+    ),
+    # MDP
+    Route("mdp.get_exchanges", "GET", "/v1/mdp"),
+    Route("mdp.get_dates", "GET", "/v1/mdp/{exchange}"),
+    Route("mdp.get_assets", "GET", "/v1/mdp/{exchange}/{date}"),
+    Route("mdp.get_securities", "GET", "/v1/mdp/{exchange}/{date}/{asset}"),
+    Route("mdp.get_sending_times", "GET", "/v1/mdp/{exchange}/{date}/{asset}/{security_id}"),
+    Route(
+        "mdp.get_message",
+        "GET",
+        "/v1/mdp/{exchange}/{date}/{asset}/{security_id}/{sending_time}",
+    ),
+    # Order books (only get_t7 sends 'indicatives')
+    Route(
+        "orderbook.get_t7",
+        "GET",
+        "/v1/ob/{market_id}/{date}/{market_segment_id}/{security_id}",
+        frozenset({"indicatives"}),
+    ),
+    Route("orderbook.get_cme", "GET", "/v1/ob/{exchange}/{date}/{asset}/{security_id}"),
+    # Algorithms
+    Route("algo.list_owners", "GET", "/v1/algo"),
+    Route("algo.run", "GET", "/v1/algo/{owner}/{algorithm}/run"),
+    Route("algo.download", "GET", "/v1/algo/{owner}/{algorithm}/download"),
+    Route("algo.get_metadata", "GET", "/v1/algo/{owner}/{algorithm}"),
+    Route("algo.get_metadata", "GET", "/v1/algo/{owner}"),
+    Route("algo.upload", "PUT", "/v1/algo/{owner}/{algorithm}"),
+    Route("algo.delete", "DELETE", "/v1/algo/{owner}/{algorithm}"),
+    # Datasets
+    Route("dataset.list_owners", "GET", "/v1/dataset"),
+    Route("dataset.get_datasets", "GET", "/v1/dataset/{owner}"),
+    Route("dataset.get_metadata", "GET", "/v1/dataset/{owner}/{dataset}"),
+    Route("dataset.get_data", "GET", "/v1/dataset/{owner}/{dataset}/data"),
+    Route("dataset.delete", "DELETE", "/v1/dataset/{owner}/{dataset}"),
+    # Insights
+    Route("insights.get_por_market_segments", "GET", "/v1/insights/por"),
+    Route("insights.get_por_rolls", "GET", "/v1/insights/por/{market_segment}"),
+    Route("insights.get_por_data", "GET", "/v1/insights/por/{market_segment}/{roll}"),
+    Route(
+        "insights.get_latency_histogram",
+        "GET",
+        "/v1/insights/latencies/{date}/{trigger}/{target}/{regime}/{target_action}",
+    ),
+    # Precalc
+    Route("precalc.list_owners", "GET", "/v1/precalc"),
+    Route("precalc.get_jobs", "GET", "/v1/precalc/{owner}"),
+    Route("precalc.get_definition", "GET", "/v1/precalc/{owner}/{precalc}"),
+    Route("precalc.get_dates", "GET", "/v1/precalc/{owner}/{precalc}/"),
+    Route("precalc.get_tasks", "GET", "/v1/precalc/{owner}/{precalc}/{date}"),
+    Route("precalc.get_results", "GET", "/v1/precalc/{owner}/{precalc}/{date}/{task}"),
+    Route("precalc.get_data", "GET", "/v1/precalc/{owner}/{precalc}/{date}/{task}/{result}"),
+    Route("precalc.create", "PUT", "/v1/precalc/{owner}/{precalc}"),
+    Route("precalc.delete", "DELETE", "/v1/precalc/{owner}/{precalc}"),
+    Route("precalc.activate", "PATCH", "/v1/precalc/{owner}/{precalc}/activate"),
+    Route("precalc.deactivate", "PATCH", "/v1/precalc/{owner}/{precalc}/deactivate"),
+    # Auction simulations (numeric segment/security routes before symbol routes)
+    Route("auction.get_exchanges", "GET", "/v1/simulation/auction/"),
+    Route("auction.get_dates", "GET", "/v1/simulation/auction/{exchange}/"),
+    Route("auction.get_market_segments", "GET", "/v1/simulation/auction/{exchange}/{date}/"),
+    Route(
+        "auction.get_securities",
+        "GET",
+        "/v1/simulation/auction/{exchange}/{date}/{market_segment_id}/",
+    ),
+    Route(
+        "auction.get_security",
+        "GET",
+        "/v1/simulation/auction/{exchange}/{date}/{market_segment_id}/{security_id}",
+    ),
+    Route(
+        "auction.get_auction_types",
+        "GET",
+        "/v1/simulation/auction/{exchange}/{date}/{market_segment_id}/{security_id}/",
+    ),
+    Route(
+        "auction.get_auction",
+        "GET",
+        "/v1/simulation/auction/{exchange}/{date}/{market_segment_id}/{security_id}/{auction_type}",
+    ),
+    Route(
+        "auction.get_security_by_symbol", "GET", "/v1/simulation/auction/{exchange}/{date}/{symbol}"
+    ),
+    Route(
+        "auction.get_auction_types_by_symbol",
+        "GET",
+        "/v1/simulation/auction/{exchange}/{date}/{symbol}/",
+    ),
+    Route(
+        "auction.get_auction_by_symbol",
+        "GET",
+        "/v1/simulation/auction/{exchange}/{date}/{symbol}/{auction_type}",
+    ),
+)
+
+
+def _api_path(path: str) -> str:
+    """Strip any base path in front of the version segment."""
+    segments = path.split("/")
+    for index, segment in enumerate(segments):
+        if len(segment) > 1 and segment[0] == "v" and segment[1:].isdigit():
+            return "/" + "/".join(segments[index:])
+    return path
+
+
+def match_route(request: httpx.Request) -> Optional[RouteMatch]:
+    """
+    Resolve a request to the resource method that issued it.
+
+    Args:
+        request: Outgoing request
+
+    Returns:
+        Matched route and its path parameters, or None for unknown paths
+
+    Example:
+        >>> match = match_route(httpx.Request("GET", "https://host/api/v1/eobi/XEUR/20200227"))
+        >>> match.route.name, match.params
+        ('eobi.get_market_segments', {'market_id': 'XEUR', 'date': '20200227'})
+    """
+    path = _api_path(request.url.path)
+    for route in _routes_for(request.method.upper(), path.split("/", 2)[1]):
+        if not route.query.issubset(request.url.params.keys()):
+            continue
+        match = route.pattern.match(path)
+        if match is not None:
+            return RouteMatch(route, match.groupdict())
+    return None
+
+
+@functools.cache
+def _routes_for(method: str, version: str) -> tuple[Route, ...]:
+    return tuple(
+        route
+        for route in ROUTES
+        if route.method == method and route.template.startswith(f"/{version}/")
+    )
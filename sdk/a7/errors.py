@@ -1,5 +1,9 @@
 """Custom exceptions for A7 SDK."""
 
+from typing import Any, Optional
+
+import httpx
+
 
 class A7Error(Exception):
     """Base exception for all A7 SDK errors."""
@@ -9,6 +13,10 @@ class A7Error(Exception):
         super().__init__(message)
         self.status_code = status_code
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle with the message and attributes, e.g. for ShardedFetcher workers."""
+        return type(self), self.args, self.__dict__
+
 
 class AuthenticationError(A7Error):
     """Raised when authentication fails (401)."""
@@ -45,17 +53,30 @@ class ValidationError(A7Error):
 class RateLimitError(A7Error):
     """Raised when rate limit is exceeded (429)."""
 
-    def __init__(self, message: str = "Rate limit exceeded. Please retry later.") -> None:
-        """Initialize rate limit error."""
+    def __init__(
+        self,
+        message: str = "Rate limit exceeded. Please retry later.",
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """Initialize rate limit error with the server's Retry-After hint (seconds)."""
         super().__init__(message, status_code=429)
+        self.retry_after = retry_after
+
+    def __reduce__(self) -> tuple[type, tuple[str, Optional[float]]]:
+        """Pickle with the constructor arguments, e.g. for ShardedFetcher workers."""
+        return type(self), (str(self), self.retry_after)
 
 
 class ServerError(A7Error):
     """Raised when server error occurs (5xx)."""
 
-    def __init__(self, message: str = "Server error occurred.") -> None:
+    def __init__(self, message: str = "Server error occurred.", status_code: int = 500) -> None:
         """Initialize server error."""
-        super().__init__(message, status_code=500)
+        super().__init__(message, status_code=status_code)
+
+    def __reduce__(self) -> tuple[type, tuple[str, Optional[int]]]:
+        """Pickle with the constructor arguments, e.g. for ShardedFetcher workers."""
+        return type(self), (str(self), self.status_code)
 
 
 class ConnectionError(A7Error):
@@ -64,3 +85,57 @@ class ConnectionError(A7Error):
     def __init__(self, message: str = "Connection to A7 API failed.") -> None:
         """Initialize connection error."""
         super().__init__(message)
+
+
+class CircuitOpenError(A7Error):
+    """Raised without sending a request while an endpoint family's circuit is open."""
+
+    def __init__(self, family: str, retry_after: Optional[float] = None) -> None:
+        """Initialize error with the endpoint family and seconds until the next probe."""
+        super().__init__(f"Circuit open for {family}; failing fast")
+        self.family = family
+        self.retry_after = retry_after
+
+    def __reduce__(self) -> tuple[type, tuple[str, Optional[float]]]:
+        """Pickle with the constructor arguments, e.g. for ShardedFetcher workers."""
+        return type(self), (self.family, self.retry_after)
+
+
+class DeadlineExceededError(A7Error):
+    """Raised instead of sending a request once the active Deadline has passed."""
+
+    def __init__(self, overdue: float = 0.0) -> None:
+        """Initialize error with the seconds since the deadline passed."""
+        super().__init__(f"Deadline exceeded {abs(overdue):.3f}s ago; request not sent")
+        self.overdue = abs(overdue)
+
+    def __reduce__(self) -> tuple[type, tuple[float]]:
+        """Pickle with the constructor arguments, e.g. for ShardedFetcher workers."""
+        return type(self), (self.overdue,)
+
+
+def error_from_response(response: httpx.Response, retry_after: Optional[float] = None) -> A7Error:
+    """
+    Map an HTTP error response to the matching A7 exception.
+
+    Args:
+        response: Response with a 4xx/5xx status code (body must be readable)
+        retry_after: Parsed Retry-After delay, attached to RateLimitError
+
+    Returns:
+        Exception instance for the caller to raise
+    """
+    status_code = response.status_code
+    message = f"HTTP {status_code}: {response.text}"
+
+    if status_code == 401:
+        return AuthenticationError(message)
+    if status_code == 403:
+        return ForbiddenError(message)
+    if status_code == 404:
+        return NotFoundError(message)
+    if status_code == 400:
+        return ValidationError(message)
+    if status_code == 429:
+        return RateLimitError(message, retry_after=retry_after)
+    return ServerError(message, status_code=status_code)
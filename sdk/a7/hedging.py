@@ -0,0 +1,334 @@
+"""Hedged requests to cut tail latency of idempotent GETs."""
+
+import asyncio
+import contextvars
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Optional
+
+import httpx
+
+from a7.config import (
+    DEFAULT_HEDGE_BUDGET,
+    DEFAULT_HEDGE_MIN_SAMPLES,
+    DEFAULT_HEDGE_PERCENTILE,
+    DEFAULT_HEDGE_THREADS,
+    DEFAULT_HEDGE_WINDOW,
+)
+from a7.endpoints import endpoint_family
+from a7.transport import AnyTransport, TransportWrapper
+
+HEDGED_METHODS = frozenset({"GET", "HEAD"})
+
+# Latency samples added before a family's hedge delay is recomputed
+_REFRESH_EVERY = 16
+
+
+class _Latencies:
+    """Recent response times of one endpoint family."""
+
+    def __init__(self, window: int) -> None:
+        self.samples: deque[float] = deque(maxlen=window)
+        self.delay: Optional[float] = None
+        self.pending = 0
+
+
+class Hedger:
+    """
+    Hedging of idempotent GET requests.
+
+    If a response has not arrived after the ``percentile`` of recent
+    response times of the same endpoint family, a duplicate request is
+    sent; whichever answers first is returned and the other is cancelled
+    (async) or discarded when it completes (sync). Hedging starts once a
+    family has ``min_samples`` response times, and at most ``budget`` extra
+    requests are sent per request overall (0.05 = 5% more traffic).
+
+    A thread cannot be interrupted, so sync clients send every hedgeable
+    request on one of ``threads`` hedging threads and a losing request runs
+    to completion, holding its thread until then. A hedge is only sent while
+    a thread is free; when none is, requests are sent without hedging.
+
+    Example:
+        >>> hedger = Hedger(percentile=95, budget=0.05, families={"/v1/ob", "/v2/rdi"})
+        >>> client = A7Client(token="...", hedging=hedger)
+        >>> hedger.stats()
+        {'requests': 1200, 'hedged': 58, 'hedge_wins': 41}
+    """
+
+    def __init__(
+        self,
+        percentile: float = DEFAULT_HEDGE_PERCENTILE,
+        budget: float = DEFAULT_HEDGE_BUDGET,
+        *,
+        min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES,
+        min_delay: float = 0.0,
+        max_delay: Optional[float] = None,
+        families: Optional[Iterable[str]] = None,
+        window: int = DEFAULT_HEDGE_WINDOW,
+        threads: int = DEFAULT_HEDGE_THREADS,
+    ) -> None:
+        """
+        Initialize hedger.
+
+        Args:
+            percentile: Percentile of recent response times after which a
+                        hedge is sent (default: 95.0)
+            budget: Maximum hedges as a fraction of all requests (default: 0.05)
+            min_samples: Response times needed before a family is hedged (default: 20)
+            min_delay: Lower bound of the hedge delay in seconds
+            max_delay: Upper bound of the hedge delay in seconds (default: none)
+            families: Endpoint families to hedge, e.g. {'/v1/ob'} (default: all)
+            window: Recent response times kept per family (default: 1000)
+            threads: Requests in flight on the hedging threads of a sync
+                     client, losers included (default: 256)
+
+        Raises:
+            ValueError: If percentile is not in (0, 100], budget is negative
+                        or threads is below 1
+        """
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be in (0, 100]")
+        if budget < 0:
+            raise ValueError("budget must not be negative")
+        if threads < 1:
+            raise ValueError("threads must be at least 1")
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = max(1, min_samples)
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.families = frozenset(families) if families is not None else None
+        self.window = window
+        self.threads = threads
+        self._lock = threading.Lock()
+        self._latencies: dict[str, _Latencies] = {}
+        self._requests = 0
+        self._hedged = 0
+        self._wins = 0
+
+    def applies_to(self, request: httpx.Request) -> bool:
+        """Check whether a request may be hedged."""
+        if request.method.upper() not in HEDGED_METHODS:
+            return False
+        return self.families is None or endpoint_family(request.url.path) in self.families
+
+    def delay(self, family: str) -> Optional[float]:
+        """
+        Get the hedge delay of an endpoint family and count the request.
+
+        Args:
+            family: Endpoint family of the request
+
+        Returns:
+            Seconds to wait before hedging, or None if the request is not
+            hedged (too few samples yet, or the budget is spent)
+        """
+        with self._lock:
+            self._requests += 1
+            latencies = self._latencies.get(family)
+            if latencies is None or self._hedged + 1 > self.budget * self._requests:
+                return None
+            return latencies.delay
+
+    def try_hedge(self) -> bool:
+        """Take one hedge from the budget; False if the budget is spent."""
+        with self._lock:
+            if self._hedged + 1 > self.budget * self._requests:
+                return False
+            self._hedged += 1
+            return True
+
+    def record(self, family: str, elapsed: float, hedge_won: bool = False) -> None:
+        """
+        Record the response time of a request.
+
+        Args:
+            family: Endpoint family of the request
+            elapsed: Seconds until the response arrived
+            hedge_won: Whether the hedge answered before the original request
+        """
+        with self._lock:
+            self._wins += hedge_won
+            latencies = self._latencies.setdefault(family, _Latencies(self.window))
+            latencies.samples.append(elapsed)
+            latencies.pending += 1
+            if len(latencies.samples) < self.min_samples:
+                return
+            if latencies.delay is not None and latencies.pending < _REFRESH_EVERY:
+                return
+            latencies.pending = 0
+            ordered = sorted(latencies.samples)
+            rank = max(0, math.ceil(self.percentile / 100 * len(ordered)) - 1)
+            delay = max(self.min_delay, ordered[rank])
+            latencies.delay = delay if self.max_delay is None else min(delay, self.max_delay)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get hedging counters.
+
+        Returns:
+            Dict with 'requests' (hedgeable requests), 'hedged' (duplicates
+            sent) and 'hedge_wins' (duplicates that answered first)
+        """
+        with self._lock:
+            return {"requests": self._requests, "hedged": self._hedged, "hedge_wins": self._wins}
+
+
+def _copy(request: httpx.Request) -> httpx.Request:
+    """Build an independent copy of a bodiless request for the hedge."""
+    return httpx.Request(
+        request.method, request.url, headers=request.headers, extensions=dict(request.extensions)
+    )
+
+
+def _discard(future: "Future[httpx.Response]") -> None:
+    """Close the response of a request that lost the race."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+class HedgingTransport(TransportWrapper):
+    """Transport wrapper that hedges slow idempotent requests with a Hedger."""
+
+    def __init__(self, transport: AnyTransport, hedger: Hedger) -> None:
+        """
+        Initialize hedging transport.
+
+        Args:
+            transport: Transport that actually sends the requests
+            hedger: Hedging configuration and statistics
+        """
+        super().__init__(transport)
+        self._hedger = hedger
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._busy = 0  # hedging threads taken by requests still in flight
+
+    def _take_thread(self) -> bool:
+        """Take a hedging thread for a request, or return False if none is free."""
+        with self._executor_lock:
+            if self._busy >= self._hedger.threads:
+                return False
+            self._busy += 1
+            return True
+
+    def _release_thread(self, *_: object) -> None:
+        with self._executor_lock:
+            self._busy -= 1
+
+    def _submit(self, request: httpx.Request) -> "Future[httpx.Response]":
+        """Send on a thread taken with _take_thread; it is released once the request is done."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self._hedger.threads, thread_name_prefix="a7-hedge"
+                )
+            pool = self._executor
+        # Each send runs in a copy of the caller's context, so the active
+        # Deadline and priority reach the transports below
+        future = pool.submit(contextvars.copy_context().run, self._timed_send, request)
+        future.add_done_callback(self._release_thread)
+        return future
+
+    def _timed_send(self, request: httpx.Request) -> httpx.Response:
+        start = time.monotonic()
+        response = self._send(request)
+        response.extensions["a7_hedge_elapsed"] = time.monotonic() - start
+        return response
+
+    async def _timed_asend(self, request: httpx.Request) -> httpx.Response:
+        start = time.monotonic()
+        response = await self._asend(request)
+        response.extensions["a7_hedge_elapsed"] = time.monotonic() - start
+        return response
+
+    def _record(self, family: str, winner: int, response: httpx.Response, delay: float) -> None:
+        elapsed = response.extensions["a7_hedge_elapsed"]
+        # A winning hedge was sent 'delay' seconds after the original request
+        self._hedger.record(family, elapsed + delay * winner, hedge_won=winner > 0)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request, and a duplicate if it is slower than the hedge delay."""
+        if not self._hedger.applies_to(request):
+            return self._send(request)
+        family = endpoint_family(request.url.path)
+        delay = self._hedger.delay(family)
+        if delay is None or not self._take_thread():
+            response = self._timed_send(request)
+            self._record(family, 0, response, 0.0)
+            return response
+
+        futures = [self._submit(request)]
+        done, _ = wait(futures, timeout=delay)
+        if not done and self._take_thread():
+            if self._hedger.try_hedge():
+                futures.append(self._submit(_copy(request)))
+            else:
+                self._release_thread()
+
+        pending = set(futures)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for winner, future in enumerate(futures):
+                if future in done and future.exception() is None:
+                    for loser in pending:
+                        loser.add_done_callback(_discard)
+                    response = future.result()
+                    self._record(family, winner, response, delay)
+                    return response
+            error = error or next(future.exception() for future in done)
+        assert error is not None
+        raise error
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request, and a duplicate if it is slower than the hedge delay."""
+        if not self._hedger.applies_to(request):
+            return await self._asend(request)
+        family = endpoint_family(request.url.path)
+        delay = self._hedger.delay(family)
+        if delay is None:
+            response = await self._timed_asend(request)
+            self._record(family, 0, response, 0.0)
+            return response
+
+        tasks = [asyncio.ensure_future(self._timed_asend(request))]
+        won: Optional[asyncio.Future[httpx.Response]] = None
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and self._hedger.try_hedge():
+                tasks.append(asyncio.ensure_future(self._timed_asend(_copy(request))))
+
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for winner, task in enumerate(tasks):
+                    if task in done and task.exception() is None:
+                        won = task
+                        response = task.result()
+                        self._record(family, winner, response, delay)
+                        return response
+                error = error or next(task.exception() for task in done)
+            assert error is not None
+            raise error
+        finally:
+            # Cancel the request that lost the race, or both if the caller was cancelled
+            for task in tasks:
+                if task is won:
+                    continue
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled() and task.exception() is None:
+                    await task.result().aclose()
+
+    def close(self) -> None:
+        """Stop the hedging threads and close the wrapped transport."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        super().close()
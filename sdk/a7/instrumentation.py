@@ -0,0 +1,341 @@
+"""Per-request instrumentation hooks."""
+
+import contextvars
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+import httpx
+
+from a7.cache import CACHE_STATUS_HEADER
+from a7.decoders import JSONDecoder
+from a7.endpoints import _api_path, endpoint_family, match_route
+from a7.transport import AnyTransport, TransportWrapper
+
+if TYPE_CHECKING:
+    from a7.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+# httpcore trace steps that make up connection setup (DNS + TCP, TLS)
+_CONNECT_STEPS = ("connect_tcp", "connect_unix_socket", "start_tls")
+
+# Response last received in the current thread or task; the resource method
+# that sent the request decodes its body in the same context
+_received: contextvars.ContextVar[Optional["weakref.ref[httpx.Response]"]] = contextvars.ContextVar(
+    "a7_instrumented_response", default=None
+)
+
+
+@dataclass
+class RequestInfo:
+    """
+    Description of an outgoing request, passed to ``on_request`` hooks.
+
+    Attributes:
+        method: HTTP method
+        url: Full request URL
+        endpoint: URL template of the resource method, e.g.
+                  '/v1/eobi/{market_id}/{date}', or the path for unknown routes
+        resource_method: Resource method that issued the request, e.g.
+                         'eobi.get_market_segments', or None for unknown routes
+        family: Endpoint family, e.g. '/v1/eobi'
+    """
+
+    method: str
+    url: httpx.URL
+    endpoint: str
+    resource_method: Optional[str]
+    family: str
+
+
+@dataclass
+class RequestMetrics(RequestInfo):
+    """
+    Outcome and timings of a request, passed to ``on_response`` hooks.
+
+    Timings are in seconds. ``wait`` runs from sending the request until the
+    response headers arrive, excluding connection setup; it includes time
+    spent in the rate limiter and between retries.
+
+    Attributes:
+        status_code: Final HTTP status, or None if no response was received
+        response_bytes: Size of the (decompressed) response body
+        cached: Whether the response was served from a response cache
+        connect: DNS, TCP and TLS setup of new connections
+        wait: Time to response headers, excluding connect
+        download: Time to read the response body
+        decode: Time to decode the JSON body, or None if it was not decoded
+        error: Exception raised by the transport, if any
+    """
+
+    status_code: Optional[int] = None
+    response_bytes: int = 0
+    cached: bool = False
+    connect: float = 0.0
+    wait: float = 0.0
+    download: float = 0.0
+    decode: Optional[float] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def total(self) -> float:
+        """Sum of all timings."""
+        return self.connect + self.wait + self.download + (self.decode or 0.0)
+
+
+RequestHook = Callable[[RequestInfo], None]
+ResponseHook = Callable[[RequestMetrics], None]
+
+
+class _ConnectTimer:
+    """httpcore ``trace`` extension adding up connection setup time."""
+
+    def __init__(self, chained: Optional[Callable[..., Any]]) -> None:
+        self.connect = 0.0
+        self._chained = chained
+        self._started: dict[str, float] = {}
+
+    def _record(self, name: str) -> None:
+        step, _, event = name.rpartition(".")
+        if not step.endswith(_CONNECT_STEPS):
+            return
+        if event == "started":
+            self._started[step] = time.perf_counter()
+        elif step in self._started:
+            self.connect += time.perf_counter() - self._started.pop(step)
+
+    def trace(self, name: str, info: dict[str, Any]) -> None:
+        self._record(name)
+        if self._chained is not None:
+            self._chained(name, info)
+
+    async def atrace(self, name: str, info: dict[str, Any]) -> None:
+        self._record(name)
+        if self._chained is not None:
+            await self._chained(name, info)
+
+
+class Instrumentation:
+    """
+    Request hooks and optional metrics collection for a client.
+
+    ``on_request`` is called before a request is sent. ``on_response`` is
+    called once the request is complete: after the JSON body has been
+    decoded, or straight away for error responses, non-JSON bodies and
+    transport errors. Exceptions raised by hooks are logged, never
+    propagated to the caller.
+
+    Example:
+        >>> from a7 import A7Client, Instrumentation, MetricsRegistry
+        >>> registry = MetricsRegistry()
+        >>> client = A7Client(
+        ...     token="YOUR_A7_TOKEN",
+        ...     instrumentation=Instrumentation(on_response=print, metrics=registry),
+        ... )
+    """
+
+    def __init__(
+        self,
+        on_request: Optional[RequestHook] = None,
+        on_response: Optional[ResponseHook] = None,
+        metrics: Optional["MetricsRegistry"] = None,
+    ) -> None:
+        """
+        Initialize instrumentation.
+
+        Args:
+            on_request: Called with a RequestInfo before each request
+            on_response: Called with a RequestMetrics after each request
+            metrics: Registry aggregating every RequestMetrics
+        """
+        self.on_request = on_request
+        self.on_response = on_response
+        self.metrics = metrics
+        self._lock = threading.Lock()
+        # Responses waiting to be decoded, by id() of the response
+        self._pending: dict[int, RequestMetrics] = {}
+
+    def describe(self, request: httpx.Request) -> RequestMetrics:
+        """
+        Classify a request by endpoint template and resource method.
+
+        Args:
+            request: Outgoing request
+
+        Returns:
+            Metrics record with no outcome yet
+        """
+        match = match_route(request)
+        return RequestMetrics(
+            method=request.method,
+            url=request.url,
+            endpoint=match.route.template if match else _api_path(request.url.path),
+            resource_method=match.route.name if match else None,
+            family=endpoint_family(request.url.path),
+        )
+
+    def request_started(self, metrics: RequestMetrics) -> None:
+        """Call the ``on_request`` hook."""
+        if self.on_request is not None:
+            self._call(self.on_request, metrics)
+
+    def response_received(self, response: httpx.Response, metrics: RequestMetrics) -> None:
+        """
+        Record a fully read response and decide when to report it.
+
+        Successful JSON responses are reported when their body is decoded; if
+        it never is, when the response is garbage collected. Everything else
+        is reported immediately.
+        """
+        content_type = response.headers.get("Content-Type", "")
+        if not (response.is_success and "json" in content_type):
+            self.finish(metrics)
+            return
+
+        key = id(response)
+        with self._lock:
+            self._pending[key] = metrics
+        weakref.finalize(response, self._release, key)
+        _received.set(weakref.ref(response))
+
+    def finish(self, metrics: RequestMetrics) -> None:
+        """Report a complete request to the hook and the registry."""
+        if self.on_response is not None:
+            self._call(self.on_response, metrics)
+        if self.metrics is not None:
+            self._call(self.metrics.observe, metrics)
+
+    def wrap_decoder(self, decode: JSONDecoder) -> JSONDecoder:
+        """
+        Wrap a JSON decoder so decode time is added to the pending request.
+
+        Args:
+            decode: Decoder used by the resources
+
+        Returns:
+            Decoder that times each call and reports the request it belongs to
+        """
+
+        def instrumented(content: bytes) -> Any:
+            start = time.perf_counter()
+            try:
+                return decode(content)
+            finally:
+                elapsed = time.perf_counter() - start
+                metrics = self._claim(content)
+                if metrics is not None:
+                    metrics.decode = elapsed
+                    self.finish(metrics)
+
+        return instrumented
+
+    def _claim(self, content: bytes) -> Optional[RequestMetrics]:
+        """Pending request of the context's last response, if content is its body."""
+        received = _received.get()
+        response = received() if received is not None else None
+        if response is None or response.content is not content:
+            return None
+        with self._lock:
+            return self._pending.pop(id(response), None)
+
+    def _release(self, key: int) -> None:
+        """Report a response whose body was never decoded."""
+        with self._lock:
+            metrics = self._pending.pop(key, None)
+        if metrics is not None:
+            self.finish(metrics)
+
+    @staticmethod
+    def _call(hook: Callable[[Any], None], metrics: RequestInfo) -> None:
+        try:
+            hook(metrics)
+        except Exception:
+            logger.exception("Instrumentation hook %r failed", hook)
+
+
+class InstrumentationTransport(TransportWrapper):
+    """Transport wrapper timing each request for an :class:`Instrumentation`."""
+
+    def __init__(self, transport: AnyTransport, instrumentation: Instrumentation) -> None:
+        """
+        Initialize instrumentation transport.
+
+        Args:
+            transport: Transport that actually sends the requests
+            instrumentation: Hooks and registry to report to
+        """
+        super().__init__(transport)
+        self._instrumentation = instrumentation
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request, reading the body so download time is known."""
+        metrics = self._instrumentation.describe(request)
+        self._instrumentation.request_started(metrics)
+        timer = _ConnectTimer(request.extensions.get("trace"))
+        request.extensions["trace"] = timer.trace
+
+        start = time.perf_counter()
+        headers_at = None
+        try:
+            response = self._send(request)
+            headers_at = time.perf_counter()
+            response.read()
+        except BaseException as exc:
+            self._fail(metrics, exc, timer, start, headers_at)
+            raise
+        self._complete(metrics, response, timer, start, headers_at)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request, reading the body so download time is known."""
+        metrics = self._instrumentation.describe(request)
+        self._instrumentation.request_started(metrics)
+        timer = _ConnectTimer(request.extensions.get("trace"))
+        request.extensions["trace"] = timer.atrace
+
+        start = time.perf_counter()
+        headers_at = None
+        try:
+            response = await self._asend(request)
+            headers_at = time.perf_counter()
+            await response.aread()
+        except BaseException as exc:
+            self._fail(metrics, exc, timer, start, headers_at)
+            raise
+        self._complete(metrics, response, timer, start, headers_at)
+        return response
+
+    def _complete(
+        self,
+        metrics: RequestMetrics,
+        response: httpx.Response,
+        timer: _ConnectTimer,
+        start: float,
+        headers_at: float,
+    ) -> None:
+        metrics.connect = timer.connect
+        metrics.wait = max(headers_at - start - timer.connect, 0.0)
+        metrics.download = time.perf_counter() - headers_at
+        metrics.status_code = response.status_code
+        metrics.response_bytes = len(response.content)
+        metrics.cached = CACHE_STATUS_HEADER in response.headers
+        self._instrumentation.response_received(response, metrics)
+
+    def _fail(
+        self,
+        metrics: RequestMetrics,
+        error: BaseException,
+        timer: _ConnectTimer,
+        start: float,
+        headers_at: Optional[float],
+    ) -> None:
+        now = time.perf_counter()
+        metrics.error = error
+        metrics.connect = timer.connect
+        metrics.wait = max((headers_at or now) - start - timer.connect, 0.0)
+        metrics.download = now - headers_at if headers_at is not None else 0.0
+        self._instrumentation.finish(metrics)
@@ -0,0 +1,213 @@
+"""In-process metrics registry with Prometheus text export."""
+
+import bisect
+import os
+import tempfile
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Union
+
+from a7.instrumentation import RequestMetrics
+
+# Latency histogram bucket bounds in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _umask() -> int:
+    """Current umask; reading it means setting it, so it is set straight back."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+class _Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        bounds = [*(repr(bound) for bound in self.buckets), "+Inf"]
+        total = 0
+        result = []
+        for bound, count in zip(bounds, self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class MetricsRegistry:
+    """
+    Latency histograms and counters per endpoint family.
+
+    Use as the ``metrics`` of an :class:`a7.Instrumentation`. One registry
+    can be shared by several clients and threads.
+
+    Metrics:
+        a7_requests_total: Requests by family and status ('error' if the
+            transport raised)
+        a7_cache_hits_total: Requests served from a response cache by family
+        a7_response_bytes_total: Response body bytes by family
+        a7_request_duration_seconds: Histogram by family and phase
+            (connect, wait, download, decode, total)
+
+    Example:
+        >>> registry = MetricsRegistry()
+        >>> client = A7Client(token="...", instrumentation=Instrumentation(metrics=registry))
+        >>> client.rdi.get_markets()
+        >>> registry.to_dict()["requests"]
+        {'/v2/rdi': {'200': 1}}
+        >>> registry.write_prometheus("/var/lib/node_exporter/a7.prom")
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """
+        Initialize metrics registry.
+
+        Args:
+            buckets: Upper bounds of the latency histogram buckets, in seconds
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._requests: defaultdict[tuple[str, str], int] = defaultdict(int)
+        self._cache_hits: defaultdict[str, int] = defaultdict(int)
+        self._bytes: defaultdict[str, int] = defaultdict(int)
+        self._durations: dict[tuple[str, str], _Histogram] = {}
+
+    def observe(self, metrics: RequestMetrics) -> None:
+        """
+        Record a completed request.
+
+        Args:
+            metrics: Outcome and timings of the request
+        """
+        status = "error" if metrics.status_code is None else str(metrics.status_code)
+        timings = {
+            "connect": metrics.connect,
+            "wait": metrics.wait,
+            "download": metrics.download,
+            "decode": metrics.decode,
+            "total": metrics.total,
+        }
+        with self._lock:
+            self._requests[metrics.family, status] += 1
+            self._bytes[metrics.family] += metrics.response_bytes
+            if metrics.cached:
+                self._cache_hits[metrics.family] += 1
+            for phase, value in timings.items():
+                if value is None:
+                    continue
+                key = (metrics.family, phase)
+                if key not in self._durations:
+                    self._durations[key] = _Histogram(self.buckets)
+                self._durations[key].observe(value)
+
+    def reset(self) -> None:
+        """Drop all recorded values."""
+        with self._lock:
+            self._requests.clear()
+            self._cache_hits.clear()
+            self._bytes.clear()
+            self._durations.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Snapshot all metrics as plain data.
+
+        Returns:
+            Dictionary with 'requests' ({family: {status: count}}), 'cache_hits'
+            and 'bytes' ({family: count}) and 'durations'
+            ({family: {phase: {'count', 'sum', 'buckets': {le: cumulative count}}}})
+        """
+        with self._lock:
+            requests: dict[str, dict[str, int]] = {}
+            for (family, status), count in sorted(self._requests.items()):
+                requests.setdefault(family, {})[status] = count
+            durations: dict[str, dict[str, Any]] = {}
+            for (family, phase), histogram in sorted(self._durations.items()):
+                durations.setdefault(family, {})[phase] = {
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "buckets": dict(histogram.cumulative()),
+                }
+            return {
+                "requests": requests,
+                "cache_hits": dict(sorted(self._cache_hits.items())),
+                "bytes": dict(sorted(self._bytes.items())),
+                "durations": durations,
+            }
+
+    def to_prometheus(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text, ending in a newline
+        """
+        with self._lock:
+            lines = [
+                "# HELP a7_requests_total A7 API requests by endpoint family and status.",
+                "# TYPE a7_requests_total counter",
+            ]
+            for (family, status), count in sorted(self._requests.items()):
+                lines.append(f'a7_requests_total{{family="{family}",status="{status}"}} {count}')
+
+            lines += [
+                "# HELP a7_cache_hits_total A7 API requests served from a response cache.",
+                "# TYPE a7_cache_hits_total counter",
+            ]
+            for family, count in sorted(self._cache_hits.items()):
+                lines.append(f'a7_cache_hits_total{{family="{family}"}} {count}')
+
+            lines += [
+                "# HELP a7_response_bytes_total A7 API response body bytes.",
+                "# TYPE a7_response_bytes_total counter",
+            ]
+            for family, count in sorted(self._bytes.items()):
+                lines.append(f'a7_response_bytes_total{{family="{family}"}} {count}')
+
+            lines += [
+                "# HELP a7_request_duration_seconds A7 API request time by phase.",
+                "# TYPE a7_request_duration_seconds histogram",
+            ]
+            for (family, phase), histogram in sorted(self._durations.items()):
+                labels = f'family="{family}",phase="{phase}"'
+                for bound, count in histogram.cumulative():
+                    lines.append(
+                        f'a7_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}'
+                    )
+                lines.append(f"a7_request_duration_seconds_sum{{{labels}}} {histogram.sum!r}")
+                lines.append(f"a7_request_duration_seconds_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Union[str, Path]) -> None:
+        """
+        Write :meth:`to_prometheus` output to a file atomically.
+
+        Suitable for the node_exporter textfile collector, which must never
+        see a partially written file. The file gets the mode ``open()`` would
+        give it (0644 less the umask), not the 0600 of a temporary file, so a
+        collector running as another user can read it.
+
+        Args:
+            path: Destination file
+        """
+        path = Path(path)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "w") as file:
+                file.write(self.to_prometheus())
+            Path(tmp).chmod(0o644 & ~_umask())
+            Path(tmp).replace(path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
@@ -0,0 +1,239 @@
+"""Client-side token-bucket rate limiting for A7 requests."""
+
+import asyncio
+import os
+import struct
+import threading
+import time
+from collections.abc import Mapping
+from typing import Callable, Optional, Protocol, Union
+
+import httpx
+
+from a7.endpoints import endpoint_family
+from a7.transport import AnyTransport, TransportWrapper
+
+Weight = Union[float, Callable[[httpx.Request], float]]
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+class BucketBackend(Protocol):
+    """Storage for token-bucket state."""
+
+    def reserve(self, cost: float, rate: float, burst: float) -> float:
+        """
+        Take ``cost`` tokens, going into debt if necessary.
+
+        Args:
+            cost: Tokens to take
+            rate: Refill rate in tokens per second
+            burst: Bucket capacity
+
+        Returns:
+            Seconds the caller has to wait before sending
+        """
+        ...
+
+
+class LocalBucket:
+    """Token bucket shared by all threads of the current process."""
+
+    def __init__(self) -> None:
+        """Initialize an empty local bucket (filled on first use)."""
+        self._lock = threading.Lock()
+        self._tokens: Optional[float] = None
+        self._stamp = 0.0
+
+    def reserve(self, cost: float, rate: float, burst: float) -> float:
+        """Take tokens and return the wait time. See :meth:`BucketBackend.reserve`."""
+        with self._lock:
+            now = time.monotonic()
+            if self._tokens is None:
+                tokens = burst
+            else:
+                tokens = min(burst, self._tokens + (now - self._stamp) * rate)
+            tokens -= cost
+            self._tokens = tokens
+            self._stamp = now
+        return max(0.0, -tokens / rate)
+
+
+class FileBucket:
+    """
+    Token bucket shared across processes through a locked state file.
+
+    Every process (e.g. each worker of a ``multiprocessing`` pool) creates its
+    own ``FileBucket`` on the same path; an exclusive ``flock`` serializes
+    updates, so the pool as a whole stays under the configured rate without a
+    coordinator. POSIX only.
+    """
+
+    _STATE = struct.Struct("<dd")
+
+    def __init__(self, path: "str | os.PathLike[str]") -> None:
+        """
+        Initialize file-backed bucket.
+
+        Args:
+            path: State file shared by all participating processes
+
+        Raises:
+            RuntimeError: If the platform has no fcntl (POSIX systems only)
+        """
+        if fcntl is None:
+            raise RuntimeError("FileBucket requires fcntl (POSIX systems only)")
+        self._path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._pid = 0
+
+    def _open(self) -> int:
+        # flock ownership is shared by forked copies of a descriptor, so each
+        # process must open the file itself
+        if self._fd is None or self._pid != os.getpid():
+            self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+            self._pid = os.getpid()
+        return self._fd
+
+    def reserve(self, cost: float, rate: float, burst: float) -> float:
+        """Take tokens and return the wait time. See :meth:`BucketBackend.reserve`."""
+        assert fcntl is not None
+        with self._lock:
+            fd = self._open()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                now = time.time()
+                data = os.pread(fd, self._STATE.size, 0)
+                if len(data) == self._STATE.size:
+                    tokens, stamp = self._STATE.unpack(data)
+                    tokens = min(burst, tokens + max(0.0, now - stamp) * rate)
+                else:
+                    tokens = burst
+                tokens -= cost
+                os.pwrite(fd, self._STATE.pack(tokens, now), 0)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        return max(0.0, -tokens / rate)
+
+    def __getstate__(self) -> dict[str, object]:
+        """Pickle only the path so the bucket can be sent to worker processes."""
+        return {"path": self._path}
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        """Restore a bucket from its path."""
+        self.__init__(str(state["path"]))
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter shared by every resource of a client.
+
+    Requests take tokens from the bucket before they are sent; when it runs dry
+    callers wait until enough tokens have been refilled. Reservations are
+    granted in arrival order, so concurrent callers queue fairly instead of
+    polling. The same limiter can be passed to several clients.
+
+    Weights make expensive endpoint families cost more than one token. A weight
+    is either a number or a callable receiving the ``httpx.Request``, e.g. to
+    scale order book requests with their ``limit`` parameter.
+
+    Example:
+        >>> limiter = RateLimiter(
+        ...     rate=10,
+        ...     burst=20,
+        ...     weights={"/v1/ob": lambda r: 1 + int(r.url.params.get("limit", 1)) / 1000},
+        ...     backend=FileBucket("/tmp/a7-ratelimit"),
+        ... )
+        >>> client = A7Client(token="...", rate_limit=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        weights: Optional[Mapping[str, Weight]] = None,
+        backend: Optional[BucketBackend] = None,
+    ) -> None:
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Sustained requests (tokens) per second
+            burst: Bucket capacity (default: same as rate)
+            weights: Token cost per endpoint family (e.g. '/v1/ob'), default 1
+            backend: Bucket storage (default: LocalBucket for this process)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else rate)
+        self.weights: dict[str, Weight] = dict(weights or {})
+        self.backend: BucketBackend = backend if backend is not None else LocalBucket()
+
+    def cost(self, request: httpx.Request) -> float:
+        """
+        Get the token cost of a request.
+
+        Args:
+            request: Outgoing request
+
+        Returns:
+            Number of tokens the request consumes
+        """
+        weight = self.weights.get(endpoint_family(request.url.path), 1.0)
+        if callable(weight):
+            return float(weight(request))
+        return float(weight)
+
+    def reserve(self, request: httpx.Request) -> float:
+        """
+        Reserve tokens for a request.
+
+        Args:
+            request: Outgoing request
+
+        Returns:
+            Seconds to wait before sending it
+        """
+        return self.backend.reserve(self.cost(request), self.rate, self.burst)
+
+    def acquire(self, request: httpx.Request) -> None:
+        """Block until the request may be sent."""
+        delay = self.reserve(request)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, request: httpx.Request) -> None:
+        """Wait without blocking the event loop until the request may be sent."""
+        delay = self.reserve(request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class RateLimitTransport(TransportWrapper):
+    """Transport wrapper that paces every outgoing request through a RateLimiter."""
+
+    def __init__(self, transport: AnyTransport, limiter: RateLimiter) -> None:
+        """
+        Initialize rate-limited transport.
+
+        Args:
+            transport: Transport that actually sends the requests
+            limiter: Shared rate limiter
+        """
+        super().__init__(transport)
+        self._limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Wait for tokens, then send the request."""
+        self._limiter.acquire(request)
+        return self._send(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Wait for tokens, then send the request."""
+        await self._limiter.acquire_async(request)
+        return await self._asend(request)
@@ -1,18 +1,56 @@
 """Resource classes for A7 API endpoints."""
 
-from a7.resources.algo import AlgoResource
-from a7.resources.auction import AuctionResource
-from a7.resources.dataset import DatasetResource
-from a7.resources.eobi import EOBIResource
-from a7.resources.insights import InsightsResource
-from a7.resources.mdp import MDPResource
-from a7.resources.orderbook import OrderBookResource
-from a7.resources.precalc import PrecalcResource
-from a7.resources.rdi import RDIResource
-from a7.resources.sd import SDResource
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from a7.resources.algo import AlgoResource, AsyncAlgoResource
+    from a7.resources.auction import AsyncAuctionResource, AuctionResource
+    from a7.resources.dataset import AsyncDatasetResource, DatasetResource
+    from a7.resources.eobi import AsyncEOBIResource, EOBIResource
+    from a7.resources.insights import AsyncInsightsResource, InsightsResource
+    from a7.resources.mdp import AsyncMDPResource, MDPResource
+    from a7.resources.orderbook import AsyncOrderBookResource, OrderBookResource
+    from a7.resources.precalc import AsyncPrecalcResource, PrecalcResource
+    from a7.resources.rdi import AsyncRDIResource, RDIResource
+    from a7.resources.sd import AsyncSDResource, SDResource
+
+# Resource modules are imported on first access, see a7.__getattr__
+_EXPORTS = {
+    "AlgoResource": "a7.resources.algo",
+    "AsyncAlgoResource": "a7.resources.algo",
+    "AsyncAuctionResource": "a7.resources.auction",
+    "AsyncDatasetResource": "a7.resources.dataset",
+    "AsyncEOBIResource": "a7.resources.eobi",
+    "AsyncInsightsResource": "a7.resources.insights",
+    "AsyncMDPResource": "a7.resources.mdp",
+    "AsyncOrderBookResource": "a7.resources.orderbook",
+    "AsyncPrecalcResource": "a7.resources.precalc",
+    "AsyncRDIResource": "a7.resources.rdi",
+    "AsyncSDResource": "a7.resources.sd",
+    "AuctionResource": "a7.resources.auction",
+    "DatasetResource": "a7.resources.dataset",
+    "EOBIResource": "a7.resources.eobi",
+    "InsightsResource": "a7.resources.insights",
+    "MDPResource": "a7.resources.mdp",
+    "OrderBookResource": "a7.resources.orderbook",
+    "PrecalcResource": "a7.resources.precalc",
+    "RDIResource": "a7.resources.rdi",
+    "SDResource": "a7.resources.sd",
+}
 
 __all__ = [
     "AlgoResource",
+    "AsyncAlgoResource",
+    "AsyncAuctionResource",
+    "AsyncDatasetResource",
+    "AsyncEOBIResource",
+    "AsyncInsightsResource",
+    "AsyncMDPResource",
+    "AsyncOrderBookResource",
+    "AsyncPrecalcResource",
+    "AsyncRDIResource",
+    "AsyncSDResource",
     "AuctionResource",
     "DatasetResource",
     "EOBIResource",
@@ -23,3 +61,18 @@ __all__ = [
     "RDIResource",
     "SDResource",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import resource classes lazily on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'a7.resources' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List public names, including those not imported yet."""
+    return sorted(set(globals()) | set(__all__))
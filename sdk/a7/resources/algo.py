@@ -5,6 +5,8 @@ from urllib.parse import quote_plus
 
 import httpx
 
+from a7.decoders import JSONDecoder, stdlib_decoder
+
 
 class AlgoResource:
     """
@@ -13,14 +15,16 @@ class AlgoResource:
     Provides access to run algorithms for data extraction and management.
     """
 
-    def __init__(self, client: httpx.Client) -> None:
+    def __init__(self, client: httpx.Client, decoder: JSONDecoder = stdlib_decoder) -> None:
         """
         Initialize Algorithm resource.
 
         Args:
             client: Configured httpx client
+            decoder: JSON decoder for response bodies (default: stdlib json)
         """
         self._client = client
+        self._decode = decoder
 
     def run(
         self,
@@ -61,7 +65,7 @@ class AlgoResource:
             params=params,
         )
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def get_metadata(
         self,
@@ -105,7 +109,7 @@ class AlgoResource:
             url = f"/v1/algo/{owner}"
         response = self._client.get(url, params={"mode": mode})
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def list_owners(self) -> list[str]:
         """
@@ -125,7 +129,7 @@ class AlgoResource:
         """
         response = self._client.get("/v1/algo")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         return result.get("Owners", [])
 
     def list_algorithms(self, owner: str, mode: str = "compact") -> list[str]:
@@ -261,7 +265,7 @@ class AlgoResource:
             headers={"Content-Type": "application/yaml"},
         )
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def download(
         self,
@@ -323,4 +327,144 @@ class AlgoResource:
         encoded_algorithm = quote_plus(algorithm)
         response = self._client.delete(f"/v1/algo/{owner}/{encoded_algorithm}")
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
+
+
+class AsyncAlgoResource:
+    """
+    Algorithm execution API endpoints (asyncio).
+
+    Awaitable counterpart of :class:`AlgoResource` for use with :class:`a7.AsyncA7Client`.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, decoder: JSONDecoder = stdlib_decoder) -> None:
+        """
+        Initialize async Algorithm resource.
+
+        Args:
+            client: Configured httpx async client
+            decoder: JSON decoder for response bodies (default: stdlib json)
+        """
+        self._client = client
+        self._decode = decoder
+
+    async def run(
+        self,
+        owner: str,
+        algorithm: str,
+        params: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Execute an algorithm with parameters. See :meth:`AlgoResource.run`."""
+        encoded_algorithm = quote_plus(algorithm)
+        response = await self._client.get(
+            f"/v1/algo/{owner}/{encoded_algorithm}/run",
+            params=params,
+        )
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_metadata(
+        self,
+        owner: str,
+        algorithm: str = "",
+        mode: str = "compact",
+    ) -> dict[str, Any]:
+        """Get algorithm metadata and configuration. See :meth:`AlgoResource.get_metadata`."""
+        if algorithm:
+            encoded_algorithm = quote_plus(algorithm)
+            url = f"/v1/algo/{owner}/{encoded_algorithm}"
+        else:
+            url = f"/v1/algo/{owner}"
+        response = await self._client.get(url, params={"mode": mode})
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def list_owners(self) -> list[str]:
+        """List all algorithm owners accessible to current user. See :meth:`AlgoResource.list_owners`."""
+        response = await self._client.get("/v1/algo")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        return result.get("Owners", [])
+
+    async def list_algorithms(self, owner: str, mode: str = "compact") -> list[str]:
+        """List all algorithms for a specific owner. See :meth:`AlgoResource.list_algorithms`."""
+        result = await self.get_metadata(owner, "", mode)
+        return result.get("Algos", [])
+
+    async def run_top_level(
+        self,
+        market: str,
+        date: int,
+        market_segment_id: int,
+        security_id: int,
+    ) -> dict[str, Any]:
+        """Run top_level algorithm (convenience method). See :meth:`AlgoResource.run_top_level`."""
+        return await self.run(
+            owner="a7",
+            algorithm="top_level",
+            params={
+                "marketId": market,
+                "date": date,
+                "marketSegmentId": market_segment_id,
+                "securityId": security_id,
+            },
+        )
+
+    async def run_price_level_v2(
+        self,
+        market: str,
+        date: int,
+        market_segment_id: int,
+        security_id: int,
+        level: int = 5,
+    ) -> dict[str, Any]:
+        """Run PriceLevelv2 algorithm for order book depth (convenience method). See :meth:`AlgoResource.run_price_level_v2`."""
+        return await self.run(
+            owner="a7",
+            algorithm="PriceLevelv2",
+            params={
+                "marketId": market,
+                "date": date,
+                "marketSegmentId": market_segment_id,
+                "securityId": security_id,
+                "Level": level,
+            },
+        )
+
+    async def upload(
+        self,
+        owner: str,
+        algorithm: str,
+        yaml_content: str,
+    ) -> dict[str, Any]:
+        """Upload/create an algorithm with YAML source code. See :meth:`AlgoResource.upload`."""
+        encoded_algorithm = quote_plus(algorithm)
+        response = await self._client.put(
+            f"/v1/algo/{owner}/{encoded_algorithm}",
+            content=yaml_content,
+            headers={"Content-Type": "application/yaml"},
+        )
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def download(
+        self,
+        owner: str,
+        algorithm: str,
+    ) -> str:
+        """Download algorithm source code. See :meth:`AlgoResource.download`."""
+        encoded_algorithm = quote_plus(algorithm)
+        response = await self._client.get(f"/v1/algo/{owner}/{encoded_algorithm}/download")
+        response.raise_for_status()
+        return response.text
+
+    async def delete(
+        self,
+        owner: str,
+        algorithm: str,
+    ) -> dict[str, Any]:
+        """Delete an algorithm. See :meth:`AlgoResource.delete`."""
+        encoded_algorithm = quote_plus(algorithm)
+        response = await self._client.delete(f"/v1/algo/{owner}/{encoded_algorithm}")
+        response.raise_for_status()
+        return self._decode(response.content)
@@ -4,6 +4,8 @@ from typing import Any, Optional
 
 import httpx
 
+from a7.decoders import JSONDecoder, stdlib_decoder
+
 
 class AuctionResource:
     """
@@ -13,14 +15,16 @@ class AuctionResource:
     Simulates outcomes of opening/intraday/closing auctions with additional orders.
     """
 
-    def __init__(self, client: httpx.Client) -> None:
+    def __init__(self, client: httpx.Client, decoder: JSONDecoder = stdlib_decoder) -> None:
         """
         Initialize Auction resource.
 
         Args:
             client: Configured httpx client
+            decoder: JSON decoder for response bodies (default: stdlib json)
         """
         self._client = client
+        self._decode = decoder
 
     def get_exchanges(self) -> list[str]:
         """
@@ -40,7 +44,7 @@ class AuctionResource:
         """
         response = self._client.get("/v1/simulation/auction/")
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def get_dates(self, exchange: str) -> list[int]:
         """
@@ -64,7 +68,7 @@ class AuctionResource:
         """
         response = self._client.get(f"/v1/simulation/auction/{exchange}/")
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def get_market_segments(self, exchange: str, date: int, mode: str = "segment") -> list[str]:
         """
@@ -99,7 +103,7 @@ class AuctionResource:
         params = {"mode": mode}
         response = self._client.get(f"/v1/simulation/auction/{exchange}/{date}/", params=params)
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def get_securities(self, exchange: str, date: int, market_segment_id: int) -> list[int]:
         """
@@ -127,7 +131,7 @@ class AuctionResource:
             f"/v1/simulation/auction/{exchange}/{date}/{market_segment_id}/"
         )
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def get_security(
         self, exchange: str, date: int, market_segment_id: int, security_id: int
@@ -159,7 +163,7 @@ class AuctionResource:
             f"/v1/simulation/auction/{exchange}/{date}/{market_segment_id}/{security_id}"
         )
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def get_security_by_symbol(self, exchange: str, date: int, symbol: str) -> dict[str, Any]:
         """
@@ -186,7 +190,7 @@ class AuctionResource:
         """
         response = self._client.get(f"/v1/simulation/auction/{exchange}/{date}/{symbol}")
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def get_auction_types(
         self,
@@ -223,7 +227,7 @@ class AuctionResource:
             f"/v1/simulation/auction/{exchange}/{date}/{market_segment_id}/{security_id}/"
         )
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def get_auction_types_by_symbol(self, exchange: str, date: int, symbol: str) -> list[str]:
         """
@@ -251,7 +255,7 @@ class AuctionResource:
         """
         response = self._client.get(f"/v1/simulation/auction/{exchange}/{date}/{symbol}/")
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def get_auction(
         self,
@@ -319,7 +323,7 @@ class AuctionResource:
             params=params,
         )
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def get_auction_by_symbol(
         self,
@@ -385,4 +389,145 @@ class AuctionResource:
             params=params,
         )
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
+
+
+class AsyncAuctionResource:
+    """
+    Xetra Auction Simulations API endpoints (asyncio).
+
+    Awaitable counterpart of :class:`AuctionResource` for use with :class:`a7.AsyncA7Client`.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, decoder: JSONDecoder = stdlib_decoder) -> None:
+        """
+        Initialize async Auction resource.
+
+        Args:
+            client: Configured httpx async client
+            decoder: JSON decoder for response bodies (default: stdlib json)
+        """
+        self._client = client
+        self._decode = decoder
+
+    async def get_exchanges(self) -> list[str]:
+        """Get available exchanges for auction simulations. See :meth:`AuctionResource.get_exchanges`."""
+        response = await self._client.get("/v1/simulation/auction/")
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_dates(self, exchange: str) -> list[int]:
+        """Get available trading days for an exchange. See :meth:`AuctionResource.get_dates`."""
+        response = await self._client.get(f"/v1/simulation/auction/{exchange}/")
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_market_segments(self, exchange: str, date: int, mode: str = "segment") -> list[str]:
+        """Get market segments or symbols for a trading day. See :meth:`AuctionResource.get_market_segments`."""
+        params = {"mode": mode}
+        response = await self._client.get(f"/v1/simulation/auction/{exchange}/{date}/", params=params)
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_securities(self, exchange: str, date: int, market_segment_id: int) -> list[int]:
+        """Get security IDs for a market segment. See :meth:`AuctionResource.get_securities`."""
+        response = await self._client.get(
+            f"/v1/simulation/auction/{exchange}/{date}/{market_segment_id}/"
+        )
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_security(
+        self, exchange: str, date: int, market_segment_id: int, security_id: int
+    ) -> dict[str, Any]:
+        """Get security reference data by segment ID and security ID. See :meth:`AuctionResource.get_security`."""
+        response = await self._client.get(
+            f"/v1/simulation/auction/{exchange}/{date}/{market_segment_id}/{security_id}"
+        )
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_security_by_symbol(self, exchange: str, date: int, symbol: str) -> dict[str, Any]:
+        """Get security reference data by trading symbol. See :meth:`AuctionResource.get_security_by_symbol`."""
+        response = await self._client.get(f"/v1/simulation/auction/{exchange}/{date}/{symbol}")
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_auction_types(
+        self,
+        exchange: str,
+        date: int,
+        market_segment_id: int,
+        security_id: int
+    ) -> list[str]:
+        """Get available auction types for a security. See :meth:`AuctionResource.get_auction_types`."""
+        response = await self._client.get(
+            f"/v1/simulation/auction/{exchange}/{date}/{market_segment_id}/{security_id}/"
+        )
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_auction_types_by_symbol(self, exchange: str, date: int, symbol: str) -> list[str]:
+        """Get available auction types for a security by symbol. See :meth:`AuctionResource.get_auction_types_by_symbol`."""
+        response = await self._client.get(f"/v1/simulation/auction/{exchange}/{date}/{symbol}/")
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_auction(
+        self,
+        exchange: str,
+        date: int,
+        market_segment_id: int,
+        security_id: int,
+        auction_type: str,
+        side: Optional[str] = None,
+        px: Optional[float] = None,
+        qty: Optional[int] = None,
+        prio: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """Get auction historical data and optionally simulate outcome. See :meth:`AuctionResource.get_auction`."""
+        params = {}
+        if side is not None:
+            params["side"] = side
+        if px is not None:
+            params["px"] = px
+        if qty is not None:
+            params["qty"] = qty
+        if prio is not None:
+            params["prio"] = prio
+
+        response = await self._client.get(
+            f"/v1/simulation/auction/{exchange}/{date}/{market_segment_id}/{security_id}/{auction_type}",
+            params=params,
+        )
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_auction_by_symbol(
+        self,
+        exchange: str,
+        date: int,
+        symbol: str,
+        auction_type: str,
+        side: Optional[str] = None,
+        px: Optional[float] = None,
+        qty: Optional[int] = None,
+        prio: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """Get auction historical data and optionally simulate outcome by symbol. See :meth:`AuctionResource.get_auction_by_symbol`."""
+        params = {}
+        if side is not None:
+            params["side"] = side
+        if px is not None:
+            params["px"] = px
+        if qty is not None:
+            params["qty"] = qty
+        if prio is not None:
+            params["prio"] = prio
+
+        response = await self._client.get(
+            f"/v1/simulation/auction/{exchange}/{date}/{symbol}/{auction_type}",
+            params=params,
+        )
+        response.raise_for_status()
+        return self._decode(response.content)
@@ -4,6 +4,8 @@ from typing import Any, Optional
 
 import httpx
 
+from a7.decoders import JSONDecoder, stdlib_decoder
+
 
 class DatasetResource:
     """
@@ -13,14 +15,16 @@ class DatasetResource:
     Allows viewing, querying, and deleting datasets.
     """
 
-    def __init__(self, client: httpx.Client) -> None:
+    def __init__(self, client: httpx.Client, decoder: JSONDecoder = stdlib_decoder) -> None:
         """
         Initialize Dataset resource.
 
         Args:
             client: Configured httpx client
+            decoder: JSON decoder for response bodies (default: stdlib json)
         """
         self._client = client
+        self._decode = decoder
 
     def list_owners(self, mode: str = "compact") -> list[str] | list[dict[str, Any]]:
         """
@@ -49,7 +53,7 @@ class DatasetResource:
         """
         response = self._client.get("/v1/dataset", params={"mode": mode})
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
 
         if mode == "detailed":
             return result.get("Owners", [])
@@ -78,7 +82,7 @@ class DatasetResource:
         """
         response = self._client.get(f"/v1/dataset/{owner}")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         return result.get("Datasets", [])
 
     def get_metadata(self, owner: str, dataset: str) -> dict[str, Any]:
@@ -104,7 +108,7 @@ class DatasetResource:
         """
         response = self._client.get(f"/v1/dataset/{owner}/{dataset}")
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def get_data(
         self,
@@ -168,7 +172,7 @@ class DatasetResource:
 
         if format == "csv":
             return response.text
-        return response.json()
+        return self._decode(response.content)
 
     def delete(self, owner: str, dataset: str) -> dict[str, Any]:
         """
@@ -194,4 +198,82 @@ class DatasetResource:
         """
         response = self._client.delete(f"/v1/dataset/{owner}/{dataset}")
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
+
+
+class AsyncDatasetResource:
+    """
+    Dataset API endpoints (asyncio).
+
+    Awaitable counterpart of :class:`DatasetResource` for use with :class:`a7.AsyncA7Client`.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, decoder: JSONDecoder = stdlib_decoder) -> None:
+        """
+        Initialize async Dataset resource.
+
+        Args:
+            client: Configured httpx async client
+            decoder: JSON decoder for response bodies (default: stdlib json)
+        """
+        self._client = client
+        self._decode = decoder
+
+    async def list_owners(self, mode: str = "compact") -> list[str] | list[dict[str, Any]]:
+        """List dataset owners accessible to current user. See :meth:`DatasetResource.list_owners`."""
+        response = await self._client.get("/v1/dataset", params={"mode": mode})
+        response.raise_for_status()
+        result = self._decode(response.content)
+
+        if mode == "detailed":
+            return result.get("Owners", [])
+        return result.get("Owners", [])
+
+    async def get_datasets(self, owner: str) -> list[str]:
+        """Get list of datasets for a specific owner. See :meth:`DatasetResource.get_datasets`."""
+        response = await self._client.get(f"/v1/dataset/{owner}")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        return result.get("Datasets", [])
+
+    async def get_metadata(self, owner: str, dataset: str) -> dict[str, Any]:
+        """Get dataset specification/schema. See :meth:`DatasetResource.get_metadata`."""
+        response = await self._client.get(f"/v1/dataset/{owner}/{dataset}")
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_data(
+        self,
+        owner: str,
+        dataset: str,
+        select: Optional[str] = None,
+        where: Optional[str] = None,
+        order_by: Optional[str] = None,
+        format: str = "json",
+        limit: Optional[int] = None,
+    ) -> dict[str, Any] | str:
+        """Query dataset results with optional filtering and ordering. See :meth:`DatasetResource.get_data`."""
+        url = f"/v1/dataset/{owner}/{dataset}/data"
+
+        params: dict[str, Any] = {"format": format}
+        if select is not None:
+            params["select"] = select
+        if where is not None:
+            params["where"] = where
+        if order_by is not None:
+            params["orderBy"] = order_by
+        if limit is not None:
+            params["limit"] = limit
+
+        response = await self._client.get(url, params=params)
+        response.raise_for_status()
+
+        if format == "csv":
+            return response.text
+        return self._decode(response.content)
+
+    async def delete(self, owner: str, dataset: str) -> dict[str, Any]:
+        """Delete a dataset. See :meth:`DatasetResource.delete`."""
+        response = await self._client.delete(f"/v1/dataset/{owner}/{dataset}")
+        response.raise_for_status()
+        return self._decode(response.content)
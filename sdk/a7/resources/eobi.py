@@ -1,9 +1,109 @@
 """Enhanced Order Book Interface (EOBI) resource."""
 
+import asyncio
+import contextvars
+from collections import deque
+from collections.abc import AsyncGenerator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Optional
 
 import httpx
 
+from a7.config import DEFAULT_EOBI_PAGE_SIZE, DEFAULT_EOBI_READ_AHEAD
+from a7.decoders import JSONDecoder, stdlib_decoder
+
+# Fully qualified EOBI message within a security: (TransactTime, ApplSeqNum, MsgSeqNum)
+MessageKey = tuple[str, int, int]
+
+
+def plan_message_requests(keys: Iterable[MessageKey]) -> dict[str, dict[int, list[int]]]:
+    """
+    Group message keys into the detailed-mode requests that fetch them.
+
+    One detailed-mode get_applseq_nums request returns every packet of a
+    transaction time, so the keys are grouped by transaction time, then by
+    ApplSeqNum, and each transaction time is one request.
+
+    Args:
+        keys: (transact_time, applseq_num, msg_seq_num) tuples
+
+    Returns:
+        MsgSeqNums per ApplSeqNum per transaction time, all in ascending order
+
+    Example:
+        >>> plan_message_requests([("1582821000143045889", 14687296, 23),
+        ...                        ("1582821000143045889", 14687296, 24)])
+        {'1582821000143045889': {14687296: [23, 24]}}
+    """
+    groups: dict[str, dict[int, set[int]]] = {}
+    for transact_time, applseq_num, msg_seq_num in keys:
+        packets = groups.setdefault(str(transact_time), {})
+        packets.setdefault(int(applseq_num), set()).add(int(msg_seq_num))
+    return {
+        transact_time: {
+            applseq: sorted(seqs) for applseq, seqs in sorted(groups[transact_time].items())
+        }
+        for transact_time in sorted(groups, key=int)
+    }
+
+
+def _msgseq_filter(packets: dict[int, list[int]]) -> str:
+    """msgSeqNumFilter selecting the wanted messages of one transaction time."""
+    return ",".join(str(seq) for seq in sorted({seq for seqs in packets.values() for seq in seqs}))
+
+
+def _pick_messages(
+    transact_time: str, packets: dict[int, list[int]], fetched: list[dict[str, Any]]
+) -> dict[MessageKey, dict[str, Any]]:
+    """Match the packets of a detailed-mode response against the wanted keys."""
+    found: dict[MessageKey, dict[str, Any]] = {}
+    for packet in fetched:
+        applseq_num = packet["PacketHeader"]["ApplSeqNum"]
+        wanted = set(packets.get(applseq_num, ()))
+        for message in packet.get("Messages", []):
+            msg_seq_num = message["MessageHeader"]["MsgSeqNum"]
+            if msg_seq_num in wanted:
+                found[(transact_time, applseq_num, msg_seq_num)] = message
+    return found
+
+
+def _packet_messages(packets: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Messages of detailed-mode packets in ApplSeqNum, then MsgSeqNum order.
+
+    Order messages carry no TransactTime of their own, only their packet
+    header does, so each message gets its packet's TransactTime.
+    """
+    ordered = sorted(packets, key=lambda packet: packet["PacketHeader"]["ApplSeqNum"])
+    result: list[dict[str, Any]] = []
+    for packet in ordered:
+        transact_time = packet["PacketHeader"].get("TransactTime")
+        for message in sorted(
+            packet.get("Messages", []), key=lambda message: message["MessageHeader"]["MsgSeqNum"]
+        ):
+            if transact_time is not None and "TransactTime" not in message:
+                result.append({**message, "TransactTime": transact_time})
+            else:
+                result.append(message)
+    return result
+
+
+def _applseq_url(
+    market_id: str, date: int, market_segment_id: int, security_id: int, transact_time: str
+) -> str:
+    """URL of the get_applseq_nums endpoint."""
+    return f"/v1/eobi/{market_id}/{date}/{market_segment_id}/{security_id}/{transact_time}"
+
+
+def _check_paging(page_size: int, read_ahead: int = 1) -> None:
+    if page_size < 1 or read_ahead < 1:
+        raise ValueError("page_size and read_ahead must be at least 1")
+
+
+def _next_page_start(page: list[str]) -> str:
+    """'from' of the page after one ending with this transact time ('from' is inclusive)."""
+    return str(int(page[-1]) + 1)
+
 
 class EOBIResource:
     """
@@ -13,14 +113,16 @@ class EOBIResource:
     EOBI provides the most granular un-normalized historical order book data.
     """
 
-    def __init__(self, client: httpx.Client) -> None:
+    def __init__(self, client: httpx.Client, decoder: JSONDecoder = stdlib_decoder) -> None:
         """
         Initialize EOBI resource.
 
         Args:
             client: Configured httpx client
+            decoder: JSON decoder for response bodies (default: stdlib json)
         """
         self._client = client
+        self._decode = decoder
 
     def get_markets(self) -> list[str]:
         """
@@ -40,7 +142,7 @@ class EOBIResource:
         """
         response = self._client.get("/v1/eobi")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         return result.get("MarketIDs", [])
 
     def get_dates(self, market_id: str) -> list[int]:
@@ -65,7 +167,7 @@ class EOBIResource:
         """
         response = self._client.get(f"/v1/eobi/{market_id}")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         return result.get("Dates", [])
 
     def get_market_segments(self, market_id: str, date: int) -> list[int]:
@@ -91,7 +193,7 @@ class EOBIResource:
         """
         response = self._client.get(f"/v1/eobi/{market_id}/{date}")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         return result.get("MarketSegmentIDs", [])
 
     def get_securities(self, market_id: str, date: int, market_segment_id: int) -> list[int]:
@@ -118,7 +220,7 @@ class EOBIResource:
         """
         response = self._client.get(f"/v1/eobi/{market_id}/{date}/{market_segment_id}")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         return result.get("SecurityIDs", [])
 
     def get_transact_times(
@@ -164,9 +266,7 @@ class EOBIResource:
         """
         url = f"/v1/eobi/{market_id}/{date}/{market_segment_id}/{security_id}"
 
-        params: dict[str, Any] = {}
-        if mode is not None:
-            params["mode"] = mode
+        params: dict[str, Any] = {"mode": mode}
         if limit is not None:
             params["limit"] = limit
         if from_time is not None:
@@ -178,7 +278,7 @@ class EOBIResource:
 
         response = self._client.get(url, params=params)
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         return result.get("TransactTimes", [])
 
     def get_applseq_nums(
@@ -220,8 +320,16 @@ class EOBIResource:
             ...     '1582821000143045889'
             ... )
         """
-        url = f"/v1/eobi/{market_id}/{date}/{market_segment_id}/{security_id}/{transact_time}"
+        url = _applseq_url(market_id, date, market_segment_id, security_id, transact_time)
+        result = self._applseq_nums(url, mode, msgseq_filter, template_id_filter)
+        if mode == "detailed":
+            return result.get("Packets", [])
+        return result.get("ApplSeqNums", [])
 
+    def _applseq_nums(
+        self, url: str, mode: str, msgseq_filter: Optional[str], template_id_filter: Optional[str]
+    ) -> Any:
+        """Decoded get_applseq_nums response, ApplSeqNums or Packets by mode."""
         params: dict[str, Any] = {"mode": mode}
         if msgseq_filter is not None:
             params["msgSeqNumFilter"] = msgseq_filter
@@ -230,11 +338,18 @@ class EOBIResource:
 
         response = self._client.get(url, params=params)
         response.raise_for_status()
-        result = response.json()
+        return self._decode(response.content)
 
-        if mode == "detailed":
-            return result.get("Packets", [])
-        return result.get("ApplSeqNums", [])
+    def _get_packets(
+        self,
+        url: str,
+        *,
+        msgseq_filter: Optional[str] = None,
+        template_id_filter: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """Packets at an _applseq_url, i.e. get_applseq_nums in detailed mode."""
+        result = self._applseq_nums(url, "detailed", msgseq_filter, template_id_filter)
+        return result.get("Packets", [])
 
     def get_msg_seq_nums(
         self,
@@ -283,7 +398,7 @@ class EOBIResource:
 
         response = self._client.get(url, params=params)
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
 
         if mode == "detailed":
             return result.get("Messages", [])
@@ -331,4 +446,485 @@ class EOBIResource:
         url = f"/v1/eobi/{market_id}/{date}/{market_segment_id}/{security_id}/{transact_time}/{applseq_num}/{msg_seq_num}"
         response = self._client.get(url)
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
+
+    def get_messages(
+        self,
+        market_id: str,
+        date: int,
+        market_segment_id: int,
+        security_id: int,
+        keys: Iterable[MessageKey],
+        *,
+        concurrency: int = DEFAULT_EOBI_READ_AHEAD,
+    ) -> dict[MessageKey, dict[str, Any]]:
+        """
+        Get many messages of a security with as few requests as possible.
+
+        Instead of one get_message call per key, the keys are grouped by
+        transaction time (see :func:`plan_message_requests`) and each group is
+        fetched with one detailed-mode get_applseq_nums request, filtered to
+        the wanted MsgSeqNums. Up to ``concurrency`` requests run at once.
+
+        Args:
+            market_id: Market identifier (e.g., 'XEUR', 'XETR')
+            date: Trading day in YYYYMMDD format
+            market_segment_id: Market segment ID
+            security_id: Security ID
+            keys: (transact_time, applseq_num, msg_seq_num) tuples
+            concurrency: Requests in flight at once (default: 8)
+
+        Returns:
+            Message per key; keys with no such message are left out
+
+        Raises:
+            ValueError: If concurrency is below 1
+            AuthenticationError: Invalid token
+            NotFoundError: Resource not found
+            ServerError: Server error occurred
+
+        Example:
+            >>> time = '1582821000143045889'
+            >>> keys = [(time, 14687296, 23), (time, 14687296, 24)]
+            >>> messages = client.eobi.get_messages('XEUR', 20200227, 187421, 204934, keys)
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        plan = plan_message_requests(keys)
+
+        def fetch(transact_time: str) -> dict[MessageKey, dict[str, Any]]:
+            packets = self._get_packets(
+                _applseq_url(market_id, date, market_segment_id, security_id, transact_time),
+                msgseq_filter=_msgseq_filter(plan[transact_time]),
+            )
+            wanted = plan[transact_time]
+            return _pick_messages(transact_time, wanted, packets)
+
+        found: dict[MessageKey, dict[str, Any]] = {}
+        if len(plan) <= 1:
+            for transact_time in plan:
+                found.update(fetch(transact_time))
+            return found
+        with ThreadPoolExecutor(min(concurrency, len(plan)), thread_name_prefix="a7-eobi") as pool:
+            futures = [
+                pool.submit(contextvars.copy_context().run, fetch, transact_time)
+                for transact_time in plan
+            ]
+            try:
+                for future in futures:
+                    found.update(future.result())
+            finally:
+                for future in futures:
+                    future.cancel()
+        return found
+
+    def iter_transact_times(
+        self,
+        market_id: str,
+        date: int,
+        market_segment_id: int,
+        security_id: int,
+        from_time: Optional[str] = None,
+        to_time: Optional[str] = None,
+        *,
+        page_size: int = DEFAULT_EOBI_PAGE_SIZE,
+    ) -> Iterator[str]:
+        """
+        Iterate over all transaction times of a security, page by page.
+
+        Pages of ``page_size`` times are requested with ``limit``/``from``
+        as the iteration goes, so a full day never has to fit in one response.
+
+        Args:
+            market_id: Market identifier (e.g., 'XEUR', 'XETR')
+            date: Trading day in YYYYMMDD format
+            market_segment_id: Market segment ID
+            security_id: Security ID
+            from_time: First transaction time to include (optional)
+            to_time: Last transaction time to include (optional)
+            page_size: Transaction times per request (default: 1000)
+
+        Yields:
+            Transaction times (nanoseconds since 1970) in ascending order
+
+        Raises:
+            ValueError: If page_size is below 1
+
+        Example:
+            >>> times = client.eobi.iter_transact_times('XETR', 20230804, 52885, 2504978)
+            >>> for transact_time in times:
+            ...     print(transact_time)
+        """
+        _check_paging(page_size)
+        last = None
+        while True:
+            page = self.get_transact_times(
+                market_id,
+                date,
+                market_segment_id,
+                security_id,
+                limit=page_size,
+                from_time=from_time,
+                to_time=to_time,
+            )
+            for transact_time in page:
+                if transact_time != last:
+                    yield transact_time
+                last = transact_time
+            if len(page) < page_size:
+                return
+            from_time = _next_page_start(page)
+
+    def iter_messages(
+        self,
+        market_id: str,
+        date: int,
+        market_segment_id: int,
+        security_id: int,
+        from_time: Optional[str] = None,
+        to_time: Optional[str] = None,
+        *,
+        template_id_filter: Optional[str] = None,
+        page_size: int = DEFAULT_EOBI_PAGE_SIZE,
+        read_ahead: int = DEFAULT_EOBI_READ_AHEAD,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over all EOBI messages of a security in sequence order.
+
+        Replaces the walk over get_transact_times, get_applseq_nums,
+        get_msg_seq_nums and get_message with one detailed-mode request per
+        transaction time, which returns its packets with all their messages.
+        Transaction times are paged (see :meth:`iter_transact_times`) and up
+        to ``read_ahead`` packet requests run ahead of the messages consumed
+        on background threads, so memory stays bounded however long the day.
+        Stopping the iteration early cancels the requests not started yet.
+
+        Args:
+            market_id: Market identifier (e.g., 'XEUR', 'XETR')
+            date: Trading day in YYYYMMDD format
+            market_segment_id: Market segment ID
+            security_id: Security ID
+            from_time: First transaction time to include (optional)
+            to_time: Last transaction time to include (optional)
+            template_id_filter: Template ID filter, e.g. '13100,13101' (optional)
+            page_size: Transaction times per request (default: 1000)
+            read_ahead: Packet requests in flight ahead of the consumer (default: 8)
+
+        Yields:
+            EOBI messages in transaction time, ApplSeqNum and MsgSeqNum order,
+            each with the TransactTime of its packet
+
+        Raises:
+            ValueError: If page_size or read_ahead is below 1
+
+        Example:
+            >>> for message in client.eobi.iter_messages('XETR', 20230804, 52885, 2504978):
+            ...     print(message['MessageHeader']['TemplateID'])
+        """
+        _check_paging(page_size, read_ahead)
+        times = self.iter_transact_times(
+            market_id, date, market_segment_id, security_id, from_time, to_time, page_size=page_size
+        )
+
+        def fetch(transact_time: str) -> list[dict[str, Any]]:
+            packets = self._get_packets(
+                _applseq_url(market_id, date, market_segment_id, security_id, transact_time),
+                template_id_filter=template_id_filter,
+            )
+            return _packet_messages(packets)
+
+        pending: deque[Future[list[dict[str, Any]]]] = deque()
+        with ThreadPoolExecutor(read_ahead, thread_name_prefix="a7-eobi") as pool:
+            try:
+                for transact_time in times:
+                    context = contextvars.copy_context()
+                    pending.append(pool.submit(context.run, fetch, transact_time))
+                    if len(pending) >= read_ahead:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+
+class AsyncEOBIResource:
+    """
+    Enhanced Order Book Interface API endpoints (asyncio).
+
+    Awaitable counterpart of :class:`EOBIResource` for use with :class:`a7.AsyncA7Client`.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, decoder: JSONDecoder = stdlib_decoder) -> None:
+        """
+        Initialize async EOBI resource.
+
+        Args:
+            client: Configured httpx async client
+            decoder: JSON decoder for response bodies (default: stdlib json)
+        """
+        self._client = client
+        self._decode = decoder
+
+    async def get_markets(self) -> list[str]:
+        """Get list of available markets. See :meth:`EOBIResource.get_markets`."""
+        response = await self._client.get("/v1/eobi")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        return result.get("MarketIDs", [])
+
+    async def get_dates(self, market_id: str) -> list[int]:
+        """Get list of available trading days for a market. See :meth:`EOBIResource.get_dates`."""
+        response = await self._client.get(f"/v1/eobi/{market_id}")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        return result.get("Dates", [])
+
+    async def get_market_segments(self, market_id: str, date: int) -> list[int]:
+        """Get list of market segments (products) for a market and date. See :meth:`EOBIResource.get_market_segments`."""
+        response = await self._client.get(f"/v1/eobi/{market_id}/{date}")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        return result.get("MarketSegmentIDs", [])
+
+    async def get_securities(self, market_id: str, date: int, market_segment_id: int) -> list[int]:
+        """Get list of securities for a market, date, and segment. See :meth:`EOBIResource.get_securities`."""
+        response = await self._client.get(f"/v1/eobi/{market_id}/{date}/{market_segment_id}")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        return result.get("SecurityIDs", [])
+
+    async def get_transact_times(
+        self,
+        market_id: str,
+        date: int,
+        market_segment_id: int,
+        security_id: int,
+        mode: str = "reference",
+        limit: Optional[int] = None,
+        from_time: Optional[str] = None,
+        to_time: Optional[str] = None,
+        applseq_filter: Optional[str] = None,
+    ) -> list[str]:
+        """Get list of transaction times for a security. See :meth:`EOBIResource.get_transact_times`."""
+        url = f"/v1/eobi/{market_id}/{date}/{market_segment_id}/{security_id}"
+
+        params: dict[str, Any] = {"mode": mode}
+        if limit is not None:
+            params["limit"] = limit
+        if from_time is not None:
+            params["from"] = from_time
+        if to_time is not None:
+            params["to"] = to_time
+        if applseq_filter is not None:
+            params["applSeqNumFilter"] = applseq_filter
+
+        response = await self._client.get(url, params=params)
+        response.raise_for_status()
+        result = self._decode(response.content)
+        return result.get("TransactTimes", [])
+
+    async def get_applseq_nums(
+        self,
+        market_id: str,
+        date: int,
+        market_segment_id: int,
+        security_id: int,
+        transact_time: str,
+        mode: str = "reference",
+        msgseq_filter: Optional[str] = None,
+        template_id_filter: Optional[str] = None,
+    ) -> list[int] | list[dict[str, Any]]:
+        """Get list of application sequence numbers or detailed packets. See :meth:`EOBIResource.get_applseq_nums`."""
+        url = _applseq_url(market_id, date, market_segment_id, security_id, transact_time)
+        result = await self._applseq_nums(url, mode, msgseq_filter, template_id_filter)
+        if mode == "detailed":
+            return result.get("Packets", [])
+        return result.get("ApplSeqNums", [])
+
+    async def _applseq_nums(
+        self, url: str, mode: str, msgseq_filter: Optional[str], template_id_filter: Optional[str]
+    ) -> Any:
+        """Decoded get_applseq_nums response, ApplSeqNums or Packets by mode."""
+        params: dict[str, Any] = {"mode": mode}
+        if msgseq_filter is not None:
+            params["msgSeqNumFilter"] = msgseq_filter
+        if template_id_filter is not None:
+            params["templateIdFilter"] = template_id_filter
+
+        response = await self._client.get(url, params=params)
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def _get_packets(
+        self,
+        url: str,
+        *,
+        msgseq_filter: Optional[str] = None,
+        template_id_filter: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """Packets at an _applseq_url, i.e. get_applseq_nums in detailed mode."""
+        result = await self._applseq_nums(url, "detailed", msgseq_filter, template_id_filter)
+        return result.get("Packets", [])
+
+    async def get_msg_seq_nums(
+        self,
+        market_id: str,
+        date: int,
+        market_segment_id: int,
+        security_id: int,
+        transact_time: str,
+        applseq_num: int,
+        mode: str = "reference",
+        template_id_filter: Optional[str] = None,
+    ) -> list[int] | list[dict[str, Any]]:
+        """Get list of message sequence numbers or detailed messages. See :meth:`EOBIResource.get_msg_seq_nums`."""
+        url = f"/v1/eobi/{market_id}/{date}/{market_segment_id}/{security_id}/{transact_time}/{applseq_num}"
+
+        params: dict[str, Any] = {"mode": mode}
+        if template_id_filter is not None:
+            params["templateIdFilter"] = template_id_filter
+
+        response = await self._client.get(url, params=params)
+        response.raise_for_status()
+        result = self._decode(response.content)
+
+        if mode == "detailed":
+            return result.get("Messages", [])
+        return result.get("MsgSeqNums", [])
+
+    async def get_message(
+        self,
+        market_id: str,
+        date: int,
+        market_segment_id: int,
+        security_id: int,
+        transact_time: str,
+        applseq_num: int,
+        msg_seq_num: int,
+    ) -> dict[str, Any]:
+        """Get EOBI message details by full identifier. See :meth:`EOBIResource.get_message`."""
+        url = f"/v1/eobi/{market_id}/{date}/{market_segment_id}/{security_id}/{transact_time}/{applseq_num}/{msg_seq_num}"
+        response = await self._client.get(url)
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_messages(
+        self,
+        market_id: str,
+        date: int,
+        market_segment_id: int,
+        security_id: int,
+        keys: Iterable[MessageKey],
+        *,
+        concurrency: int = DEFAULT_EOBI_READ_AHEAD,
+    ) -> dict[MessageKey, dict[str, Any]]:
+        """
+        Get many messages of a security with as few requests as possible.
+
+        See :meth:`EOBIResource.get_messages`.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        plan = plan_message_requests(keys)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(transact_time: str) -> dict[MessageKey, dict[str, Any]]:
+            async with semaphore:
+                packets = await self._get_packets(
+                    _applseq_url(market_id, date, market_segment_id, security_id, transact_time),
+                    msgseq_filter=_msgseq_filter(plan[transact_time]),
+                )
+            wanted = plan[transact_time]
+            return _pick_messages(transact_time, wanted, packets)
+
+        found: dict[MessageKey, dict[str, Any]] = {}
+        for result in await asyncio.gather(*(fetch(t) for t in plan)):
+            found.update(result)
+        return found
+
+    async def iter_transact_times(
+        self,
+        market_id: str,
+        date: int,
+        market_segment_id: int,
+        security_id: int,
+        from_time: Optional[str] = None,
+        to_time: Optional[str] = None,
+        *,
+        page_size: int = DEFAULT_EOBI_PAGE_SIZE,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Iterate over all transaction times of a security, page by page.
+
+        See :meth:`EOBIResource.iter_transact_times`.
+        """
+        _check_paging(page_size)
+        last = None
+        while True:
+            page = await self.get_transact_times(
+                market_id,
+                date,
+                market_segment_id,
+                security_id,
+                limit=page_size,
+                from_time=from_time,
+                to_time=to_time,
+            )
+            for transact_time in page:
+                if transact_time != last:
+                    yield transact_time
+                last = transact_time
+            if len(page) < page_size:
+                return
+            from_time = _next_page_start(page)
+
+    async def iter_messages(
+        self,
+        market_id: str,
+        date: int,
+        market_segment_id: int,
+        security_id: int,
+        from_time: Optional[str] = None,
+        to_time: Optional[str] = None,
+        *,
+        template_id_filter: Optional[str] = None,
+        page_size: int = DEFAULT_EOBI_PAGE_SIZE,
+        read_ahead: int = DEFAULT_EOBI_READ_AHEAD,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Iterate over all EOBI messages of a security in sequence order.
+
+        See :meth:`EOBIResource.iter_messages`; read-ahead runs as tasks on
+        the event loop instead of threads.
+        """
+        _check_paging(page_size, read_ahead)
+
+        async def fetch(transact_time: str) -> list[dict[str, Any]]:
+            packets = await self._get_packets(
+                _applseq_url(market_id, date, market_segment_id, security_id, transact_time),
+                template_id_filter=template_id_filter,
+            )
+            return _packet_messages(packets)
+
+        pending: deque[asyncio.Task[list[dict[str, Any]]]] = deque()
+        try:
+            async for transact_time in self.iter_transact_times(
+                market_id,
+                date,
+                market_segment_id,
+                security_id,
+                from_time,
+                to_time,
+                page_size=page_size,
+            ):
+                pending.append(asyncio.ensure_future(fetch(transact_time)))
+                if len(pending) >= read_ahead:
+                    for message in await pending.popleft():
+                        yield message
+            while pending:
+                for message in await pending.popleft():
+                    yield message
+        finally:
+            for task in pending:
+                task.cancel()
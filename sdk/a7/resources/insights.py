@@ -4,6 +4,8 @@ from typing import Any
 
 import httpx
 
+from a7.decoders import JSONDecoder, stdlib_decoder
+
 
 class InsightsResource:
     """
@@ -14,14 +16,16 @@ class InsightsResource:
     - Latency Histograms: Market participants' reaction time analysis
     """
 
-    def __init__(self, client: httpx.Client) -> None:
+    def __init__(self, client: httpx.Client, decoder: JSONDecoder = stdlib_decoder) -> None:
         """
         Initialize Insights resource.
 
         Args:
             client: Configured httpx client
+            decoder: JSON decoder for response bodies (default: stdlib json)
         """
         self._client = client
+        self._decode = decoder
 
     def get_por_market_segments(self) -> list[str]:
         """
@@ -41,7 +45,7 @@ class InsightsResource:
         """
         response = self._client.get("/v1/insights/por")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         return result.get("MarketSegments", [])
 
     def get_por_rolls(self, market_segment: str) -> list[int]:
@@ -66,7 +70,7 @@ class InsightsResource:
         """
         response = self._client.get(f"/v1/insights/por/{market_segment}")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         return result.get("Rolls", [])
 
     def get_por_data(
@@ -113,7 +117,7 @@ class InsightsResource:
 
         response = self._client.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def get_latency_histogram(
         self,
@@ -172,4 +176,73 @@ class InsightsResource:
 
         if format == "csv":
             return response.text
-        return response.json()
+        return self._decode(response.content)
+
+
+class AsyncInsightsResource:
+    """
+    Market Data Insights API endpoints (asyncio).
+
+    Awaitable counterpart of :class:`InsightsResource` for use with :class:`a7.AsyncA7Client`.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, decoder: JSONDecoder = stdlib_decoder) -> None:
+        """
+        Initialize async Insights resource.
+
+        Args:
+            client: Configured httpx async client
+            decoder: JSON decoder for response bodies (default: stdlib json)
+        """
+        self._client = client
+        self._decode = decoder
+
+    async def get_por_market_segments(self) -> list[str]:
+        """Get list of market segments available for Pace of the Roll analysis. See :meth:`InsightsResource.get_por_market_segments`."""
+        response = await self._client.get("/v1/insights/por")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        return result.get("MarketSegments", [])
+
+    async def get_por_rolls(self, market_segment: str) -> list[int]:
+        """Get list of available rolls for a market segment. See :meth:`InsightsResource.get_por_rolls`."""
+        response = await self._client.get(f"/v1/insights/por/{market_segment}")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        return result.get("Rolls", [])
+
+    async def get_por_data(
+        self,
+        market_segment: str,
+        roll: int,
+        days: int = 10,
+        n: int = 20,
+        comp: str = "c",
+    ) -> dict[str, Any]:
+        """Get Pace of the Roll details for a specific roll. See :meth:`InsightsResource.get_por_data`."""
+        url = f"/v1/insights/por/{market_segment}/{roll}"
+        params = {"days": days, "n": n, "comp": comp}
+
+        response = await self._client.get(url, params=params)
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_latency_histogram(
+        self,
+        date: int,
+        trigger: str,
+        target: str,
+        regime: str,
+        target_action: str,
+        format: str = "json",
+    ) -> dict[str, Any] | str:
+        """Get latency histogram for market participants' reaction times. See :meth:`InsightsResource.get_latency_histogram`."""
+        url = f"/v1/insights/latencies/{date}/{trigger}/{target}/{regime}/{target_action}"
+        params = {"format": format}
+
+        response = await self._client.get(url, params=params)
+        response.raise_for_status()
+
+        if format == "csv":
+            return response.text
+        return self._decode(response.content)
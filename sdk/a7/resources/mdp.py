@@ -4,6 +4,8 @@ from typing import Any, Optional
 
 import httpx
 
+from a7.decoders import JSONDecoder, stdlib_decoder
+
 
 class MDPResource:
     """
@@ -12,14 +14,16 @@ class MDPResource:
     Provides access to CME MDP market data messages.
     """
 
-    def __init__(self, client: httpx.Client) -> None:
+    def __init__(self, client: httpx.Client, decoder: JSONDecoder = stdlib_decoder) -> None:
         """
         Initialize MDP resource.
 
         Args:
             client: Configured httpx client
+            decoder: JSON decoder for response bodies (default: stdlib json)
         """
         self._client = client
+        self._decode = decoder
 
     def get_exchanges(self) -> list[str]:
         """
@@ -39,7 +43,7 @@ class MDPResource:
         """
         response = self._client.get("/v1/mdp")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         return result.get("Exchanges", [])
 
     def get_dates(self, exchange: str) -> list[int]:
@@ -64,7 +68,7 @@ class MDPResource:
         """
         response = self._client.get(f"/v1/mdp/{exchange}")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         return result.get("Dates", [])
 
     def get_assets(self, exchange: str, date: int) -> list[str]:
@@ -90,7 +94,7 @@ class MDPResource:
         """
         response = self._client.get(f"/v1/mdp/{exchange}/{date}")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         return result.get("Assets", [])
 
     def get_securities(self, exchange: str, date: int, asset: str) -> list[int]:
@@ -117,7 +121,7 @@ class MDPResource:
         """
         response = self._client.get(f"/v1/mdp/{exchange}/{date}/{asset}")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         return result.get("SecurityIDs", [])
 
     def get_sending_times(
@@ -178,7 +182,7 @@ class MDPResource:
 
         response = self._client.get(url, params=params)
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
 
         if mode == "detailed":
             return result.get("Packets", [])
@@ -221,4 +225,101 @@ class MDPResource:
         url = f"/v1/mdp/{exchange}/{date}/{asset}/{security_id}/{sending_time}"
         response = self._client.get(url)
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
+
+
+class AsyncMDPResource:
+    """
+    Market Data Platform API endpoints (asyncio).
+
+    Awaitable counterpart of :class:`MDPResource` for use with :class:`a7.AsyncA7Client`.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, decoder: JSONDecoder = stdlib_decoder) -> None:
+        """
+        Initialize async MDP resource.
+
+        Args:
+            client: Configured httpx async client
+            decoder: JSON decoder for response bodies (default: stdlib json)
+        """
+        self._client = client
+        self._decode = decoder
+
+    async def get_exchanges(self) -> list[str]:
+        """Get list of available exchanges. See :meth:`MDPResource.get_exchanges`."""
+        response = await self._client.get("/v1/mdp")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        return result.get("Exchanges", [])
+
+    async def get_dates(self, exchange: str) -> list[int]:
+        """Get list of available trading days for an exchange. See :meth:`MDPResource.get_dates`."""
+        response = await self._client.get(f"/v1/mdp/{exchange}")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        return result.get("Dates", [])
+
+    async def get_assets(self, exchange: str, date: int) -> list[str]:
+        """Get list of assets for an exchange and date. See :meth:`MDPResource.get_assets`."""
+        response = await self._client.get(f"/v1/mdp/{exchange}/{date}")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        return result.get("Assets", [])
+
+    async def get_securities(self, exchange: str, date: int, asset: str) -> list[int]:
+        """Get list of security IDs for an exchange, date, and asset. See :meth:`MDPResource.get_securities`."""
+        response = await self._client.get(f"/v1/mdp/{exchange}/{date}/{asset}")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        return result.get("SecurityIDs", [])
+
+    async def get_sending_times(
+        self,
+        exchange: str,
+        date: int,
+        asset: str,
+        security_id: int,
+        mode: str = "reference",
+        limit: Optional[int] = None,
+        from_time: Optional[str] = None,
+        to_time: Optional[str] = None,
+        msgseq_num: Optional[int] = None,
+        template_id: Optional[int] = None,
+    ) -> list[str] | list[dict[str, Any]]:
+        """Get list of sending times or detailed packets for a security. See :meth:`MDPResource.get_sending_times`."""
+        url = f"/v1/mdp/{exchange}/{date}/{asset}/{security_id}"
+
+        params: dict[str, Any] = {"mode": mode}
+        if limit is not None:
+            params["limit"] = limit
+        if from_time is not None:
+            params["from"] = from_time
+        if to_time is not None:
+            params["to"] = to_time
+        if msgseq_num is not None:
+            params["msgSeqNum"] = msgseq_num
+        if template_id is not None:
+            params["templateID"] = template_id
+
+        response = await self._client.get(url, params=params)
+        response.raise_for_status()
+        result = self._decode(response.content)
+
+        if mode == "detailed":
+            return result.get("Packets", [])
+        return result.get("SendingTimes", [])
+
+    async def get_message(
+        self,
+        exchange: str,
+        date: int,
+        asset: str,
+        security_id: int,
+        sending_time: str,
+    ) -> dict[str, Any]:
+        """Get MDP packet/message details by identifier. See :meth:`MDPResource.get_message`."""
+        url = f"/v1/mdp/{exchange}/{date}/{asset}/{security_id}/{sending_time}"
+        response = await self._client.get(url)
+        response.raise_for_status()
+        return self._decode(response.content)
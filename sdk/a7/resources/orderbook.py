@@ -4,6 +4,8 @@ from typing import Any, Optional
 
 import httpx
 
+from a7.decoders import JSONDecoder, stdlib_decoder
+
 
 class OrderBookResource:
     """
@@ -13,14 +15,16 @@ class OrderBookResource:
     Supports both T7 markets (XEUR, XETR) and CME markets.
     """
 
-    def __init__(self, client: httpx.Client) -> None:
+    def __init__(self, client: httpx.Client, decoder: JSONDecoder = stdlib_decoder) -> None:
         """
         Initialize Order Book resource.
 
         Args:
             client: Configured httpx client
+            decoder: JSON decoder for response bodies (default: stdlib json)
         """
         self._client = client
+        self._decode = decoder
 
     def get_t7(
         self,
@@ -99,7 +103,7 @@ class OrderBookResource:
 
         response = self._client.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def get_cme(
         self,
@@ -165,4 +169,89 @@ class OrderBookResource:
 
         response = self._client.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
+
+
+class AsyncOrderBookResource:
+    """
+    Order Book API endpoints (asyncio).
+
+    Awaitable counterpart of :class:`OrderBookResource` for use with :class:`a7.AsyncA7Client`.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, decoder: JSONDecoder = stdlib_decoder) -> None:
+        """
+        Initialize async Order Book resource.
+
+        Args:
+            client: Configured httpx async client
+            decoder: JSON decoder for response bodies (default: stdlib json)
+        """
+        self._client = client
+        self._decode = decoder
+
+    async def get_t7(
+        self,
+        market_id: str,
+        date: int,
+        market_segment_id: int,
+        security_id: int,
+        from_time: Optional[str] = None,
+        to_time: Optional[str] = None,
+        limit: int = 1,
+        levels: int = 10,
+        orderbook: str = "aggregated",
+        trades: bool = False,
+        indicatives: bool = False,
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """Get order book(s) for T7 markets (XEUR, XETR). See :meth:`OrderBookResource.get_t7`."""
+        url = f"/v1/ob/{market_id}/{date}/{market_segment_id}/{security_id}"
+
+        params: dict[str, Any] = {
+            "limit": limit,
+            "levels": levels,
+            "orderbook": orderbook,
+            "trades": trades,
+            "indicatives": indicatives,
+        }
+
+        if from_time is not None:
+            params["from"] = from_time
+        if to_time is not None:
+            params["to"] = to_time
+
+        response = await self._client.get(url, params=params)
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_cme(
+        self,
+        exchange: str,
+        date: int,
+        asset: str,
+        security_id: int,
+        from_time: Optional[str] = None,
+        to_time: Optional[str] = None,
+        limit: int = 1,
+        levels: int = 10,
+        orderbook: str = "aggregated",
+        trades: bool = False,
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """Get order book(s) for CME markets. See :meth:`OrderBookResource.get_cme`."""
+        url = f"/v1/ob/{exchange}/{date}/{asset}/{security_id}"
+
+        params: dict[str, Any] = {
+            "limit": limit,
+            "levels": levels,
+            "orderbook": orderbook,
+            "trades": trades,
+        }
+
+        if from_time is not None:
+            params["from"] = from_time
+        if to_time is not None:
+            params["to"] = to_time
+
+        response = await self._client.get(url, params=params)
+        response.raise_for_status()
+        return self._decode(response.content)
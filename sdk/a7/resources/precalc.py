@@ -4,6 +4,8 @@ from typing import Any
 
 import httpx
 
+from a7.decoders import JSONDecoder, stdlib_decoder
+
 
 class PrecalcResource:
     """
@@ -13,14 +15,16 @@ class PrecalcResource:
     Precalc jobs generate datasets that can be accessed via the Dataset API.
     """
 
-    def __init__(self, client: httpx.Client) -> None:
+    def __init__(self, client: httpx.Client, decoder: JSONDecoder = stdlib_decoder) -> None:
         """
         Initialize Precalc resource.
 
         Args:
             client: Configured httpx client
+            decoder: JSON decoder for response bodies (default: stdlib json)
         """
         self._client = client
+        self._decode = decoder
 
     def list_owners(self) -> list[str]:
         """
@@ -40,7 +44,7 @@ class PrecalcResource:
         """
         response = self._client.get("/v1/precalc")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         return result.get("Owners", [])
 
     def get_jobs(self, owner: str) -> list[str]:
@@ -66,7 +70,7 @@ class PrecalcResource:
         """
         response = self._client.get(f"/v1/precalc/{owner}")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         return result.get("Jobs", [])
 
     def get_definition(self, owner: str, precalc: str) -> dict[str, Any]:
@@ -92,7 +96,7 @@ class PrecalcResource:
         """
         response = self._client.get(f"/v1/precalc/{owner}/{precalc}")
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def create(
         self,
@@ -132,7 +136,7 @@ class PrecalcResource:
             json=definition,
         )
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def delete(self, owner: str, precalc: str) -> dict[str, Any]:
         """
@@ -160,7 +164,7 @@ class PrecalcResource:
         """
         response = self._client.delete(f"/v1/precalc/{owner}/{precalc}")
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def activate(self, owner: str, precalc: str) -> dict[str, Any]:
         """
@@ -185,7 +189,7 @@ class PrecalcResource:
         """
         response = self._client.patch(f"/v1/precalc/{owner}/{precalc}/activate")
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def deactivate(self, owner: str, precalc: str) -> dict[str, Any]:
         """
@@ -210,7 +214,7 @@ class PrecalcResource:
         """
         response = self._client.patch(f"/v1/precalc/{owner}/{precalc}/deactivate")
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def get_dates(self, owner: str, precalc: str) -> list[int]:
         """
@@ -237,7 +241,7 @@ class PrecalcResource:
         # Note: OpenAPI shows trailing slash for this endpoint
         response = self._client.get(f"/v1/precalc/{owner}/{precalc}/")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         return result.get("Dates", [])
 
     def get_tasks(self, owner: str, precalc: str, date: int) -> list[str]:
@@ -265,7 +269,7 @@ class PrecalcResource:
         """
         response = self._client.get(f"/v1/precalc/{owner}/{precalc}/{date}")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         return result.get("Tasks", [])
 
     def get_results(self, owner: str, precalc: str, date: int, task: str) -> list[str]:
@@ -294,7 +298,7 @@ class PrecalcResource:
         """
         response = self._client.get(f"/v1/precalc/{owner}/{precalc}/{date}/{task}")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         return result.get("Results", [])
 
     def get_data(
@@ -337,4 +341,113 @@ class PrecalcResource:
 
         response = self._client.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
+
+
+class AsyncPrecalcResource:
+    """
+    Precalculation Management API endpoints (asyncio).
+
+    Awaitable counterpart of :class:`PrecalcResource` for use with :class:`a7.AsyncA7Client`.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, decoder: JSONDecoder = stdlib_decoder) -> None:
+        """
+        Initialize async Precalc resource.
+
+        Args:
+            client: Configured httpx async client
+            decoder: JSON decoder for response bodies (default: stdlib json)
+        """
+        self._client = client
+        self._decode = decoder
+
+    async def list_owners(self) -> list[str]:
+        """List precalc owners accessible to current user. See :meth:`PrecalcResource.list_owners`."""
+        response = await self._client.get("/v1/precalc")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        return result.get("Owners", [])
+
+    async def get_jobs(self, owner: str) -> list[str]:
+        """Get list of precalc jobs for an owner. See :meth:`PrecalcResource.get_jobs`."""
+        response = await self._client.get(f"/v1/precalc/{owner}")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        return result.get("Jobs", [])
+
+    async def get_definition(self, owner: str, precalc: str) -> dict[str, Any]:
+        """Get precalc job definition. See :meth:`PrecalcResource.get_definition`."""
+        response = await self._client.get(f"/v1/precalc/{owner}/{precalc}")
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def create(
+        self,
+        owner: str,
+        precalc: str,
+        definition: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Create a new precalc job. See :meth:`PrecalcResource.create`."""
+        response = await self._client.put(
+            f"/v1/precalc/{owner}/{precalc}",
+            json=definition,
+        )
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def delete(self, owner: str, precalc: str) -> dict[str, Any]:
+        """Delete a precalc job. See :meth:`PrecalcResource.delete`."""
+        response = await self._client.delete(f"/v1/precalc/{owner}/{precalc}")
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def activate(self, owner: str, precalc: str) -> dict[str, Any]:
+        """Activate a precalc job. See :meth:`PrecalcResource.activate`."""
+        response = await self._client.patch(f"/v1/precalc/{owner}/{precalc}/activate")
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def deactivate(self, owner: str, precalc: str) -> dict[str, Any]:
+        """Deactivate a precalc job. See :meth:`PrecalcResource.deactivate`."""
+        response = await self._client.patch(f"/v1/precalc/{owner}/{precalc}/deactivate")
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_dates(self, owner: str, precalc: str) -> list[int]:
+        """Get available dates where tasks exist for a precalc job. See :meth:`PrecalcResource.get_dates`."""
+        response = await self._client.get(f"/v1/precalc/{owner}/{precalc}/")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        return result.get("Dates", [])
+
+    async def get_tasks(self, owner: str, precalc: str, date: int) -> list[str]:
+        """Get available tasks for a precalc job on a specific date. See :meth:`PrecalcResource.get_tasks`."""
+        response = await self._client.get(f"/v1/precalc/{owner}/{precalc}/{date}")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        return result.get("Tasks", [])
+
+    async def get_results(self, owner: str, precalc: str, date: int, task: str) -> list[str]:
+        """Get available result sets for a specific task. See :meth:`PrecalcResource.get_results`."""
+        response = await self._client.get(f"/v1/precalc/{owner}/{precalc}/{date}/{task}")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        return result.get("Results", [])
+
+    async def get_data(
+        self,
+        owner: str,
+        precalc: str,
+        date: int,
+        task: str,
+        result: str,
+        mode: str = "json",
+    ) -> dict[str, Any]:
+        """Get generated data for a specific result set. See :meth:`PrecalcResource.get_data`."""
+        url = f"/v1/precalc/{owner}/{precalc}/{date}/{task}/{result}"
+        params = {"mode": mode}
+
+        response = await self._client.get(url, params=params)
+        response.raise_for_status()
+        return self._decode(response.content)
@@ -4,6 +4,8 @@ from typing import Any
 
 import httpx
 
+from a7.decoders import JSONDecoder, stdlib_decoder
+
 
 class RDIResource:
     """
@@ -12,14 +14,16 @@ class RDIResource:
     Provides access to market data, segments, and security details.
     """
 
-    def __init__(self, client: httpx.Client) -> None:
+    def __init__(self, client: httpx.Client, decoder: JSONDecoder = stdlib_decoder) -> None:
         """
         Initialize RDI resource.
 
         Args:
             client: Configured httpx client
+            decoder: JSON decoder for response bodies (default: stdlib json)
         """
         self._client = client
+        self._decode = decoder
 
     def get_markets(self) -> list[dict[str, Any]]:
         """
@@ -40,7 +44,7 @@ class RDIResource:
         """
         response = self._client.get("/v2/rdi/")
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def get_market_segments(self, market_id: str, date: int) -> list[dict[str, Any]]:
         """
@@ -66,7 +70,7 @@ class RDIResource:
         """
         response = self._client.get(f"/v2/rdi/{market_id}/{date}/")
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def get_security_details(
         self,
@@ -101,7 +105,7 @@ class RDIResource:
         """
         response = self._client.get(f"/v2/rdi/{market_id}/{date}/{market_segment_id}/{security_id}?annotation={annotation}")
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def get_instrument_snapshot(
         self,
@@ -143,4 +147,64 @@ class RDIResource:
             f"/v2/rdi/{market_id}/{date}/{market_segment_id}/{security_id}/{msg_seq_num}?annotation={annotation}"
         )
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
+
+
+class AsyncRDIResource:
+    """
+    Reference Data Interface v2 API endpoints (asyncio).
+
+    Awaitable counterpart of :class:`RDIResource` for use with :class:`a7.AsyncA7Client`.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, decoder: JSONDecoder = stdlib_decoder) -> None:
+        """
+        Initialize async RDI resource.
+
+        Args:
+            client: Configured httpx async client
+            decoder: JSON decoder for response bodies (default: stdlib json)
+        """
+        self._client = client
+        self._decode = decoder
+
+    async def get_markets(self) -> list[dict[str, Any]]:
+        """Get list of available markets. See :meth:`RDIResource.get_markets`."""
+        response = await self._client.get("/v2/rdi/")
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_market_segments(self, market_id: str, date: int) -> list[dict[str, Any]]:
+        """Get market segments for a specific market and date. See :meth:`RDIResource.get_market_segments`."""
+        response = await self._client.get(f"/v2/rdi/{market_id}/{date}/")
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_security_details(
+        self,
+        market_id: str,
+        date: int,
+        market_segment_id: int,
+        security_id: int,
+        annotation: str = "unannotated",
+    ) -> dict[str, Any]:
+        """Get detailed security information. See :meth:`RDIResource.get_security_details`."""
+        response = await self._client.get(f"/v2/rdi/{market_id}/{date}/{market_segment_id}/{security_id}?annotation={annotation}")
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_instrument_snapshot(
+        self,
+        market_id: str,
+        date: int,
+        market_segment_id: int,
+        security_id: int,
+        msg_seq_num: int,
+        annotation: str = "unannotated",
+    ) -> list[dict[str, Any]]:
+        """Get RDI v2 instrument snapshot message. See :meth:`RDIResource.get_instrument_snapshot`."""
+        response = await self._client.get(
+            f"/v2/rdi/{market_id}/{date}/{market_segment_id}/{security_id}/{msg_seq_num}?annotation={annotation}"
+        )
+        response.raise_for_status()
+        return self._decode(response.content)
@@ -4,6 +4,8 @@ from typing import Any
 
 import httpx
 
+from a7.decoders import JSONDecoder, stdlib_decoder
+
 
 class SDResource:
     """
@@ -13,14 +15,16 @@ class SDResource:
     Similar to RDI but specifically for CME exchanges.
     """
 
-    def __init__(self, client: httpx.Client) -> None:
+    def __init__(self, client: httpx.Client, decoder: JSONDecoder = stdlib_decoder) -> None:
         """
         Initialize SD resource.
 
         Args:
             client: Configured httpx client
+            decoder: JSON decoder for response bodies (default: stdlib json)
         """
         self._client = client
+        self._decode = decoder
 
     def get_exchanges(self) -> list[str]:
         """
@@ -40,7 +44,7 @@ class SDResource:
         """
         response = self._client.get("/v2/sd/")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         # API returns a list directly, not wrapped in a dict
         if isinstance(result, list):
             return result
@@ -68,7 +72,7 @@ class SDResource:
         """
         response = self._client.get(f"/v2/sd/{exchange}/")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         # API returns a list directly, not wrapped in a dict
         if isinstance(result, list):
             return result
@@ -97,7 +101,7 @@ class SDResource:
         """
         response = self._client.get(f"/v2/sd/{exchange}/{date}/")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         # API returns a list directly, not wrapped in a dict
         if isinstance(result, list):
             return result
@@ -128,7 +132,7 @@ class SDResource:
         """
         response = self._client.get(f"/v2/sd/{exchange}/{date}/{asset}/")
         response.raise_for_status()
-        result = response.json()
+        result = self._decode(response.content)
         # API returns a list directly, not wrapped in a dict
         if isinstance(result, list):
             return result
@@ -161,7 +165,7 @@ class SDResource:
         """
         response = self._client.get(f"/v2/sd/{exchange}/{date}/{asset}")
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
 
     def get_security_details(
         self,
@@ -195,4 +199,83 @@ class SDResource:
         """
         response = self._client.get(f"/v2/sd/{exchange}/{date}/{asset}/{security_id}")
         response.raise_for_status()
-        return response.json()
+        return self._decode(response.content)
+
+
+class AsyncSDResource:
+    """
+    CME Reference Data API (Security Details v2) endpoints (asyncio).
+
+    Awaitable counterpart of :class:`SDResource` for use with :class:`a7.AsyncA7Client`.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, decoder: JSONDecoder = stdlib_decoder) -> None:
+        """
+        Initialize async SD resource.
+
+        Args:
+            client: Configured httpx async client
+            decoder: JSON decoder for response bodies (default: stdlib json)
+        """
+        self._client = client
+        self._decode = decoder
+
+    async def get_exchanges(self) -> list[str]:
+        """Get available CME exchanges. See :meth:`SDResource.get_exchanges`."""
+        response = await self._client.get("/v2/sd/")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        # API returns a list directly, not wrapped in a dict
+        if isinstance(result, list):
+            return result
+        return result.get("Exchanges", [])
+
+    async def get_dates(self, exchange: str) -> list[int]:
+        """Get available trading days for a CME exchange. See :meth:`SDResource.get_dates`."""
+        response = await self._client.get(f"/v2/sd/{exchange}/")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        # API returns a list directly, not wrapped in a dict
+        if isinstance(result, list):
+            return result
+        return result.get("Dates", [])
+
+    async def get_assets(self, exchange: str, date: int) -> list[str]:
+        """Get available assets for a CME exchange on a trading day. See :meth:`SDResource.get_assets`."""
+        response = await self._client.get(f"/v2/sd/{exchange}/{date}/")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        # API returns a list directly, not wrapped in a dict
+        if isinstance(result, list):
+            return result
+        return result.get("Assets", [])
+
+    async def get_securities(self, exchange: str, date: int, asset: str) -> list[str]:
+        """Get security IDs for an asset. See :meth:`SDResource.get_securities`."""
+        response = await self._client.get(f"/v2/sd/{exchange}/{date}/{asset}/")
+        response.raise_for_status()
+        result = self._decode(response.content)
+        # API returns a list directly, not wrapped in a dict
+        if isinstance(result, list):
+            return result
+        return result.get("SecurityIDs", [])
+
+    async def get_all_security_details(
+        self, exchange: str, date: int, asset: str
+    ) -> list[dict[str, Any]]:
+        """Get security details for all securities in an asset. See :meth:`SDResource.get_all_security_details`."""
+        response = await self._client.get(f"/v2/sd/{exchange}/{date}/{asset}")
+        response.raise_for_status()
+        return self._decode(response.content)
+
+    async def get_security_details(
+        self,
+        exchange: str,
+        date: int,
+        asset: str,
+        security_id: int
+    ) -> dict[str, Any]:
+        """Get security details for a specific security. See :meth:`SDResource.get_security_details`."""
+        response = await self._client.get(f"/v2/sd/{exchange}/{date}/{asset}/{security_id}")
+        response.raise_for_status()
+        return self._decode(response.content)
@@ -0,0 +1,200 @@
+"""Automatic retries with jittered exponential backoff for A7 requests."""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+from a7.config import (
+    DEFAULT_BACKOFF_FACTOR,
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_MAX_BACKOFF,
+)
+from a7.errors import ConnectionError
+from a7.transport import AnyTransport, TransportWrapper
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """
+    Parse the Retry-After header of a response.
+
+    Args:
+        response: HTTP response
+
+    Returns:
+        Delay in seconds, or None if the header is missing or malformed
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry configuration for A7 clients.
+
+    Only idempotent methods are retried by default, so a failed PUT/PATCH/DELETE
+    is never replayed behind the caller's back.
+
+    Attributes:
+        max_attempts: Total attempts per request including the first (1 disables retries)
+        backoff_factor: Base delay in seconds; attempt n waits up to factor * 2**(n-1)
+        max_backoff: Upper bound for a single delay in seconds
+        jitter: Randomize delays ("full jitter") to avoid synchronized retry storms
+        respect_retry_after: Wait at least as long as the server's Retry-After header
+        retry_statuses: HTTP status codes that trigger a retry
+        retry_methods: HTTP methods that may be retried
+        retry_on_connection_errors: Also retry connect/read failures and timeouts
+
+    Example:
+        >>> client = A7Client(token="...", retry=RetryPolicy(max_attempts=5))
+    """
+
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR
+    max_backoff: float = DEFAULT_MAX_BACKOFF
+    jitter: bool = True
+    respect_retry_after: bool = True
+    retry_statuses: frozenset[int] = RETRYABLE_STATUS_CODES
+    retry_methods: frozenset[str] = IDEMPOTENT_METHODS
+    retry_on_connection_errors: bool = True
+
+    @property
+    def enabled(self) -> bool:
+        """Whether this policy retries at all."""
+        return self.max_attempts > 1
+
+    def is_retryable_request(self, request: httpx.Request) -> bool:
+        """Check whether a request may be sent more than once."""
+        return request.method.upper() in self.retry_methods
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Compute the backoff delay after a failed attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def delay_for(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """
+        Compute the delay before the next attempt, honoring Retry-After.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            response: Failed response, if the attempt produced one
+
+        Returns:
+            Delay in seconds
+        """
+        delay = self.backoff(attempt)
+        if response is not None and self.respect_retry_after:
+            retry_after = parse_retry_after(response)
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, self.max_backoff))
+        return delay
+
+
+class RetryTransport(TransportWrapper):
+    """
+    Transport wrapper that retries failed requests according to a RetryPolicy.
+
+    When retries run out, connection failures surface as ConnectionError and the
+    last response is returned; the client turns every error response into the
+    matching :mod:`a7.errors` exception.
+    """
+
+    def __init__(self, transport: AnyTransport, policy: RetryPolicy) -> None:
+        """
+        Initialize retry transport.
+
+        Args:
+            transport: Transport that actually sends the requests
+            policy: Retry configuration
+        """
+        super().__init__(transport)
+        self._policy = policy
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, retrying retryable failures."""
+        policy = self._policy
+        if not policy.enabled or not policy.is_retryable_request(request):
+            return self._send(request)
+
+        attempt = 1
+        while True:
+            try:
+                response = self._send(request)
+            except httpx.TransportError as exc:
+                if not policy.retry_on_connection_errors:
+                    raise
+                if attempt >= policy.max_attempts:
+                    raise ConnectionError(
+                        f"Request failed after {attempt} attempts: {exc!r}"
+                    ) from exc
+                delay = policy.delay_for(attempt)
+            else:
+                if response.status_code not in policy.retry_statuses:
+                    return response
+                if attempt >= policy.max_attempts:
+                    return response
+                delay = policy.delay_for(attempt, response)
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request asynchronously, retrying retryable failures."""
+        policy = self._policy
+        if not policy.enabled or not policy.is_retryable_request(request):
+            return await self._asend(request)
+
+        attempt = 1
+        while True:
+            try:
+                response = await self._asend(request)
+            except httpx.TransportError as exc:
+                if not policy.retry_on_connection_errors:
+                    raise
+                if attempt >= policy.max_attempts:
+                    raise ConnectionError(
+                        f"Request failed after {attempt} attempts: {exc!r}"
+                    ) from exc
+                delay = policy.delay_for(attempt)
+            else:
+                if response.status_code not in policy.retry_statuses:
+                    return response
+                if attempt >= policy.max_attempts:
+                    return response
+                delay = policy.delay_for(attempt, response)
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
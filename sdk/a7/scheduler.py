@@ -0,0 +1,272 @@
+"""Priority-aware scheduling of requests over a fixed concurrency budget."""
+
+import asyncio
+import contextlib
+import contextvars
+import threading
+from collections import deque
+from collections.abc import Generator, Mapping
+from typing import Callable, Optional
+
+import httpx
+
+from a7.config import (
+    DEFAULT_PRIORITY,
+    DEFAULT_PRIORITY_WEIGHTS,
+    DEFAULT_SCHEDULER_CONCURRENCY,
+)
+from a7.errors import DeadlineExceededError
+from a7.timeouts import Deadline
+from a7.transport import AnyTransport, TransportWrapper
+
+# Priority class of the code running in the current thread or task
+_current: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "a7_priority", default=None
+)
+
+
+@contextlib.contextmanager
+def priority(name: str) -> Generator[None, None, None]:
+    """
+    Tag the requests made in a block with a priority class.
+
+    The tag applies to the current thread or task and to the calls of
+    :meth:`A7Client.map` and :meth:`A7Client.gather` started in the block;
+    it has no effect on clients without a :class:`Scheduler`.
+
+    Args:
+        name: Priority class, e.g. 'interactive' or 'bulk'
+
+    Example:
+        >>> with priority("interactive"):
+        ...     book = client.orderbook.get_t7("XEUR", 20240102, 688, 2504978)
+    """
+    token = _current.set(name)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+class _Waiter:
+    """A request queued for a concurrency slot."""
+
+    __slots__ = ("granted", "wake")
+
+    def __init__(self, wake: Callable[[], None]) -> None:
+        self.wake = wake
+        self.granted = False
+
+
+class Scheduler:
+    """
+    Weighted fair queuing of requests over a fixed concurrency budget.
+
+    At most ``concurrency`` requests are in flight at once. Requests beyond
+    that wait in one queue per priority class; whenever a slot frees up,
+    the next request is taken from the class that has used the smallest
+    share of its weight, so a class with weight 16 gets 16 slots for every
+    one of a class with weight 1 while both have requests waiting, and an
+    idle class cannot bank credit. Latency-sensitive requests thus jump
+    ahead of a backlog of bulk requests without starving it.
+
+    Tag requests with :func:`priority`; untagged requests get
+    ``default``. One scheduler can be shared by several clients, sync and
+    async alike, to share one budget.
+
+    Example:
+        >>> scheduler = Scheduler(concurrency=16, weights={"interactive": 16, "bulk": 1},
+        ...                       default="bulk")
+        >>> client = A7Client(token="...", scheduler=scheduler)
+        >>> with priority("interactive"):
+        ...     client.orderbook.get_t7("XEUR", 20240102, 688, 2504978)
+    """
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_SCHEDULER_CONCURRENCY,
+        weights: Optional[Mapping[str, float]] = None,
+        *,
+        default: str = DEFAULT_PRIORITY,
+    ) -> None:
+        """
+        Initialize scheduler.
+
+        Args:
+            concurrency: Requests in flight at once (default: 16)
+            weights: Share of the slots per priority class
+                     (default: interactive 16, normal 4, bulk 1)
+            default: Priority class of untagged requests (default: 'normal')
+
+        Raises:
+            ValueError: If concurrency is below 1, a weight is not positive or
+                        the default class has no weight
+        """
+        weights = dict(weights if weights is not None else DEFAULT_PRIORITY_WEIGHTS)
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if any(weight <= 0 for weight in weights.values()):
+            raise ValueError("priority weights must be positive")
+        if default not in weights:
+            raise ValueError(f"default priority {default!r} has no weight")
+        self.concurrency = concurrency
+        self.weights = weights
+        self.default = default
+        self._lock = threading.Lock()
+        self._queues: dict[str, deque[_Waiter]] = {name: deque() for name in weights}
+        self._finish: dict[str, float] = dict.fromkeys(weights, 0.0)
+        self._virtual_time = 0.0
+        self._active = 0
+
+    def _class_of(self, name: Optional[str]) -> str:
+        name = name if name is not None else _current.get() or self.default
+        if name not in self.weights:
+            raise ValueError(f"Unknown priority class: {name!r}")
+        return name
+
+    def _charge(self, name: str) -> None:
+        """Advance a class's virtual finish time by one request (lock held)."""
+        start = max(self._finish[name], self._virtual_time)
+        self._virtual_time = start
+        self._finish[name] = start + 1.0 / self.weights[name]
+
+    def _admit(self, name: str, waiter: _Waiter) -> bool:
+        """Take a slot now, or queue the waiter; True if a slot was taken."""
+        with self._lock:
+            if self._active < self.concurrency and not any(self._queues.values()):
+                self._active += 1
+                self._charge(name)
+                return True
+            self._queues[name].append(waiter)
+            return False
+
+    def _withdraw(self, name: str, waiter: _Waiter) -> bool:
+        """Remove a waiter that gave up; False if it was granted a slot meanwhile."""
+        with self._lock:
+            if waiter.granted:
+                return False
+            self._queues[name].remove(waiter)
+            return True
+
+    def release(self) -> None:
+        """Give back a slot, handing it to the next waiting request if any."""
+        with self._lock:
+            waiting = [name for name, queue in self._queues.items() if queue]
+            if not waiting:
+                self._active -= 1
+                return
+            name = min(
+                waiting,
+                key=lambda n: max(self._finish[n], self._virtual_time) + 1.0 / self.weights[n],
+            )
+            self._charge(name)
+            waiter = self._queues[name].popleft()
+            waiter.granted = True
+        waiter.wake()
+
+    def acquire(self, name: Optional[str] = None) -> None:
+        """
+        Block until a slot is free for a request.
+
+        Args:
+            name: Priority class (default: the class set with :func:`priority`)
+
+        Raises:
+            ValueError: If the priority class is unknown
+            DeadlineExceededError: If the active Deadline passes while waiting
+        """
+        name = self._class_of(name)
+        event = threading.Event()
+        waiter = _Waiter(event.set)
+        if self._admit(name, waiter):
+            return
+        deadline = Deadline.current()
+        if event.wait(deadline.remaining() if deadline is not None else None):
+            return
+        if not self._withdraw(name, waiter):
+            return
+        raise DeadlineExceededError()
+
+    async def acquire_async(self, name: Optional[str] = None) -> None:
+        """
+        Wait without blocking the event loop until a slot is free for a request.
+
+        Args:
+            name: Priority class (default: the class set with :func:`priority`)
+
+        Raises:
+            ValueError: If the priority class is unknown
+            DeadlineExceededError: If the active Deadline passes while waiting
+        """
+        name = self._class_of(name)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+
+        def resolve() -> None:
+            if not future.done():
+                future.set_result(None)
+
+        def wake() -> None:
+            loop.call_soon_threadsafe(resolve)
+
+        waiter = _Waiter(wake)
+        if self._admit(name, waiter):
+            return
+        deadline = Deadline.current()
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(future), deadline.remaining() if deadline is not None else None
+            )
+        except asyncio.TimeoutError:
+            if self._withdraw(name, waiter):
+                raise DeadlineExceededError() from None
+        except BaseException:
+            if not self._withdraw(name, waiter):
+                self.release()
+            raise
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get the current load.
+
+        Returns:
+            Dict with 'active' (requests in flight) and the number of
+            requests waiting per priority class
+        """
+        with self._lock:
+            return {"active": self._active, **{n: len(q) for n, q in self._queues.items()}}
+
+
+class SchedulerTransport(TransportWrapper):
+    """Transport wrapper that sends each request only once a Scheduler grants a slot."""
+
+    def __init__(self, transport: AnyTransport, scheduler: Scheduler) -> None:
+        """
+        Initialize scheduler transport.
+
+        Args:
+            transport: Transport that actually sends the requests
+            scheduler: Shared scheduler
+        """
+        super().__init__(transport)
+        self._scheduler = scheduler
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Wait for a slot, then send the request and read its body."""
+        self._scheduler.acquire()
+        try:
+            response = self._send(request)
+            response.read()
+        finally:
+            self._scheduler.release()
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Wait for a slot, then send the request and read its body."""
+        await self._scheduler.acquire_async()
+        try:
+            response = await self._asend(request)
+            await response.aread()
+        finally:
+            self._scheduler.release()
+        return response
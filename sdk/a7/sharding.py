@@ -0,0 +1,314 @@
+"""Multi-process sharded execution of resource method calls."""
+
+import itertools
+import multiprocessing
+import os
+import pickle
+import shutil
+import tempfile
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from a7.auth import CredentialPool
+from a7.batch import BatchCall, BatchResult
+from a7.client import A7Client
+from a7.config import DEFAULT_BATCH_CONCURRENCY
+from a7.errors import A7Error, DeadlineExceededError
+from a7.ratelimit import FileBucket, RateLimiter
+from a7.timeouts import Deadline
+
+# Callable run in the worker on each successful result, e.g. to pack it into arrays
+Reducer = Callable[[Any], Any]
+
+# Chunks submitted ahead of the results consumed, per process
+_WINDOW_PER_PROCESS = 2
+
+# The worker process's own client, created by _init_worker after the process starts
+_worker: dict[str, A7Client] = {}
+
+
+def _init_worker(options: dict[str, Any]) -> None:
+    """Create the worker's client; runs once in every worker process."""
+    _worker["client"] = A7Client(**options)
+
+
+def _portable(error: Exception) -> Exception:
+    """Make an exception safe to send back to the parent process."""
+    try:
+        pickle.loads(pickle.dumps(error))
+    except Exception:
+        return A7Error(f"{type(error).__name__}: {error}")
+    return error
+
+
+def _expired_chunk(start: int, calls: list[BatchCall], deadline: Deadline) -> list[BatchResult]:
+    """Results of a chunk not started before the deadline, each failed with DeadlineExceededError."""
+    overdue = time.monotonic() - deadline.expires_at
+    return [
+        BatchResult(start + offset, str(method), kwargs, error=DeadlineExceededError(overdue))
+        for offset, (method, kwargs) in enumerate(calls)
+    ]
+
+
+def _run_chunk(
+    start: int,
+    calls: list[BatchCall],
+    reducer: Optional[Reducer],
+    threads: int,
+    deadline: Optional[Deadline],
+) -> list[BatchResult]:
+    """Run a chunk of calls on the worker's client and reduce the results."""
+    results = _worker["client"].gather(calls, max_concurrency=threads, deadline=deadline)
+    for result in results:
+        result.index += start
+        if result.ok and reducer is not None:
+            try:
+                result.value = reducer(result.value)
+            except Exception as error:
+                result.value, result.error = None, error
+        if result.error is not None:
+            result.error = _portable(result.error)
+    return results
+
+
+def time_windows(start: int, end: int, width: int) -> list[tuple[str, str]]:
+    """
+    Split a time range into consecutive windows.
+
+    Use the windows as ``from_time``/``to_time`` arguments to shard a long
+    range of one security over several calls.
+
+    Args:
+        start: Range start in nanoseconds since the epoch
+        end: Range end in nanoseconds since the epoch (inclusive)
+        width: Window length in nanoseconds
+
+    Returns:
+        (from_time, to_time) pairs as strings, covering start to end without overlap
+
+    Raises:
+        ValueError: If width is not positive
+
+    Example:
+        >>> time_windows(0, 250, 100)
+        [('0', '99'), ('100', '199'), ('200', '250')]
+    """
+    if width <= 0:
+        raise ValueError("width must be positive")
+    return [
+        (str(lower), str(min(lower + width - 1, end))) for lower in range(start, end + 1, width)
+    ]
+
+
+class ShardedFetcher:
+    """
+    Run resource method calls across a pool of worker processes.
+
+    JSON decoding of large order books and EOBI packets is CPU-bound and
+    holds the GIL, so threads stop scaling once one core is busy. The
+    fetcher shards the calls into chunks and spreads them over ``processes``
+    workers. Every worker builds its own :class:`~a7.client.A7Client` after
+    it starts, so no connection pool or lock is ever shared across a fork,
+    and runs each chunk on ``threads`` threads with :meth:`A7Client.gather`.
+
+    An optional ``reducer`` runs in the worker on every result, so only what
+    it returns is sent back: e.g. an ``array.array`` of prices instead of a
+    tree of dicts, or the path of a file the reducer wrote. Failed calls are
+    captured per item as with :meth:`A7Client.map`; HTTP errors arrive as the
+    matching :mod:`a7.errors` exception.
+
+    A ``rate_limit`` applies to all workers together: its bucket is moved
+    to a :class:`~a7.ratelimit.FileBucket` in a temporary directory unless
+    it already uses one.
+
+    Example:
+        >>> calls = [
+        ...     ("orderbook.get_t7", {"market_id": "XEUR", "date": date,
+        ...                           "market_segment_id": 688, "security_id": security,
+        ...                           "limit": 1000})
+        ...     for date in [20240102, 20240103] for security in securities
+        ... ]
+        >>> with ShardedFetcher(token="...", processes=8, rate_limit=RateLimiter(20)) as fetcher:
+        ...     for result in fetcher.map(calls, reducer=best_bids, ordered=False):
+        ...         store(result.kwargs, result.unwrap())
+    """
+
+    def __init__(
+        self,
+        token: Union[str, CredentialPool],
+        *,
+        processes: Optional[int] = None,
+        threads: int = DEFAULT_BATCH_CONCURRENCY,
+        chunk_size: int = 16,
+        rate_limit: Optional[RateLimiter] = None,
+        start_method: Optional[str] = None,
+        **client_options: Any,
+    ) -> None:
+        """
+        Initialize sharded fetcher.
+
+        Args:
+            token: A7 API token, or a CredentialPool; every worker tracks
+                   throttled tokens in its own copy of the pool
+            processes: Worker processes (default: os.cpu_count())
+            threads: Concurrent calls within each worker (default: 8)
+            chunk_size: Calls sent to a worker at a time (default: 16)
+            rate_limit: Rate limit shared by all workers; its weights must be
+                        picklable (module-level functions, not lambdas)
+            start_method: multiprocessing start method, e.g. 'spawn' or
+                          'forkserver' (default: the platform default)
+            **client_options: Further A7Client keyword arguments for every
+                              worker (base_url, retry, cache, ...); they must
+                              be picklable
+
+        Raises:
+            ValueError: If processes, threads or chunk_size is below 1
+        """
+        processes = processes if processes is not None else os.cpu_count() or 1
+        if min(processes, threads, chunk_size) < 1:
+            raise ValueError("processes, threads and chunk_size must be at least 1")
+        self.processes = processes
+        self.threads = threads
+        self.chunk_size = chunk_size
+        self._tempdir: Optional[Path] = None
+        if rate_limit is not None and not isinstance(rate_limit.backend, FileBucket):
+            self._tempdir = Path(tempfile.mkdtemp(prefix="a7-sharding-"))
+            rate_limit = RateLimiter(
+                rate_limit.rate,
+                rate_limit.burst,
+                rate_limit.weights,
+                FileBucket(self._tempdir / "ratelimit"),
+            )
+        options = {"token": token, "rate_limit": rate_limit, **client_options}
+        self._pool = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+            initargs=(options,),
+        )
+
+    def map(
+        self,
+        calls: Iterable[BatchCall],
+        *,
+        reducer: Optional[Reducer] = None,
+        ordered: bool = True,
+        deadline: Optional[Deadline] = None,
+    ) -> Iterator[BatchResult]:
+        """
+        Run calls in the worker processes and iterate over the results.
+
+        Calls are read lazily and sent in chunks, a few per process ahead of
+        the results consumed.
+
+        Args:
+            calls: (resource_method, kwargs) pairs; resource_method must be a
+                   name such as 'orderbook.get_t7', since bound methods cannot
+                   be sent to other processes
+            reducer: Picklable callable run in the worker on each result;
+                     its return value becomes the result's value
+            ordered: Yield results in call order (default) or chunk by chunk
+                     as they complete
+            deadline: Time budget for all calls; once spent, no further chunks
+                      or calls are started and each call left fails with
+                      DeadlineExceededError
+
+        Returns:
+            Iterator of BatchResult, one per call
+
+        Raises:
+            ValueError: If a resource method is not given by name
+        """
+        return self._run(iter(calls), reducer, ordered, deadline)
+
+    def gather(
+        self,
+        calls: Iterable[BatchCall],
+        *,
+        reducer: Optional[Reducer] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> list[BatchResult]:
+        """
+        Run calls in the worker processes and wait for all results.
+
+        Args:
+            calls: (resource_method, kwargs) pairs, see :meth:`map`
+            reducer: Picklable callable run in the worker on each result
+            deadline: Time budget for all calls, see :meth:`map`
+
+        Returns:
+            BatchResult of every call, in call order
+        """
+        return list(self.map(calls, reducer=reducer, deadline=deadline))
+
+    def _chunks(self, calls: Iterator[BatchCall]) -> Iterator[tuple[int, list[BatchCall]]]:
+        start = 0
+        while chunk := list(itertools.islice(calls, self.chunk_size)):
+            for method, _ in chunk:
+                if not isinstance(method, str):
+                    raise ValueError(
+                        f"Pass resource methods by name to ShardedFetcher, got {method!r}"
+                    )
+            yield start, [(method, dict(kwargs)) for method, kwargs in chunk]
+            start += len(chunk)
+
+    def _run(
+        self,
+        calls: Iterator[BatchCall],
+        reducer: Optional[Reducer],
+        ordered: bool,
+        deadline: Optional[Deadline],
+    ) -> Iterator[BatchResult]:
+        window = self.processes * _WINDOW_PER_PROCESS
+        chunks = self._chunks(calls)
+        queued: deque[Future[list[BatchResult]]] = deque()
+        running: set[Future[list[BatchResult]]] = set()
+
+        def submit() -> None:
+            for start, chunk in chunks:
+                if deadline is not None and deadline.expired:
+                    future: Future[list[BatchResult]] = Future()
+                    future.set_result(_expired_chunk(start, chunk, deadline))
+                else:
+                    future = self._pool.submit(
+                        _run_chunk, start, chunk, reducer, self.threads, deadline
+                    )
+                if ordered:
+                    queued.append(future)
+                else:
+                    running.add(future)
+                if len(queued) + len(running) >= window:
+                    return
+
+        try:
+            submit()
+            while queued or running:
+                if ordered:
+                    yield from queued.popleft().result()
+                else:
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+                submit()
+        finally:
+            for future in (*queued, *running):
+                future.cancel()
+
+    def close(self) -> None:
+        """Stop the worker processes and remove the shared rate-limit state."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        if self._tempdir is not None:
+            shutil.rmtree(self._tempdir, ignore_errors=True)
+            self._tempdir = None
+
+    def __enter__(self) -> "ShardedFetcher":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Context manager exit."""
+        self.close()
@@ -0,0 +1,29 @@
+"""Offline testing and benchmarking tools for the A7 SDK."""
+
+from a7.testing.replay import (
+    Archive,
+    Recording,
+    RecordingTransport,
+    ReplayMissError,
+    ReplayTransport,
+)
+from a7.testing.standin import (
+    FaultProfile,
+    MarketProfile,
+    StandInServer,
+    StandInTransport,
+    SyntheticMarket,
+)
+
+__all__ = [
+    "Archive",
+    "FaultProfile",
+    "MarketProfile",
+    "Recording",
+    "RecordingTransport",
+    "ReplayMissError",
+    "ReplayTransport",
+    "StandInServer",
+    "StandInTransport",
+    "SyntheticMarket",
+]
@@ -0,0 +1,290 @@
+"""Record real A7 responses to an archive and replay them offline."""
+
+import asyncio
+import gzip
+import json
+import struct
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Literal, NamedTuple, Optional, Union
+
+import httpx
+
+from a7.cache import cache_key
+from a7.transport import AnyTransport, TransportWrapper
+
+# Frame header: metadata length, body length
+_FRAME = struct.Struct("<II")
+
+# Headers describing the wire encoding, which no longer applies to the stored body
+_SKIPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class ReplayMissError(LookupError):
+    """Raised by a strict :class:`ReplayTransport` for requests not in the archive."""
+
+
+class Recording(NamedTuple):
+    """One recorded response."""
+
+    method: str
+    url: str
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    elapsed: float
+
+
+class Archive:
+    """
+    Compact on-disk archive of recorded responses.
+
+    Records are length-prefixed (JSON metadata + raw body) and stored in a
+    single gzip stream, appended to by :class:`RecordingTransport` and read
+    back by :class:`ReplayTransport`. Request headers, including the
+    Authorization token, are never stored.
+
+    Example:
+        >>> archive = Archive("eobi-crawl.a7rec")
+        >>> len(archive)
+        1250
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Initialize archive.
+
+        Args:
+            path: Archive file; created on the first recorded response
+        """
+        self.path = Path(path).expanduser()
+        self._lock = threading.Lock()
+        self._writer: Optional[gzip.GzipFile] = None
+
+    def append(self, recording: Recording) -> None:
+        """
+        Append a recording and flush it to disk.
+
+        Args:
+            recording: Response to store
+        """
+        meta = json.dumps(
+            {
+                "method": recording.method,
+                "url": recording.url,
+                "status": recording.status,
+                "headers": recording.headers,
+                "elapsed": recording.elapsed,
+            }
+        ).encode()
+        with self._lock:
+            if self._writer is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._writer = gzip.GzipFile(self.path, "ab")
+            self._writer.write(_FRAME.pack(len(meta), len(recording.body)))
+            self._writer.write(meta)
+            self._writer.write(recording.body)
+            self._writer.flush()
+
+    def __iter__(self) -> Iterator[Recording]:
+        """Iterate over all recordings in the order they were made."""
+        if not self.path.exists():
+            return
+        with gzip.open(self.path, "rb") as file:
+            while header := file.read(_FRAME.size):
+                if len(header) < _FRAME.size:
+                    break  # truncated by an interrupted recording
+                meta_size, body_size = _FRAME.unpack(header)
+                meta = json.loads(file.read(meta_size))
+                body = file.read(body_size)
+                if len(body) < body_size:
+                    break
+                yield Recording(
+                    meta["method"],
+                    meta["url"],
+                    meta["status"],
+                    [tuple(pair) for pair in meta["headers"]],
+                    body,
+                    meta["elapsed"],
+                )
+
+    def __len__(self) -> int:
+        """Number of recordings in the archive."""
+        return sum(1 for _ in self)
+
+    def close(self) -> None:
+        """Finish the gzip stream of an archive being recorded."""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+
+class RecordingTransport(TransportWrapper):
+    """
+    Transport that passes requests on and records every response.
+
+    Use as the ``transport`` of a client to capture a live session; each
+    attempt is recorded, including error responses, so retries replay
+    faithfully.
+
+    Example:
+        >>> archive = Archive("eobi-crawl.a7rec")
+        >>> with A7Client(token="...", transport=RecordingTransport(archive)) as client:
+        ...     client.eobi.get_market_segments("XEUR", 20200227)
+    """
+
+    def __init__(self, archive: Archive, transport: Optional[AnyTransport] = None) -> None:
+        """
+        Initialize recording transport.
+
+        Args:
+            archive: Archive to append responses to
+            transport: Transport that actually sends the requests
+                       (default: httpx.HTTPTransport(); pass httpx.AsyncHTTPTransport()
+                       for AsyncA7Client)
+        """
+        super().__init__(transport if transport is not None else httpx.HTTPTransport())
+        self.archive = archive
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request and record the response."""
+        start = time.perf_counter()
+        response = self._send(request)
+        response.read()
+        self._record(request, response, time.perf_counter() - start)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request and record the response."""
+        start = time.perf_counter()
+        response = await self._asend(request)
+        await response.aread()
+        self._record(request, response, time.perf_counter() - start)
+        return response
+
+    def _record(self, request: httpx.Request, response: httpx.Response, elapsed: float) -> None:
+        headers = [
+            (name, value)
+            for name, value in response.headers.items()
+            if name.lower() not in _SKIPPED_HEADERS
+        ]
+        self.archive.append(
+            Recording(
+                request.method,
+                str(request.url),
+                response.status_code,
+                headers,
+                response.content,
+                elapsed,
+            )
+        )
+
+    def close(self) -> None:
+        """Close the wrapped transport and finish the archive."""
+        super().close()
+        self.archive.close()
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport and finish the archive."""
+        await super().aclose()
+        self.archive.close()
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Transport serving responses from an :class:`Archive` without any network.
+
+    Requests are matched by method, URL and query (in any order). Several
+    recordings for the same request are served in turn, and the last one is
+    repeated once they run out. Delays can be added to mimic the live service:
+    a fixed or recorded latency per request, plus transfer time for the body
+    at a given bandwidth.
+
+    Example:
+        >>> replay = ReplayTransport(Archive("eobi-crawl.a7rec"), latency=0.02, bandwidth=5e6)
+        >>> client = A7Client(token="offline", transport=replay)
+    """
+
+    def __init__(
+        self,
+        archive: Archive,
+        *,
+        latency: Union[float, Literal["recorded"]] = 0.0,
+        bandwidth: Optional[float] = None,
+        strict: bool = True,
+    ) -> None:
+        """
+        Initialize replay transport.
+
+        Args:
+            archive: Archive to serve responses from (loaded into memory)
+            latency: Seconds to wait before each response, or 'recorded' to wait
+                     as long as the original request took (default: 0.0)
+            bandwidth: Simulated transfer rate in bytes per second (default: unlimited)
+            strict: Raise ReplayMissError for unknown requests; otherwise answer 404
+
+        Raises:
+            ValueError: If bandwidth is not positive
+        """
+        if bandwidth is not None and bandwidth <= 0:
+            raise ValueError("bandwidth must be positive")
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.strict = strict
+        self._lock = threading.Lock()
+        self._recordings: dict[str, list[Recording]] = {}
+        self._served: dict[str, int] = {}
+        for recording in archive:
+            key = cache_key(httpx.Request(recording.method, recording.url))
+            self._recordings.setdefault(key, []).append(recording)
+
+    def __len__(self) -> int:
+        """Number of loaded recordings."""
+        return sum(len(recordings) for recordings in self._recordings.values())
+
+    def _lookup(self, request: httpx.Request) -> Optional[Recording]:
+        key = cache_key(request)
+        with self._lock:
+            recordings = self._recordings.get(key)
+            if not recordings:
+                return None
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+            return recordings[min(index, len(recordings) - 1)]
+
+    def _delay(self, recording: Recording) -> float:
+        delay = recording.elapsed if self.latency == "recorded" else float(self.latency)
+        if self.bandwidth is not None:
+            delay += len(recording.body) / self.bandwidth
+        return delay
+
+    def _response(self, request: httpx.Request, recording: Optional[Recording]) -> httpx.Response:
+        if recording is None:
+            if self.strict:
+                raise ReplayMissError(f"No recording for {request.method} {request.url}")
+            return httpx.Response(404, request=request)
+        return httpx.Response(
+            recording.status, headers=recording.headers, content=recording.body, request=request
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Serve the recorded response after the simulated delay."""
+        recording = self._lookup(request)
+        if recording is not None and (delay := self._delay(recording)) > 0:
+            time.sleep(delay)
+        return self._response(request, recording)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Serve the recorded response after the simulated delay."""
+        recording = self._lookup(request)
+        if recording is not None and (delay := self._delay(recording)) > 0:
+            await asyncio.sleep(delay)
+        return self._response(request, recording)
+
+    def reset(self) -> None:
+        """Start serving every request's recordings from the first one again."""
+        with self._lock:
+            self._served.clear()
@@ -0,0 +1,1214 @@
+"""Local stand-in for the A7 API serving synthetic market data on demand."""
+
+import asyncio
+import csv
+import datetime
+import functools
+import io
+import json
+import random
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, NamedTuple, Optional
+
+import httpx
+
+from a7.endpoints import match_route
+
+# EOBI prices carry 8 implied decimals, quantities 4
+PRICE_SCALE = 10**8
+QTY_SCALE = 10**4
+
+# EOBI template IDs of the generated order flow
+ORDER_ADD = 13100
+ORDER_MODIFY = 13101
+ORDER_DELETE = 13102
+FULL_ORDER_EXECUTION = 13104
+
+# EOBI Side values
+BUY = 1
+SELL = 2
+
+_BODY_LEN = {ORDER_ADD: 56, ORDER_MODIFY: 80, ORDER_DELETE: 64, FULL_ORDER_EXECUTION: 56}
+_SIDE_NAMES = {BUY: "BUY", SELL: "SELL"}
+_TICK = PRICE_SCALE // 20
+_MASK = (1 << 64) - 1
+_MDP_ASSETS = ("GE", "ZN", "ZB", "ES", "NQ", "CL", "GC", "6E")
+_AUCTION_TYPES = ("opening", "intraday", "closing")
+_DATASET_FIELDS = (
+    ("time", "int"),
+    ("price", "double"),
+    ("quantity", "double"),
+    ("tradeid", "int"),
+    ("day", "int"),
+    ("market", "string"),
+    ("marketsegmentid", "int"),
+)
+
+
+def _mix(*values: int) -> int:
+    """Deterministic 64-bit hash of integers (splitmix64 finalizer per value)."""
+    result = 0x9E3779B97F4A7C15
+    for value in values:
+        result = ((result ^ (value & _MASK)) * 0xBF58476D1CE4E5B9) & _MASK
+        result ^= result >> 31
+        result = (result * 0x94D049BB133111EB) & _MASK
+        result ^= result >> 29
+    return result
+
+
+class _HTTPError(Exception):
+    """Error response produced by a stand-in handler."""
+
+    def __init__(self, status_code: int, message: str) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+
+
+@dataclass(frozen=True)
+class MarketProfile:
+    """
+    Shape and volume of the synthetic market data.
+
+    Identifiers follow a fixed scheme so they can be computed up front:
+    segment ``s`` (1-based) of the ``m``-th market (0-based) has
+    MarketSegmentID ``1000 * (m + 1) + s``, and its ``n``-th security has
+    SecurityID ``segment * 1_000_000 + n``.
+
+    Each security trades for ``session_seconds`` from 08:00 UTC. Every
+    TransactTime carries one packet (ApplSeqNum) with an order add, plus a
+    delete or full execution of an order added ``4 * book_depth`` packets
+    earlier and occasionally an order modify, so the order book always holds
+    about ``book_depth`` price levels per side.
+
+    Attributes:
+        markets: T7 market identifiers (EOBI, order books, RDI, auctions)
+        dates: Trading days of every market and exchange
+        segments_per_market: MarketSegmentIDs per market (and MDP/SD assets)
+        securities_per_segment: SecurityIDs per segment (and per asset)
+        messages_per_second: Approximate EOBI messages per second per security
+        session_seconds: Length of the trading session
+        book_depth: Price levels per side of the order book
+        dataset_rows: Rows of every dataset
+        seed: Varies all generated values
+
+    Example:
+        >>> profile = MarketProfile(securities_per_segment=200, messages_per_second=50)
+    """
+
+    markets: tuple[str, ...] = ("XEUR", "XETR")
+    dates: tuple[int, ...] = (20240102, 20240103, 20240104)
+    segments_per_market: int = 4
+    securities_per_segment: int = 10
+    messages_per_second: float = 10.0
+    session_seconds: int = 3600
+    book_depth: int = 10
+    dataset_rows: int = 1000
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class FaultProfile:
+    """
+    Latency and failures injected by a :class:`StandInTransport`.
+
+    Attributes:
+        latency: Seconds to wait before every response
+        latency_jitter: Extra random delay of up to this many seconds
+        throttle_rate: Probability of answering 429 Too Many Requests
+        retry_after: Retry-After of 429 responses, in seconds
+        error_rate: Probability of answering with ``error_status``
+        error_status: Status of injected server errors
+        max_requests_per_second: Answer 429 once requests exceed this rate
+        seed: Seed of the random choices
+
+    Example:
+        >>> faults = FaultProfile(latency=0.02, throttle_rate=0.05, error_rate=0.01)
+    """
+
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: float = 1.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    max_requests_per_second: Optional[float] = None
+    seed: int = 0
+
+
+@dataclass(frozen=True)
+class _Stream:
+    """Order flow of one security; everything is computed from the packet index."""
+
+    market_id: str
+    segment_id: int
+    security_id: int
+    start: int
+    step: int
+    count: int
+    depth: int
+    seed: int
+
+    @property
+    def lifetime(self) -> int:
+        """Packets an order rests in the book before it is deleted or executed."""
+        return 4 * self.depth
+
+    @property
+    def mid(self) -> int:
+        return (_mix(self.seed, self.security_id) % 900 + 100) * PRICE_SCALE
+
+    def time(self, index: int) -> int:
+        """TransactTime of a packet; jitter below step / 2 keeps times increasing."""
+        jitter = _mix(self.seed, self.security_id, index, 1) % max(self.step // 2, 1)
+        return self.start + index * self.step + jitter
+
+    def index_from(self, timestamp: int) -> int:
+        """Index of the first packet at or after a timestamp."""
+        if timestamp <= self.start:
+            return 0
+        index = (timestamp - self.start) // self.step
+        if index >= self.count:
+            return self.count
+        return index if self.time(index) >= timestamp else index + 1
+
+    def find(self, timestamp: int) -> int:
+        """Index of the packet with exactly this TransactTime."""
+        index = self.index_from(timestamp)
+        if index >= self.count or self.time(index) != timestamp:
+            raise _HTTPError(404, f"No data for TransactTime {timestamp}")
+        return index
+
+    def _modified(self, order: int) -> bool:
+        return order % 7 == 3
+
+    def _first_seq(self, index: int) -> int:
+        """MsgSeqNum of the first message of a packet."""
+        modifies = max(index - self.lifetime // 2, 0)
+        return 1 + index + max(index - self.lifetime, 0) + (modifies + 3) // 7
+
+    def order(self, order: int, at: int) -> dict[str, Any]:
+        """State of an order after packet ``at`` (while it rests in the book)."""
+        mixed = _mix(self.seed, self.security_id, order, 2)
+        side = BUY if mixed & 1 else SELL
+        offset = ((mixed >> 1) % self.depth + 1) * _TICK
+        modify_at = order + self.lifetime // 2
+        state = {
+            "side": side,
+            "price": self.mid - offset if side == BUY else self.mid + offset,
+            "qty": ((mixed >> 16) % 20 + 1) * QTY_SCALE,
+            "priority": self.time(order),
+            "template": ORDER_ADD,
+            "seq": self._first_seq(order + 1) - 1,
+            "time_in": self.time(order),
+        }
+        if self._modified(order) and modify_at <= at:
+            state["prev_priority"] = state["priority"]
+            state["prev_qty"] = state["qty"]
+            state["qty"] += QTY_SCALE
+            state["time_in"] = self.time(modify_at)
+            # Priority just before the packet, so it never equals that of the order it adds
+            state["priority"] = state["time_in"] - 1
+            state["template"] = ORDER_MODIFY
+            state["seq"] = self._first_seq(modify_at)
+        return state
+
+    @staticmethod
+    def _details(state: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "TrdRegTSTimePriority": str(state["priority"]),
+            "DisplayQty": state["qty"],
+            "Side": state["side"],
+            "OrdType": 2,
+            "Price": state["price"],
+        }
+
+    def messages(self, index: int) -> list[dict[str, Any]]:
+        """Messages of a packet in MsgSeqNum order."""
+        transact_time = self.time(index)
+        body: list[tuple[int, dict[str, Any]]] = []
+
+        modified = index - self.lifetime // 2
+        if modified >= 0 and self._modified(modified):
+            before = self.order(modified, index - 1)
+            after = self.order(modified, index)
+            body.append(
+                (
+                    ORDER_MODIFY,
+                    {
+                        "TrdRegTSTimeIn": str(transact_time),
+                        "TrdRegTSPrevTimePriority": str(before["priority"]),
+                        "PrevPrice": before["price"],
+                        "PrevDisplayQty": before["qty"],
+                        "OrderDetails": self._details(after),
+                    },
+                )
+            )
+
+        removed = index - self.lifetime
+        if removed >= 0:
+            state = self.order(removed, index - 1)
+            if removed % 5 == 0:
+                body.append(
+                    (
+                        FULL_ORDER_EXECUTION,
+                        {
+                            "Side": state["side"],
+                            "Price": state["price"],
+                            "TrdRegTSTimePriority": str(state["priority"]),
+                            "TrdMatchID": removed // 5 + 1,
+                            "LastQty": state["qty"],
+                            "LastPx": state["price"],
+                        },
+                    )
+                )
+            else:
+                body.append(
+                    (
+                        ORDER_DELETE,
+                        {
+                            "TrdRegTSTimeIn": str(transact_time),
+                            "OrderDetails": self._details(state),
+                        },
+                    )
+                )
+
+        body.append(
+            (
+                ORDER_ADD,
+                {
+                    "TrdRegTSTimeIn": str(transact_time),
+                    "OrderDetails": self._details(self.order(index, index)),
+                },
+            )
+        )
+
+        first = self._first_seq(index)
+        return [
+            {
+                "MessageHeader": {
+                    "BodyLen": _BODY_LEN[template],
+                    "TemplateID": template,
+                    "MsgSeqNum": first + offset,
+                },
+                "ApplSeqNum": index + 1,
+                "SecurityID": self.security_id,
+                **fields,
+            }
+            for offset, (template, fields) in enumerate(body)
+        ]
+
+    def packet(self, index: int, messages: list[dict[str, Any]]) -> dict[str, Any]:
+        return {
+            "PacketHeader": {
+                "ApplSeqNum": index + 1,
+                "MarketSegmentID": self.segment_id,
+                "PartitionID": 1,
+                "CompletionIndicator": 1,
+                "TransactTime": str(self.time(index)),
+            },
+            "Messages": messages,
+        }
+
+    def book(
+        self, index: int, levels: int, complete: bool, trades: bool, indicatives: bool
+    ) -> dict[str, Any]:
+        """T7 order book after a packet, in the /v1/ob response format."""
+        by_side: dict[int, dict[int, list[dict[str, Any]]]] = {BUY: {}, SELL: {}}
+        for order in range(max(index - self.lifetime + 1, 0), index + 1):
+            state = self.order(order, index)
+            by_side[state["side"]].setdefault(state["price"], []).append(state)
+
+        result: dict[str, Any] = {
+            "MarketId": self.market_id,
+            "MarketSegmentId": self.segment_id,
+            "SecurityId": self.security_id,
+            "Timestamp": str(self.time(index)),
+            "prev": str(self.time(index - 1)) if index > 0 else None,
+            "next": str(self.time(index + 1)) if index + 1 < self.count else None,
+        }
+        for side, key in ((BUY, "Buy"), (SELL, "Sell")):
+            prices = sorted(by_side[side], reverse=side == BUY)[:levels]
+            result[key] = [self._level(price, by_side[side][price], complete) for price in prices]
+        if trades:
+            result["Trades"] = self._trades(index)
+        if indicatives:
+            result["Indicatives"] = []
+        return result
+
+    @staticmethod
+    def _level(price: int, states: list[dict[str, Any]], complete: bool) -> dict[str, Any]:
+        level: dict[str, Any] = {
+            "Price": str(price),
+            "Quantity": str(sum(state["qty"] for state in states)),
+            "OrderCount": len(states),
+        }
+        if complete:
+            orders = []
+            for state in sorted(states, key=lambda item: item["priority"]):
+                order = {
+                    "TemplateID": state["template"],
+                    "MsgSeqNum": state["seq"],
+                    "TrdRegTSTimeIn": str(state["time_in"]),
+                    "TrdRegTSTimePriority": str(state["priority"]),
+                    "DisplayQty": state["qty"],
+                }
+                if state["template"] == ORDER_MODIFY:
+                    order["TrdRegTSPrevTimePriority"] = str(state["prev_priority"])
+                    order["PrevPrice"] = str(state["price"])
+                    order["PrevDisplayQty"] = str(state["prev_qty"])
+                orders.append(order)
+            level["Orders"] = orders
+        return level
+
+    def _trades(self, index: int) -> list[dict[str, Any]]:
+        return [
+            {
+                "TemplateID": FULL_ORDER_EXECUTION,
+                "MsgSeqNum": message["MessageHeader"]["MsgSeqNum"],
+                "Side": _SIDE_NAMES[message["Side"]],
+                "AlgorithmicTradeIndicator": 0,
+                "TrdMatchID": message["TrdMatchID"],
+                "Price": str(message["Price"]),
+                "TrdRegTSTimePriority": message["TrdRegTSTimePriority"],
+                "LastQty": str(message["LastQty"]),
+                "LastPx": str(message["LastPx"]),
+            }
+            for message in self.messages(index)
+            if message["MessageHeader"]["TemplateID"] == FULL_ORDER_EXECUTION
+        ]
+
+
+class SyntheticMarket:
+    """
+    Deterministic synthetic market data described by a :class:`MarketProfile`.
+
+    Nothing is stored: every identifier, message and order book is computed
+    from the profile on request, so volume only costs time when it is read.
+
+    Example:
+        >>> market = SyntheticMarket(MarketProfile())
+        >>> market.segments("XEUR", 20240102)
+        [1001, 1002, 1003, 1004]
+    """
+
+    def __init__(self, profile: MarketProfile) -> None:
+        """
+        Initialize synthetic market.
+
+        Args:
+            profile: Shape and volume of the generated data
+
+        Raises:
+            ValueError: If a volume setting is not positive
+        """
+        if profile.messages_per_second <= 0 or profile.session_seconds <= 0:
+            raise ValueError("messages_per_second and session_seconds must be positive")
+        if profile.book_depth < 1:
+            raise ValueError("book_depth must be at least 1")
+        self.profile = profile
+
+    def dates(self, market_id: str) -> list[int]:
+        """Trading days of a market."""
+        self._market_index(market_id)
+        return list(self.profile.dates)
+
+    def segments(self, market_id: str, date: int) -> list[int]:
+        """MarketSegmentIDs of a market on a trading day."""
+        base = 1000 * (self._market_index(market_id) + 1)
+        self._check_date(date)
+        return [base + number for number in range(1, self.profile.segments_per_market + 1)]
+
+    def securities(self, market_id: str, date: int, market_segment_id: int) -> list[int]:
+        """SecurityIDs of a market segment on a trading day."""
+        if market_segment_id not in self.segments(market_id, date):
+            raise _HTTPError(404, f"Unknown MarketSegmentID {market_segment_id}")
+        base = market_segment_id * 1_000_000
+        return [base + number for number in range(1, self.profile.securities_per_segment + 1)]
+
+    def stream(
+        self, market_id: str, date: int, market_segment_id: int, security_id: int
+    ) -> _Stream:
+        """Order flow of a security on a trading day."""
+        if security_id not in self.securities(market_id, date, market_segment_id):
+            raise _HTTPError(404, f"Unknown SecurityID {security_id}")
+        return _stream(self.profile, market_id, date, market_segment_id, security_id)
+
+    def _market_index(self, market_id: str) -> int:
+        try:
+            return self.profile.markets.index(market_id)
+        except ValueError:
+            raise _HTTPError(404, f"Unknown market {market_id}") from None
+
+    def _check_date(self, date: int) -> None:
+        if date not in self.profile.dates:
+            raise _HTTPError(404, f"No data for date {date}")
+
+
+def _session_start(date: int) -> int:
+    """08:00 UTC of a trading day in nanoseconds since 1970."""
+    day = datetime.datetime.strptime(str(date), "%Y%m%d").replace(
+        hour=8, tzinfo=datetime.timezone.utc
+    )
+    return int(day.timestamp()) * 10**9
+
+
+@functools.lru_cache(maxsize=4096)
+def _stream(
+    profile: MarketProfile, market_id: str, date: int, market_segment_id: int, security_id: int
+) -> _Stream:
+    step = max(int(2e9 / profile.messages_per_second), 4)
+    start = _session_start(date) + _mix(profile.seed, security_id, 0) % step
+    return _Stream(
+        market_id=market_id,
+        segment_id=market_segment_id,
+        security_id=security_id,
+        start=start,
+        step=step,
+        count=max(profile.session_seconds * 10**9 // step, 1),
+        depth=profile.book_depth,
+        seed=profile.seed,
+    )
+
+
+def _int(query: httpx.QueryParams, name: str) -> Optional[int]:
+    value = query.get(name)
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise _HTTPError(400, f"Invalid {name}: {value!r}") from None
+
+
+def _int_set(query: httpx.QueryParams, name: str) -> Optional[set[int]]:
+    value = query.get(name)
+    if not value:
+        return None
+    try:
+        return {int(item) for item in value.split(",") if item.strip()}
+    except ValueError:
+        raise _HTTPError(400, f"Invalid {name}: {value!r}") from None
+
+
+def _flag(query: httpx.QueryParams, name: str) -> bool:
+    return query.get(name, "false").lower() == "true"
+
+
+def _window(stream: _Stream, query: httpx.QueryParams) -> range:
+    """Packet indices selected by the from/to/limit query parameters."""
+    from_time = _int(query, "from")
+    to_time = _int(query, "to")
+    limit = _int(query, "limit")
+    first = stream.index_from(from_time) if from_time is not None else 0
+    end = stream.index_from(to_time + 1) if to_time is not None else stream.count
+    if limit is not None:
+        end = min(end, first + max(limit, 0))
+    return range(first, max(end, first))
+
+
+def _filter_messages(
+    messages: list[dict[str, Any]], query: httpx.QueryParams, *, msgseq: bool
+) -> list[dict[str, Any]]:
+    templates = _int_set(query, "templateIdFilter")
+    seqs = _int_set(query, "msgSeqNumFilter") if msgseq else None
+    return [
+        message
+        for message in messages
+        if (templates is None or message["MessageHeader"]["TemplateID"] in templates)
+        and (seqs is None or message["MessageHeader"]["MsgSeqNum"] in seqs)
+    ]
+
+
+class _Call(NamedTuple):
+    """What a handler answers: the data, the route's path parameters and the query."""
+
+    market: SyntheticMarket
+    params: dict[str, str]
+    query: httpx.QueryParams
+
+
+_Handler = Callable[[_Call], Any]
+_HANDLERS: dict[str, _Handler] = {}
+
+
+def _handles(*names: str) -> Callable[[_Handler], _Handler]:
+    def register(handler: _Handler) -> _Handler:
+        for name in names:
+            _HANDLERS[name] = handler
+        return handler
+
+    return register
+
+
+def _eobi_stream(market: SyntheticMarket, params: dict[str, str]) -> _Stream:
+    return market.stream(
+        params["market_id"],
+        int(params["date"]),
+        int(params["market_segment_id"]),
+        int(params["security_id"]),
+    )
+
+
+@_handles("eobi.get_markets")
+def _eobi_markets(call: _Call) -> Any:
+    return {"MarketIDs": list(call.market.profile.markets)}
+
+
+@_handles("eobi.get_dates")
+def _eobi_dates(call: _Call) -> Any:
+    return {"Dates": call.market.dates(call.params["market_id"])}
+
+
+@_handles("eobi.get_market_segments")
+def _eobi_segments(call: _Call) -> Any:
+    return {
+        "MarketSegmentIDs": call.market.segments(call.params["market_id"], int(call.params["date"]))
+    }
+
+
+@_handles("eobi.get_securities")
+def _eobi_securities(call: _Call) -> Any:
+    securities = call.market.securities(
+        call.params["market_id"], int(call.params["date"]), int(call.params["market_segment_id"])
+    )
+    return {"SecurityIDs": securities}
+
+
+@_handles("eobi.get_transact_times")
+def _eobi_transact_times(call: _Call) -> Any:
+    stream = _eobi_stream(call.market, call.params)
+    window = _window(stream, call.query)
+    applseqs = _int_set(call.query, "applSeqNumFilter")
+    if applseqs is not None:
+        indices = [seq - 1 for seq in sorted(applseqs) if seq - 1 in window]
+    else:
+        indices = list(window)
+    return {"TransactTimes": [str(stream.time(index)) for index in indices]}
+
+
+@_handles("eobi.get_applseq_nums")
+def _eobi_applseq_nums(call: _Call) -> Any:
+    stream = _eobi_stream(call.market, call.params)
+    index = stream.find(int(call.params["transact_time"]))
+    if call.query.get("mode") == "detailed":
+        messages = _filter_messages(stream.messages(index), call.query, msgseq=True)
+        return {"Packets": [stream.packet(index, messages)]}
+    return {"ApplSeqNums": [index + 1]}
+
+
+@_handles("eobi.get_msg_seq_nums", "eobi.get_message")
+def _eobi_messages(call: _Call) -> Any:
+    stream = _eobi_stream(call.market, call.params)
+    index = stream.find(int(call.params["transact_time"]))
+    if int(call.params["applseq_num"]) != index + 1:
+        raise _HTTPError(404, f"No packet {call.params['applseq_num']}")
+    messages = stream.messages(index)
+    if "msg_seq_num" in call.params:
+        for message in messages:
+            if message["MessageHeader"]["MsgSeqNum"] == int(call.params["msg_seq_num"]):
+                return message
+        raise _HTTPError(404, f"No message {call.params['msg_seq_num']}")
+    messages = _filter_messages(messages, call.query, msgseq=False)
+    if call.query.get("mode") == "detailed":
+        return {"Messages": messages}
+    return {"MsgSeqNums": [message["MessageHeader"]["MsgSeqNum"] for message in messages]}
+
+
+@_handles("orderbook.get_t7")
+def _orderbook_t7(call: _Call) -> Any:
+    stream = _eobi_stream(call.market, call.params)
+    from_time = _int(call.query, "from")
+    to_time = _int(call.query, "to")
+    limit = min(_int(call.query, "limit") or 1, 10_000)
+    levels = _int(call.query, "levels") or 10
+    # The book valid at 'from' is the one after the last packet up to that time
+    first = max(stream.index_from(from_time + 1) - 1, 0) if from_time is not None else 0
+    end = stream.index_from(to_time + 1) if to_time is not None else stream.count
+    books = [
+        stream.book(
+            index,
+            levels,
+            complete=call.query.get("orderbook") == "complete",
+            trades=_flag(call.query, "trades"),
+            indicatives=_flag(call.query, "indicatives"),
+        )
+        for index in range(first, max(min(end, first + limit), first + 1))
+    ]
+    return books[0] if limit == 1 else books
+
+
+def _mdp_asset(market: SyntheticMarket, exchange: str, date: int, asset: str) -> int:
+    if exchange != "XCME":
+        raise _HTTPError(404, f"Unknown exchange {exchange}")
+    if date not in market.profile.dates:
+        raise _HTTPError(404, f"No data for date {date}")
+    assets = _assets(market.profile)
+    if asset not in assets:
+        raise _HTTPError(404, f"Unknown asset {asset}")
+    return assets.index(asset)
+
+
+def _assets(profile: MarketProfile) -> list[str]:
+    count = profile.segments_per_market
+    return [*_MDP_ASSETS[:count], *(f"A{number:02d}" for number in range(len(_MDP_ASSETS), count))]
+
+
+def _mdp_securities(market: SyntheticMarket, exchange: str, date: int, asset: str) -> list[int]:
+    base = (90_000 + _mdp_asset(market, exchange, date, asset)) * 1_000
+    return [base + number for number in range(1, market.profile.securities_per_segment + 1)]
+
+
+def _mdp_stream(market: SyntheticMarket, params: dict[str, str]) -> _Stream:
+    exchange, date, asset = params["exchange"], int(params["date"]), params["asset"]
+    security_id = int(params["security_id"])
+    if security_id not in _mdp_securities(market, exchange, date, asset):
+        raise _HTTPError(404, f"Unknown SecurityID {security_id}")
+    return _stream(market.profile, exchange, date, security_id // 1_000, security_id)
+
+
+def _mdp_packet(stream: _Stream, index: int) -> list[dict[str, Any]]:
+    state = stream.order(index, index)
+    return [
+        {"PacketHeader": {"MsgSeqNum": index + 1, "SendingTime": str(stream.time(index))}},
+        {
+            "TemplateID": 46,
+            "SecurityID": stream.security_id,
+            "MDUpdateAction": 0,
+            "MDEntryType": "0" if state["side"] == BUY else "1",
+            "MDEntryPx": state["price"] / PRICE_SCALE,
+            "MDEntrySize": state["qty"] // QTY_SCALE,
+            "RptSeq": index + 1,
+        },
+    ]
+
+
+@_handles("mdp.get_exchanges", "sd.get_exchanges")
+def _mdp_exchanges(_call: _Call) -> Any:
+    return {"Exchanges": ["XCME"]}
+
+
+@_handles("mdp.get_dates", "sd.get_dates")
+def _mdp_dates(call: _Call) -> Any:
+    if call.params["exchange"] != "XCME":
+        raise _HTTPError(404, f"Unknown exchange {call.params['exchange']}")
+    return {"Dates": list(call.market.profile.dates)}
+
+
+@_handles("mdp.get_assets", "sd.get_assets")
+def _mdp_assets(call: _Call) -> Any:
+    _mdp_dates(call)
+    if int(call.params["date"]) not in call.market.profile.dates:
+        raise _HTTPError(404, f"No data for date {call.params['date']}")
+    return {"Assets": _assets(call.market.profile)}
+
+
+@_handles("mdp.get_securities")
+def _mdp_security_ids(call: _Call) -> Any:
+    securities = _mdp_securities(
+        call.market, call.params["exchange"], int(call.params["date"]), call.params["asset"]
+    )
+    return {"SecurityIDs": securities}
+
+
+@_handles("mdp.get_sending_times")
+def _mdp_sending_times(call: _Call) -> Any:
+    stream = _mdp_stream(call.market, call.params)
+    window = _window(stream, call.query)
+    if call.query.get("mode") == "detailed":
+        return {"Packets": [_mdp_packet(stream, index) for index in window]}
+    return {"SendingTimes": [str(stream.time(index)) for index in window]}
+
+
+@_handles("mdp.get_message")
+def _mdp_message(call: _Call) -> Any:
+    stream = _mdp_stream(call.market, call.params)
+    index = stream.find(int(call.params["sending_time"]))
+    return {"Messages": _mdp_packet(stream, index)}
+
+
+def _sd_details(asset: str, security_id: int) -> dict[str, Any]:
+    return {
+        "SecurityID": str(security_id),
+        "SecurityIDSource": "8",
+        "Symbol": f"{asset}{security_id % 1_000:03d}",
+        "SecurityGroup": asset,
+        "Asset": asset,
+        "SecurityExchange": "XCME",
+        "SecurityType": "FUT",
+        "MinPriceIncrement": "0.05",
+        "DisplayFactor": "1",
+    }
+
+
+@_handles("sd.get_securities")
+def _sd_security_ids(call: _Call) -> Any:
+    securities = _mdp_securities(
+        call.market, call.params["exchange"], int(call.params["date"]), call.params["asset"]
+    )
+    return {"SecurityIDs": [str(security) for security in securities]}
+
+
+@_handles("sd.get_all_security_details", "sd.get_security_details")
+def _sd_security_details(call: _Call) -> Any:
+    asset = call.params["asset"]
+    securities = _mdp_securities(
+        call.market, call.params["exchange"], int(call.params["date"]), asset
+    )
+    if "security_id" in call.params:
+        if int(call.params["security_id"]) not in securities:
+            raise _HTTPError(404, f"Unknown SecurityID {call.params['security_id']}")
+        securities = [int(call.params["security_id"])]
+    return [_sd_details(asset, security) for security in securities]
+
+
+def _instrument_snapshot(stream: _Stream, msg_seq_num: int) -> dict[str, Any]:
+    return {
+        "Template": "InstrumentSnapshot",
+        "MsgType": "d",
+        "MsgSeqNum": msg_seq_num,
+        "SecurityID": str(stream.security_id),
+        "SecurityIDSource": "M",
+        "SecurityType": "FUT",
+        "SecurityStatus": "1",
+        "SecurityDesc": f"SYN {stream.security_id}",
+        "InstrumentPricePrecision": 2,
+        "MinPriceIncrement": _TICK / PRICE_SCALE,
+        "NoMarketSegments": 1,
+        "MarketSegmentGrp": [{"MarketSegmentID": stream.segment_id, "PriceType": "22"}],
+    }
+
+
+@_handles("rdi.get_markets")
+def _rdi_markets(call: _Call) -> Any:
+    return list(call.market.profile.markets)
+
+
+@_handles("rdi.get_market_segments")
+def _rdi_segments(call: _Call) -> Any:
+    return call.market.segments(call.params["market_id"], int(call.params["date"]))
+
+
+@_handles("rdi.get_security_details", "rdi.get_instrument_snapshot")
+def _rdi_security(call: _Call) -> Any:
+    stream = _eobi_stream(call.market, call.params)
+    # MsgSeqNum 1 is the product snapshot, followed by one instrument snapshot per security
+    msg_seq_num = stream.security_id % 1_000_000 + 1
+    snapshot = _instrument_snapshot(stream, msg_seq_num)
+    if "msg_seq_num" in call.params:
+        if int(call.params["msg_seq_num"]) != msg_seq_num:
+            raise _HTTPError(404, f"No message {call.params['msg_seq_num']}")
+        return snapshot
+    product = {
+        "Template": "ProductSnapshot",
+        "MsgType": "BU",
+        "MsgSeqNum": 1,
+        "MarketSegmentID": stream.segment_id,
+        "MarketSegment": f"S{stream.segment_id}",
+        "Currency": "EUR",
+    }
+    return [product, snapshot]
+
+
+@_handles("algo.run")
+def _algo_run(call: _Call) -> Any:
+    try:
+        stream = call.market.stream(
+            call.query["marketId"],
+            int(call.query["date"]),
+            int(call.query["marketSegmentId"]),
+            int(call.query["securityId"]),
+        )
+    except (KeyError, ValueError):
+        raise _HTTPError(
+            400, "marketId, date, marketSegmentId and securityId are required"
+        ) from None
+    points = min(_int(call.query, "limit") or 100, stream.count)
+    indices = [index * stream.count // points for index in range(points)]
+    books = [
+        stream.book(index, 1, complete=False, trades=False, indicatives=False) for index in indices
+    ]
+    content = {
+        "time": [book["Timestamp"] for book in books],
+        "bid": [
+            int(book["Buy"][0]["Price"]) / PRICE_SCALE if book["Buy"] else None for book in books
+        ],
+        "ask": [
+            int(book["Sell"][0]["Price"]) / PRICE_SCALE if book["Sell"] else None for book in books
+        ],
+    }
+    return [
+        {
+            "algo": call.params["algorithm"],
+            "protocol": f"STAT total {points} elements (synthetic)",
+            "series": [{"content": content, "name": "top_level"}],
+            "values": [],
+        }
+    ]
+
+
+@_handles("dataset.get_data")
+def _dataset_data(call: _Call) -> Any:
+    if call.query.get("where"):
+        raise _HTTPError(400, "The stand-in does not evaluate 'where' clauses")
+    names = [name for name, _ in _DATASET_FIELDS]
+    select = call.query.get("select", "*")
+    columns = names if select in ("", "*") else [name.strip() for name in select.split(",")]
+    unknown = set(columns) - set(names)
+    if unknown:
+        raise _HTTPError(400, f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    profile = call.market.profile
+    count = min(_int(call.query, "limit") or profile.dataset_rows, profile.dataset_rows)
+    rows: list[list[Any]] = []
+    dataset_seed = zlib.crc32(call.params["dataset"].encode())
+    for number in range(count):
+        mixed = _mix(profile.seed, dataset_seed, number)
+        market_index = mixed % len(profile.markets)
+        day = profile.dates[number % len(profile.dates)]
+        values = {
+            "time": _session_start(day) + number * 10**6,
+            "price": float((mixed >> 16) % 100_000) / 100,
+            "quantity": float((mixed >> 32) % 100 + 1),
+            "tradeid": number + 1,
+            "day": day,
+            "market": profile.markets[market_index],
+            "marketsegmentid": 1000 * (market_index + 1)
+            + 1
+            + (mixed >> 8) % profile.segments_per_market,
+        }
+        rows.append([values[column] for column in columns])
+
+    order_by = call.query.get("orderBy")
+    if order_by:
+        if order_by not in columns:
+            raise _HTTPError(400, f"Unknown field {order_by}")
+        position = columns.index(order_by)
+        rows.sort(key=lambda row: row[position])
+
+    if call.query.get("format") == "csv":
+        text = io.StringIO()
+        writer = csv.writer(text, lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows(rows)
+        return text.getvalue()
+    types = dict(_DATASET_FIELDS)
+    return {"data": rows, "meta": [{"name": column, "type": types[column]} for column in columns]}
+
+
+def _auction_security(market: SyntheticMarket, params: dict[str, str]) -> _Stream:
+    """Resolve either a symbol ('S' + SecurityID) or a segment/security pair."""
+    if "symbol" in params:
+        symbol = params["symbol"]
+        if not (symbol.startswith("S") and symbol[1:].isdigit()):
+            raise _HTTPError(404, f"Unknown symbol {symbol}")
+        security_id = int(symbol[1:])
+        segment_id = security_id // 1_000_000
+    else:
+        segment_id, security_id = int(params["market_segment_id"]), int(params["security_id"])
+    return market.stream(params["exchange"], int(params["date"]), segment_id, security_id)
+
+
+@_handles("auction.get_exchanges")
+def _auction_exchanges(call: _Call) -> Any:
+    return list(call.market.profile.markets)
+
+
+@_handles("auction.get_dates")
+def _auction_dates(call: _Call) -> Any:
+    return call.market.dates(call.params["exchange"])
+
+
+@_handles("auction.get_market_segments")
+def _auction_segments(call: _Call) -> Any:
+    exchange, date = call.params["exchange"], int(call.params["date"])
+    segments = call.market.segments(exchange, date)
+    if call.query.get("mode") == "symbol":
+        return [
+            f"S{security}"
+            for segment in segments
+            for security in call.market.securities(exchange, date, segment)
+        ]
+    return [str(segment) for segment in segments]
+
+
+@_handles("auction.get_securities")
+def _auction_securities(call: _Call) -> Any:
+    return call.market.securities(
+        call.params["exchange"], int(call.params["date"]), int(call.params["market_segment_id"])
+    )
+
+
+@_handles("auction.get_security", "auction.get_security_by_symbol")
+def _auction_security_details(call: _Call) -> Any:
+    stream = _auction_security(call.market, call.params)
+    return {
+        "Exchange": stream.market_id,
+        "Date": int(call.params["date"]),
+        "Symbol": f"S{stream.security_id}",
+        "MarketSegmentID": stream.segment_id,
+        "SecurityID": stream.security_id,
+        "Index": "SYN",
+        "ISIN": f"XS{stream.security_id:010d}",
+        "Ticks": [{"From": 0.0, "To": 1_000_000.0, "Tick": _TICK / PRICE_SCALE}],
+    }
+
+
+@_handles("auction.get_auction_types", "auction.get_auction_types_by_symbol")
+def _auction_types(call: _Call) -> Any:
+    _auction_security(call.market, call.params)
+    return list(_AUCTION_TYPES)
+
+
+@_handles("auction.get_auction", "auction.get_auction_by_symbol")
+def _auction(call: _Call) -> Any:
+    stream = _auction_security(call.market, call.params)
+    auction_type = call.params["auction_type"]
+    if auction_type not in _AUCTION_TYPES:
+        raise _HTTPError(404, f"Unknown auction type {auction_type}")
+    index = {"opening": 0, "intraday": stream.count // 2, "closing": stream.count - 1}[auction_type]
+    price = stream.mid / PRICE_SCALE
+    volume = (_mix(stream.seed, stream.security_id, index, 3) % 500 + 1) * 100
+    result: dict[str, Any] = {
+        "Exchange": stream.market_id,
+        "Date": int(call.params["date"]),
+        "MarketSegmentID": stream.segment_id,
+        "SecurityID": stream.security_id,
+        "AuctionType": auction_type,
+        "AuctionStartTimestamp": stream.time(index) - 120 * 10**9,
+        "AuctionEndTimestamp": stream.time(index),
+        "AuctionReferencePrice": price,
+        "UncrossingPrice": price,
+        "MatchedVolume": volume,
+    }
+    sides, prices, quantities = (call.query.get_list(name) for name in ("side", "px", "qty"))
+    if sides:
+        if not len(sides) == len(prices) == len(quantities):
+            raise _HTTPError(400, "side, px and qty must be given for every simulated order")
+        priorities = call.query.get_list("prio") or ["0"] * len(sides)
+        orders = [
+            {
+                "Side": side,
+                "Px": px if px == "null" else float(px),
+                "Qty": int(qty),
+                "Prio": int(prio),
+            }
+            for side, px, qty, prio in zip(sides, prices, quantities, priorities)
+        ]
+        result["SimulatedUncrossingPrice"] = price
+        result["SimulatedMatchedVolume"] = volume + sum(int(qty) for qty in quantities)
+        result["SimulatedOrders"] = orders
+    return result
+
+
+class StandInTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Transport answering A7 API requests locally with synthetic data.
+
+    Serves the EOBI, T7 order book, MDP, RDI v2, SD v2, algorithm run,
+    dataset data and auction simulation endpoints with the payload shapes of
+    the OpenAPI specs, generated on demand at the volume set by a
+    :class:`MarketProfile`. Latency, 429s and server errors can be injected
+    with a :class:`FaultProfile`. Requests without a bearer token are
+    rejected with 401, and endpoints not listed above answer 404.
+
+    Example:
+        >>> standin = StandInTransport(MarketProfile(securities_per_segment=100))
+        >>> client = A7Client(token="local", transport=standin)
+        >>> client.eobi.get_market_segments("XEUR", 20240102)
+        [1001, 1002, 1003, 1004]
+    """
+
+    def __init__(
+        self, profile: Optional[MarketProfile] = None, faults: Optional[FaultProfile] = None
+    ) -> None:
+        """
+        Initialize stand-in transport.
+
+        Args:
+            profile: Shape and volume of the data (default: MarketProfile())
+            faults: Injected latency and errors (default: none)
+        """
+        self.market = SyntheticMarket(profile or MarketProfile())
+        self.faults = faults or FaultProfile()
+        self.statuses: Counter[int] = Counter()
+        self._random = random.Random(self.faults.seed)
+        self._lock = threading.Lock()
+        self._tokens = self.faults.max_requests_per_second or 0.0
+        self._refilled = time.monotonic()
+
+    def _plan(self) -> tuple[float, Optional[int]]:
+        """Pick the delay and any injected error status for the next request."""
+        faults = self.faults
+        with self._lock:
+            delay = faults.latency + self._random.uniform(0.0, faults.latency_jitter)
+            if faults.max_requests_per_second is not None:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._tokens + (now - self._refilled) * faults.max_requests_per_second,
+                    faults.max_requests_per_second,
+                )
+                self._refilled = now
+                if self._tokens < 1.0:
+                    return delay, 429
+                self._tokens -= 1.0
+            roll = self._random.random()
+            if roll < faults.throttle_rate:
+                return delay, 429
+            if roll < faults.throttle_rate + faults.error_rate:
+                return delay, faults.error_status
+        return delay, None
+
+    def _respond(self, request: httpx.Request, injected: Optional[int]) -> httpx.Response:
+        if not request.headers.get("Authorization", "").startswith("Bearer "):
+            response = httpx.Response(401, text="Authorization failed", request=request)
+        elif injected == 429:
+            response = httpx.Response(
+                429,
+                headers={"Retry-After": f"{self.faults.retry_after:g}"},
+                json={"code": "429", "message": "Too many requests"},
+                request=request,
+            )
+        elif injected is not None:
+            response = httpx.Response(
+                injected, json={"code": str(injected), "message": "Injected error"}, request=request
+            )
+        else:
+            response = self._serve(request)
+        with self._lock:
+            self.statuses[response.status_code] += 1
+        return response
+
+    def _serve(self, request: httpx.Request) -> httpx.Response:
+        match = match_route(request)
+        handler = _HANDLERS.get(match.route.name) if match is not None else None
+        try:
+            if match is None or handler is None:
+                raise _HTTPError(404, f"{request.url.path} is not served by the stand-in")
+            payload = handler(_Call(self.market, match.params, request.url.params))
+        except _HTTPError as exc:
+            return httpx.Response(
+                exc.status_code,
+                json={"code": str(exc.status_code), "message": exc.message},
+                request=request,
+            )
+        if isinstance(payload, str):
+            return httpx.Response(
+                200, headers={"Content-Type": "text/csv"}, text=payload, request=request
+            )
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        return httpx.Response(
+            200, headers={"Content-Type": "application/json"}, content=body, request=request
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer the request after any injected delay."""
+        delay, injected = self._plan()
+        if delay > 0:
+            time.sleep(delay)
+        return self._respond(request, injected)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer the request after any injected delay."""
+        delay, injected = self._plan()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self._respond(request, injected)
+
+
+class StandInServer:
+    """
+    HTTP server in a background thread answering through a :class:`StandInTransport`.
+
+    Use it instead of passing the transport to a client when requests should
+    cross a real socket, e.g. to measure connection pooling or to share one
+    stand-in between processes.
+
+    Example:
+        >>> with StandInServer(StandInTransport()) as server:
+        ...     client = A7Client(token="local", base_url=server.base_url)
+        ...     client.eobi.get_markets()
+        ['XEUR', 'XETR']
+    """
+
+    def __init__(
+        self, transport: Optional[StandInTransport] = None, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        """
+        Initialize stand-in server.
+
+        Args:
+            transport: Stand-in answering the requests (default: StandInTransport())
+            host: Interface to listen on
+            port: Port to listen on (default: any free port)
+        """
+        self.transport = transport if transport is not None else StandInTransport()
+        self._address = (host, port)
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to a client, e.g. 'http://127.0.0.1:50123/api'."""
+        if self._server is None:
+            raise RuntimeError("Server is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self) -> "StandInServer":
+        """Start listening in a daemon thread."""
+        transport = self.transport
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                request = httpx.Request(
+                    self.command,
+                    f"http://{self.headers.get('Host', 'localhost')}{self.path}",
+                    headers=list(self.headers.items()),
+                    content=self.rfile.read(length) if length else b"",
+                )
+                response = transport.handle_request(request)
+                self.send_response(response.status_code)
+                for name, value in response.headers.items():
+                    if name.lower() not in ("content-length", "transfer-encoding", "connection"):
+                        self.send_header(name, value)
+                self.send_header("Content-Length", str(len(response.content)))
+                self.end_headers()
+                self.wfile.write(response.content)
+
+            do_GET = do_PUT = do_PATCH = do_DELETE = _handle
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(self._address, Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and wait for its thread."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "StandInServer":
+        """Start the server."""
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop the server."""
+        self.stop()
@@ -0,0 +1,222 @@
+"""Timeouts per resource method or endpoint family, and deadlines for multi-call work."""
+
+import contextlib
+import contextvars
+import time
+from collections.abc import Generator, Mapping
+from typing import Any, Callable, Optional, Union
+
+import httpx
+
+from a7.endpoints import endpoint_family, match_route
+from a7.errors import DeadlineExceededError
+from a7.transport import AnyTransport, TransportWrapper
+
+# Seconds for all four phases, an httpx.Timeout with a connect/read/write/pool split,
+# or a callable choosing either for a request (e.g. by its query parameters)
+TimeoutSpec = Union[float, httpx.Timeout, Callable[[httpx.Request], Union[float, httpx.Timeout]]]
+
+_PHASES = ("connect", "read", "write", "pool")
+
+# Deadline of the code running in the current thread or task, set by 'with Deadline(...)'
+_current: contextvars.ContextVar[Optional["Deadline"]] = contextvars.ContextVar(
+    "a7_deadline", default=None
+)
+
+
+class TimeoutProfile:
+    """
+    Request timeouts per resource method, resource or endpoint family.
+
+    Keys are resource methods (``'rdi.get_markets'``), resources
+    (``'algo'``) or endpoint families (``'/v1/ob'``); the most specific key
+    that matches a request wins, and requests matching no key keep the
+    client's ``timeout``. Values are seconds, an :class:`httpx.Timeout`
+    with separate connect/read/write/pool limits, or a callable that picks
+    one per request.
+
+    Example:
+        >>> profile = TimeoutProfile({
+        ...     "rdi.get_markets": 2.0,
+        ...     "algo": httpx.Timeout(600.0, connect=5.0),
+        ...     "dataset.get_data": lambda r: 900.0 if r.url.params.get("format") == "csv" else 60.0,
+        ... })
+        >>> client = A7Client(token="...", timeouts=profile)
+    """
+
+    def __init__(self, timeouts: Mapping[str, TimeoutSpec]) -> None:
+        """
+        Initialize timeout profile.
+
+        Args:
+            timeouts: Timeout per resource method, resource or endpoint family
+        """
+        self.timeouts: dict[str, TimeoutSpec] = dict(timeouts)
+
+    def timeout_for(self, request: httpx.Request) -> Optional[httpx.Timeout]:
+        """
+        Get the timeout configured for a request.
+
+        Args:
+            request: Outgoing request
+
+        Returns:
+            Timeout of the most specific matching key, or None if no key matches
+        """
+        spec: Optional[TimeoutSpec] = None
+        match = match_route(request)
+        if match is not None:
+            name = match.route.name
+            spec = self.timeouts.get(name, self.timeouts.get(name.partition(".")[0]))
+        if spec is None:
+            spec = self.timeouts.get(endpoint_family(request.url.path))
+        if spec is None:
+            return None
+        if callable(spec):
+            spec = spec(request)
+        return spec if isinstance(spec, httpx.Timeout) else httpx.Timeout(spec)
+
+
+class Deadline:
+    """
+    Overall time budget for a sequence of calls.
+
+    While a deadline is active, every request checks it before being sent:
+    once the budget is spent, no new request goes out and
+    :class:`~a7.errors.DeadlineExceededError` is raised instead (retries
+    included), and each request's connect/read/write/pool timeouts are cut
+    to the time left, so no single wait outlasts the deadline. Cached
+    responses are still served.
+
+    Activate a deadline with ``with`` around any code using a client, or
+    pass it to composite operations such as :meth:`A7Client.map`, which also
+    stop taking new calls when it expires. Nested deadlines never extend an
+    enclosing one.
+
+    Example:
+        >>> with Deadline(60):
+        ...     for segment in client.eobi.get_market_segments("XEUR", 20240102):
+        ...         crawl(segment)
+        >>> client.gather(calls, deadline=Deadline(300))
+    """
+
+    def __init__(self, seconds: float) -> None:
+        """
+        Initialize deadline.
+
+        Args:
+            seconds: Time budget starting now
+        """
+        self.expires_at = time.monotonic() + seconds
+        self._tokens: list[contextvars.Token[Optional[Deadline]]] = []
+
+    @classmethod
+    def current(cls) -> Optional["Deadline"]:
+        """Get the deadline active in the current thread or task, if any."""
+        return _current.get()
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (0.0 once it has passed)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the time budget is spent."""
+        return time.monotonic() >= self.expires_at
+
+    def check(self) -> None:
+        """
+        Fail if the deadline has passed.
+
+        Raises:
+            DeadlineExceededError: If the time budget is spent
+        """
+        if self.expired:
+            raise DeadlineExceededError(self.expires_at - time.monotonic())
+
+    def __enter__(self) -> "Deadline":
+        """Activate the deadline, or keep an earlier enclosing one."""
+        self._tokens.append(_current.set(earlier(self, _current.get())))
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Restore the deadline that was active before."""
+        _current.reset(self._tokens.pop())
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle without activation state, e.g. for ShardedFetcher workers."""
+        return {"expires_at": self.expires_at}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled deadline."""
+        self.expires_at = state["expires_at"]
+        self._tokens = []
+
+
+def earlier(first: Optional[Deadline], second: Optional[Deadline]) -> Optional[Deadline]:
+    """Get the deadline that expires first, ignoring None."""
+    if first is None or (second is not None and second.expires_at < first.expires_at):
+        return second
+    return first
+
+
+@contextlib.contextmanager
+def activated(deadline: Optional[Deadline]) -> Generator[None, None, None]:
+    """
+    Make a deadline the active one in this thread or task for a block.
+
+    Unlike ``with deadline:``, the same deadline can be activated by many
+    threads at once, e.g. by the workers of a batch. As with ``with``, an
+    earlier enclosing deadline stays in force.
+
+    Args:
+        deadline: Deadline to activate, or None to leave the active one unchanged
+    """
+    if deadline is None:
+        yield
+        return
+    token = _current.set(earlier(deadline, _current.get()))
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+class TimeoutTransport(TransportWrapper):
+    """Transport wrapper applying a TimeoutProfile and the active Deadline."""
+
+    def __init__(self, transport: AnyTransport, profile: Optional[TimeoutProfile] = None) -> None:
+        """
+        Initialize timeout transport.
+
+        Args:
+            transport: Transport that actually sends the requests
+            profile: Optional timeouts per resource method or endpoint family
+        """
+        super().__init__(transport)
+        self._profile = profile
+
+    def _apply(self, request: httpx.Request) -> None:
+        timeout = self._profile.timeout_for(request) if self._profile is not None else None
+        if timeout is not None:
+            request.extensions["timeout"] = timeout.as_dict()
+        deadline = _current.get()
+        if deadline is None:
+            return
+        deadline.check()
+        remaining = deadline.remaining()
+        phases = request.extensions.get("timeout", {})
+        request.extensions["timeout"] = {
+            phase: remaining if phases.get(phase) is None else min(phases[phase], remaining)
+            for phase in _PHASES
+        }
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request with its profile timeout, unless the deadline has passed."""
+        self._apply(request)
+        return self._send(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send the request with its profile timeout, unless the deadline has passed."""
+        self._apply(request)
+        return await self._asend(request)
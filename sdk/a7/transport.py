@@ -0,0 +1,60 @@
+"""Transport building blocks shared by the sync and async A7 clients."""
+
+from typing import Union
+
+import httpx
+
+AnyTransport = Union[httpx.BaseTransport, httpx.AsyncBaseTransport]
+
+
+class TransportWrapper(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Base class for transport middleware.
+
+    A wrapper delegates to an inner transport and can be stacked under either
+    ``httpx.Client`` or ``httpx.AsyncClient``; the sync or async entry point is
+    used depending on the kind of transport being wrapped. Subclasses override
+    ``handle_request`` / ``handle_async_request`` and call ``self._send`` /
+    ``self._asend`` to pass the request on.
+    """
+
+    def __init__(self, transport: AnyTransport) -> None:
+        """
+        Initialize transport wrapper.
+
+        Args:
+            transport: Inner transport (sync or async)
+        """
+        self._transport = transport
+
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        """Send a request through the wrapped sync transport."""
+        transport = self._transport
+        assert isinstance(transport, httpx.BaseTransport)
+        return transport.handle_request(request)
+
+    async def _asend(self, request: httpx.Request) -> httpx.Response:
+        """Send a request through the wrapped async transport."""
+        transport = self._transport
+        assert isinstance(transport, httpx.AsyncBaseTransport)
+        return await transport.handle_async_request(request)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Pass the request through unchanged."""
+        return self._send(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Pass the request through unchanged."""
+        return await self._asend(request)
+
+    def close(self) -> None:
+        """Close the wrapped transport."""
+        transport = self._transport
+        assert isinstance(transport, httpx.BaseTransport)
+        transport.close()
+
+    async def aclose(self) -> None:
+        """Close the wrapped async transport."""
+        transport = self._transport
+        assert isinstance(transport, httpx.AsyncBaseTransport)
+        await transport.aclose()
@@ -0,0 +1,49 @@
+"""Helpers shared by the benchmark scripts: summaries, environment and JSON output."""
+
+import json
+import platform
+import statistics
+import sys
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Optional
+
+import a7
+
+_SCALES = {"s": 1.0, "ms": 1e3, "us": 1e6}
+
+
+def summary(samples: list[float], unit: str = "ms") -> dict[str, float]:
+    """Min, median and max of timings in seconds, converted to ``unit``."""
+    scale = _SCALES[unit]
+    return {
+        f"min_{unit}": round(min(samples) * scale, 3),
+        f"median_{unit}": round(statistics.median(samples) * scale, 3),
+        f"max_{unit}": round(max(samples) * scale, 3),
+    }
+
+
+def _version(package: str) -> Optional[str]:
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return None
+
+
+def environment() -> dict[str, Any]:
+    """Versions the results depend on, so reports of different releases can be compared."""
+    return {
+        "a7": a7.__version__,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        **{package: _version(package) for package in ("httpx", "h2", "orjson", "msgspec")},
+    }
+
+
+def emit(report: dict[str, Any], output: Optional[Path]) -> None:
+    """Print the report as JSON and optionally write it to a file."""
+    text = json.dumps(report, indent=2)
+    print(text)
+    if output is not None:
+        output.write_text(text + "\n")
@@ -0,0 +1,202 @@
+"""
+Benchmark EOBI crawl throughput at several concurrency levels.
+
+The crawl walks the EOBI hierarchy of one market and date the way bulk
+downloads do: market segments, then the securities of each segment, then
+the first transact times of each security, then every packet in detailed
+mode. Requests after the first level are spread over a thread pool
+(``A7Client``) or an asyncio semaphore (``AsyncA7Client``) of the given
+size.
+
+The local stand-in (``a7.testing``) answers with a fixed latency per
+request, in process or, with ``--http``, through a real HTTP server so
+connection pooling is included.
+
+Usage:
+    python benchmarks/bench_crawl.py [--concurrency 1 4 16 64] [--latency 0.005] [--output crawl.json]
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+from _common import emit, environment
+from a7 import A7Client, AsyncA7Client
+from a7.retry import RetryPolicy
+from a7.testing import FaultProfile, MarketProfile, StandInServer, StandInTransport
+
+MARKET, DATE = "XEUR", 20240102
+
+
+class Crawl:
+    """Counts of one crawl."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.messages = 0
+
+    def packets(self, packets: list[dict[str, Any]]) -> None:
+        """Count the messages of detailed packets."""
+        self.messages += sum(len(packet["Messages"]) for packet in packets)
+
+
+def crawl_sync(client: A7Client, concurrency: int, transact_times: int) -> Crawl:
+    """Crawl with a thread pool."""
+    crawl = Crawl()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        segments = client.eobi.get_market_segments(MARKET, DATE)
+        crawl.requests += 1
+
+        securities = [
+            (segment, security)
+            for segment, ids in zip(
+                segments,
+                pool.map(lambda s: client.eobi.get_securities(MARKET, DATE, s), segments),
+            )
+            for security in ids
+        ]
+        crawl.requests += len(segments)
+
+        times = pool.map(
+            lambda key: client.eobi.get_transact_times(MARKET, DATE, *key, limit=transact_times),
+            securities,
+        )
+        packets = [(key, time_) for key, ids in zip(securities, times) for time_ in ids]
+        crawl.requests += len(securities)
+
+        for result in pool.map(
+            lambda item: client.eobi.get_applseq_nums(
+                MARKET, DATE, *item[0], item[1], mode="detailed"
+            ),
+            packets,
+        ):
+            crawl.packets(result)
+        crawl.requests += len(packets)
+    return crawl
+
+
+async def crawl_async(client: AsyncA7Client, concurrency: int, transact_times: int) -> Crawl:
+    """Crawl with asyncio tasks limited by a semaphore."""
+    crawl = Crawl()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(coroutine: Any) -> Any:
+        async with semaphore:
+            crawl.requests += 1
+            return await coroutine
+
+    segments = await limited(client.eobi.get_market_segments(MARKET, DATE))
+    security_ids = await asyncio.gather(
+        *(limited(client.eobi.get_securities(MARKET, DATE, s)) for s in segments)
+    )
+    securities = [(s, security) for s, ids in zip(segments, security_ids) for security in ids]
+    times = await asyncio.gather(
+        *(
+            limited(client.eobi.get_transact_times(MARKET, DATE, *key, limit=transact_times))
+            for key in securities
+        )
+    )
+    packets = await asyncio.gather(
+        *(
+            limited(client.eobi.get_applseq_nums(MARKET, DATE, *key, time_, mode="detailed"))
+            for key, ids in zip(securities, times)
+            for time_ in ids
+        )
+    )
+    for result in packets:
+        crawl.packets(result)
+    return crawl
+
+
+def _result(crawl: Crawl, seconds: float) -> dict[str, Any]:
+    return {
+        "seconds": round(seconds, 3),
+        "requests": crawl.requests,
+        "requests_per_s": round(crawl.requests / seconds, 1),
+        "messages": crawl.messages,
+        "messages_per_s": round(crawl.messages / seconds, 1),
+    }
+
+
+def bench_crawl(
+    mode: str,
+    concurrency: int,
+    standin: StandInTransport,
+    base_url: Optional[str],
+    transact_times: int,
+) -> dict[str, Any]:
+    """Run one crawl and report its throughput."""
+    options: dict[str, Any] = {
+        "retry": RetryPolicy(max_attempts=1),
+        "max_connections": max(concurrency, 10),
+    }
+    if base_url is not None:
+        options["base_url"] = base_url
+    else:
+        options["transport"] = standin
+
+    start = time.perf_counter()
+    if mode == "sync":
+        with A7Client(token="benchmark", **options) as client:
+            crawl = crawl_sync(client, concurrency, transact_times)
+    else:
+
+        async def run() -> Crawl:
+            async with AsyncA7Client(token="benchmark", **options) as client:
+                return await crawl_async(client, concurrency, transact_times)
+
+        crawl = asyncio.run(run())
+    return _result(crawl, time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the crawl benchmarks and print JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--latency", type=float, default=0.005, help="Stand-in latency (s)")
+    parser.add_argument("--segments", type=int, default=2, help="Market segments to crawl")
+    parser.add_argument("--securities", type=int, default=5, help="Securities per segment")
+    parser.add_argument("--transact-times", type=int, default=20, help="Packets per security")
+    parser.add_argument("--http", action="store_true", help="Serve the stand-in over HTTP")
+    parser.add_argument("--output", type=Path, help="Also write the JSON results to this file")
+    args = parser.parse_args()
+
+    standin = StandInTransport(
+        MarketProfile(
+            markets=(MARKET,),
+            segments_per_market=args.segments,
+            securities_per_segment=args.securities,
+        ),
+        FaultProfile(latency=args.latency),
+    )
+    server = StandInServer(standin) if args.http else None
+    base_url = server.start().base_url if server is not None else None
+
+    results: dict[str, dict[str, Any]] = {"sync": {}, "async": {}}
+    try:
+        for mode, levels in results.items():
+            for concurrency in args.concurrency:
+                levels[str(concurrency)] = bench_crawl(
+                    mode, concurrency, standin, base_url, args.transact_times
+                )
+    finally:
+        if server is not None:
+            server.stop()
+
+    report = {
+        "environment": environment(),
+        "latency": args.latency,
+        "http": args.http,
+        "segments": args.segments,
+        "securities_per_segment": args.securities,
+        "transact_times": args.transact_times,
+        "results": results,
+    }
+    emit(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
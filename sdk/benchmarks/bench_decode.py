@@ -0,0 +1,115 @@
+"""
+Benchmark JSON decoding of large A7 payloads with every installed decoder.
+
+Payloads are generated by the local stand-in (``a7.testing``) so runs are
+reproducible without network access or credentials:
+
+- ``orderbook_t7``: ``orderbook.get_t7`` with many complete books and trades
+- ``eobi_detailed``: EOBI packets in detailed mode, as returned by
+  ``eobi.get_applseq_nums(..., mode="detailed")`` for a range of packets
+- ``transact_times``: a full session of EOBI transact times
+
+Usage:
+    python benchmarks/bench_decode.py [--books 1000] [--packets 20000] [--output decode.json]
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+from _common import emit, environment, summary
+from a7.decoders import get_decoder
+from a7.testing import MarketProfile, StandInTransport
+
+MARKET, DATE, SEGMENT, SECURITY = "XEUR", 20240102, 1001, 1001000001
+DECODERS = ("json", "orjson", "msgspec")
+
+
+def _standin_body(transport: StandInTransport, path: str, **query: Any) -> bytes:
+    """Fetch a raw response body from the stand-in."""
+    request = httpx.Request(
+        "GET",
+        f"https://a7.deutsche-boerse.com/api{path}",
+        params=query,
+        headers={"Authorization": "Bearer benchmark"},
+    )
+    response = transport.handle_request(request)
+    response.raise_for_status()
+    return response.content
+
+
+def payloads(books: int, packets: int, depth: int) -> dict[str, bytes]:
+    """Build the benchmark payloads."""
+    profile = MarketProfile(
+        markets=(MARKET,),
+        messages_per_second=max(packets / 3600, 1.0),
+        book_depth=depth,
+    )
+    transport = StandInTransport(profile)
+    security = f"/v1/eobi/{MARKET}/{DATE}/{SEGMENT}/{SECURITY}"
+    orderbook = f"/v1/ob/{MARKET}/{DATE}/{SEGMENT}/{SECURITY}"
+    stream = transport.market.stream(MARKET, DATE, SEGMENT, SECURITY)
+    eobi = {
+        "Packets": [
+            stream.packet(index, stream.messages(index))
+            for index in range(min(packets, stream.count))
+        ]
+    }
+    return {
+        "orderbook_t7": _standin_body(
+            transport,
+            orderbook,
+            limit=books,
+            levels=depth,
+            orderbook="complete",
+            trades="true",
+            indicatives="false",
+        ),
+        "eobi_detailed": json.dumps(eobi).encode(),
+        "transact_times": _standin_body(transport, security),
+    }
+
+
+def bench_decode(body: bytes, decoder: str, repeats: int) -> dict[str, Any]:
+    """Time decoding one payload."""
+    decode = get_decoder(decoder)
+    decode(body)  # warm up
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        decode(body)
+        samples.append(time.perf_counter() - start)
+    return {
+        **summary(samples, "ms"),
+        "mb_per_s": round(len(body) / min(samples) / 1e6, 1),
+    }
+
+
+def main() -> None:
+    """Run the decode benchmarks and print JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--books", type=int, default=1000, help="Order books in orderbook_t7")
+    parser.add_argument("--packets", type=int, default=20000, help="Packets in eobi_detailed")
+    parser.add_argument("--depth", type=int, default=10, help="Price levels per book side")
+    parser.add_argument("--repeats", type=int, default=10, help="Timing samples per decoder")
+    parser.add_argument("--output", type=Path, help="Also write the JSON results to this file")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {}
+    for name, body in payloads(args.books, args.packets, args.depth).items():
+        results[name] = {"bytes": len(body), "decoders": {}}
+        for decoder in DECODERS:
+            try:
+                results[name]["decoders"][decoder] = bench_decode(body, decoder, args.repeats)
+            except ImportError:
+                continue  # decoder not installed
+
+    report = {"environment": environment(), "repeats": args.repeats, "payloads": results}
+    emit(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
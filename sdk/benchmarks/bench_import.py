@@ -0,0 +1,118 @@
+"""
+Benchmark SDK startup: import time and first-request latency.
+
+Each measurement runs in a fresh interpreter so that nothing is cached in
+``sys.modules``. First-request latency is measured against a local HTTP
+server, from interpreter start-up code to the decoded result of
+``client.rdi.get_markets()``.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 20] [--output startup.json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from _common import emit, environment, summary
+
+SDK_ROOT = Path(__file__).resolve().parent.parent
+
+IMPORT_SNIPPETS = {
+    "import a7": "import a7",
+    "from a7 import A7Client": "from a7 import A7Client",
+}
+
+FIRST_REQUEST_SNIPPET = """
+import sys, time
+start = time.perf_counter()
+from a7 import A7Client
+imported = time.perf_counter()
+client = A7Client(token="benchmark", base_url=sys.argv[1])
+created = time.perf_counter()
+client.rdi.get_markets()
+done = time.perf_counter()
+print(imported - start, created - imported, done - created)
+"""
+
+MARKETS_BODY = json.dumps({"MarketIDs": ["XEUR", "XETR"]}).encode()
+
+
+class _MarketsHandler(BaseHTTPRequestHandler):
+    """Answer every GET with a small RDI markets listing."""
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(MARKETS_BODY)))
+        self.end_headers()
+        self.wfile.write(MARKETS_BODY)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def _run(code: str, *args: str) -> str:
+    env = {**os.environ, "PYTHONPATH": str(SDK_ROOT), "NO_PROXY": "*"}
+    result = subprocess.run(
+        [sys.executable, "-c", code, *args],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    return result.stdout
+
+
+def bench_imports(runs: int) -> dict[str, dict[str, float]]:
+    """Time each import statement in a fresh interpreter."""
+    results = {}
+    timer = "import time; t = time.perf_counter(); {}; print(time.perf_counter() - t)"
+    for name, snippet in IMPORT_SNIPPETS.items():
+        samples = [float(_run(timer.format(snippet))) for _ in range(runs)]
+        results[name] = summary(samples)
+    return results
+
+
+def bench_first_request(runs: int) -> dict[str, dict[str, float]]:
+    """Time import, client construction and the first request in a fresh interpreter."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MarketsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/api"
+    phases: dict[str, list[float]] = {"import": [], "construct": [], "first_request": []}
+    try:
+        for _ in range(runs):
+            values = [float(value) for value in _run(FIRST_REQUEST_SNIPPET, base_url).split()]
+            for phase, value in zip(phases, values):
+                phases[phase].append(value)
+    finally:
+        server.shutdown()
+    phases["total"] = [sum(values) for values in zip(*phases.values())]
+    return {phase: summary(samples) for phase, samples in phases.items()}
+
+
+def main() -> None:
+    """Run the startup benchmarks and print JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20, help="Interpreter launches per measurement")
+    parser.add_argument("--output", type=Path, help="Also write the JSON results to this file")
+    args = parser.parse_args()
+
+    report = {
+        "environment": environment(),
+        "runs": args.runs,
+        "imports": bench_imports(args.runs),
+        "first_request": bench_first_request(args.runs),
+    }
+    emit(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+Benchmark per-call SDK overhead of every read-only resource method.
+
+Each method is called against a zero-latency in-memory transport serving
+canned responses (recorded once from the local stand-in, see
+``a7.testing.StandInTransport``). The same URLs are also fetched with a
+bare ``httpx.Client`` and decoded with the same JSON decoder; the
+difference is the cost added by the SDK: URL building, the transport
+middleware stack and result handling.
+
+Usage:
+    python benchmarks/bench_overhead.py [--calls 200] [--repeats 5] [--output overhead.json]
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+from _common import emit, environment, summary
+from a7 import A7Client, Instrumentation, MetricsRegistry
+from a7.decoders import get_decoder
+from a7.testing import MarketProfile, StandInTransport
+
+MARKET, DATE, SEGMENT, SECURITY = "XEUR", 20240102, 1001, 1001000001
+EXCHANGE, ASSET, CME_SECURITY = "XCME", "GE", 90000001
+SYMBOL = f"S{SECURITY}"
+OWNER = "a7"
+
+# Placeholders filled in from the stand-in before the run
+IDS = {"transact_time": "", "sending_time": ""}
+
+CALLS: dict[str, Callable[[A7Client], Any]] = {
+    "rdi.get_markets": lambda c: c.rdi.get_markets(),
+    "rdi.get_market_segments": lambda c: c.rdi.get_market_segments(MARKET, DATE),
+    "rdi.get_security_details": lambda c: c.rdi.get_security_details(
+        MARKET, DATE, SEGMENT, SECURITY
+    ),
+    "rdi.get_instrument_snapshot": lambda c: c.rdi.get_instrument_snapshot(
+        MARKET, DATE, SEGMENT, SECURITY, 2
+    ),
+    "sd.get_exchanges": lambda c: c.sd.get_exchanges(),
+    "sd.get_dates": lambda c: c.sd.get_dates(EXCHANGE),
+    "sd.get_assets": lambda c: c.sd.get_assets(EXCHANGE, DATE),
+    "sd.get_securities": lambda c: c.sd.get_securities(EXCHANGE, DATE, ASSET),
+    "sd.get_all_security_details": lambda c: c.sd.get_all_security_details(EXCHANGE, DATE, ASSET),
+    "sd.get_security_details": lambda c: c.sd.get_security_details(
+        EXCHANGE, DATE, ASSET, CME_SECURITY
+    ),
+    "algo.list_owners": lambda c: c.algo.list_owners(),
+    "algo.list_algorithms": lambda c: c.algo.list_algorithms(OWNER),
+    "algo.get_metadata": lambda c: c.algo.get_metadata(OWNER, "top_level"),
+    "algo.run": lambda c: c.algo.run_top_level(MARKET, DATE, SEGMENT, SECURITY),
+    "algo.download": lambda c: c.algo.download(OWNER, "top_level"),
+    "eobi.get_markets": lambda c: c.eobi.get_markets(),
+    "eobi.get_dates": lambda c: c.eobi.get_dates(MARKET),
+    "eobi.get_market_segments": lambda c: c.eobi.get_market_segments(MARKET, DATE),
+    "eobi.get_securities": lambda c: c.eobi.get_securities(MARKET, DATE, SEGMENT),
+    "eobi.get_transact_times": lambda c: c.eobi.get_transact_times(
+        MARKET, DATE, SEGMENT, SECURITY, limit=100
+    ),
+    "eobi.get_applseq_nums": lambda c: c.eobi.get_applseq_nums(
+        MARKET, DATE, SEGMENT, SECURITY, IDS["transact_time"], mode="detailed"
+    ),
+    "eobi.get_msg_seq_nums": lambda c: c.eobi.get_msg_seq_nums(
+        MARKET, DATE, SEGMENT, SECURITY, IDS["transact_time"], 1
+    ),
+    "eobi.get_message": lambda c: c.eobi.get_message(
+        MARKET, DATE, SEGMENT, SECURITY, IDS["transact_time"], 1, 1
+    ),
+    "mdp.get_exchanges": lambda c: c.mdp.get_exchanges(),
+    "mdp.get_dates": lambda c: c.mdp.get_dates(EXCHANGE),
+    "mdp.get_assets": lambda c: c.mdp.get_assets(EXCHANGE, DATE),
+    "mdp.get_securities": lambda c: c.mdp.get_securities(EXCHANGE, DATE, ASSET),
+    "mdp.get_sending_times": lambda c: c.mdp.get_sending_times(
+        EXCHANGE, DATE, ASSET, CME_SECURITY, limit=100
+    ),
+    "mdp.get_message": lambda c: c.mdp.get_message(
+        EXCHANGE, DATE, ASSET, CME_SECURITY, IDS["sending_time"]
+    ),
+    "orderbook.get_t7": lambda c: c.orderbook.get_t7(MARKET, DATE, SEGMENT, SECURITY),
+    "orderbook.get_cme": lambda c: c.orderbook.get_cme(EXCHANGE, DATE, ASSET, CME_SECURITY),
+    "dataset.list_owners": lambda c: c.dataset.list_owners(),
+    "dataset.get_datasets": lambda c: c.dataset.get_datasets(OWNER),
+    "dataset.get_metadata": lambda c: c.dataset.get_metadata(OWNER, "TRADES"),
+    "dataset.get_data": lambda c: c.dataset.get_data(OWNER, "TRADES", limit=100),
+    "insights.get_por_market_segments": lambda c: c.insights.get_por_market_segments(),
+    "insights.get_por_rolls": lambda c: c.insights.get_por_rolls("FDAX"),
+    "insights.get_por_data": lambda c: c.insights.get_por_data("FDAX", 202403),
+    "insights.get_latency_histogram": lambda c: c.insights.get_latency_histogram(
+        DATE, "trigger", "target", "regime", "action"
+    ),
+    "precalc.list_owners": lambda c: c.precalc.list_owners(),
+    "precalc.get_jobs": lambda c: c.precalc.get_jobs(OWNER),
+    "precalc.get_definition": lambda c: c.precalc.get_definition(OWNER, "job"),
+    "precalc.get_dates": lambda c: c.precalc.get_dates(OWNER, "job"),
+    "precalc.get_tasks": lambda c: c.precalc.get_tasks(OWNER, "job", DATE),
+    "precalc.get_results": lambda c: c.precalc.get_results(OWNER, "job", DATE, "task"),
+    "precalc.get_data": lambda c: c.precalc.get_data(OWNER, "job", DATE, "task", "result"),
+    "auction.get_exchanges": lambda c: c.auction.get_exchanges(),
+    "auction.get_dates": lambda c: c.auction.get_dates(MARKET),
+    "auction.get_market_segments": lambda c: c.auction.get_market_segments(MARKET, DATE),
+    "auction.get_securities": lambda c: c.auction.get_securities(MARKET, DATE, SEGMENT),
+    "auction.get_security": lambda c: c.auction.get_security(MARKET, DATE, SEGMENT, SECURITY),
+    "auction.get_security_by_symbol": lambda c: c.auction.get_security_by_symbol(
+        MARKET, DATE, SYMBOL
+    ),
+    "auction.get_auction_types": lambda c: c.auction.get_auction_types(
+        MARKET, DATE, SEGMENT, SECURITY
+    ),
+    "auction.get_auction_types_by_symbol": lambda c: c.auction.get_auction_types_by_symbol(
+        MARKET, DATE, SYMBOL
+    ),
+    "auction.get_auction": lambda c: c.auction.get_auction(
+        MARKET, DATE, SEGMENT, SECURITY, "opening"
+    ),
+    "auction.get_auction_by_symbol": lambda c: c.auction.get_auction_by_symbol(
+        MARKET, DATE, SYMBOL, "opening"
+    ),
+}
+
+
+class CannedTransport(httpx.BaseTransport):
+    """
+    Serve each URL's first stand-in response from memory, with no latency.
+
+    Endpoints the stand-in does not serve get an empty JSON object, which is
+    enough to exercise the SDK's request and result handling.
+    """
+
+    def __init__(self) -> None:
+        self.standin = StandInTransport(MarketProfile(markets=(MARKET,), session_seconds=600))
+        self.responses: dict[str, tuple[int, dict[str, str], bytes]] = {}
+        self.last_url = ""
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        self.last_url = url
+        if url not in self.responses:
+            response = self.standin.handle_request(request)
+            if response.status_code == 200:
+                headers = {"Content-Type": response.headers["Content-Type"]}
+                self.responses[url] = (200, headers, response.content)
+            else:
+                self.responses[url] = (200, {"Content-Type": "application/json"}, b"{}")
+        status, headers, body = self.responses[url]
+        return httpx.Response(status, headers=headers, content=body, request=request)
+
+
+def _time_calls(call: Callable[[], Any], calls: int, repeats: int) -> list[float]:
+    """Seconds per call, one sample per repeat."""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(calls):
+            call()
+        samples.append((time.perf_counter() - start) / calls)
+    return samples
+
+
+def bench_overhead(calls: int, repeats: int, instrumented: bool) -> dict[str, dict[str, Any]]:
+    """Time every method through the SDK and as a bare httpx request."""
+    transport = CannedTransport()
+    decode = get_decoder()
+    options: dict[str, Any] = {}
+    if instrumented:
+        options["instrumentation"] = Instrumentation(metrics=MetricsRegistry())
+    client = A7Client(token="benchmark", transport=transport, json_decoder=decode, **options)
+    http = httpx.Client(transport=transport, headers={"Authorization": "Bearer benchmark"})
+
+    (IDS["transact_time"],) = client.eobi.get_transact_times(
+        MARKET, DATE, SEGMENT, SECURITY, limit=1
+    )
+    (IDS["sending_time"],) = client.mdp.get_sending_times(
+        EXCHANGE, DATE, ASSET, CME_SECURITY, limit=1
+    )
+
+    results = {}
+    for name, method in CALLS.items():
+        method(client)  # records the response and warms up
+        url = transport.last_url
+
+        def sdk_call(method: Callable[[A7Client], Any] = method) -> Any:
+            return method(client)
+
+        def bare_call(url: str = url) -> Any:
+            response = http.get(url)
+            if response.headers["Content-Type"].startswith("application/json"):
+                return decode(response.content)
+            return response.text
+
+        sdk = _time_calls(sdk_call, calls, repeats)
+        bare = _time_calls(bare_call, calls, repeats)
+        results[name] = {
+            "sdk": summary(sdk, "us"),
+            "httpx": summary(bare, "us"),
+            "overhead_us": round((min(sdk) - min(bare)) * 1e6, 3),
+        }
+    client.close()
+    http.close()
+    return results
+
+
+def main() -> None:
+    """Run the overhead benchmarks and print JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200, help="Calls per timing sample")
+    parser.add_argument("--repeats", type=int, default=5, help="Timing samples per method")
+    parser.add_argument("--output", type=Path, help="Also write the JSON results to this file")
+    args = parser.parse_args()
+
+    report = {
+        "environment": environment(),
+        "calls": args.calls,
+        "repeats": args.repeats,
+        "default": bench_overhead(args.calls, args.repeats, instrumented=False),
+        "instrumented": bench_overhead(args.calls, args.repeats, instrumented=True),
+    }
+    emit(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -255,11 +255,11 @@ def skip_if_not_found(func):
     Decorator to skip test if resource not found or API error occurs.
 
     Use for tests that depend on specific data availability.
-    Handles NotFoundError, 404/500 HTTP errors gracefully.
+    Handles NotFoundError, ServerError, 404/500 HTTP errors gracefully.
     """
     import functools
     import httpx
-    from a7.errors import NotFoundError
+    from a7.errors import NotFoundError, ServerError
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
@@ -267,6 +267,8 @@ def skip_if_not_found(func):
             return func(*args, **kwargs)
         except NotFoundError as e:
             pytest.skip(f"Resource not available in environment: {e}")
+        except ServerError as e:
+            pytest.skip(f"Server error ({e.status_code}): API unavailable")
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 pytest.skip(f"Resource not found (404): {e.request.url}")
@@ -4,7 +4,7 @@ import httpx
 import pytest
 import respx
 
-from a7 import A7Client
+from a7 import A7Client, AuthenticationError, NotFoundError
 
 # Base URL for mocking - matches DEFAULT_BASE_URL in config.py
 BASE_URL = "https://a7.deutsche-boerse.com/api"
@@ -68,7 +68,7 @@ def test_run_algorithm_invalid_algorithm(mock_client: A7Client) -> None:
         return_value=httpx.Response(404, json={"error": "Algorithm not found"})
     )
 
-    with pytest.raises(httpx.HTTPStatusError):
+    with pytest.raises(NotFoundError):
         mock_client.algo.run("a7", "invalid_algo", {})
 
 
@@ -79,7 +79,7 @@ def test_run_algorithm_auth_error(mock_client: A7Client) -> None:
         return_value=httpx.Response(401, json={"error": "Unauthorized"})
     )
 
-    with pytest.raises(httpx.HTTPStatusError):
+    with pytest.raises(AuthenticationError):
         mock_client.algo.run_top_level("XEUR", 20250101, 688, 204934)
 
 
@@ -160,5 +160,5 @@ def test_get_algorithm_metadata_not_found(mock_client: A7Client) -> None:
         return_value=httpx.Response(404, json={"error": "Algorithm not found"})
     )
 
-    with pytest.raises(httpx.HTTPStatusError):
+    with pytest.raises(NotFoundError):
         mock_client.algo.get_metadata("dbag", "INVALID")
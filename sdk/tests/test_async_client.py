@@ -0,0 +1,114 @@
+"""Unit tests for AsyncA7Client with mocked HTTP responses."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from a7 import AsyncA7Client, NotFoundError
+
+# Base URL for mocking - matches DEFAULT_BASE_URL in config.py
+BASE_URL = "https://a7.deutsche-boerse.com/api"
+
+
+def test_async_client_initialization(test_token: str) -> None:
+    """Test async client exposes all ten resources."""
+    client = AsyncA7Client(token=test_token)
+
+    for name in (
+        "rdi",
+        "eobi",
+        "mdp",
+        "orderbook",
+        "algo",
+        "dataset",
+        "precalc",
+        "auction",
+        "insights",
+        "sd",
+    ):
+        assert getattr(client, name) is not None
+
+    asyncio.run(client.aclose())
+
+
+@respx.mock
+def test_async_get_eobi_markets(test_token: str) -> None:
+    """Test awaitable EOBI market listing."""
+    respx.get(f"{BASE_URL}/v1/eobi").mock(
+        return_value=httpx.Response(200, json={"MarketIDs": ["XEUR", "XETR"]})
+    )
+
+    async def run() -> list[str]:
+        async with AsyncA7Client(token=test_token) as client:
+            return await client.eobi.get_markets()
+
+    assert asyncio.run(run()) == ["XEUR", "XETR"]
+
+
+@respx.mock
+def test_async_get_t7_orderbook_params(test_token: str) -> None:
+    """Test async order book request sends the same query as the sync client."""
+    route = respx.get(f"{BASE_URL}/v1/ob/XETR/20230804/52885/2504978").mock(
+        return_value=httpx.Response(200, json={"TransactTime": "1691099685504424493"})
+    )
+
+    async def run() -> object:
+        async with AsyncA7Client(token=test_token) as client:
+            return await client.orderbook.get_t7(
+                "XETR", 20230804, 52885, 2504978, from_time="1691099685504424493"
+            )
+
+    result = asyncio.run(run())
+
+    assert result == {"TransactTime": "1691099685504424493"}
+    params = route.calls.last.request.url.params
+    assert params["from"] == "1691099685504424493"
+    assert params["limit"] == "1"
+
+
+@respx.mock
+def test_async_list_algorithms_chains_get_metadata(test_token: str) -> None:
+    """Test async convenience methods await their underlying calls."""
+    respx.get(f"{BASE_URL}/v1/algo/lp124").mock(
+        return_value=httpx.Response(200, json={"Algos": ["top_level", "DBAG"]})
+    )
+
+    async def run() -> list[str]:
+        async with AsyncA7Client(token=test_token) as client:
+            return await client.algo.list_algorithms("lp124")
+
+    assert asyncio.run(run()) == ["top_level", "DBAG"]
+
+
+@respx.mock
+def test_async_concurrent_requests(test_token: str) -> None:
+    """Test many requests can be in flight on one event loop."""
+    respx.get(url__regex=rf"{BASE_URL}/v1/eobi/XEUR/\d+").mock(
+        return_value=httpx.Response(200, json={"MarketSegmentIDs": [688]})
+    )
+
+    async def run() -> list[list[int]]:
+        async with AsyncA7Client(token=test_token) as client:
+            return await asyncio.gather(
+                *(client.eobi.get_market_segments("XEUR", 20200227 + i) for i in range(20))
+            )
+
+    results = asyncio.run(run())
+
+    assert len(results) == 20
+    assert all(segments == [688] for segments in results)
+
+
+@respx.mock
+def test_async_not_found_raises(test_token: str) -> None:
+    """Test async client surfaces HTTP errors like the sync client."""
+    respx.get(f"{BASE_URL}/v2/rdi/").mock(return_value=httpx.Response(404, json={}))
+
+    async def run() -> None:
+        async with AsyncA7Client(token=test_token) as client:
+            await client.rdi.get_markets()
+
+    with pytest.raises(NotFoundError):
+        asyncio.run(run())
@@ -0,0 +1,151 @@
+"""Unit tests for concurrent batch execution (client.map / client.gather)."""
+
+import asyncio
+import itertools
+import time
+from collections.abc import Iterator
+from typing import Optional
+
+import pytest
+
+from a7 import A7Client, AsyncA7Client, Deadline, DeadlineExceededError, NotFoundError
+from a7.retry import RetryPolicy
+from a7.testing import FaultProfile, MarketProfile, StandInTransport
+
+MARKET, DATE = "XEUR", 20240102
+
+
+def _standin(latency: float = 0.0) -> StandInTransport:
+    return StandInTransport(MarketProfile(markets=(MARKET,)), FaultProfile(latency=latency))
+
+
+def _segment_calls(segments: list[int]) -> list[tuple[str, dict[str, int | str]]]:
+    return [
+        ("eobi.get_securities", {"market_id": MARKET, "date": DATE, "market_segment_id": s})
+        for s in segments
+    ]
+
+
+def test_gather_keeps_order_and_captures_errors() -> None:
+    """Test results come back in call order, with failures captured per item."""
+    client = A7Client(token="local", transport=_standin(), retry=RetryPolicy(max_attempts=1))
+    calls = [
+        *_segment_calls([1001, 9999, 1002]),
+        (client.eobi.get_market_segments, {"market_id": MARKET, "date": DATE}),
+    ]
+
+    results = client.gather(calls, max_concurrency=4)
+
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert [result.ok for result in results] == [True, False, True, True]
+    assert results[0].value == [1001000000 + n for n in range(1, 11)]
+    assert results[0].method == "eobi.get_securities"
+    assert results[3].method == "eobi.get_market_segments"
+    assert results[3].unwrap() == [1001, 1002, 1003, 1004]
+    with pytest.raises(NotFoundError):
+        results[1].unwrap()
+
+
+def test_map_runs_calls_concurrently() -> None:
+    """Test calls overlap on the thread pool and can be consumed as completed."""
+    client = A7Client(token="local", transport=_standin(latency=0.1))
+    calls = _segment_calls([1001, 1002, 1003, 1004] * 2)
+
+    start = time.perf_counter()
+    results = list(client.map(calls, max_concurrency=8, ordered=False))
+    elapsed = time.perf_counter() - start
+
+    assert sorted(result.index for result in results) == list(range(8))
+    assert all(result.ok for result in results)
+    assert elapsed < 0.5
+
+
+def test_map_consumes_calls_lazily() -> None:
+    """Test an endless generator of calls is only read ahead by a bounded window."""
+    client = A7Client(token="local", transport=_standin())
+    consumed = 0
+
+    def calls() -> Iterator[tuple[str, dict[str, str]]]:
+        nonlocal consumed
+        for _ in itertools.count():
+            consumed += 1
+            yield "eobi.get_dates", {"market_id": MARKET}
+
+    for result in client.map(calls(), max_concurrency=2):
+        if result.index == 4:
+            break
+
+    assert consumed <= 5 + 2 * 4
+
+
+def test_invalid_batch_arguments() -> None:
+    """Test unknown resource methods fail on their own and a bad concurrency fails up front."""
+    client = A7Client(token="local", transport=_standin())
+
+    results = client.gather(
+        [("eobi.no_such_method", {}), *_segment_calls([1001]), ("_client.get", {})]
+    )
+    assert [result.ok for result in results] == [False, True, False]
+    for result in (results[0], results[2]):
+        with pytest.raises(ValueError, match="Unknown resource method"):
+            result.unwrap()
+    with pytest.raises(ValueError, match="max_concurrency"):
+        client.map(_segment_calls([1001]), max_concurrency=0)
+
+
+def test_batch_deadline_keeps_earlier_enclosing_deadline() -> None:
+    """Test a batch deadline never extends an enclosing, earlier one."""
+    client = A7Client(token="local", transport=_standin())
+    seen: list[Optional[Deadline]] = []
+
+    def record() -> None:
+        seen.append(Deadline.current())
+
+    outer = Deadline(60)
+    with outer:
+        client.gather([(record, {})], deadline=Deadline(600))
+        client.gather([(record, {})], deadline=Deadline(1))
+    assert seen[0] is outer
+    assert seen[1] is not outer and seen[1] is not None
+    assert seen[1].expires_at < outer.expires_at
+
+
+def test_calls_left_at_the_deadline_fail_with_deadline_exceeded() -> None:
+    """Test every call not started before the deadline gets a DeadlineExceededError result."""
+    client = A7Client(token="local", transport=_standin(latency=0.2))
+    calls = _segment_calls([1001, 1002, 1003, 1004] * 2)
+
+    # One worker submits four calls ahead; the rest are never started
+    results = client.gather(calls, max_concurrency=1, deadline=Deadline(0.1))
+
+    assert [result.index for result in results] == list(range(8))
+    assert results[0].ok
+    for result in results[1:]:
+        assert result.method == "eobi.get_securities"
+        assert isinstance(result.error, DeadlineExceededError)
+
+    async def run() -> list[Optional[Exception]]:
+        async with AsyncA7Client(token="local", transport=_standin()) as aclient:
+            results = await aclient.gather(calls, deadline=Deadline(0))
+            return [result.error for result in results]
+
+    assert all(isinstance(error, DeadlineExceededError) for error in asyncio.run(run()))
+
+
+def test_async_gather_and_map() -> None:
+    """Test the async client runs batches on the event loop."""
+
+    async def run() -> tuple[list[bool], list[int]]:
+        async with AsyncA7Client(
+            token="local", transport=_standin(latency=0.05), retry=RetryPolicy(max_attempts=1)
+        ) as client:
+            gathered = await client.gather(_segment_calls([1001, 9999]), max_concurrency=2)
+            indices = [
+                result.index
+                async for result in client.map(_segment_calls([1001] * 6), ordered=False)
+            ]
+            return [result.ok for result in gathered], indices
+
+    ok, indices = asyncio.run(run())
+    assert ok == [True, False]
+    assert sorted(indices) == list(range(6))
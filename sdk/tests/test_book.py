@@ -0,0 +1,150 @@
+"""Unit tests for local order book reconstruction from EOBI messages."""
+
+from typing import Any
+
+import pytest
+
+from a7 import A7Client
+from a7.book import OrderBook, check_against_t7, compare_books, replay
+from a7.testing import MarketProfile, StandInTransport
+
+PROFILE = MarketProfile(
+    markets=("XEUR",),
+    dates=(20240102,),
+    segments_per_market=1,
+    securities_per_segment=1,
+    messages_per_second=10.0,
+    session_seconds=30,
+    book_depth=5,
+)
+SECURITY = ("XEUR", 20240102, 1001, 1001000001)
+
+
+def message(template: int, seq: int, time: int, **fields: Any) -> dict[str, Any]:
+    """EOBI message in the detailed-mode format."""
+    return {
+        "MessageHeader": {"TemplateID": template, "MsgSeqNum": seq},
+        "SecurityID": 7,
+        "TransactTime": str(time),
+        **fields,
+    }
+
+
+def details(side: int, price: int, priority: int, qty: int) -> dict[str, Any]:
+    """OrderDetails of an order."""
+    return {"Side": side, "Price": price, "TrdRegTSTimePriority": str(priority), "DisplayQty": qty}
+
+
+def test_replay_matches_t7_books(test_token: str) -> None:
+    """Test the local book equals get_t7 after every packet, aggregated and complete."""
+    client = A7Client(token=test_token, transport=StandInTransport(PROFILE))
+    messages = list(client.eobi.iter_messages(*SECURITY))
+    book = OrderBook(security_id=SECURITY[3])
+
+    snapshots = list(replay(messages, book=book, levels=5))
+
+    assert len(snapshots) == len(client.eobi.get_transact_times(*SECURITY))
+    assert book.unmatched == 0
+    for snapshot in snapshots[::40]:
+        assert check_against_t7(client, *SECURITY[:3], snapshot, levels=5) == []
+    last = int(snapshots[-1]["Timestamp"])
+    for snapshot in replay(messages, at=[last], complete=True):
+        assert snapshot["SecurityId"] == SECURITY[3]
+        assert check_against_t7(client, *SECURITY[:3], snapshot) == []
+    with pytest.raises(ValueError):
+        check_against_t7(client, *SECURITY[:3], OrderBook().snapshot())
+
+
+def test_replay_intervals_and_times(test_token: str) -> None:
+    """Test snapshots at fixed intervals and at given times follow get_t7 semantics."""
+    client = A7Client(token=test_token, transport=StandInTransport(PROFILE))
+    messages = list(client.eobi.iter_messages(*SECURITY))
+    times = [int(t) for t in client.eobi.get_transact_times(*SECURITY)]
+
+    every_second = list(replay(messages, interval=10**9))
+    assert [int(s["Timestamp"]) for s in every_second[:-1]] == [
+        max(t for t in times if t <= times[0] + k * 10**9) for k in range(1, len(every_second))
+    ]
+    assert every_second[-1]["Timestamp"] == str(times[-1])
+
+    at = [times[0] - 1, times[3], times[3] + 1, times[9] + 1, times[-1] + 10**9]
+    assert [s["Timestamp"] for s in replay(messages, at=at)] == [
+        str(times[3]),
+        str(times[3]),
+        str(times[9]),
+        str(times[-1]),
+    ]
+    with pytest.raises(ValueError):
+        next(replay(messages, interval=10, at=at))
+
+
+def test_book_handles_partial_fills_and_snapshot_cycles() -> None:
+    """Test partial executions, same-priority modifies, mass deletes and snapshots."""
+    book = OrderBook(security_id=7)
+    book.apply(message(13100, 1, 10, OrderDetails=details(1, 100, 1, 5)))
+    book.apply(message(13100, 2, 11, OrderDetails=details(1, 100, 2, 3)))
+    book.apply(message(13100, 3, 12, OrderDetails=details(2, 105, 3, 4)))
+    book.apply(message(13105, 4, 13, Side=1, Price=100, TrdRegTSTimePriority="1", LastQty=2))
+    book.apply(message(13106, 5, 14, OrderDetails=details(1, 100, 2, 1)))
+    assert book.best_bid() == (100, 4)
+    assert book.snapshot(complete=True)["Buy"][0]["Orders"] == [
+        {"TrdRegTSTimePriority": "1", "DisplayQty": 3},
+        {"TrdRegTSTimePriority": "2", "DisplayQty": 1},
+    ]
+
+    book.apply(message(13102, 6, 15, OrderDetails=details(2, 105, 99, 4)))
+    assert book.unmatched == 1
+    book.apply({**message(13100, 7, 15, OrderDetails=details(2, 90, 4, 1)), "SecurityID": 8})
+    assert book.best_ask() == (105, 4)
+
+    book.apply(message(13601, 8, 16))
+    assert book.best_bid() is None
+    book.apply(message(13602, 9, 16, OrderDetails=details(2, 104, 5, 6)))
+    book.apply(message(13103, 10, 17))
+    assert book.snapshot() == {"SecurityId": 7, "Timestamp": "17", "Buy": [], "Sell": []}
+
+
+def test_snapshot_cycle_rebuilds_the_book() -> None:
+    """Test a snapshot cycle (13601, then 13602 per order) replaces a stale or empty book."""
+    cycle = [
+        message(13601, 1, 20),
+        message(13602, 2, 20, OrderDetails=details(1, 99, 5, 2)),
+        message(13602, 3, 20, OrderDetails=details(1, 100, 6, 3)),
+        message(13602, 4, 20, OrderDetails=details(2, 101, 7, 4)),
+    ]
+    execution = message(13104, 5, 21, OrderDetails=details(1, 100, 6, 3))
+
+    stale = OrderBook(security_id=7)
+    stale.apply(message(13100, 1, 10, OrderDetails=details(1, 98, 1, 9)))
+    stale.apply(message(13100, 2, 11, OrderDetails=details(2, 102, 2, 9)))
+    joined = OrderBook(security_id=7)
+    for book in (stale, joined):
+        for cycle_message in [*cycle, execution]:
+            book.apply(cycle_message)
+
+    expected = {
+        "SecurityId": 7,
+        "Timestamp": "21",
+        "Buy": [{"Price": "99", "Quantity": "2", "OrderCount": 1}],
+        "Sell": [{"Price": "101", "Quantity": "4", "OrderCount": 1}],
+    }
+    assert stale.snapshot() == joined.snapshot() == expected
+    assert stale.unmatched == joined.unmatched == 0
+    assert [s["Timestamp"] for s in replay([*cycle, execution])] == ["20", "21"]
+
+
+def test_compare_books_reports_differences() -> None:
+    """Test compare_books lists level and timestamp mismatches."""
+    local = {"Timestamp": "5", "Buy": [{"Price": "100", "Quantity": "3", "OrderCount": 1}]}
+    remote = {
+        "Timestamp": "5",
+        "Buy": [{"Price": 100, "Quantity": "4", "OrderCount": 2}],
+        "Sell": [{"Price": "101", "Quantity": "1", "OrderCount": 1}],
+    }
+
+    assert compare_books(local, local) == []
+    assert compare_books(local, remote) == [
+        "Buy level 0 Quantity: 3 != 4",
+        "Buy level 0 OrderCount: 1 != 2",
+        "Sell level 0: None != {'Price': '101', 'Quantity': '1', 'OrderCount': 1}",
+    ]
@@ -0,0 +1,154 @@
+"""Unit tests for the per-endpoint-family circuit breaker."""
+
+import asyncio
+import contextlib
+import time
+
+import httpx
+import pytest
+import respx
+
+from a7 import A7Client, AsyncA7Client, CircuitBreaker, CircuitOpenError, ServerError
+from a7.retry import RetryPolicy
+from a7.testing import FaultProfile, StandInTransport
+
+# Base URL for mocking - matches DEFAULT_BASE_URL in config.py
+BASE_URL = "https://a7.deutsche-boerse.com/api"
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+@respx.mock
+def test_opens_after_consecutive_failures(test_token: str) -> None:
+    """Test an open circuit fails fast for its family only."""
+    route = respx.get(f"{BASE_URL}/v1/ob/XEUR/20240102/1001/1001000001").mock(
+        return_value=httpx.Response(503)
+    )
+    respx.get(f"{BASE_URL}/v1/eobi").mock(
+        return_value=httpx.Response(200, json={"MarketIDs": ["XEUR"]})
+    )
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    client = A7Client(token=test_token, circuit_breaker=breaker, retry=NO_RETRY)
+
+    for _ in range(3):
+        with pytest.raises(ServerError):
+            client.orderbook.get_t7("XEUR", 20240102, 1001, 1001000001)
+    with pytest.raises(CircuitOpenError) as excinfo:
+        client.orderbook.get_t7("XEUR", 20240102, 1001, 1001000001)
+
+    assert route.call_count == 3
+    assert excinfo.value.family == "/v1/ob"
+    retry_after = excinfo.value.retry_after
+    assert retry_after is not None and 0 < retry_after <= 60
+    assert breaker.state("/v1/ob") == "open"
+    assert client.eobi.get_markets() == ["XEUR"]
+
+
+@respx.mock
+def test_success_resets_failure_count(test_token: str) -> None:
+    """Test failures must be consecutive to open the circuit."""
+    respx.get(f"{BASE_URL}/v1/mdp").mock(
+        side_effect=[httpx.Response(503), httpx.Response(200, json={}), httpx.Response(503)]
+    )
+    breaker = CircuitBreaker(failure_threshold=2)
+    client = A7Client(token=test_token, circuit_breaker=breaker, retry=NO_RETRY)
+
+    for _ in range(3):
+        with contextlib.suppress(ServerError):
+            client.mdp.get_exchanges()
+
+    assert breaker.state("/v1/mdp") == "closed"
+
+
+@respx.mock
+def test_half_open_probe(test_token: str) -> None:
+    """Test a failed probe reopens the circuit and a successful one closes it."""
+    route = respx.get(f"{BASE_URL}/v1/mdp").mock(
+        side_effect=[
+            httpx.Response(500),
+            httpx.Response(500),
+            httpx.Response(200, json={"Exchanges": ["XCME"]}),
+        ]
+    )
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    client = A7Client(token=test_token, circuit_breaker=breaker, retry=NO_RETRY)
+
+    with pytest.raises(ServerError):
+        client.mdp.get_exchanges()
+    time.sleep(0.06)
+    assert breaker.state("/v1/mdp") == "half_open"
+    with pytest.raises(ServerError):
+        client.mdp.get_exchanges()  # failed probe
+    with pytest.raises(CircuitOpenError):
+        client.mdp.get_exchanges()
+    time.sleep(0.06)
+
+    assert client.mdp.get_exchanges() == ["XCME"]
+    assert breaker.state("/v1/mdp") == "closed"
+    assert route.call_count == 3
+
+
+def test_outcomes_from_before_a_transition_are_ignored() -> None:
+    """Test late results of requests let through earlier do not move the circuit."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    early = breaker.before_request("/v1/ob")
+    late = breaker.before_request("/v1/ob")
+    breaker.record("/v1/ob", False, early)
+    assert breaker.state("/v1/ob") == "open"
+
+    time.sleep(0.03)
+    breaker.record("/v1/ob", False, late)  # must not extend the open window
+    time.sleep(0.03)
+    assert breaker.state("/v1/ob") == "half_open"
+
+    breaker.record("/v1/ob", True, late)  # no probe has run yet
+    assert breaker.state("/v1/ob") == "half_open"
+    probe = breaker.before_request("/v1/ob")
+    breaker.record("/v1/ob", True, probe)
+    assert breaker.state("/v1/ob") == "closed"
+
+
+def test_slow_responses_open_circuit() -> None:
+    """Test responses slower than the latency threshold count as failures."""
+    breaker = CircuitBreaker(failure_threshold=2, latency_threshold=0.01)
+    standin = StandInTransport(faults=FaultProfile(latency=0.03))
+    client = A7Client(token="local", transport=standin, circuit_breaker=breaker)
+
+    assert client.eobi.get_markets() == ["XEUR", "XETR"]
+    assert client.eobi.get_markets() == ["XEUR", "XETR"]
+    with pytest.raises(CircuitOpenError):
+        client.eobi.get_markets()
+
+
+def test_retries_stop_when_circuit_opens() -> None:
+    """Test the retry loop gives up as soon as the circuit opens."""
+    standin = StandInTransport(faults=FaultProfile(error_rate=1.0))
+    client = A7Client(
+        token="local",
+        transport=standin,
+        circuit_breaker=CircuitBreaker(failure_threshold=2),
+        retry=RetryPolicy(max_attempts=5, backoff_factor=0.0),
+    )
+
+    with pytest.raises(CircuitOpenError):
+        client.eobi.get_markets()
+    assert standin.statuses[503] == 2
+
+
+@respx.mock
+def test_async_client_breaker(test_token: str) -> None:
+    """Test the async client shares the same breaker logic."""
+    respx.get(f"{BASE_URL}/v1/eobi").mock(side_effect=httpx.ConnectError("refused"))
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    async def run() -> None:
+        async with AsyncA7Client(
+            token=test_token, circuit_breaker=breaker, retry=NO_RETRY
+        ) as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.eobi.get_markets()
+            with pytest.raises(CircuitOpenError):
+                await client.eobi.get_markets()
+
+    asyncio.run(run())
+    assert breaker.state("/v1/eobi") == "open"
@@ -0,0 +1,212 @@
+"""Unit tests for the persistent and in-memory response caches."""
+
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from a7 import A7Client, AsyncA7Client, DiskCache, MemoryCache, NotFoundError
+from a7.cache import cache_key
+from a7.endpoints import match_route
+
+# Base URL for mocking - matches DEFAULT_BASE_URL in config.py
+BASE_URL = "https://a7.deutsche-boerse.com/api"
+
+MESSAGE_URL = (
+    f"{BASE_URL}/v1/eobi/XEUR/20200227/187421/72862561103511553/1582821000143045889/14687296/23"
+)
+MESSAGE = {"MessageHeader": {"TemplateID": 13300, "MsgSeqNum": 23}}
+
+
+@pytest.fixture(autouse=True)
+def fixed_today(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pin 'today' so the test dates are in the past."""
+    monkeypatch.setattr("a7.cache._today", lambda: 20250101)
+
+
+def _get_message(client: A7Client) -> object:
+    return client.eobi.get_message(
+        "XEUR", 20200227, 187421, 72862561103511553, "1582821000143045889", 14687296, 23
+    )
+
+
+def test_match_route_resolves_resource_method() -> None:
+    """Test request paths resolve to resource methods and path parameters."""
+    match = match_route(httpx.Request("GET", MESSAGE_URL))
+
+    assert match is not None
+    assert match.route.name == "eobi.get_message"
+    assert match.params["date"] == "20200227"
+    assert match.params["msg_seq_num"] == "23"
+
+
+def test_cache_key_ignores_query_order() -> None:
+    """Test query parameters are normalized."""
+    first = httpx.Request("GET", f"{BASE_URL}/v1/ob/XETR/20230804/1/2?limit=1&levels=10")
+    second = httpx.Request("GET", f"{BASE_URL}/v1/ob/XETR/20230804/1/2?levels=10&limit=1")
+    other = httpx.Request("GET", f"{BASE_URL}/v1/ob/XETR/20230804/1/2?levels=5&limit=1")
+
+    assert cache_key(first) == cache_key(second)
+    assert cache_key(first) != cache_key(other)
+
+
+def test_rules_only_cover_past_dates(tmp_path: Path) -> None:
+    """Test only configured methods with a past date are cacheable."""
+    cache = DiskCache(tmp_path)
+
+    assert cache.is_cacheable(httpx.Request("GET", MESSAGE_URL))
+    assert not cache.is_cacheable(httpx.Request("GET", f"{BASE_URL}/v1/eobi/XEUR/20250101"))
+    assert not cache.is_cacheable(httpx.Request("GET", f"{BASE_URL}/v1/eobi"))
+    assert not cache.is_cacheable(httpx.Request("GET", f"{BASE_URL}/v1/algo/a7/top_level/run"))
+    assert not cache.is_cacheable(httpx.Request("DELETE", f"{BASE_URL}/v1/dataset/o/d"))
+    malformed = MESSAGE_URL.replace("20200227", "-20200227")
+    assert not cache.is_cacheable(httpx.Request("GET", malformed))
+
+
+@respx.mock
+def test_historical_response_served_from_disk(test_token: str, tmp_path: Path) -> None:
+    """Test a second client with the same cache directory does not hit the network."""
+    route = respx.get(MESSAGE_URL).mock(return_value=httpx.Response(200, json=MESSAGE))
+
+    assert _get_message(A7Client(token=test_token, cache=DiskCache(tmp_path))) == MESSAGE
+    assert _get_message(A7Client(token=test_token, cache=DiskCache(tmp_path))) == MESSAGE
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_today_is_never_cached(test_token: str, tmp_path: Path) -> None:
+    """Test requests for the current trading day always go to the server."""
+    route = respx.get(f"{BASE_URL}/v1/eobi/XEUR/20250101").mock(
+        return_value=httpx.Response(200, json={"MarketSegmentIDs": [688]})
+    )
+    cache = DiskCache(tmp_path)
+    client = A7Client(token=test_token, cache=cache)
+
+    client.eobi.get_market_segments("XEUR", 20250101)
+    client.eobi.get_market_segments("XEUR", 20250101)
+
+    assert route.call_count == 2
+    assert len(cache) == 0
+
+
+@respx.mock
+def test_errors_are_not_cached(test_token: str, tmp_path: Path) -> None:
+    """Test non-200 responses are passed through without being stored."""
+    respx.get(MESSAGE_URL).mock(return_value=httpx.Response(404))
+    cache = DiskCache(tmp_path)
+
+    with pytest.raises(NotFoundError):
+        _get_message(A7Client(token=test_token, cache=cache))
+    assert len(cache) == 0
+
+
+def test_lru_eviction_respects_size_cap(tmp_path: Path) -> None:
+    """Test least recently used entries are evicted beyond max_size."""
+    cache = DiskCache(tmp_path, max_size=300, compression_level=0)
+
+    def request(n: int) -> httpx.Request:
+        return httpx.Request("GET", f"{BASE_URL}/v1/eobi/XEUR/20200227/{n}")
+
+    for n in range(3):
+        response = httpx.Response(200, content=bytes([n]) * 100)
+        cache.set(request(n), response)
+        cache.get(request(0))
+
+    assert cache.size <= 300
+    assert cache.get(request(0)) is not None
+    assert cache.get(request(1)) is None
+    assert cache.get(request(2)) is not None
+
+
+@respx.mock
+def test_async_client_uses_cache(test_token: str, tmp_path: Path) -> None:
+    """Test async client reads and writes the same cache."""
+    route = respx.get(f"{BASE_URL}/v2/rdi/XEUR/20200227/").mock(
+        return_value=httpx.Response(200, json=[{"MarketSegmentID": 688}])
+    )
+
+    async def run() -> list[object]:
+        async with AsyncA7Client(token=test_token, cache=DiskCache(tmp_path)) as client:
+            return [await client.rdi.get_market_segments("XEUR", 20200227) for _ in range(2)]
+
+    assert asyncio.run(run()) == [[{"MarketSegmentID": 688}]] * 2
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_discovery_listing_served_from_memory(test_token: str) -> None:
+    """Test repeated discovery calls hit the network once."""
+    route = respx.get(f"{BASE_URL}/v1/eobi/XEUR").mock(
+        return_value=httpx.Response(200, json={"Dates": [20200227]})
+    )
+    client = A7Client(token=test_token, discovery_cache=MemoryCache())
+
+    for _ in range(3):
+        assert client.eobi.get_dates("XEUR") == [20200227]
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_memory_cache_ttl_expiry(test_token: str) -> None:
+    """Test expired entries are fetched again."""
+    route = respx.get(f"{BASE_URL}/v1/mdp").mock(
+        return_value=httpx.Response(200, json={"Exchanges": ["XCME"]})
+    )
+    client = A7Client(token=test_token, discovery_cache=MemoryCache(ttl=0))
+
+    client.mdp.get_exchanges()
+    client.mdp.get_exchanges()
+
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_memory_cache_skips_non_discovery_routes(test_token: str) -> None:
+    """Test message endpoints are not cached in memory."""
+    route = respx.get(MESSAGE_URL).mock(return_value=httpx.Response(200, json=MESSAGE))
+    client = A7Client(token=test_token, discovery_cache=MemoryCache())
+
+    _get_message(client)
+    _get_message(client)
+
+    assert route.call_count == 2
+
+
+def test_memory_cache_max_entries_evicts_lru() -> None:
+    """Test the least recently used entry is dropped at capacity."""
+    cache = MemoryCache(max_entries=2)
+
+    def request(market: str) -> httpx.Request:
+        return httpx.Request("GET", f"{BASE_URL}/v1/eobi/{market}")
+
+    for market in ("XEUR", "XETR"):
+        cache.set(request(market), httpx.Response(200, json={"Dates": []}))
+    cache.get(request("XEUR"))
+    cache.set(request("XEEE"), httpx.Response(200, json={"Dates": []}))
+
+    assert len(cache) == 2
+    assert cache.get(request("XETR")) is None
+    assert cache.get(request("XEUR")) is not None
+
+
+@respx.mock
+def test_memory_cache_invalidate(test_token: str) -> None:
+    """Test invalidate() by method and path parameters."""
+    respx.get(url__regex=rf"{BASE_URL}/v1/eobi/\w+$").mock(
+        return_value=httpx.Response(200, json={"Dates": [20200227]})
+    )
+    respx.get(f"{BASE_URL}/v1/eobi").mock(
+        return_value=httpx.Response(200, json={"MarketIDs": ["XEUR", "XETR"]})
+    )
+    discovery = MemoryCache()
+    client = A7Client(token=test_token, discovery_cache=discovery)
+    client.eobi.get_markets()
+    client.eobi.get_dates("XEUR")
+    client.eobi.get_dates("XETR")
+
+    assert discovery.invalidate("eobi.get_dates", market_id="XEUR") == 1
+    assert discovery.invalidate("eobi.get_dates") == 1
+    assert discovery.invalidate() == 1
+    assert len(discovery) == 0
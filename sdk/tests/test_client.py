@@ -1,8 +1,14 @@
 """Tests for A7Client initialization and basic functionality."""
 
+import subprocess
+import sys
+from typing import Any
+
+import httpx
 import pytest
 
 from a7 import A7Client
+from a7.resources import RDIResource
 
 
 def test_client_initialization(test_token: str) -> None:
@@ -77,3 +83,87 @@ def test_client_alternate_url(test_token: str) -> None:
     alt_url = "https://a7.deutsche-boerse.de/api/v1/"
     client = A7Client(token=test_token, base_url=alt_url)
     assert client is not None
+
+
+@pytest.fixture
+def transport_kwargs(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    """Capture the keyword arguments the client passes to httpx.HTTPTransport."""
+    captured: dict[str, Any] = {}
+
+    class RecordingTransport(httpx.HTTPTransport):
+        def __init__(self, **kwargs: Any) -> None:
+            captured.update(kwargs)
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(httpx, "HTTPTransport", RecordingTransport)
+    return captured
+
+
+def test_client_pool_limits(test_token: str, transport_kwargs: dict[str, Any]) -> None:
+    """Test pool limits given to the constructor reach the transport."""
+    A7Client(token=test_token, max_connections=8, max_keepalive_connections=4, keepalive_expiry=30)
+
+    assert transport_kwargs["limits"] == httpx.Limits(
+        max_connections=8, max_keepalive_connections=4, keepalive_expiry=30
+    )
+    assert transport_kwargs["http2"] is False
+
+
+def test_client_pool_limits_from_environment(
+    test_token: str, transport_kwargs: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test A7_* environment variables apply on the no-proxy path, arguments win."""
+    monkeypatch.setenv("NO_PROXY", "*")
+    monkeypatch.setenv("A7_MAX_CONNECTIONS", "250")
+    monkeypatch.setenv("A7_KEEPALIVE_EXPIRY", "12.5")
+    monkeypatch.setenv("A7_HTTP2", "false")
+
+    A7Client(token=test_token, max_keepalive_connections=50)
+
+    assert transport_kwargs["proxy"] is None
+    assert transport_kwargs["limits"] == httpx.Limits(
+        max_connections=250, max_keepalive_connections=50, keepalive_expiry=12.5
+    )
+
+
+def test_client_pool_limits_through_proxy(
+    test_token: str, transport_kwargs: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test pool limits also apply when requests go through a proxy."""
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    monkeypatch.delenv("no_proxy", raising=False)
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+
+    A7Client(token=test_token, max_connections=3)
+
+    assert transport_kwargs["proxy"] == "http://proxy.example:3128"
+    assert transport_kwargs["limits"].max_connections == 3
+
+
+def test_client_invalid_pool_env(test_token: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test malformed A7_* values are reported by name."""
+    monkeypatch.setenv("A7_MAX_CONNECTIONS", "many")
+
+    with pytest.raises(ValueError, match="A7_MAX_CONNECTIONS"):
+        A7Client(token=test_token)
+
+
+def test_import_is_lazy() -> None:
+    """Test 'import a7' does not load httpx or the resource modules."""
+    code = (
+        "import sys, a7; "
+        "assert 'httpx' not in sys.modules; "
+        "assert 'a7.resources.eobi' not in sys.modules; "
+        "assert a7.A7Client.__name__ == 'A7Client'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_resources_are_created_on_first_access(test_token: str) -> None:
+    """Test resource attributes are built lazily and then reused."""
+    client = A7Client(token=test_token)
+
+    assert "rdi" not in vars(client)
+    assert isinstance(client.rdi, RDIResource)
+    assert client.rdi is client.rdi
+    assert "eobi" not in vars(client)
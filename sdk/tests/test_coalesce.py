@@ -0,0 +1,103 @@
+"""Unit tests for single-flight request coalescing."""
+
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import respx
+
+from a7 import A7Client, AsyncA7Client, NotFoundError
+from a7.retry import RetryPolicy
+
+# Base URL for mocking - matches DEFAULT_BASE_URL in config.py
+BASE_URL = "https://a7.deutsche-boerse.com/api"
+
+SEGMENTS = {"MarketSegmentIDs": [688, 1176]}
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def _slow_response(
+    release: threading.Event, response: httpx.Response
+) -> Callable[[httpx.Request], httpx.Response]:
+    def side_effect(request: httpx.Request) -> httpx.Response:
+        release.wait(timeout=5)
+        return response
+
+    return side_effect
+
+
+@respx.mock
+def test_concurrent_identical_gets_share_one_request(test_token: str) -> None:
+    """Test threads asking for the same URL at once trigger a single request."""
+    release = threading.Event()
+    route = respx.get(f"{BASE_URL}/v1/eobi/XEUR/20200227").mock(
+        side_effect=_slow_response(release, httpx.Response(200, json=SEGMENTS))
+    )
+    client = A7Client(token=test_token, coalesce=True)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(client.eobi.get_market_segments, "XEUR", 20200227) for _ in range(8)]
+        # Give every worker time to join the in-flight request
+        threading.Event().wait(0.2)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == [[688, 1176]] * 8
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_sequential_gets_are_not_coalesced(test_token: str) -> None:
+    """Test a finished request is not reused by later calls."""
+    route = respx.get(f"{BASE_URL}/v1/eobi/XEUR/20200227").mock(
+        return_value=httpx.Response(200, json=SEGMENTS)
+    )
+    client = A7Client(token=test_token, coalesce=True)
+
+    client.eobi.get_market_segments("XEUR", 20200227)
+    client.eobi.get_market_segments("XEUR", 20200227)
+
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_errors_are_shared(test_token: str) -> None:
+    """Test every waiting caller sees the leader's error response."""
+    release = threading.Event()
+    route = respx.get(f"{BASE_URL}/v1/eobi/XEUR/20200227").mock(
+        side_effect=_slow_response(release, httpx.Response(404))
+    )
+    client = A7Client(token=test_token, coalesce=True, retry=NO_RETRY)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(client.eobi.get_market_segments, "XEUR", 20200227) for _ in range(4)]
+        threading.Event().wait(0.2)
+        release.set()
+        for future in futures:
+            with pytest.raises(NotFoundError):
+                future.result()
+
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_async_gather_shares_one_request(test_token: str) -> None:
+    """Test concurrent coroutines for the same URL trigger a single request."""
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=SEGMENTS)
+
+    route = respx.get(f"{BASE_URL}/v1/eobi/XEUR/20200227").mock(side_effect=slow)
+
+    async def run() -> list[object]:
+        async with AsyncA7Client(token=test_token, coalesce=True) as client:
+            return await asyncio.gather(
+                *(client.eobi.get_market_segments("XEUR", 20200227) for _ in range(5))
+            )
+
+    assert asyncio.run(run()) == [[688, 1176]] * 5
+    assert route.call_count == 1
@@ -0,0 +1,134 @@
+"""Unit tests for the columnar EOBI message store."""
+
+import math
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from a7 import A7Client, MessageStore
+from a7.columnar import MISSING, TemplateTable, _Column, numpy
+from a7.testing import MarketProfile, StandInTransport
+
+PROFILE = MarketProfile(
+    markets=("XEUR",),
+    dates=(20240102,),
+    segments_per_market=1,
+    securities_per_segment=1,
+    messages_per_second=10.0,
+    session_seconds=30,
+)
+SECURITY = ("XEUR", 20240102, 1001, 1001000001)
+
+
+@pytest.fixture
+def messages(test_token: str) -> list[dict[str, Any]]:
+    """A stand-in day of EOBI messages for one security."""
+    client = A7Client(token=test_token, transport=StandInTransport(PROFILE))
+    return list(client.eobi.iter_messages(*SECURITY))
+
+
+def test_store_routes_by_template_and_rebuilds_messages(messages: list[dict[str, Any]]) -> None:
+    """Test messages go to one typed table per TemplateID and come back unchanged."""
+    store = MessageStore()
+    store.extend(messages)
+
+    assert len(store) == len(messages)
+    assert store.templates == sorted({m["MessageHeader"]["TemplateID"] for m in messages})
+    for template_id in store.templates:
+        expected = [m for m in messages if m["MessageHeader"]["TemplateID"] == template_id]
+        assert list(store[template_id]) == expected
+
+    adds = store[13100]
+    assert adds.column("OrderDetails.Price").typecode == "q"
+    assert adds.column("TransactTime").typecode == "q"
+    assert adds.column("TransactTime")[0] == int(messages[0]["TransactTime"])
+    assert store.nbytes < len(messages) * 120
+
+
+def test_store_slices_and_round_trips_through_a_file(
+    messages: list[dict[str, Any]], tmp_path: Path
+) -> None:
+    """Test time and row slices, and save/load."""
+    store = MessageStore()
+    store.extend(messages)
+    times = sorted({int(m["TransactTime"]) for m in messages})
+
+    window = store.between(times[10], times[19])
+    assert (
+        sorted({int(m["TransactTime"]) for t in window.templates for m in window[t]})
+        == times[10:20]
+    )
+    assert list(store[13100].slice(2, 4)) == list(store[13100])[2:4]
+
+    path = tmp_path / "day.a7cols"
+    store.save(path)
+    loaded = MessageStore.load(path)
+    assert loaded.templates == store.templates
+    for template_id in store.templates:
+        assert list(loaded[template_id]) == list(store[template_id])
+    (tmp_path / "bad").write_bytes(b"nope")
+    with pytest.raises(ValueError):
+        MessageStore.load(tmp_path / "bad")
+
+
+def test_columns_handle_missing_enum_and_widened_fields() -> None:
+    """Test sparse fields, interned strings and columns widened by later values."""
+    rows = [
+        {"MessageHeader": {"TemplateID": 1}, "Side": "BUY", "Px": 5, "Id": "00"},
+        {"MessageHeader": {"TemplateID": 1}, "Side": "SELL", "Px": 5.5, "Extra": [1, 2]},
+        {"MessageHeader": {"TemplateID": 1}, "Side": "BUY", "Px": None, "Id": "12"},
+    ]
+    store = MessageStore()
+    store.extend(rows)
+    table = store[1]
+
+    assert list(table.column("Side")) == [0, 1, 0]
+    assert table.categories("Side") == ["BUY", "SELL"]
+    assert table.column("Px").typecode == "d"
+    assert math.isnan(table.column("Px")[2])
+    assert table.column("Id").typecode == "i"
+    assert table.message(1) == rows[1]
+    assert table.message(-1) == {"MessageHeader": {"TemplateID": 1}, "Side": "BUY", "Id": "12"}
+    assert store[1].slice(0, 1).columns == table.columns
+    assert MISSING == -(2**63)
+
+    store.extend([{"MessageHeader": {"TemplateID": 2}, "Seq": seq} for seq in (5, "6", "7")])
+    assert store[2].column("Seq").typecode == "q"
+    assert list(store[2].column("Seq")) == [5, 6, 7]
+    assert store[2].message(1)["Seq"] == 6
+
+
+def test_widening_copies_a_column_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test ints in a float column and digit strings in an enum column are appended in place."""
+    conversions: list[str] = []
+    converted = _Column.converted
+
+    def counting(column: _Column, kind: str) -> _Column:
+        conversions.append(kind)
+        return converted(column, kind)
+
+    monkeypatch.setattr(_Column, "converted", counting)
+    table = TemplateTable(1)
+    prices: list[int | float] = [100, 100.5, *range(200)]
+    for n, price in enumerate(prices):
+        table.append({"Px": price, "Code": "ABC" if n == 0 else str(n)})
+
+    assert conversions == ["float"]
+    assert table.column("Px").typecode == "d"
+    assert [table.message(row)["Px"] for row in range(len(table))] == prices
+    assert table.categories("Code")[:2] == ["ABC", "1"]
+
+
+def test_to_numpy_needs_numpy(messages: list[dict[str, Any]]) -> None:
+    """Test columns convert to NumPy arrays, or ImportError without NumPy."""
+    store = MessageStore()
+    store.extend(messages)
+
+    if numpy is None:
+        with pytest.raises(ImportError):
+            store[13100].to_numpy("OrderDetails.Price")
+    else:
+        prices = store[13100].to_numpy("OrderDetails.Price")
+        assert prices.dtype == numpy.int64
+        assert prices.tolist() == list(store[13100].column("OrderDetails.Price"))
@@ -0,0 +1,145 @@
+"""Unit tests for the EOBI hierarchy crawler."""
+
+import asyncio
+import queue
+import threading
+from pathlib import Path
+
+import pytest
+
+from a7 import A7Client, AsyncA7Client, CrawlCheckpoint, CrawlItem, EOBICrawler
+from a7.testing import MarketProfile, StandInTransport
+
+PROFILE = MarketProfile(
+    markets=("XEUR",),
+    dates=(20240102,),
+    segments_per_market=3,
+    securities_per_segment=4,
+    messages_per_second=2.0,
+    session_seconds=30,
+)
+
+
+def keys(items: list[CrawlItem]) -> set[tuple[int, int]]:
+    """Segment and security of each item."""
+    return {(item.market_segment_id, item.security_id) for item in items}
+
+
+def test_crawl_emits_every_security_with_transact_times(test_token: str) -> None:
+    """Test the crawl hands every security of the market to a callback."""
+    client = A7Client(token=test_token, transport=StandInTransport(PROFILE))
+    items: list[CrawlItem] = []
+
+    count = EOBICrawler(
+        client, "XEUR", 20240102, segment_concurrency=2, security_concurrency=3, page_size=7
+    ).run(items.append)
+
+    assert count == len(items) == 12
+    assert keys(items) == {
+        (segment, security)
+        for segment in client.eobi.get_market_segments("XEUR", 20240102)
+        for security in client.eobi.get_securities("XEUR", 20240102, segment)
+    }
+    for item in items:
+        assert item.transact_times == client.eobi.get_transact_times(
+            "XEUR", 20240102, item.market_segment_id, item.security_id
+        )
+
+
+def test_crawl_selected_segments_to_queue(test_token: str) -> None:
+    """Test a crawl of given segments without transact times fills a queue."""
+    client = A7Client(token=test_token, transport=StandInTransport(PROFILE))
+    work: queue.Queue[CrawlItem] = queue.Queue()
+
+    EOBICrawler(client, "XEUR", 20240102, market_segment_ids=[1002], transact_times=False).run(work)
+
+    items = [work.get_nowait() for _ in range(work.qsize())]
+    assert keys(items) == {(1002, 1002000000 + n) for n in range(1, 5)}
+    assert all(item.transact_times == [] for item in items)
+    with pytest.raises(ValueError):
+        EOBICrawler(client, "XEUR", 20240102, security_concurrency=0)
+
+
+def test_crawl_resumes_from_checkpoint(test_token: str, tmp_path: Path) -> None:
+    """Test an interrupted crawl resumes without repeating handed-over securities."""
+    client = A7Client(token=test_token, transport=StandInTransport(PROFILE))
+    path = tmp_path / "xeur.crawl"
+    first: list[CrawlItem] = []
+
+    def flaky(item: CrawlItem) -> None:
+        if len(first) == 5:
+            raise RuntimeError("consumer crashed")
+        first.append(item)
+
+    with pytest.raises(RuntimeError):
+        EOBICrawler(
+            client, "XEUR", 20240102, security_concurrency=1, checkpoint=CrawlCheckpoint(path)
+        ).run(flaky)
+
+    rest: list[CrawlItem] = []
+    checkpoint = CrawlCheckpoint(path)
+    assert len(checkpoint.securities) == 5
+    EOBICrawler(client, "XEUR", 20240102, checkpoint=checkpoint).run(rest.append)
+
+    assert len(first) + len(rest) == 12
+    assert not keys(first) & keys(rest)
+    assert len(keys(first + rest)) == 12
+    assert CrawlCheckpoint(path).segments == {1001, 1002, 1003}
+    with pytest.raises(ValueError):
+        EOBICrawler(client, "XEUR", 20240103, checkpoint=CrawlCheckpoint(path)).run(rest.append)
+
+
+def test_async_crawl_to_queue(test_token: str) -> None:
+    """Test the async crawl puts every security on an asyncio queue."""
+    expected = {(1000 + s, (1000 + s) * 1_000_000 + n) for s in (1, 2, 3) for n in range(1, 5)}
+
+    async def run() -> list[CrawlItem]:
+        work: asyncio.Queue[CrawlItem] = asyncio.Queue()
+        transport = StandInTransport(PROFILE)
+        async with AsyncA7Client(token=test_token, transport=transport) as client:
+            crawler = EOBICrawler(client, "XEUR", 20240102, security_concurrency=2)
+            assert await crawler.arun(work) == 12
+        return [work.get_nowait() for _ in range(work.qsize())]
+
+    items = asyncio.run(run())
+    assert keys(items) == expected
+    assert all(item.transact_times for item in items)
+
+
+def test_queued_items_count_once_marked_done(test_token: str, tmp_path: Path) -> None:
+    """Test a resumed queue crawl hands over again the items never marked done."""
+    client = A7Client(token=test_token, transport=StandInTransport(PROFILE))
+    path = tmp_path / "xeur.crawl"
+    checkpoint = CrawlCheckpoint(path)
+    work: queue.Queue[CrawlItem] = queue.Queue()
+
+    EOBICrawler(client, "XEUR", 20240102, checkpoint=checkpoint).run(work)
+    items = [work.get_nowait() for _ in range(work.qsize())]
+    assert CrawlCheckpoint(path).securities == set()
+    done = [item for item in items if item.market_segment_id != 1002 or item.security_id % 2]
+    for item in done:
+        checkpoint.mark_done(item)
+
+    assert CrawlCheckpoint(path).segments == {1001, 1003}
+    EOBICrawler(client, "XEUR", 20240102, checkpoint=CrawlCheckpoint(path)).run(work)
+    assert keys([work.get_nowait() for _ in range(work.qsize())]) == keys(items) - keys(done)
+
+
+def test_consumer_runs_outside_the_crawl_lock(test_token: str) -> None:
+    """Test a blocked consumer does not stop other securities being handed over."""
+    client = A7Client(token=test_token, transport=StandInTransport(PROFILE))
+    release = threading.Event()
+    items: list[CrawlItem] = []
+
+    def consumer(item: CrawlItem) -> None:
+        if not items:
+            items.append(item)
+            assert release.wait(5)
+            return
+        items.append(item)
+        if len(items) == 12:
+            release.set()
+
+    crawler = EOBICrawler(client, "XEUR", 20240102, security_concurrency=4)
+    assert crawler.run(consumer) == 12
+    assert release.is_set()
@@ -0,0 +1,144 @@
+"""Unit tests for the multi-token credential pool."""
+
+import asyncio
+import pickle
+
+import httpx
+import pytest
+import respx
+
+from a7 import A7Client, AsyncA7Client, CredentialPool, RateLimiter, RateLimitError
+from a7.retry import RetryPolicy
+
+# Base URL for mocking - matches DEFAULT_BASE_URL in config.py
+BASE_URL = "https://a7.deutsche-boerse.com/api"
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def _authorizations(route: respx.Route) -> list[str]:
+    return [call.request.headers["Authorization"] for call in route.calls]
+
+
+@respx.mock
+def test_round_robin() -> None:
+    """Test requests take turns across the tokens."""
+    route = respx.get(f"{BASE_URL}/v1/eobi").mock(
+        return_value=httpx.Response(200, json={"MarketIDs": ["XEUR"]})
+    )
+    pool = CredentialPool(["a", "Bearer b", "c"])
+    client = A7Client(token=pool)
+
+    for _ in range(4):
+        client.eobi.get_markets()
+
+    assert _authorizations(route) == ["Bearer a", "Bearer b", "Bearer c", "Bearer a"]
+    assert [stats["requests"] for stats in pool.stats()] == [2, 1, 1]
+
+
+@respx.mock
+def test_throttled_token_benched_without_failing() -> None:
+    """Test a 429 benches the token and the request succeeds with another one."""
+
+    def reply(request: httpx.Request) -> httpx.Response:
+        if request.headers["Authorization"] == "Bearer a":
+            return httpx.Response(429, headers={"Retry-After": "30"})
+        return httpx.Response(200, json={"MarketIDs": ["XEUR"]})
+
+    route = respx.get(f"{BASE_URL}/v1/eobi").mock(side_effect=reply)
+    pool = CredentialPool(["a", "b"])
+    client = A7Client(token=pool, retry=NO_RETRY)
+
+    assert client.eobi.get_markets() == ["XEUR"]
+    assert client.eobi.get_markets() == ["XEUR"]
+
+    assert _authorizations(route) == ["Bearer a", "Bearer b", "Bearer b"]
+    stats = pool.stats()
+    assert stats[0]["throttled"] == 1
+    assert 29 < stats[0]["benched_for"] <= 30
+    assert stats[1] == {"requests": 2, "throttled": 0, "benched_for": 0.0}
+
+
+class CountingLimiter(RateLimiter):
+    """Rate limiter counting the requests it lets through."""
+
+    def __init__(self) -> None:
+        super().__init__(rate=1000)
+        self.acquired = 0
+
+    def acquire(self, request: httpx.Request) -> None:
+        self.acquired += 1
+        super().acquire(request)
+
+
+@respx.mock
+def test_resend_after_429_takes_rate_limit_tokens() -> None:
+    """Test the resend with another token passes the rate limiter like any attempt."""
+    respx.get(f"{BASE_URL}/v1/eobi").mock(
+        side_effect=[httpx.Response(429), httpx.Response(200, json={"MarketIDs": ["XEUR"]})]
+    )
+    limiter = CountingLimiter()
+    client = A7Client(token=CredentialPool(["a", "b"]), retry=NO_RETRY, rate_limit=limiter)
+
+    assert client.eobi.get_markets() == ["XEUR"]
+    assert limiter.acquired == 2
+
+
+@respx.mock
+def test_all_tokens_throttled_reaches_retry() -> None:
+    """Test the 429 surfaces once every token is benched."""
+    route = respx.get(f"{BASE_URL}/v1/eobi").mock(return_value=httpx.Response(429))
+    pool = CredentialPool(["a", "b"], cooldown=5.0)
+    client = A7Client(token=pool, retry=RetryPolicy(max_attempts=2, backoff_factor=0.0))
+
+    with pytest.raises(RateLimitError):
+        client.eobi.get_markets()
+
+    # Both tokens tried on the first attempt; the retry goes to the one back first
+    assert route.call_count == 3
+    assert [stats["throttled"] for stats in pool.stats()] == [2, 1]
+
+
+def test_least_throttled_prefers_oldest_throttle() -> None:
+    """Test the least-recently-throttled strategy avoids recently throttled tokens."""
+    pool = CredentialPool(["a", "b", "c"], strategy="least_throttled", cooldown=0.0)
+    pool.bench(0)
+    pool.bench(2)
+
+    assert pool.acquire() == 1
+    assert pool.acquire() == 1
+    assert pool.alternative({1}) == 0
+    assert pool.alternative({0, 1, 2}) is None
+    with pytest.raises(ValueError, match="strategy"):
+        CredentialPool(["a"], strategy="random")
+    with pytest.raises(ValueError, match="at least one"):
+        CredentialPool([])
+
+
+@respx.mock
+def test_async_client_pool() -> None:
+    """Test the async client switches tokens the same way."""
+    route = respx.get(f"{BASE_URL}/v1/eobi").mock(
+        side_effect=[httpx.Response(429), httpx.Response(200, json={"MarketIDs": ["XEUR"]})]
+    )
+    pool = CredentialPool(["a", "b"])
+
+    async def run() -> list[str]:
+        async with AsyncA7Client(token=pool, retry=NO_RETRY) as client:
+            return await client.eobi.get_markets()
+
+    assert asyncio.run(run()) == ["XEUR"]
+    assert _authorizations(route) == ["Bearer a", "Bearer b"]
+
+
+def test_pool_pickles_without_state() -> None:
+    """Test a pickled pool keeps its tokens and settings but not its usage."""
+    pool = CredentialPool(["a", "b"], strategy="least_throttled", cooldown=10.0)
+    pool.bench(0)
+
+    copy = pickle.loads(pickle.dumps(pool))
+
+    assert len(copy) == 2
+    assert copy.authorization(1) == "Bearer b"
+    assert copy.strategy == "least_throttled"
+    assert copy.stats()[0]["throttled"] == 0
@@ -0,0 +1,67 @@
+"""Unit tests for pluggable JSON decoders."""
+
+import importlib.util
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from a7 import A7Client
+from a7.decoders import get_decoder, stdlib_decoder
+
+# Base URL for mocking - matches DEFAULT_BASE_URL in config.py
+BASE_URL = "https://a7.deutsche-boerse.com/api"
+
+BODY = (
+    b'{"TransactTimes": [1582821000143045889], "SecurityID": 72862561103511553,'
+    b' "Price": 1.5e-3, "Text": "B\\u00f6rse", "Flag": null}'
+)
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_decoders_agree_with_stdlib(name: str) -> None:
+    """Test every available decoder returns what json.loads returns."""
+    if name != "json" and importlib.util.find_spec(name) is None:
+        pytest.skip(f"{name} not installed")
+
+    assert get_decoder(name)(BODY) == stdlib_decoder(BODY)
+
+
+def test_auto_detect_prefers_fast_library() -> None:
+    """Test the default decoder is not the stdlib one when orjson is installed."""
+    pytest.importorskip("orjson")
+
+    assert get_decoder() is not stdlib_decoder
+
+
+def test_missing_library(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test asking for an uninstalled library fails clearly."""
+    monkeypatch.setattr("a7.decoders.msgspec", None)
+
+    with pytest.raises(ImportError, match="msgspec"):
+        get_decoder("msgspec")
+
+
+def test_unknown_decoder() -> None:
+    """Test unknown names are rejected."""
+    with pytest.raises(ValueError, match="ujson"):
+        get_decoder("ujson")
+
+
+@respx.mock
+def test_client_uses_custom_decoder(test_token: str) -> None:
+    """Test resources decode bodies with the client's decoder."""
+    respx.get(f"{BASE_URL}/v1/eobi").mock(
+        return_value=httpx.Response(200, json={"MarketIDs": ["XEUR"]})
+    )
+    seen: list[bytes] = []
+
+    def decode(content: bytes) -> Any:
+        seen.append(content)
+        return stdlib_decoder(content)
+
+    client = A7Client(token=test_token, json_decoder=decode)
+
+    assert client.eobi.get_markets() == ["XEUR"]
+    assert seen == [b'{"MarketIDs":["XEUR"]}']
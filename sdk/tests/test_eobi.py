@@ -1,14 +1,29 @@
 """Unit tests for EOBI resource with mocked HTTP responses."""
 
+import asyncio
+from typing import Any
+
 import httpx
 import pytest
 import respx
 
-from a7 import A7Client
+from a7 import A7Client, AsyncA7Client, AuthenticationError, NotFoundError
+from a7.resources.eobi import _next_page_start, plan_message_requests
+from a7.testing import MarketProfile, StandInTransport
 
 # Base URL for mocking - matches DEFAULT_BASE_URL in config.py
 BASE_URL = "https://a7.deutsche-boerse.com/api"
 
+STREAM_PROFILE = MarketProfile(
+    markets=("XEUR",),
+    dates=(20240102,),
+    segments_per_market=1,
+    securities_per_segment=1,
+    messages_per_second=10.0,
+    session_seconds=30,
+)
+SECURITY = ("XEUR", 20240102, 1001, 1001000001)
+
 
 @respx.mock
 def test_get_eobi_message_success(mock_client: A7Client) -> None:
@@ -53,7 +68,7 @@ def test_get_eobi_message_not_found(mock_client: A7Client) -> None:
         f"{BASE_URL}/v1/eobi/XEUR/20200227/187421/72862561103511553/1582821000143045889/14687296/999"
     ).mock(return_value=httpx.Response(404, json={"error": "Message not found"}))
 
-    with pytest.raises(httpx.HTTPStatusError):
+    with pytest.raises(NotFoundError):
         mock_client.eobi.get_message(
             market_id="XEUR",
             date=20200227,
@@ -72,7 +87,7 @@ def test_get_eobi_message_auth_error(mock_client: A7Client) -> None:
         f"{BASE_URL}/v1/eobi/XEUR/20200227/187421/72862561103511553/1582821000143045889/14687296/23"
     ).mock(return_value=httpx.Response(401, json={"error": "Unauthorized"}))
 
-    with pytest.raises(httpx.HTTPStatusError):
+    with pytest.raises(AuthenticationError):
         mock_client.eobi.get_message(
             market_id="XEUR",
             date=20200227,
@@ -82,3 +97,111 @@ def test_get_eobi_message_auth_error(mock_client: A7Client) -> None:
             applseq_num=14687296,
             msg_seq_num=23,
         )
+
+
+def test_iter_messages_matches_packet_walk(test_token: str) -> None:
+    """Test iter_messages pages transact times and yields every message in order."""
+    client = A7Client(token=test_token, transport=StandInTransport(STREAM_PROFILE))
+    times = client.eobi.get_transact_times(*SECURITY)
+    expected: list[dict[str, Any]] = []
+    for transact_time in times:
+        for packet in client.eobi.get_applseq_nums(*SECURITY, transact_time, mode="detailed"):
+            assert isinstance(packet, dict)
+            header = packet["PacketHeader"]
+            expected += [{**m, "TransactTime": header["TransactTime"]} for m in packet["Messages"]]
+
+    assert list(client.eobi.iter_transact_times(*SECURITY, page_size=7)) == times
+    messages = list(client.eobi.iter_messages(*SECURITY, page_size=7, read_ahead=3))
+    assert messages == expected
+    seq_nums = [message["MessageHeader"]["MsgSeqNum"] for message in messages]
+    assert seq_nums == list(range(1, len(messages) + 1))
+
+
+def test_paging_resumes_right_after_a_page(test_token: str) -> None:
+    """Test 'from' is inclusive, so the next page starts one nanosecond after the last time."""
+    client = A7Client(token=test_token, transport=StandInTransport(STREAM_PROFILE))
+    times = client.eobi.get_transact_times(*SECURITY)
+
+    page = client.eobi.get_transact_times(*SECURITY, limit=7)
+    assert page == times[:7]
+    assert client.eobi.get_transact_times(*SECURITY, limit=1, from_time=page[-1]) == [page[-1]]
+    next_page = client.eobi.get_transact_times(*SECURITY, limit=7, from_time=_next_page_start(page))
+    assert next_page == times[7:14]
+    for page_size in (1, len(times) - 1, len(times)):
+        assert list(client.eobi.iter_transact_times(*SECURITY, page_size=page_size)) == times
+
+
+def test_iter_messages_bounds_and_filter(test_token: str) -> None:
+    """Test from/to bounds are inclusive and the template filter is forwarded."""
+    client = A7Client(token=test_token, transport=StandInTransport(STREAM_PROFILE))
+    times = client.eobi.get_transact_times(*SECURITY)
+
+    window = client.eobi.iter_messages(*SECURITY, times[10], times[19], page_size=4)
+    assert sorted({message["TransactTime"] for message in window}, key=int) == times[10:20]
+
+    adds = list(client.eobi.iter_messages(*SECURITY, template_id_filter="13100"))
+    assert adds
+    assert {message["MessageHeader"]["TemplateID"] for message in adds} == {13100}
+
+    with pytest.raises(ValueError):
+        next(client.eobi.iter_messages(*SECURITY, read_ahead=0))
+
+
+def test_iter_messages_async(test_token: str) -> None:
+    """Test the async iterator yields the same stream and can be closed early."""
+    client = A7Client(token=test_token, transport=StandInTransport(STREAM_PROFILE))
+    expected = list(client.eobi.iter_messages(*SECURITY))
+
+    async def run() -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        transport = StandInTransport(STREAM_PROFILE)
+        async with AsyncA7Client(token=test_token, transport=transport) as aclient:
+            stream = aclient.eobi.iter_messages(*SECURITY, page_size=5, read_ahead=4)
+            messages = [message async for message in stream]
+            head: list[dict[str, Any]] = []
+            partial = aclient.eobi.iter_messages(*SECURITY, read_ahead=4)
+            async for message in partial:
+                head.append(message)
+                if len(head) == 3:
+                    break
+            await partial.aclose()
+            return messages, head
+
+    messages, head = asyncio.run(run())
+    assert messages == expected
+    assert head == expected[:3]
+
+
+def test_get_messages_batches_by_transact_time(test_token: str) -> None:
+    """Test get_messages fetches sparse keys with one request per transact time."""
+    transport = StandInTransport(STREAM_PROFILE)
+    client = A7Client(token=test_token, transport=transport)
+    messages = list(client.eobi.iter_messages(*SECURITY))
+    missing = (messages[0]["TransactTime"], 1, 10_000)
+    # get_messages returns messages as sent, without their packet's TransactTime
+    keys = {
+        (m.pop("TransactTime"), m["ApplSeqNum"], m["MessageHeader"]["MsgSeqNum"]): m
+        for m in messages[::25]
+    }
+    sent = sum(transport.statuses.values())
+
+    found = client.eobi.get_messages(*SECURITY, [*keys, missing], concurrency=3)
+
+    assert found == keys
+    assert sum(transport.statuses.values()) - sent == len({key[0] for key in keys})
+    for key, message in found.items():
+        assert message == client.eobi.get_message(*SECURITY, *key)
+
+
+def test_plan_message_requests_groups_keys() -> None:
+    """Test keys are grouped by transact time, then ApplSeqNum, in order."""
+    # Integer transact times are accepted too
+    keys: list[tuple[Any, int, int]] = [
+        ("20", 2, 5),
+        ("10", 1, 3),
+        ("20", 2, 4),
+        (20, 3, 6),
+        ("10", 1, 3),
+    ]
+    plan = plan_message_requests(keys)
+
+    assert plan == {"10": {1: [3]}, "20": {2: [4, 5], 3: [6]}}
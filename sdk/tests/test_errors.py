@@ -1,11 +1,15 @@
 """Tests for custom exceptions."""
 
+import pickle
+
 import pytest
 
 from a7 import (
     A7Error,
     AuthenticationError,
+    CircuitOpenError,
     ConnectionError,
+    DeadlineExceededError,
     ForbiddenError,
     NotFoundError,
     RateLimitError,
@@ -81,3 +85,25 @@ def test_custom_messages() -> None:
     error = NotFoundError("Security XYZ not found")
     assert "Security XYZ not found" in str(error)
     assert error.status_code == 404
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        A7Error("Teapot", status_code=418),
+        AuthenticationError("HTTP 401: expired"),
+        NotFoundError(),
+        RateLimitError("HTTP 429: slow down", retry_after=2.5),
+        ServerError("HTTP 503: maintenance", status_code=503),
+        ConnectionError("Request failed after 3 attempts"),
+        CircuitOpenError("/v1/ob", retry_after=12.0),
+        DeadlineExceededError(0.25),
+    ],
+)
+def test_errors_pickle_round_trip(error: A7Error) -> None:
+    """Test every error keeps its type, message and attributes through pickle."""
+    copy = pickle.loads(pickle.dumps(error))
+
+    assert type(copy) is type(error)
+    assert str(copy) == str(error)
+    assert vars(copy) == vars(error)
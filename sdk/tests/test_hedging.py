@@ -0,0 +1,135 @@
+"""Unit tests for hedged requests."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from a7 import A7Client, AsyncA7Client, Deadline, DeadlineExceededError, Hedger
+
+
+class DelayedTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Transport answering each request after the next of a list of delays."""
+
+    def __init__(self, delays: list[float]) -> None:
+        self.delays = delays
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _next_delay(self) -> float:
+        with self._lock:
+            self.calls += 1
+            return self.delays[min(self.calls, len(self.delays)) - 1]
+
+    def _response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, json={"MarketIDs": ["XEUR"], "call": self.calls}, request=request
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        time.sleep(self._next_delay())
+        return self._response(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(self._next_delay())
+        return self._response(request)
+
+
+def test_hedge_beats_slow_request() -> None:
+    """Test a request slower than the hedge delay is answered by the hedge."""
+    transport = DelayedTransport([0.0, 0.0, 1.0, 0.0])
+    hedger = Hedger(budget=1.0, min_samples=2, min_delay=0.02)
+    client = A7Client(token="local", transport=transport, hedging=hedger)
+
+    client.eobi.get_markets()
+    client.eobi.get_markets()
+    start = time.monotonic()
+    assert client.eobi.get_markets() == ["XEUR"]
+
+    assert time.monotonic() - start < 0.5
+    assert transport.calls == 4
+    assert hedger.stats() == {"requests": 3, "hedged": 1, "hedge_wins": 1}
+
+
+def test_hedged_requests_keep_the_deadline() -> None:
+    """Test requests sent on hedging threads still honour the caller's Deadline."""
+    transport = DelayedTransport([0.0])
+    client = A7Client(token="local", transport=transport, hedging=Hedger(budget=1.0, min_samples=1))
+    client.eobi.get_markets()
+
+    with pytest.raises(DeadlineExceededError), Deadline(0):
+        client.eobi.get_markets()
+    assert transport.calls == 1
+
+
+def test_no_hedge_before_min_samples() -> None:
+    """Test families are not hedged until enough response times are known."""
+    transport = DelayedTransport([0.1])
+    hedger = Hedger(budget=1.0, min_samples=5)
+    client = A7Client(token="local", transport=transport, hedging=hedger)
+
+    for _ in range(4):
+        client.eobi.get_markets()
+
+    assert transport.calls == 4
+    assert hedger.stats()["hedged"] == 0
+
+
+def test_budget_caps_hedges() -> None:
+    """Test hedges stay within the budget even when every request is slow."""
+    transport = DelayedTransport([0.0, 0.05])
+    hedger = Hedger(budget=0.1, min_samples=1, max_delay=0.01)
+    client = A7Client(token="local", transport=transport, hedging=hedger)
+
+    for _ in range(20):
+        client.eobi.get_markets()
+
+    stats = hedger.stats()
+    assert 1 <= stats["hedged"] <= 2
+    assert transport.calls == 20 + stats["hedged"]
+
+
+def test_losers_hold_their_hedging_thread() -> None:
+    """Test a hedge is only sent while a hedging thread is free, losers still in flight included."""
+    transport = DelayedTransport([0.0, 1.0, 0.0, 0.2])
+    hedger = Hedger(budget=1.0, min_samples=1, max_delay=0.02, threads=2)
+    client = A7Client(token="local", transport=transport, hedging=hedger)
+
+    client.eobi.get_markets()
+    client.eobi.get_markets()  # hedged; the slow original keeps its thread
+    client.eobi.get_markets()  # takes the last thread, leaving none for a hedge
+
+    assert transport.calls == 4
+    assert hedger.stats() == {"requests": 3, "hedged": 1, "hedge_wins": 1}
+    with pytest.raises(ValueError, match="threads"):
+        Hedger(threads=0)
+
+
+def test_applies_only_to_idempotent_requests() -> None:
+    """Test only GET/HEAD requests of the selected families are hedged."""
+    hedger = Hedger(families={"/v1/ob"})
+    base = "https://a7.deutsche-boerse.com/api"
+
+    assert hedger.applies_to(httpx.Request("GET", f"{base}/v1/ob/XEUR/20240102/1001/1"))
+    assert not hedger.applies_to(httpx.Request("GET", f"{base}/v1/eobi"))
+    assert not hedger.applies_to(httpx.Request("POST", f"{base}/v1/ob/XEUR/20240102/1001/1"))
+    with pytest.raises(ValueError, match="percentile"):
+        Hedger(percentile=0)
+
+
+def test_async_hedge_cancels_loser() -> None:
+    """Test the async client returns the hedge and cancels the slow request."""
+    transport = DelayedTransport([0.0, 5.0, 0.0])
+    hedger = Hedger(budget=1.0, min_samples=1, min_delay=0.02)
+
+    async def run() -> float:
+        async with AsyncA7Client(token="local", transport=transport, hedging=hedger) as client:
+            await client.eobi.get_markets()
+            start = time.monotonic()
+            assert await client.eobi.get_markets() == ["XEUR"]
+            return time.monotonic() - start
+
+    assert asyncio.run(run()) < 1.0
+    assert hedger.stats() == {"requests": 2, "hedged": 1, "hedge_wins": 1}
@@ -0,0 +1,185 @@
+"""Unit tests for instrumentation hooks and the metrics registry."""
+
+import asyncio
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from a7 import A7Client, AsyncA7Client, Instrumentation, MetricsRegistry, NotFoundError, ServerError
+from a7.instrumentation import RequestInfo, RequestMetrics
+from a7.retry import RetryPolicy
+
+# Base URL for mocking - matches DEFAULT_BASE_URL in config.py
+BASE_URL = "https://a7.deutsche-boerse.com/api"
+
+
+def _recording() -> tuple[Instrumentation, list[RequestInfo], list[RequestMetrics]]:
+    started: list[RequestInfo] = []
+    finished: list[RequestMetrics] = []
+    instrumentation = Instrumentation(on_request=started.append, on_response=finished.append)
+    return instrumentation, started, finished
+
+
+@respx.mock
+def test_hooks_receive_endpoint_and_timings(test_token: str) -> None:
+    """Test pre and post hooks describe the request and include decode time."""
+    respx.get(f"{BASE_URL}/v1/eobi/XEUR/20200227").mock(
+        return_value=httpx.Response(200, json={"MarketSegmentIDs": [688]})
+    )
+    instrumentation, started, finished = _recording()
+    client = A7Client(token=test_token, instrumentation=instrumentation)
+
+    assert client.eobi.get_market_segments("XEUR", 20200227) == [688]
+
+    assert [info.resource_method for info in started] == ["eobi.get_market_segments"]
+    (metrics,) = finished
+    assert metrics.endpoint == "/v1/eobi/{market_id}/{date}"
+    assert metrics.family == "/v1/eobi"
+    assert metrics.status_code == 200
+    assert metrics.response_bytes == len(b'{"MarketSegmentIDs":[688]}')
+    assert metrics.decode is not None
+    assert metrics.total >= metrics.wait >= 0.0
+
+
+@respx.mock
+def test_error_response_reported_without_decode(test_token: str) -> None:
+    """Test error responses are reported even though they are never decoded."""
+    respx.get(f"{BASE_URL}/v1/eobi/XEUR").mock(return_value=httpx.Response(404))
+    instrumentation, _, finished = _recording()
+    client = A7Client(token=test_token, instrumentation=instrumentation)
+
+    with pytest.raises(NotFoundError):
+        client.eobi.get_dates("XEUR")
+
+    (metrics,) = finished
+    assert metrics.status_code == 404
+    assert metrics.decode is None
+
+
+@respx.mock
+def test_transport_error_reported(test_token: str) -> None:
+    """Test connection failures reach the post hook with the exception."""
+    respx.get(f"{BASE_URL}/v1/mdp").mock(side_effect=httpx.ConnectError("refused"))
+    instrumentation, _, finished = _recording()
+    client = A7Client(
+        token=test_token, instrumentation=instrumentation, retry=RetryPolicy(max_attempts=1)
+    )
+
+    with pytest.raises(Exception, match="refused"):
+        client.mdp.get_exchanges()
+
+    (metrics,) = finished
+    assert metrics.status_code is None
+    assert isinstance(metrics.error, httpx.ConnectError)
+
+
+@respx.mock
+def test_failing_hook_does_not_break_request(test_token: str) -> None:
+    """Test exceptions raised by hooks are swallowed."""
+    respx.get(f"{BASE_URL}/v1/mdp").mock(
+        return_value=httpx.Response(200, json={"Exchanges": ["XCME"]})
+    )
+
+    def broken(_: RequestInfo) -> None:
+        raise RuntimeError("hook bug")
+
+    client = A7Client(token=test_token, instrumentation=Instrumentation(on_request=broken))
+
+    assert client.mdp.get_exchanges() == ["XCME"]
+
+
+@respx.mock
+def test_registry_counts_and_exports(test_token: str, tmp_path: Path) -> None:
+    """Test the registry aggregates per family and renders Prometheus text."""
+    respx.get(f"{BASE_URL}/v2/rdi/").mock(return_value=httpx.Response(200, json=[]))
+    respx.get(f"{BASE_URL}/v1/eobi").mock(return_value=httpx.Response(503))
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    client = A7Client(
+        token=test_token,
+        instrumentation=Instrumentation(metrics=registry),
+        retry=RetryPolicy(max_attempts=1),
+    )
+
+    client.rdi.get_markets()
+    client.rdi.get_markets()
+    with pytest.raises(ServerError):
+        client.eobi.get_markets()
+
+    snapshot = registry.to_dict()
+    assert snapshot["requests"] == {"/v1/eobi": {"503": 1}, "/v2/rdi": {"200": 2}}
+    assert snapshot["durations"]["/v2/rdi"]["total"]["count"] == 2
+    assert snapshot["durations"]["/v2/rdi"]["total"]["buckets"]["+Inf"] == 2
+    assert "decode" not in snapshot["durations"]["/v1/eobi"]
+
+    path = tmp_path / "a7.prom"
+    previous = os.umask(0o027)
+    try:
+        registry.write_prometheus(path)
+    finally:
+        os.umask(previous)
+    if os.name == "posix":
+        assert path.stat().st_mode & 0o777 == 0o640
+    text = path.read_text()
+    assert 'a7_requests_total{family="/v2/rdi",status="200"} 2' in text
+    assert 'a7_request_duration_seconds_bucket{family="/v2/rdi",phase="total",le="+Inf"} 2' in text
+
+
+@respx.mock
+def test_decode_time_paired_with_its_own_response(test_token: str) -> None:
+    """Test concurrent requests with identical one-byte bodies each get their own decode."""
+    respx.get(f"{BASE_URL}/v1/eobi").mock(return_value=httpx.Response(200, json=1))
+    respx.get(f"{BASE_URL}/v2/rdi/").mock(return_value=httpx.Response(200, json=1))
+    second_received, first_finished = threading.Event(), threading.Event()
+    finished: list[RequestMetrics] = []
+
+    def on_response(metrics: RequestMetrics) -> None:
+        finished.append(metrics)
+        if metrics.resource_method == "eobi.get_markets":
+            first_finished.set()
+
+    def decode(content: bytes) -> Any:
+        # The eobi body is decoded only after the rdi response arrived,
+        # and the rdi body only after the eobi request was reported
+        if threading.current_thread() is second:
+            second_received.set()
+            first_finished.wait(2)
+        else:
+            second_received.wait(2)
+        return {}
+
+    client = A7Client(
+        token=test_token,
+        json_decoder=decode,
+        instrumentation=Instrumentation(on_response=on_response),
+    )
+    first = threading.Thread(target=client.eobi.get_markets)
+    second = threading.Thread(target=client.rdi.get_markets)
+    first.start()
+    second.start()
+    first.join()
+    second.join()
+
+    assert [m.resource_method for m in finished] == ["eobi.get_markets", "rdi.get_markets"]
+    assert all(m.decode is not None for m in finished)
+
+
+@respx.mock
+def test_async_client_hooks(test_token: str) -> None:
+    """Test the async client reports through the same hooks."""
+    respx.get(f"{BASE_URL}/v1/mdp").mock(
+        return_value=httpx.Response(200, json={"Exchanges": ["XCME"]})
+    )
+    instrumentation, _, finished = _recording()
+
+    async def run() -> list[str]:
+        async with AsyncA7Client(token=test_token, instrumentation=instrumentation) as client:
+            return await client.mdp.get_exchanges()
+
+    assert asyncio.run(run()) == ["XCME"]
+    assert [metrics.resource_method for metrics in finished] == ["mdp.get_exchanges"]
+    assert finished[0].decode is not None
@@ -4,7 +4,7 @@ import httpx
 import pytest
 import respx
 
-from a7 import A7Client
+from a7 import A7Client, AuthenticationError, NotFoundError
 
 # Base URL for mocking - matches DEFAULT_BASE_URL in config.py
 BASE_URL = "https://a7.deutsche-boerse.com/api"
@@ -93,7 +93,7 @@ def test_get_mdp_message_not_found(mock_client: A7Client) -> None:
         return_value=httpx.Response(404, json={"error": "Message not found"})
     )
 
-    with pytest.raises(httpx.HTTPStatusError):
+    with pytest.raises(NotFoundError):
         mock_client.mdp.get_message(
             exchange="NYUM",
             date=20220915,
@@ -110,7 +110,7 @@ def test_get_mdp_message_auth_error(mock_client: A7Client) -> None:
         return_value=httpx.Response(401, json={"error": "Unauthorized"})
     )
 
-    with pytest.raises(httpx.HTTPStatusError):
+    with pytest.raises(AuthenticationError):
         mock_client.mdp.get_message(
             exchange="NYUM",
             date=20220915,
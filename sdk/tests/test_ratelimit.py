@@ -0,0 +1,121 @@
+"""Unit tests for the client-side rate limiter."""
+
+import multiprocessing
+import pickle
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from a7 import A7Client, FileBucket, RateLimiter
+from a7.endpoints import endpoint_family
+from a7.ratelimit import LocalBucket
+
+# Base URL for mocking - matches DEFAULT_BASE_URL in config.py
+BASE_URL = "https://a7.deutsche-boerse.com/api"
+
+
+def _request(path: str, **params: str | int) -> httpx.Request:
+    return httpx.Request("GET", f"{BASE_URL}{path}", params=params)
+
+
+@pytest.mark.parametrize(
+    ("path", "family"),
+    [
+        ("/api/v1/eobi/XEUR/20200227/688", "/v1/eobi"),
+        ("/api/v1/ob/XETR/20230804/52885/2504978", "/v1/ob"),
+        ("/api/v2/rdi/", "/v2/rdi"),
+        ("/v2/sd/XCME/20200106/GE", "/v2/sd"),
+        ("/api/v1/simulation/auction/XETR/", "/v1/simulation/auction"),
+        ("/api/v1/insights/por/FOAT/202406", "/v1/insights/por"),
+    ],
+)
+def test_endpoint_family(path: str, family: str) -> None:
+    """Test request paths map to their endpoint family."""
+    assert endpoint_family(path) == family
+
+
+def test_local_bucket_allows_burst_then_waits() -> None:
+    """Test burst is granted immediately and further calls wait 1/rate each."""
+    bucket = LocalBucket()
+
+    waits = [bucket.reserve(1, rate=10.0, burst=3.0) for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(0.1, abs=0.01)
+    assert waits[4] == pytest.approx(0.2, abs=0.01)
+
+
+def test_weights_per_endpoint_family() -> None:
+    """Test fixed and callable weights are applied by endpoint family."""
+    limiter = RateLimiter(
+        rate=100,
+        weights={
+            "/v1/eobi": 0.5,
+            "/v1/ob": lambda r: 1 + int(r.url.params.get("limit", 1)) / 1000,
+        },
+    )
+
+    assert limiter.cost(_request("/v1/eobi")) == 0.5
+    assert limiter.cost(_request("/v1/ob/XETR/20230804/52885/2504978", limit=10000)) == 11.0
+    assert limiter.cost(_request("/v2/rdi/")) == 1.0
+
+
+def test_invalid_rate() -> None:
+    """Test non-positive rates are rejected."""
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+
+
+def test_file_bucket_shared_between_instances(tmp_path: Path) -> None:
+    """Test two buckets on the same file draw from one budget."""
+    path = tmp_path / "bucket"
+    first = FileBucket(path)
+    second = pickle.loads(pickle.dumps(FileBucket(path)))
+
+    assert first.reserve(1, rate=1.0, burst=2.0) == 0.0
+    assert second.reserve(1, rate=1.0, burst=2.0) == 0.0
+    assert first.reserve(1, rate=1.0, burst=2.0) == pytest.approx(1.0, abs=0.05)
+
+
+def test_file_bucket_needs_fcntl(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a platform without fcntl is reported as a RuntimeError."""
+    monkeypatch.setattr("a7.ratelimit.fcntl", None)
+    with pytest.raises(RuntimeError, match="fcntl"):
+        FileBucket(tmp_path / "bucket")
+
+
+def _reserve_in_child(path: str, queue: "multiprocessing.Queue[float]") -> None:
+    queue.put(FileBucket(path).reserve(1, rate=1.0, burst=1.0))
+
+
+def test_file_bucket_across_processes(tmp_path: Path) -> None:
+    """Test a child process sees tokens taken by the parent."""
+    path = str(tmp_path / "bucket")
+    FileBucket(path).reserve(1, rate=1.0, burst=1.0)
+
+    ctx = multiprocessing.get_context("spawn")
+    queue: multiprocessing.Queue[float] = ctx.Queue()
+    process = ctx.Process(target=_reserve_in_child, args=(path, queue))
+    process.start()
+    process.join(timeout=30)
+
+    assert queue.get(timeout=5) > 0.0
+
+
+@respx.mock
+def test_client_waits_for_tokens(test_token: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test client requests are paced by the shared limiter."""
+    sleeps: list[float] = []
+    monkeypatch.setattr("a7.ratelimit.time.sleep", sleeps.append)
+    respx.get(f"{BASE_URL}/v1/eobi").mock(
+        return_value=httpx.Response(200, json={"MarketIDs": ["XEUR"]})
+    )
+    client = A7Client(token=test_token, rate_limit=RateLimiter(rate=2, burst=1))
+
+    for _ in range(3):
+        client.eobi.get_markets()
+
+    assert len(sleeps) == 2
+    assert sleeps[0] == pytest.approx(0.5, abs=0.05)
@@ -4,7 +4,7 @@ import httpx
 import pytest
 import respx
 
-from a7 import A7Client
+from a7 import A7Client, NotFoundError
 
 # Base URL for mocking - matches DEFAULT_BASE_URL in config.py
 BASE_URL = "https://a7.deutsche-boerse.com/api"
@@ -122,5 +122,5 @@ def test_get_instrument_snapshot_not_found(mock_client: A7Client) -> None:
         return_value=httpx.Response(404, json={"error": "Snapshot not found"})
     )
 
-    with pytest.raises(httpx.HTTPStatusError):
+    with pytest.raises(NotFoundError):
         mock_client.rdi.get_instrument_snapshot("XETR", 20201104, 52162, 9999999, 106)
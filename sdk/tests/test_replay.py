@@ -0,0 +1,106 @@
+"""Unit tests for the record/replay transports."""
+
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from a7 import A7Client, AsyncA7Client, NotFoundError, ServerError
+from a7.retry import RetryPolicy
+from a7.testing import Archive, RecordingTransport, ReplayMissError, ReplayTransport
+
+# Base URL for mocking - matches DEFAULT_BASE_URL in config.py
+BASE_URL = "https://a7.deutsche-boerse.com/api"
+
+
+def _fake_a7(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/api/v1/eobi/XEUR/20200227":
+        return httpx.Response(200, json={"MarketSegmentIDs": [688, 1176]})
+    if request.url.path == "/api/v1/ob/XEUR/20200227/688/4128839":
+        return httpx.Response(200, json=[{"Levels": int(request.url.params["levels"])}])
+    return httpx.Response(404)
+
+
+def _record(path: Path) -> None:
+    archive = Archive(path)
+    transport = RecordingTransport(archive, httpx.MockTransport(_fake_a7))
+    with A7Client(token="live", transport=transport) as client:
+        client.eobi.get_market_segments("XEUR", 20200227)
+        client.orderbook.get_t7("XEUR", 20200227, 688, 4128839, levels=5)
+
+
+def test_record_then_replay(tmp_path: Path) -> None:
+    """Test a recorded session is served back identically without the original transport."""
+    path = tmp_path / "session.a7rec"
+    _record(path)
+
+    recordings = list(Archive(path))
+    assert [r.status for r in recordings] == [200, 200]
+    assert not any("live" in str(r.headers) for r in recordings)
+
+    with A7Client(token="offline", transport=ReplayTransport(Archive(path))) as client:
+        assert client.eobi.get_market_segments("XEUR", 20200227) == [688, 1176]
+        assert client.orderbook.get_t7("XEUR", 20200227, 688, 4128839, levels=5) == [{"Levels": 5}]
+
+
+def test_strict_replay_rejects_unknown_requests(tmp_path: Path) -> None:
+    """Test unrecorded requests fail loudly, or answer 404 when not strict."""
+    path = tmp_path / "session.a7rec"
+    _record(path)
+    no_retry = RetryPolicy(max_attempts=1)
+
+    strict = A7Client(token="x", transport=ReplayTransport(Archive(path)), retry=no_retry)
+    with pytest.raises(ReplayMissError):
+        strict.eobi.get_markets()
+
+    lenient = A7Client(
+        token="x", transport=ReplayTransport(Archive(path), strict=False), retry=no_retry
+    )
+    with pytest.raises(NotFoundError):
+        lenient.eobi.get_markets()
+
+
+def test_repeated_recordings_served_in_order(tmp_path: Path) -> None:
+    """Test retries replay as recorded: first the 503, then the success."""
+    responses = iter([httpx.Response(503), httpx.Response(200, json={"MarketIDs": ["XEUR"]})])
+    path = tmp_path / "retry.a7rec"
+    retry = RetryPolicy(backoff_factor=0)
+    recorder = RecordingTransport(Archive(path), httpx.MockTransport(lambda _: next(responses)))
+    with A7Client(token="x", transport=recorder, retry=retry) as client:
+        client.eobi.get_markets()
+
+    replay = ReplayTransport(Archive(path))
+    client = A7Client(token="x", transport=replay, retry=RetryPolicy(max_attempts=1))
+
+    with pytest.raises(ServerError):
+        client.eobi.get_markets()
+    assert client.eobi.get_markets() == ["XEUR"]
+    assert client.eobi.get_markets() == ["XEUR"]
+
+
+def test_simulated_latency_and_bandwidth(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test replay waits latency plus body size over bandwidth."""
+    path = tmp_path / "session.a7rec"
+    _record(path)
+    sleeps: list[float] = []
+    monkeypatch.setattr("a7.testing.replay.time.sleep", sleeps.append)
+    body_size = len(b'{"MarketSegmentIDs":[688,1176]}')
+
+    replay = ReplayTransport(Archive(path), latency=0.05, bandwidth=1000.0)
+    A7Client(token="x", transport=replay).eobi.get_market_segments("XEUR", 20200227)
+
+    assert sleeps == [pytest.approx(0.05 + body_size / 1000.0)]
+
+
+def test_async_replay(tmp_path: Path) -> None:
+    """Test the async client replays the same archive."""
+    path = tmp_path / "session.a7rec"
+    _record(path)
+
+    async def run() -> list[int]:
+        transport = ReplayTransport(Archive(path))
+        async with AsyncA7Client(token="x", transport=transport) as client:
+            return await client.eobi.get_market_segments("XEUR", 20200227)
+
+    assert asyncio.run(run()) == [688, 1176]
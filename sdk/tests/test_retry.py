@@ -0,0 +1,168 @@
+"""Unit tests for retry policy and retry transport."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from a7 import (
+    A7Client,
+    AsyncA7Client,
+    AuthenticationError,
+    NotFoundError,
+    RateLimitError,
+    RetryPolicy,
+    ServerError,
+)
+from a7.errors import ConnectionError
+from a7.retry import parse_retry_after
+
+# Base URL for mocking - matches DEFAULT_BASE_URL in config.py
+BASE_URL = "https://a7.deutsche-boerse.com/api"
+
+# No sleeping between attempts in unit tests
+FAST_RETRY = RetryPolicy(max_attempts=3, backoff_factor=0.0, respect_retry_after=False)
+
+
+def test_backoff_grows_exponentially_and_is_capped() -> None:
+    """Test backoff without jitter doubles per attempt up to max_backoff."""
+    policy = RetryPolicy(backoff_factor=0.5, max_backoff=3.0, jitter=False)
+
+    assert policy.backoff(1) == 0.5
+    assert policy.backoff(2) == 1.0
+    assert policy.backoff(3) == 2.0
+    assert policy.backoff(4) == 3.0
+
+
+def test_backoff_jitter_stays_within_bounds() -> None:
+    """Test jittered backoff never exceeds the deterministic delay."""
+    policy = RetryPolicy(backoff_factor=1.0, max_backoff=10.0)
+
+    for attempt in range(1, 6):
+        assert 0.0 <= policy.backoff(attempt) <= min(10.0, 2 ** (attempt - 1))
+
+
+def test_parse_retry_after_seconds_and_date() -> None:
+    """Test Retry-After header in delta-seconds and HTTP-date form."""
+    seconds = httpx.Response(429, headers={"Retry-After": "7"})
+    past_date = httpx.Response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    garbage = httpx.Response(429, headers={"Retry-After": "soon"})
+
+    assert parse_retry_after(seconds) == 7.0
+    assert parse_retry_after(past_date) == 0.0
+    assert parse_retry_after(garbage) is None
+    assert parse_retry_after(httpx.Response(429)) is None
+
+
+def test_delay_honors_retry_after() -> None:
+    """Test Retry-After raises the delay above the backoff, capped at max_backoff."""
+    policy = RetryPolicy(backoff_factor=0.1, max_backoff=5.0, jitter=False)
+
+    assert policy.delay_for(1, httpx.Response(429, headers={"Retry-After": "2"})) == 2.0
+    assert policy.delay_for(1, httpx.Response(429, headers={"Retry-After": "60"})) == 5.0
+
+
+@respx.mock
+def test_get_retried_until_success(test_token: str) -> None:
+    """Test GET is retried on 503 and 429 and returns the eventual success."""
+    route = respx.get(f"{BASE_URL}/v1/eobi").mock(
+        side_effect=[
+            httpx.Response(503),
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"MarketIDs": ["XEUR"]}),
+        ]
+    )
+    client = A7Client(token=test_token, retry=FAST_RETRY)
+
+    assert client.eobi.get_markets() == ["XEUR"]
+    assert route.call_count == 3
+
+
+@respx.mock
+def test_exhausted_retries_raise_typed_errors(test_token: str) -> None:
+    """Test typed errors are raised once attempts run out."""
+    respx.get(f"{BASE_URL}/v1/eobi").mock(return_value=httpx.Response(503))
+    respx.get(f"{BASE_URL}/v1/mdp").mock(
+        return_value=httpx.Response(429, headers={"Retry-After": "0"})
+    )
+    client = A7Client(token=test_token, retry=FAST_RETRY)
+
+    with pytest.raises(ServerError) as server_error:
+        client.eobi.get_markets()
+    with pytest.raises(RateLimitError) as rate_limit_error:
+        client.mdp.get_exchanges()
+
+    assert server_error.value.status_code == 503
+    assert rate_limit_error.value.retry_after == 0.0
+
+
+@respx.mock
+def test_connection_errors_retried_then_typed(test_token: str) -> None:
+    """Test transport errors are retried and surface as ConnectionError."""
+    route = respx.get(f"{BASE_URL}/v1/eobi").mock(side_effect=httpx.ConnectError("boom"))
+    client = A7Client(token=test_token, retry=FAST_RETRY)
+
+    with pytest.raises(ConnectionError):
+        client.eobi.get_markets()
+    assert route.call_count == 3
+
+
+@respx.mock
+def test_non_idempotent_methods_not_retried(test_token: str) -> None:
+    """Test PATCH is sent once and its error still maps to a typed exception."""
+    route = respx.patch(f"{BASE_URL}/v1/precalc/lp124/job/activate").mock(
+        return_value=httpx.Response(503)
+    )
+    client = A7Client(token=test_token, retry=FAST_RETRY)
+
+    with pytest.raises(ServerError):
+        client.precalc.activate("lp124", "job")
+    assert route.call_count == 1
+
+
+@respx.mock
+def test_non_retryable_status_not_retried(test_token: str) -> None:
+    """Test 404 is not retried and raises NotFoundError."""
+    route = respx.get(f"{BASE_URL}/v1/eobi").mock(return_value=httpx.Response(404))
+    client = A7Client(token=test_token, retry=FAST_RETRY)
+
+    with pytest.raises(NotFoundError):
+        client.eobi.get_markets()
+    assert route.call_count == 1
+
+
+@respx.mock
+@pytest.mark.parametrize(
+    ("status", "error"), [(401, AuthenticationError), (404, NotFoundError), (503, ServerError)]
+)
+def test_error_responses_typed_with_retries_disabled(
+    test_token: str, status: int, error: type[Exception]
+) -> None:
+    """Test every error response maps to its a7.errors type, whether or not it was retried."""
+    respx.get(f"{BASE_URL}/v1/eobi").mock(return_value=httpx.Response(status))
+
+    with pytest.raises(error):
+        A7Client(token=test_token, retry=RetryPolicy(max_attempts=1)).eobi.get_markets()
+
+    async def fetch() -> None:
+        async with AsyncA7Client(token=test_token, retry=RetryPolicy(max_attempts=1)) as client:
+            await client.eobi.get_markets()
+
+    with pytest.raises(error):
+        asyncio.run(fetch())
+
+
+@respx.mock
+def test_async_client_retries(test_token: str) -> None:
+    """Test async client shares the same retry behaviour."""
+    route = respx.get(f"{BASE_URL}/v1/eobi").mock(
+        side_effect=[httpx.Response(502), httpx.Response(200, json={"MarketIDs": ["XETR"]})]
+    )
+
+    async def run() -> list[str]:
+        async with AsyncA7Client(token=test_token, retry=FAST_RETRY) as client:
+            return await client.eobi.get_markets()
+
+    assert asyncio.run(run()) == ["XETR"]
+    assert route.call_count == 2
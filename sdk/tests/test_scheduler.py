@@ -0,0 +1,158 @@
+"""Unit tests for the priority-aware request scheduler."""
+
+import asyncio
+import threading
+import time
+from typing import Callable, Optional
+
+import httpx
+import pytest
+
+from a7 import A7Client, Deadline, DeadlineExceededError, Hedger, Scheduler, priority
+
+
+class GatedTransport(httpx.BaseTransport):
+    """Transport recording request paths, holding requests until the gate opens."""
+
+    def __init__(self) -> None:
+        self.gate = threading.Event()
+        self.paths: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.paths.append(request.url.path)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.gate.wait(5)
+        with self._lock:
+            self.in_flight -= 1
+        return httpx.Response(200, json={"MarketIDs": [], "Exchanges": []}, request=request)
+
+
+def _wait_for(condition: Callable[[], bool]) -> None:
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_concurrency_budget() -> None:
+    """Test no more requests are in flight than the scheduler allows."""
+    transport = GatedTransport()
+    transport.gate.set()
+    scheduler = Scheduler(concurrency=3)
+    client = A7Client(token="local", transport=transport, scheduler=scheduler)
+
+    results = client.gather([("eobi.get_markets", {})] * 30, max_concurrency=10)
+
+    assert all(result.ok for result in results)
+    assert transport.max_in_flight <= 3
+    assert scheduler.stats() == {"active": 0, "interactive": 0, "normal": 0, "bulk": 0}
+
+
+def test_interactive_jumps_bulk_queue() -> None:
+    """Test a waiting interactive request is sent before queued bulk requests."""
+    transport = GatedTransport()
+    scheduler = Scheduler(concurrency=1)
+    client = A7Client(token="local", transport=transport, scheduler=scheduler)
+
+    def backfill() -> None:
+        with priority("bulk"):
+            client.gather([("eobi.get_markets", {})] * 5, max_concurrency=5)
+
+    bulk = threading.Thread(target=backfill)
+    bulk.start()
+    _wait_for(lambda: scheduler.stats()["bulk"] == 4)
+
+    def interactive() -> None:
+        with priority("interactive"):
+            client.mdp.get_exchanges()
+
+    lookup = threading.Thread(target=interactive)
+    lookup.start()
+    _wait_for(lambda: scheduler.stats()["interactive"] == 1)
+    transport.gate.set()
+    bulk.join()
+    lookup.join()
+
+    assert transport.paths[1] == "/api/v1/mdp"
+    assert transport.paths.count("/api/v1/eobi") == 5
+
+
+def test_weighted_fair_order() -> None:
+    """Test waiting classes are served in proportion to their weights."""
+    scheduler = Scheduler(concurrency=1, weights={"fast": 3, "slow": 1}, default="slow")
+    order: list[str] = []
+
+    async def request(name: str) -> None:
+        await scheduler.acquire_async(name)
+        order.append(name)
+        scheduler.release()
+
+    async def run() -> None:
+        await scheduler.acquire_async()
+        tasks = [asyncio.ensure_future(request(name)) for name in ["slow", "fast"] * 6]
+        await asyncio.sleep(0)
+        scheduler.release()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+
+    assert order[:8].count("fast") == 6
+    assert order[8:] == ["slow"] * 4
+
+
+def test_deadline_while_queued() -> None:
+    """Test a queued request gives up when the active deadline passes."""
+    scheduler = Scheduler(concurrency=1)
+    scheduler.acquire()
+
+    with Deadline(0.05), pytest.raises(DeadlineExceededError):
+        scheduler.acquire()
+
+    assert scheduler.stats()["normal"] == 0
+    scheduler.release()
+    assert scheduler.stats()["active"] == 0
+
+
+class RecordingScheduler(Scheduler):
+    """Scheduler recording the priority class of every request it admits."""
+
+    def __init__(self) -> None:
+        super().__init__(concurrency=4)
+        self.classes: list[str] = []
+
+    def acquire(self, name: Optional[str] = None) -> None:
+        self.classes.append(self._class_of(name))
+        super().acquire(name)
+
+
+def test_priority_survives_hedging_threads() -> None:
+    """Test hedged sync requests reach the scheduler with the caller's priority."""
+    scheduler = RecordingScheduler()
+    transport = httpx.MockTransport(lambda r: httpx.Response(200, json={"MarketIDs": []}))
+    client = A7Client(
+        token="local",
+        transport=transport,
+        scheduler=scheduler,
+        hedging=Hedger(budget=1.0, min_samples=1),
+    )
+    client.eobi.get_markets()
+
+    with priority("interactive"):
+        client.eobi.get_markets()
+    assert scheduler.classes == ["normal", "interactive"]
+
+
+def test_invalid_configuration() -> None:
+    """Test unknown priority classes and bad settings are rejected."""
+    scheduler = Scheduler()
+    with priority("urgent"), pytest.raises(ValueError, match="urgent"):
+        scheduler.acquire()
+    with pytest.raises(ValueError, match="concurrency"):
+        Scheduler(concurrency=0)
+    with pytest.raises(ValueError, match="default"):
+        Scheduler(weights={"bulk": 1})
@@ -0,0 +1,113 @@
+"""Unit tests for the multi-process sharded fetcher."""
+
+import time
+from array import array
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from a7 import A7Client, Deadline, DeadlineExceededError, NotFoundError, RateLimiter
+from a7.retry import RetryPolicy
+from a7.sharding import ShardedFetcher, time_windows
+from a7.testing import MarketProfile, StandInServer, StandInTransport
+
+MARKET, DATE, SEGMENT = "XEUR", 20240102, 1001
+
+
+@pytest.fixture(scope="module")
+def base_url() -> Iterator[str]:
+    """Stand-in server reachable from the worker processes."""
+    with StandInServer(StandInTransport(MarketProfile(markets=(MARKET,)))) as server:
+        yield server.base_url
+
+
+def _book_call(security_id: int) -> tuple[str, dict[str, Any]]:
+    return "orderbook.get_t7", {
+        "market_id": MARKET,
+        "date": DATE,
+        "market_segment_id": SEGMENT,
+        "security_id": security_id,
+        "limit": 5,
+    }
+
+
+def _timestamps(books: list[dict[str, Any]]) -> "array[int]":
+    """Reducer keeping only the timestamps of the books, as a compact array."""
+    return array("q", [int(book["Timestamp"]) for book in books])
+
+
+def test_gather_reduces_in_workers(base_url: str) -> None:
+    """Test results come back reduced, in order, with portable per-item errors."""
+    securities = [SEGMENT * 1_000_000 + n for n in range(1, 11)]
+    calls = [_book_call(security) for security in [*securities, 9]]
+
+    with ShardedFetcher(
+        token="local",
+        base_url=base_url,
+        processes=2,
+        threads=2,
+        chunk_size=3,
+        retry=RetryPolicy(max_attempts=1),
+    ) as fetcher:
+        results = fetcher.gather(calls, reducer=_timestamps)
+
+    client = A7Client(token="local", base_url=base_url)
+    expected: list[array[int]] = []
+    for _, kwargs in calls[:-1]:
+        books = client.orderbook.get_t7(**kwargs)
+        assert isinstance(books, list)
+        expected.append(_timestamps(books))
+    assert [result.index for result in results] == list(range(11))
+    assert [result.value for result in results[:-1]] == expected
+    assert isinstance(results[-1].error, NotFoundError)
+
+
+def test_rate_limit_shared_by_workers(base_url: str) -> None:
+    """Test a process-local rate limiter is turned into one shared bucket."""
+    limiter = RateLimiter(rate=20, burst=1)
+    fetcher = ShardedFetcher(
+        token="local", base_url=base_url, processes=2, chunk_size=1, rate_limit=limiter
+    )
+    state = fetcher._tempdir
+    assert state is not None
+
+    start = time.perf_counter()
+    results = list(fetcher.map(("eobi.get_markets", {}) for _ in range(11)))
+    elapsed = time.perf_counter() - start
+    fetcher.close()
+
+    assert all(result.ok for result in results)
+    assert elapsed >= 0.45  # 10 refills at 20/s, whichever worker sends them
+    assert not state.exists()
+
+
+def test_calls_left_at_the_deadline_are_reported(base_url: str) -> None:
+    """Test chunks not started before the deadline come back as DeadlineExceededError results."""
+    calls = [("eobi.get_markets", {}) for _ in range(12)]
+    with ShardedFetcher(token="local", base_url=base_url, processes=1, chunk_size=2) as fetcher:
+        results = fetcher.gather(calls, deadline=Deadline(0))
+
+    assert [result.index for result in results] == list(range(12))
+    assert all(result.method == "eobi.get_markets" for result in results)
+    assert all(isinstance(result.error, DeadlineExceededError) for result in results)
+
+
+def test_invalid_calls_rejected(base_url: str) -> None:
+    """Test bound methods cannot be sent to worker processes."""
+    client = A7Client(token="local", base_url=base_url)
+    with (
+        ShardedFetcher(token="local", base_url=base_url, processes=1) as fetcher,
+        pytest.raises(ValueError, match="by name"),
+    ):
+        fetcher.gather([(client.eobi.get_markets, {})])
+    with pytest.raises(ValueError, match="at least 1"):
+        ShardedFetcher(token="local", processes=0)
+
+
+def test_time_windows() -> None:
+    """Test time ranges split into inclusive, non-overlapping windows."""
+    assert time_windows(0, 250, 100) == [("0", "99"), ("100", "199"), ("200", "250")]
+    assert time_windows(5, 5, 10) == [("5", "5")]
+    with pytest.raises(ValueError, match="positive"):
+        time_windows(0, 1, 0)
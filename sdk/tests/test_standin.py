@@ -0,0 +1,139 @@
+"""Unit tests for the local A7 stand-in."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from a7 import A7Client, AsyncA7Client, ServerError
+from a7.retry import RetryPolicy
+from a7.testing import (
+    FaultProfile,
+    MarketProfile,
+    StandInServer,
+    StandInTransport,
+    SyntheticMarket,
+)
+
+PROFILE = MarketProfile(
+    markets=("XEUR",),
+    dates=(20240102,),
+    segments_per_market=2,
+    securities_per_segment=3,
+    messages_per_second=20.0,
+    session_seconds=60,
+    book_depth=5,
+)
+
+
+def test_eobi_hierarchy_and_paging(test_token: str) -> None:
+    """Test the EOBI hierarchy is served with the configured volume and paging."""
+    client = A7Client(token=test_token, transport=StandInTransport(PROFILE))
+    eobi = client.eobi
+
+    assert eobi.get_markets() == ["XEUR"]
+    assert eobi.get_market_segments("XEUR", 20240102) == [1001, 1002]
+    assert eobi.get_securities("XEUR", 20240102, 1002) == [1002000001, 1002000002, 1002000003]
+
+    times = eobi.get_transact_times("XEUR", 20240102, 1001, 1001000001)
+    assert len(times) == 600
+    assert times == sorted(times, key=int)
+    page = eobi.get_transact_times("XEUR", 20240102, 1001, 1001000001, limit=10, from_time=times[5])
+    assert page == times[5:15]
+
+    msg_seq_nums = [
+        seq
+        for applseq, transact_time in enumerate(times[:50], start=1)
+        for seq in eobi.get_msg_seq_nums("XEUR", 20240102, 1001, 1001000001, transact_time, applseq)
+    ]
+    assert msg_seq_nums == list(range(1, len(msg_seq_nums) + 1))
+
+
+def test_order_book_matches_message_stream(test_token: str) -> None:
+    """Test get_t7 returns the book built by the EOBI messages up to that time."""
+    client = A7Client(token=test_token, transport=StandInTransport(PROFILE))
+    times = client.eobi.get_transact_times("XEUR", 20240102, 1001, 1001000001, limit=80)
+
+    resting: dict[tuple[int, int], int] = {}
+    for applseq, transact_time in enumerate(times, start=1):
+        (packet,) = client.eobi.get_applseq_nums(
+            "XEUR", 20240102, 1001, 1001000001, transact_time, mode="detailed"
+        )
+        assert isinstance(packet, dict)
+        assert packet["PacketHeader"]["ApplSeqNum"] == applseq
+        for message in packet["Messages"]:
+            details = message.get("OrderDetails", message)
+            key = (details["Side"], details["Price"])
+            if message["MessageHeader"]["TemplateID"] == 13100:
+                resting[key] = resting.get(key, 0) + details["DisplayQty"]
+            elif message["MessageHeader"]["TemplateID"] == 13101:
+                resting[key] += details["DisplayQty"] - message["PrevDisplayQty"]
+            else:
+                resting[key] -= details.get("DisplayQty", message.get("LastQty"))
+
+    book = client.orderbook.get_t7("XEUR", 20240102, 1001, 1001000001, from_time=times[-1])
+    assert isinstance(book, dict)
+    assert book["Timestamp"] == times[-1]
+    levels = {
+        (side, int(level["Price"])): int(level["Quantity"])
+        for side, name in ((1, "Buy"), (2, "Sell"))
+        for level in book[name]
+    }
+    assert levels == {key: qty for key, qty in resting.items() if qty}
+
+
+def test_injected_faults() -> None:
+    """Test 429s carry Retry-After, server errors use the configured status."""
+    throttled = StandInTransport(PROFILE, FaultProfile(throttle_rate=1.0, retry_after=2.5))
+    with httpx.Client(transport=throttled, headers={"Authorization": "Bearer x"}) as http:
+        response = http.get("https://a7.local/api/v1/eobi")
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "2.5"
+
+    failing = StandInTransport(PROFILE, FaultProfile(error_rate=1.0, error_status=502))
+    client = A7Client(
+        token="x", transport=failing, retry=RetryPolicy(max_attempts=2, backoff_factor=0)
+    )
+    with pytest.raises(ServerError):
+        client.eobi.get_markets()
+    assert failing.statuses == {502: 2}
+
+    limited = StandInTransport(PROFILE, FaultProfile(max_requests_per_second=2))
+    with httpx.Client(transport=limited, headers={"Authorization": "Bearer x"}) as http:
+        statuses = [http.get("https://a7.local/api/v1/eobi").status_code for _ in range(5)]
+    assert statuses[:2] == [200, 200]
+    assert 429 in statuses
+
+
+def test_rejects_missing_token_and_unknown_ids() -> None:
+    """Test requests without a token get 401 and unknown identifiers 404."""
+    with httpx.Client(transport=StandInTransport(PROFILE)) as http:
+        assert http.get("https://a7.local/api/v1/eobi").status_code == 401
+        http.headers["Authorization"] = "Bearer x"
+        assert http.get("https://a7.local/api/v1/eobi/XETR").status_code == 404
+        assert http.get("https://a7.local/api/v1/eobi/XEUR/20240102/9999").status_code == 404
+        assert http.get("https://a7.local/api/v1/precalc").status_code == 404
+
+
+def test_server_over_http(test_token: str) -> None:
+    """Test the threaded server answers real HTTP requests from a client."""
+    with (
+        StandInServer(StandInTransport(PROFILE)) as server,
+        A7Client(token=test_token, base_url=server.base_url) as client,
+    ):
+        assert client.rdi.get_market_segments("XEUR", 20240102) == [1001, 1002]
+        csv = client.dataset.get_data("a7", "TRADES", limit=2, format="csv")
+        assert isinstance(csv, str)
+        assert csv.count("\n") == 3
+
+
+def test_async_client(test_token: str) -> None:
+    """Test the async client is served by the same transport."""
+    expected = SyntheticMarket(PROFILE).securities("XEUR", 20240102, 1001)
+
+    async def run() -> list[int]:
+        transport = StandInTransport(PROFILE)
+        async with AsyncA7Client(token=test_token, transport=transport) as client:
+            return await client.eobi.get_securities("XEUR", 20240102, 1001)
+
+    assert asyncio.run(run()) == expected
@@ -0,0 +1,129 @@
+"""Unit tests for timeout profiles and deadlines."""
+
+import asyncio
+import pickle
+import time
+
+import httpx
+import pytest
+
+from a7 import A7Client, AsyncA7Client, Deadline, DeadlineExceededError, TimeoutProfile
+from a7.retry import RetryPolicy
+
+BASE_URL = "https://a7.deutsche-boerse.com/api"
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Transport recording the timeouts of each request, answering after a delay."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.timeouts: list[dict[str, float]] = []
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.timeouts.append(request.extensions["timeout"])
+        time.sleep(self.delay)
+        return httpx.Response(200, json={"MarketIDs": ["XEUR"]}, request=request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.timeouts.append(request.extensions["timeout"])
+        await asyncio.sleep(self.delay)
+        return httpx.Response(200, json={"MarketIDs": ["XEUR"]}, request=request)
+
+
+def test_most_specific_key_wins() -> None:
+    """Test resource method keys beat resource keys, which beat family keys."""
+    profile = TimeoutProfile(
+        {
+            "rdi.get_markets": 2.0,
+            "algo": httpx.Timeout(600.0, connect=5.0),
+            "/v1/algo": 1.0,
+            "dataset.get_data": lambda r: 900.0 if r.url.params.get("format") == "csv" else 60.0,
+            "/v1/ob": 10.0,
+        }
+    )
+
+    def timeout(path: str, **params: str) -> "httpx.Timeout | None":
+        return profile.timeout_for(httpx.Request("GET", f"{BASE_URL}{path}", params=params))
+
+    assert timeout("/v2/rdi/") == httpx.Timeout(2.0)
+    assert timeout("/v2/rdi/XEUR/20240102/") is None
+    assert timeout("/v1/algo/owner/top_level/run") == httpx.Timeout(600.0, connect=5.0)
+    assert timeout("/v1/dataset/owner/trades/data", format="csv") == httpx.Timeout(900.0)
+    assert timeout("/v1/dataset/owner/trades/data", format="json") == httpx.Timeout(60.0)
+    assert timeout("/v1/ob/XEUR/20240102/1001/1001000001", indicatives="false") == httpx.Timeout(
+        10.0
+    )
+
+
+def test_client_applies_profile() -> None:
+    """Test profile timeouts replace the client timeout for matching requests only."""
+    transport = RecordingTransport()
+    profile = TimeoutProfile({"rdi.get_markets": httpx.Timeout(2.0, connect=0.5)})
+    client = A7Client(token="local", timeout=30.0, timeouts=profile, transport=transport)
+
+    client.rdi.get_markets()
+    client.eobi.get_markets()
+
+    assert transport.timeouts[0] == {"connect": 0.5, "read": 2.0, "write": 2.0, "pool": 2.0}
+    assert transport.timeouts[1] == {"connect": 30.0, "read": 30.0, "write": 30.0, "pool": 30.0}
+
+
+def test_deadline_cuts_timeouts_and_stops_requests() -> None:
+    """Test requests under a deadline get the time left and none is sent after it."""
+    transport = RecordingTransport()
+    client = A7Client(token="local", transport=transport, retry=RetryPolicy(max_attempts=1))
+
+    with Deadline(5.0) as deadline:
+        client.eobi.get_markets()
+        with Deadline(60.0):
+            client.eobi.get_markets()
+        deadline.expires_at = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            client.eobi.get_markets()
+    client.eobi.get_markets()
+
+    assert len(transport.timeouts) == 3
+    assert all(value <= 5.0 for value in transport.timeouts[0].values())
+    assert all(value <= 5.0 for value in transport.timeouts[1].values())
+    assert transport.timeouts[2]["read"] == 30.0
+
+
+def test_gather_stops_at_deadline() -> None:
+    """Test a batch sends no new calls once its deadline has passed but reports each one."""
+    transport = RecordingTransport(delay=0.05)
+    client = A7Client(token="local", transport=transport)
+
+    start = time.monotonic()
+    results = client.gather(
+        (("eobi.get_markets", {}) for _ in range(100)), max_concurrency=2, deadline=Deadline(0.2)
+    )
+
+    assert time.monotonic() - start < 1.0
+    assert len(results) == 100
+    assert 2 <= len(transport.timeouts) < 100
+    assert all(result.ok or isinstance(result.error, DeadlineExceededError) for result in results)
+
+
+def test_async_deadline() -> None:
+    """Test the async client honours a deadline active in the running task."""
+    transport = RecordingTransport()
+
+    async def run() -> None:
+        async with AsyncA7Client(token="local", transport=transport) as client:
+            with Deadline(0.0), pytest.raises(DeadlineExceededError):
+                await client.eobi.get_markets()
+            results = await client.gather([("eobi.get_markets", {})] * 3, deadline=Deadline(10.0))
+            assert all(result.ok for result in results)
+
+    asyncio.run(run())
+    assert len(transport.timeouts) == 3
+
+
+def test_deadline_pickles() -> None:
+    """Test deadlines and their errors can be sent to worker processes."""
+    deadline = pickle.loads(pickle.dumps(Deadline(10.0)))
+    error = pickle.loads(pickle.dumps(DeadlineExceededError(1.5)))
+
+    assert 9.0 < deadline.remaining() <= 10.0
+    assert error.overdue == 1.5